@@ -1,6 +1,7 @@
 # Assuming you have not changed the general structure of the template no modification is needed in this file.
 from . import commands
 from .lib import fusion360utils as futil
+from .lib.jobQueue import stopJobQueue
 
 
 def run(context):
@@ -17,8 +18,19 @@ def stop(context):
         # Remove all of the event handlers your app has created
         futil.clear_handlers()
 
+        # Drop queued generation steps, their events are unregistered
+        stopJobQueue()
+
         # This will run the start function in each of your commands as defined in commands/__init__.py
         commands.stop()
 
+        # Write generation cache counters kept in memory
+        from .lib.generationCache import flushGenerationCache
+
+        flushGenerationCache()
+
+        # Write pending log lines before the add-in is unloaded
+        futil.stop_logging()
+
     except:
         futil.handle_error("stop")
@@ -0,0 +1,4 @@
+"""Offline stand-in for the subset of the Fusion 360 ``adsk`` package used by
+the generators. Only meant for benchmarks, it doesn't model real geometry:
+bodies are axis aligned boxes with plausible bounding boxes.
+"""
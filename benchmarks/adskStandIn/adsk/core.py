@@ -0,0 +1,675 @@
+import math
+import re
+
+from .recording import recorder
+
+
+class Base:
+    objectType = "adsk::core::Base"
+
+    @classmethod
+    def classType(cls):
+        return f"adsk::core::{cls.__name__}"
+
+    @property
+    def isValid(self):
+        return True
+
+
+class Point3D(Base):
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
+
+    @staticmethod
+    def create(x=0.0, y=0.0, z=0.0):
+        return Point3D(x, y, z)
+
+    def copy(self):
+        return Point3D(self.x, self.y, self.z)
+
+    def asArray(self):
+        return [self.x, self.y, self.z]
+
+    def asVector(self):
+        return Vector3D(self.x, self.y, self.z)
+
+    def distanceTo(self, other):
+        return math.sqrt(
+            (self.x - other.x) ** 2 + (self.y - other.y) ** 2 + (self.z - other.z) ** 2
+        )
+
+    def isEqualTo(self, other):
+        return self.isEqualToByTolerance(other, 1e-10)
+
+    def isEqualToByTolerance(self, other, tolerance):
+        return self.distanceTo(other) <= tolerance
+
+    def translateBy(self, vector):
+        self.x += vector.x
+        self.y += vector.y
+        self.z += vector.z
+        return True
+
+    def transformBy(self, matrix):
+        self.x, self.y, self.z = matrix.transformPoint(self.x, self.y, self.z)
+        return True
+
+    def __repr__(self):
+        return f"Point3D({self.x:.4f}, {self.y:.4f}, {self.z:.4f})"
+
+
+class Vector3D(Base):
+    def __init__(self, x=0.0, y=0.0, z=0.0):
+        self.x = float(x)
+        self.y = float(y)
+        self.z = float(z)
+
+    @staticmethod
+    def create(x=0.0, y=0.0, z=0.0):
+        return Vector3D(x, y, z)
+
+    def copy(self):
+        return Vector3D(self.x, self.y, self.z)
+
+    @property
+    def length(self):
+        return math.sqrt(self.x**2 + self.y**2 + self.z**2)
+
+    def add(self, other):
+        self.x += other.x
+        self.y += other.y
+        self.z += other.z
+        return True
+
+    def subtract(self, other):
+        self.x -= other.x
+        self.y -= other.y
+        self.z -= other.z
+        return True
+
+    def scaleBy(self, scale):
+        self.x *= scale
+        self.y *= scale
+        self.z *= scale
+        return True
+
+    def normalize(self):
+        length = self.length
+        if length > 0:
+            self.scaleBy(1 / length)
+        return True
+
+    def crossProduct(self, other):
+        return Vector3D(
+            self.y * other.z - self.z * other.y,
+            self.z * other.x - self.x * other.z,
+            self.x * other.y - self.y * other.x,
+        )
+
+    def dotProduct(self, other):
+        return self.x * other.x + self.y * other.y + self.z * other.z
+
+    def asArray(self):
+        return [self.x, self.y, self.z]
+
+    def asPoint(self):
+        return Point3D(self.x, self.y, self.z)
+
+
+class Matrix3D(Base):
+    def __init__(self):
+        # row major 4x4 matrix
+        self._data = [[1.0 if i == j else 0.0 for j in range(4)] for i in range(4)]
+
+    @staticmethod
+    def create():
+        return Matrix3D()
+
+    def copy(self):
+        matrix = Matrix3D()
+        matrix._data = [list(row) for row in self._data]
+        return matrix
+
+    @property
+    def translation(self):
+        return Vector3D(self._data[0][3], self._data[1][3], self._data[2][3])
+
+    @translation.setter
+    def translation(self, value):
+        self._data[0][3] = value.x
+        self._data[1][3] = value.y
+        self._data[2][3] = value.z
+
+    def setToRotation(self, angle, axis, origin):
+        axis = axis.copy()
+        axis.normalize()
+        x, y, z = axis.x, axis.y, axis.z
+        c, s = math.cos(angle), math.sin(angle)
+        t = 1 - c
+        rotation = [
+            [t * x * x + c, t * x * y - s * z, t * x * z + s * y],
+            [t * x * y + s * z, t * y * y + c, t * y * z - s * x],
+            [t * x * z - s * y, t * y * z + s * x, t * z * z + c],
+        ]
+        for i in range(3):
+            for j in range(3):
+                self._data[i][j] = rotation[i][j]
+            self._data[i][3] = [origin.x, origin.y, origin.z][i] - sum(
+                rotation[i][j] * [origin.x, origin.y, origin.z][j] for j in range(3)
+            )
+        return True
+
+    def transformPoint(self, x, y, z):
+        return tuple(
+            self._data[i][0] * x
+            + self._data[i][1] * y
+            + self._data[i][2] * z
+            + self._data[i][3]
+            for i in range(3)
+        )
+
+
+class BoundingBox3D(Base):
+    def __init__(self, minPoint: Point3D, maxPoint: Point3D):
+        self.minPoint = minPoint
+        self.maxPoint = maxPoint
+
+    @staticmethod
+    def create(minPoint, maxPoint):
+        return BoundingBox3D(minPoint.copy(), maxPoint.copy())
+
+    def copy(self):
+        return BoundingBox3D(self.minPoint.copy(), self.maxPoint.copy())
+
+    def contains(self, point):
+        return all(
+            low - 1e-9 <= value <= high + 1e-9
+            for low, value, high in zip(
+                self.minPoint.asArray(), point.asArray(), self.maxPoint.asArray()
+            )
+        )
+
+    def combine(self, other):
+        self.minPoint = Point3D(
+            *[
+                min(a, b)
+                for a, b in zip(self.minPoint.asArray(), other.minPoint.asArray())
+            ]
+        )
+        self.maxPoint = Point3D(
+            *[
+                max(a, b)
+                for a, b in zip(self.maxPoint.asArray(), other.maxPoint.asArray())
+            ]
+        )
+        return True
+
+
+class ObjectCollection(Base):
+    def __init__(self):
+        self._items = []
+
+    @staticmethod
+    def create():
+        return ObjectCollection()
+
+    def add(self, item):
+        if item in self._items:
+            return False
+        self._items.append(item)
+        return True
+
+    def removeByIndex(self, index):
+        del self._items[index]
+        return True
+
+    def clear(self):
+        self._items = []
+        return True
+
+    def item(self, index):
+        return self._items[index]
+
+    def find(self, item, startIndex=0):
+        try:
+            return self._items.index(item, startIndex)
+        except ValueError:
+            return -1
+
+    @property
+    def count(self):
+        return len(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(list(self._items))
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+
+# length units as cm, the internal length unit
+_EXPRESSION_UNITS = {"cm": 1.0, "mm": 0.1, "m": 100.0}
+
+
+def _evaluateExpression(expression: str) -> float:
+    """Evaluates arithmetic of numbers, lengths and user parameters.
+
+    Other expressions evaluate to their first token, or 0.0 when it isn't a number.
+    """
+
+    def value(match):
+        name = match.group(0)
+        if name in _EXPRESSION_UNITS:
+            return f"*{_EXPRESSION_UNITS[name]!r}"
+        parameter = Application.get().activeProduct.userParameters.itemByName(name)
+        if parameter is None:
+            raise ValueError(name)
+        return repr(_evaluateExpression(parameter.expression))
+
+    try:
+        text = re.sub(r"[A-Za-z_]\w*", value, str(expression))
+        if re.fullmatch(r"[\d.eE+\-*/() ]+", text):
+            return float(eval(text, {"__builtins__": {}}))
+    except (ValueError, SyntaxError, ZeroDivisionError, TypeError):
+        pass
+    try:
+        return float(str(expression).split(" ")[0])
+    except ValueError:
+        return 0.0
+
+
+class ValueInput(Base):
+    RealValueType = 0
+    StringValueType = 1
+
+    def __init__(self, value, valueType):
+        self._value = value
+        self.valueType = valueType
+
+    @staticmethod
+    def createByReal(value):
+        recorder.call("ValueInput.createByReal")
+        return ValueInput(float(value), ValueInput.RealValueType)
+
+    @staticmethod
+    def createByString(value):
+        recorder.call("ValueInput.createByString")
+        return ValueInput(str(value), ValueInput.StringValueType)
+
+    @property
+    def realValue(self):
+        if self.valueType == ValueInput.RealValueType:
+            return self._value
+        return _evaluateExpression(self._value)
+
+    @property
+    def stringValue(self):
+        if self.valueType == ValueInput.StringValueType:
+            return self._value
+        return str(self._value)
+
+
+class LogLevels:
+    InfoLogLevel = 0
+    WarningLogLevel = 1
+    ErrorLogLevel = 2
+
+
+class LogTypes:
+    ConsoleLogType = 0
+    FileLogType = 1
+
+
+class DialogResults:
+    DialogOK = 0
+    DialogCancel = 1
+    DialogYes = 2
+    DialogNo = 3
+
+
+class MessageBoxButtonTypes:
+    OKButtonType = 0
+    OKCancelButtonType = 1
+    YesNoButtonType = 3
+
+
+class DropDownStyles:
+    LabeledIconDropDownStyle = 1
+    TextListDropDownStyle = 2
+    CheckBoxDropDownStyle = 0
+
+
+class TablePresentationStyles:
+    nameValueTablePresentationStyle = 0
+    itemBorderTablePresentationStyle = 1
+    transparentBackgroundTablePresentationStyle = 2
+
+
+class Event(Base):
+    def __init__(self, name=""):
+        self.name = name
+        self._handlers = []
+
+    def add(self, handler: "EventHandler"):
+        self._handlers.append(handler)
+        return True
+
+    def remove(self, handler):
+        if handler in self._handlers:
+            self._handlers.remove(handler)
+        return True
+
+    def fire(self, args):
+        for handler in list(self._handlers):
+            handler.notify(args)
+
+
+class EventHandler:
+    def notify(self, args):
+        pass
+
+
+class CustomEventHandler(EventHandler):
+    pass
+
+
+class CustomEvent(Event):
+    def add(self, handler: "CustomEventHandler"):
+        return super().add(handler)
+
+
+class CustomEventArgs(Base):
+    def __init__(self, additionalInfo=""):
+        self.additionalInfo = additionalInfo
+        self.firingEvent = None
+
+
+class ProgressBar(Base):
+    def __init__(self):
+        self.isVisible = False
+        self.progressValue = 0
+        self.maximumValue = 0
+        self.message = ""
+
+    def show(self, message, minimumValue=0, maximumValue=100, isInfinite=False):
+        self.isVisible = True
+        self.message = message
+        self.maximumValue = maximumValue
+        self.progressValue = minimumValue
+        return True
+
+    def showBusy(self, message, isInfinite=True):
+        self.isVisible = True
+        self.message = message
+        return True
+
+    def hide(self):
+        self.isVisible = False
+        return True
+
+
+class UserInterface(Base):
+    def __init__(self):
+        self.messages = []
+        self.progressBar = ProgressBar()
+        self.statusMessage = ""
+
+    def messageBox(self, text, title="", buttons=0, icon=0):
+        self.messages.append(text)
+        return DialogResults.DialogOK
+
+
+class ImportManager(Base):
+    def createFusionArchiveImportOptions(self, filename):
+        recorder.call("ImportManager.createFusionArchiveImportOptions")
+        return ImportOptions(filename)
+
+    def importToTarget2(self, importOptions, target):
+        recorder.call("ImportManager.importToTarget2")
+        occurrence = target.occurrences.addNewComponent(Matrix3D.create())
+        collection = ObjectCollection.create()
+        collection.add(occurrence)
+        return collection
+
+
+class ImportOptions(Base):
+    def __init__(self, filename):
+        self.filename = filename
+
+
+class Application(Base):
+    _instance = None
+
+    def __init__(self):
+        self.userInterface = UserInterface()
+        self.importManager = ImportManager()
+        self.logMessages = []
+        self._customEvents = {}
+        self._activeProduct = None
+
+    @staticmethod
+    def get():
+        if Application._instance is None:
+            Application._instance = Application()
+        return Application._instance
+
+    @property
+    def activeProduct(self):
+        if self._activeProduct is None:
+            from . import fusion
+
+            self._activeProduct = fusion.Design()
+        return self._activeProduct
+
+    def newDesign(self):
+        """Stand-in only: replaces the active design with an empty one."""
+        from . import fusion
+
+        self._activeProduct = fusion.Design()
+        return self._activeProduct
+
+    def log(
+        self, message, level=LogLevels.InfoLogLevel, logType=LogTypes.ConsoleLogType
+    ):
+        self.logMessages.append((level, logType, message))
+
+    def registerCustomEvent(self, eventId):
+        event = self._customEvents.get(eventId)
+        if event is None:
+            event = CustomEvent(eventId)
+            self._customEvents[eventId] = event
+        return event
+
+    def unregisterCustomEvent(self, eventId):
+        return self._customEvents.pop(eventId, None) is not None
+
+    def fireCustomEvent(self, eventId, additionalInfo=""):
+        # Fusion queues custom events to the main thread, the stand-in
+        # dispatches them synchronously on the calling thread.
+        event = self._customEvents.get(eventId)
+        if event is None:
+            return False
+        args = CustomEventArgs(additionalInfo)
+        args.firingEvent = event
+        event.fire(args)
+        return True
+
+
+class CommandInput(Base):
+    def __init__(self, inputId="", name=""):
+        self.id = inputId
+        self.name = name
+        self.isVisible = True
+        self.isEnabled = True
+        self.tooltip = ""
+        self.parentCommandInput = None
+
+    @property
+    def objectType(self):
+        return type(self).classType()
+
+
+class ValueCommandInput(CommandInput):
+    def __init__(self, inputId="", name="", unitType="cm", value=0.0):
+        super().__init__(inputId, name)
+        self.unitType = unitType
+        self.value = value
+        self.minimumValue = None
+        self.maximumValue = None
+
+    @property
+    def expression(self):
+        if self.unitType == "deg":
+            return f"{math.degrees(self.value)} deg"
+        return f"{self.value} {self.unitType}"
+
+    @expression.setter
+    def expression(self, value):
+        number = float(str(value).split(" ")[0])
+        self.value = math.radians(number) if self.unitType == "deg" else number
+
+
+class IntegerSpinnerCommandInput(CommandInput):
+    def __init__(self, inputId="", name="", value=0):
+        super().__init__(inputId, name)
+        self.value = value
+
+
+class BoolValueCommandInput(CommandInput):
+    def __init__(self, inputId="", name="", value=False):
+        super().__init__(inputId, name)
+        self.value = value
+
+
+class StringValueCommandInput(CommandInput):
+    def __init__(self, inputId="", name="", value=""):
+        super().__init__(inputId, name)
+        self.value = value
+
+
+class TextBoxCommandInput(CommandInput):
+    def __init__(self, inputId="", name="", formattedText=""):
+        super().__init__(inputId, name)
+        self.formattedText = formattedText
+        self.text = formattedText
+
+
+class GroupCommandInput(CommandInput):
+    def __init__(self, inputId="", name="", isExpanded=True):
+        super().__init__(inputId, name)
+        self.isExpanded = isExpanded
+
+
+class TableCommandInput(CommandInput):
+    def __init__(self, inputId="", name="", numberOfColumns=1):
+        super().__init__(inputId, name)
+        self.numberOfColumns = numberOfColumns
+        self.commandInputs = CommandInputs()
+        self._rows = []
+
+    @property
+    def rowCount(self):
+        return len(self._rows)
+
+    def addCommandInput(self, input, row, column, rowSpan=0, columnSpan=0):
+        while len(self._rows) <= row:
+            self._rows.append([None] * self.numberOfColumns)
+        self._rows[row][column] = input
+        input.parentCommandInput = self
+        return True
+
+    def getInputAtPosition(self, row, column):
+        return self._rows[row][column]
+
+    def deleteRow(self, row):
+        del self._rows[row]
+        return True
+
+
+class CommandInputs(Base):
+    def __init__(self):
+        self._inputs = []
+
+    def add(self, input):
+        """Stand-in only: adds an already created input."""
+        self._inputs.append(input)
+        return input
+
+    def itemById(self, inputId):
+        for input in self._inputs:
+            if input.id == inputId:
+                return input
+        return None
+
+    @property
+    def count(self):
+        return len(self._inputs)
+
+    def __iter__(self):
+        return iter(self._inputs)
+
+
+class CommandControl(Base):
+    pass
+
+
+class CommandEventArgs(Base):
+    pass
+
+
+class CommandCreatedEventArgs(Base):
+    pass
+
+
+class InputChangedEventArgs(Base):
+    pass
+
+
+class ValidateInputsEventArgs(Base):
+    pass
+
+
+class ListItem(Base):
+    def __init__(self, name, isSelected=False):
+        self.name = name
+        self.isSelected = isSelected
+
+
+class ListItems(Base):
+    def __init__(self):
+        self._items = []
+
+    def add(self, name, isSelected=False, icon=""):
+        item = ListItem(name, isSelected)
+        self._items.append(item)
+        return item
+
+    def item(self, index):
+        return self._items[index]
+
+    @property
+    def count(self):
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+
+class DropDownCommandInput(CommandInput):
+    def __init__(self, inputId="", name="", items=(), selected=None):
+        super().__init__(inputId, name)
+        self.listItems = ListItems()
+        for item in items:
+            self.listItems.add(item, item == selected)
+
+    @property
+    def selectedItem(self):
+        for item in self.listItems:
+            if item.isSelected:
+                return item
+        return None
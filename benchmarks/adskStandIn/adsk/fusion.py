@@ -0,0 +1,2293 @@
+import itertools
+import math
+import os
+
+from . import core
+from .core import Base, BoundingBox3D, ObjectCollection, Point3D, Vector3D, ValueInput
+from .recording import recorder, recorded
+
+TOLERANCE = 1e-9
+# sketch (u, v) axes for each plane normal axis
+SKETCH_AXES = {2: (0, 1), 1: (0, 2), 0: (1, 2)}
+_ids = itertools.count(1)
+
+
+class FusionBase(Base):
+    @classmethod
+    def classType(cls):
+        return f"adsk::fusion::{cls.__name__}"
+
+    @property
+    def objectType(self):
+        return type(self).classType()
+
+    @classmethod
+    def cast(cls, obj):
+        return obj if isinstance(obj, cls) else None
+
+
+# enums
+
+
+class FeatureOperations:
+    JoinFeatureOperation = 0
+    CutFeatureOperation = 1
+    IntersectFeatureOperation = 2
+    NewBodyFeatureOperation = 3
+    NewComponentFeatureOperation = 4
+
+
+class ExtentDirections:
+    PositiveExtentDirection = 0
+    NegativeExtentDirection = 1
+    SymmetricExtentDirection = 2
+
+
+class PatternDistanceType:
+    ExtentPatternDistanceType = 0
+    SpacingPatternDistanceType = 1
+
+
+class DimensionOrientations:
+    AlignedDimensionOrientation = 0
+    HorizontalDimensionOrientation = 1
+    VerticalDimensionOrientation = 2
+
+
+class ShellTypes:
+    SharpOffsetShellType = 0
+    RoundedOffsetShellType = 1
+
+
+class SurfaceExtendTypes:
+    NaturalSurfaceExtendType = 0
+    TangentSurfaceExtendType = 1
+    PerpendicularSurfaceExtendType = 2
+
+
+class DesignTypes:
+    DirectDesignType = 0
+    ParametricDesignType = 1
+
+
+class BooleanTypes:
+    DifferenceBooleanType = 0
+    IntersectionBooleanType = 1
+    UnionBooleanType = 2
+
+
+# geometry helpers
+
+
+class PlaneSpec:
+    """Axis aligned plane, normal along `axis` pointing to `sign`."""
+
+    def __init__(self, axis: int, offset: float, sign: int = 1):
+        self.axis = axis
+        self.offset = offset
+        self.sign = sign
+
+    def offsetBy(self, distance: float):
+        return PlaneSpec(self.axis, self.offset + self.sign * distance, self.sign)
+
+    @property
+    def normal(self):
+        values = [0.0, 0.0, 0.0]
+        values[self.axis] = float(self.sign)
+        return Vector3D(*values)
+
+
+def _valueOf(value):
+    if isinstance(value, ValueInput):
+        return value.realValue
+    if isinstance(value, (int, float)):
+        return float(value)
+    if hasattr(value, "realValue"):
+        return value.realValue
+    return float(value)
+
+
+def _boxFromCorners(corners):
+    return BoundingBox3D(
+        Point3D(*[min(c[i] for c in corners) for i in range(3)]),
+        Point3D(*[max(c[i] for c in corners) for i in range(3)]),
+    )
+
+
+def _boxCorners(box: BoundingBox3D):
+    low = box.minPoint.asArray()
+    high = box.maxPoint.asArray()
+    return [
+        [high[i] if (mask >> i) & 1 else low[i] for i in range(3)] for mask in range(8)
+    ]
+
+
+def _boxesTouch(box1: BoundingBox3D, box2: BoundingBox3D, tolerance=TOLERANCE):
+    return all(
+        box1.minPoint.asArray()[i] <= box2.maxPoint.asArray()[i] + tolerance
+        and box2.minPoint.asArray()[i] <= box1.maxPoint.asArray()[i] + tolerance
+        for i in range(3)
+    )
+
+
+def _intersectBoxes(box1: BoundingBox3D, box2: BoundingBox3D):
+    low = [max(a, b) for a, b in zip(box1.minPoint.asArray(), box2.minPoint.asArray())]
+    high = [min(a, b) for a, b in zip(box1.maxPoint.asArray(), box2.maxPoint.asArray())]
+    high = [max(l, h) for l, h in zip(low, high)]
+    return BoundingBox3D(Point3D(*low), Point3D(*high))
+
+
+def _unionBoxes(boxes):
+    result = boxes[0].copy()
+    for box in boxes[1:]:
+        result.combine(box)
+    return result
+
+
+def _planeSpecOf(entity) -> PlaneSpec:
+    if isinstance(entity, (ConstructionPlane, BRepFace)):
+        return entity._spec
+    if isinstance(entity, Profile):
+        return entity.parentSketch._spec
+    raise TypeError(f"Stand-in can't use {type(entity).__name__} as a planar entity")
+
+
+# timeline
+
+
+class TimelineObject(FusionBase):
+    def __init__(self, timeline: "Timeline", entity):
+        self._timeline = timeline
+        self.entity = entity
+        self.isGroup = False
+        self.isSuppressed = False
+        self.parentGroup = None
+
+    @property
+    def index(self):
+        return self._timeline._objects.index(self)
+
+    def rollTo(self, rollBefore: bool):
+        self._timeline.markerPosition = self.index if rollBefore else self.index + 1
+        return True
+
+    def deleteMe(self):
+        self._timeline._objects.remove(self)
+        return True
+
+
+class TimelineGroup(FusionBase):
+    def __init__(self, startIndex: int, endIndex: int):
+        self.name = ""
+        self.startIndex = startIndex
+        self.endIndex = endIndex
+        self.isCollapsed = True
+
+    @property
+    def count(self):
+        return self.endIndex - self.startIndex + 1
+
+    def deleteMe(self, deleteGroupAndContents: bool = False):
+        return True
+
+
+class TimelineGroups(FusionBase):
+    def __init__(self, timeline: "Timeline"):
+        self._timeline = timeline
+        self._groups = []
+
+    @recorded
+    def add(self, startIndex: int, endIndex: int):
+        if endIndex >= len(self._timeline._objects) or startIndex > endIndex:
+            raise RuntimeError(
+                f"Invalid timeline group range {startIndex}..{endIndex}"
+                f" for timeline of {len(self._timeline._objects)} objects"
+            )
+        group = TimelineGroup(startIndex, endIndex)
+        self._groups.append(group)
+        return group
+
+    @property
+    def count(self):
+        return len(self._groups)
+
+    def item(self, index):
+        return self._groups[index]
+
+    def __iter__(self):
+        return iter(self._groups)
+
+
+class Timeline(FusionBase):
+    def __init__(self):
+        self._objects: list[TimelineObject] = []
+        self.timelineGroups = TimelineGroups(self)
+        self.markerPosition = 0
+
+    def _append(self, entity):
+        timelineObject = TimelineObject(self, entity)
+        if self.markerPosition < len(self._objects):
+            self._objects.insert(self.markerPosition, timelineObject)
+        else:
+            self._objects.append(timelineObject)
+        self.markerPosition += 1
+        return timelineObject
+
+    @property
+    def count(self):
+        return len(self._objects)
+
+    def item(self, index):
+        return self._objects[index]
+
+    def moveToEnd(self):
+        self.markerPosition = len(self._objects)
+        return True
+
+
+# b-rep
+
+
+class BRepVertex(FusionBase):
+    def __init__(self, geometry: Point3D):
+        self.geometry = geometry
+
+
+class CurveEvaluator3D(FusionBase):
+    def __init__(self, start: Point3D, end: Point3D):
+        self._start = start
+        self._end = end
+
+    def getEndPoints(self):
+        return (True, self._start.copy(), self._end.copy())
+
+
+class BRepEdges(FusionBase):
+    def __init__(self, edges):
+        self._edges = list(edges)
+
+    @property
+    def count(self):
+        return len(self._edges)
+
+    def item(self, index):
+        return self._edges[index]
+
+    def __iter__(self):
+        return iter(self._edges)
+
+    def __len__(self):
+        return len(self._edges)
+
+    def __getitem__(self, index):
+        return self._edges[index]
+
+
+class BRepEdge(FusionBase):
+    def __init__(self, body: "BRepBody", start: Point3D, end: Point3D):
+        self.body = body
+        self.tempId = next(_ids)
+        self._start = start
+        self._end = end
+        self._owner: "BRepFace" = None
+        self.startVertex = BRepVertex(start)
+        self.endVertex = BRepVertex(end)
+        self.evaluator = CurveEvaluator3D(start, end)
+
+    @property
+    def boundingBox(self):
+        return _boxFromCorners([self._start.asArray(), self._end.asArray()])
+
+    @property
+    def length(self):
+        return self._start.distanceTo(self._end)
+
+    @property
+    def tangentiallyConnectedEdges(self):
+        if self._owner is None:
+            return BRepEdges([self])
+        return BRepEdges(self._owner._edges)
+
+    @property
+    def isValid(self):
+        return self.body.isValid
+
+
+class SurfaceEvaluator(FusionBase):
+    def __init__(self, face: "BRepFace"):
+        self._face = face
+
+    def getNormalAtPoint(self, point):
+        return (True, self._face._spec.normal)
+
+
+class Plane(FusionBase):
+    def __init__(self, origin: Point3D, normal: Vector3D):
+        self.origin = origin
+        self.normal = normal
+
+
+class BRepFace(FusionBase):
+    def __init__(self, body: "BRepBody", spec: PlaneSpec, box: BoundingBox3D):
+        self.body = body
+        self.tempId = next(_ids)
+        self._spec = spec
+        self._box = box
+        self._edges: list[BRepEdge] = []
+        self.evaluator = SurfaceEvaluator(self)
+
+    @property
+    def boundingBox(self):
+        return self._box.copy()
+
+    @property
+    def edges(self):
+        return BRepEdges(self._edges)
+
+    @property
+    def area(self):
+        u, v = SKETCH_AXES[self._spec.axis]
+        low = self._box.minPoint.asArray()
+        high = self._box.maxPoint.asArray()
+        return (high[u] - low[u]) * (high[v] - low[v])
+
+    @property
+    def pointOnFace(self):
+        low = self._box.minPoint.asArray()
+        high = self._box.maxPoint.asArray()
+        return Point3D(*[(l + h) / 2 for l, h in zip(low, high)])
+
+    @property
+    def geometry(self):
+        return Plane(self.pointOnFace, self._spec.normal)
+
+    @property
+    def centroid(self):
+        return self.pointOnFace
+
+    @property
+    def isValid(self):
+        return self.body.isValid
+
+
+class BRepFaces(BRepEdges):
+    pass
+
+
+class BRepBody(FusionBase):
+    def __init__(self, component: "Component", box: BoundingBox3D, name: str = ""):
+        self.parentComponent = component
+        self._id = next(_ids)
+        self._version = 0
+        self._box = box
+        self._topology = None
+        self._removed = False
+        self.name = name or f"Body{self._id}"
+        self.isVisible = True
+        self.isLightBulbOn = True
+        self.isSolid = True
+        self.isTemporary = False
+
+    def _modified(self, box: BoundingBox3D = None):
+        if box is not None:
+            self._box = box
+        self._version += 1
+        self._topology = None
+
+    def _buildTopology(self):
+        low = self._box.minPoint.asArray()
+        high = self._box.maxPoint.asArray()
+        corners = {}
+        for mask in range(8):
+            corners[mask] = Point3D(
+                *[high[i] if (mask >> i) & 1 else low[i] for i in range(3)]
+            )
+        edges = {}
+        for mask in range(8):
+            for axis in range(3):
+                if not (mask >> axis) & 1:
+                    other = mask | (1 << axis)
+                    edges[(mask, other)] = BRepEdge(self, corners[mask], corners[other])
+        faces = []
+        # top face first, so chains started from top edges follow the top loop
+        for axis, side in [(2, 1), (2, 0), (1, 0), (1, 1), (0, 0), (0, 1)]:
+            coordinate = high[axis] if side else low[axis]
+            faceLow = list(low)
+            faceHigh = list(high)
+            faceLow[axis] = faceHigh[axis] = coordinate
+            face = BRepFace(
+                self,
+                PlaneSpec(axis, coordinate, 1 if side else -1),
+                BoundingBox3D(Point3D(*faceLow), Point3D(*faceHigh)),
+            )
+            for (start, end), edge in edges.items():
+                if ((start >> axis) & 1) == side and ((end >> axis) & 1) == side:
+                    face._edges.append(edge)
+                    if edge._owner is None:
+                        edge._owner = face
+            faces.append(face)
+        self._topology = (faces, list(edges.values()))
+
+    @property
+    def faces(self):
+        if self._topology is None:
+            self._buildTopology()
+        return BRepFaces(self._topology[0])
+
+    @property
+    def edges(self):
+        if self._topology is None:
+            self._buildTopology()
+        return BRepEdges(self._topology[1])
+
+    @property
+    def boundingBox(self):
+        return self._box.copy()
+
+    @property
+    def revisionId(self):
+        return f"{self._id}:{self._version}"
+
+    @property
+    def entityToken(self):
+        return f"body-{self._id}"
+
+    @property
+    def volume(self):
+        low = self._box.minPoint.asArray()
+        high = self._box.maxPoint.asArray()
+        return abs((high[0] - low[0]) * (high[1] - low[1]) * (high[2] - low[2]))
+
+    @property
+    def isValid(self):
+        return not self._removed
+
+    @property
+    def attributes(self):
+        if not hasattr(self, "_attributes"):
+            self._attributes = Attributes()
+        return self._attributes
+
+    def copy(self):
+        return BRepBody(self.parentComponent, self._box.copy(), self.name)
+
+    def deleteMe(self):
+        self._removed = True
+        return True
+
+
+class BRepBodies(FusionBase):
+    def __init__(self, component: "Component" = None, bodies=()):
+        self._component = component
+        self._bodies = list(bodies)
+
+    def _alive(self):
+        return [body for body in self._bodies if not body._removed]
+
+    @property
+    def count(self):
+        return len(self._alive())
+
+    def item(self, index):
+        return self._alive()[index]
+
+    def __iter__(self):
+        return iter(self._alive())
+
+    def __len__(self):
+        return len(self._alive())
+
+    def __getitem__(self, index):
+        return self._alive()[index]
+
+    @recorded
+    def add(self, body: BRepBody, baseFeature: "BaseFeature" = None):
+        newBody = BRepBody(self._component, body._box.copy(), body.name)
+        self._bodies.append(newBody)
+        if baseFeature is not None:
+            baseFeature._bodies.append(newBody)
+        return newBody
+
+
+# sketches
+
+
+class SketchPoint(FusionBase):
+    def __init__(self, sketch: "Sketch", geometry: Point3D, isFixed: bool = False):
+        self.parentSketch = sketch
+        self.geometry = geometry
+        self.isFixed = isFixed
+
+    @property
+    def worldGeometry(self):
+        return self.parentSketch.sketchToModelSpace(self.geometry)
+
+
+class SketchCurve(FusionBase):
+    def __init__(self, sketch: "Sketch"):
+        self.parentSketch = sketch
+        self.isConstruction = False
+        self.isFixed = False
+        self.tempId = next(_ids)
+
+    def _points(self):
+        return []
+
+    @property
+    def boundingBox(self):
+        return _boxFromCorners([point.asArray() for point in self._points()])
+
+    def deleteMe(self):
+        self.parentSketch._curves.remove(self)
+        return True
+
+
+class SketchLine(SketchCurve):
+    def __init__(self, sketch, start: SketchPoint, end: SketchPoint):
+        super().__init__(sketch)
+        self.startSketchPoint = start
+        self.endSketchPoint = end
+
+    def _points(self):
+        return [self.startSketchPoint.geometry, self.endSketchPoint.geometry]
+
+    @property
+    def length(self):
+        return self.startSketchPoint.geometry.distanceTo(self.endSketchPoint.geometry)
+
+
+class SketchCircle(SketchCurve):
+    def __init__(self, sketch, center: SketchPoint, radius: float):
+        super().__init__(sketch)
+        self.centerSketchPoint = center
+        self.radius = radius
+
+    def _points(self):
+        center = self.centerSketchPoint.geometry
+        return [
+            Point3D(center.x - self.radius, center.y - self.radius, 0),
+            Point3D(center.x + self.radius, center.y + self.radius, 0),
+        ]
+
+
+class SketchArc(SketchCurve):
+    def __init__(
+        self, sketch, center: SketchPoint, start: SketchPoint, end: SketchPoint
+    ):
+        super().__init__(sketch)
+        self.centerSketchPoint = center
+        self.startSketchPoint = start
+        self.endSketchPoint = end
+
+    @property
+    def radius(self):
+        return self.centerSketchPoint.geometry.distanceTo(
+            self.startSketchPoint.geometry
+        )
+
+    def _points(self):
+        return [self.startSketchPoint.geometry, self.endSketchPoint.geometry]
+
+
+class SketchEntityList(FusionBase):
+    def __init__(self, items):
+        self._items = list(items)
+
+    @property
+    def count(self):
+        return len(self._items)
+
+    def item(self, index):
+        return self._items[index]
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __len__(self):
+        return len(self._items)
+
+
+def _sketchPoint(sketch: "Sketch", point):
+    if isinstance(point, SketchPoint):
+        return point
+    return SketchPoint(sketch, Point3D(point.x, point.y, 0))
+
+
+class SketchLines(FusionBase):
+    def __init__(self, sketch: "Sketch"):
+        self._sketch = sketch
+
+    def _lines(self):
+        return [c for c in self._sketch._curves if isinstance(c, SketchLine)]
+
+    @recorded
+    def addByTwoPoints(self, startPoint, endPoint):
+        line = SketchLine(
+            self._sketch,
+            _sketchPoint(self._sketch, startPoint),
+            _sketchPoint(self._sketch, endPoint),
+        )
+        self._sketch._curves.append(line)
+        return line
+
+    @recorded
+    def addTwoPointRectangle(self, pointOne, pointTwo):
+        x1, y1 = pointOne.x, pointOne.y
+        x2, y2 = pointTwo.x, pointTwo.y
+        p1 = SketchPoint(self._sketch, Point3D(x1, y1, 0))
+        p2 = SketchPoint(self._sketch, Point3D(x2, y1, 0))
+        p3 = SketchPoint(self._sketch, Point3D(x2, y2, 0))
+        p4 = SketchPoint(self._sketch, Point3D(x1, y2, 0))
+        lines = [
+            SketchLine(self._sketch, p1, p2),
+            SketchLine(self._sketch, p2, p3),
+            SketchLine(self._sketch, p3, p4),
+            SketchLine(self._sketch, p4, p1),
+        ]
+        self._sketch._curves.extend(lines)
+        return SketchEntityList(lines)
+
+    @recorded
+    def addCenterPointRectangle(self, centerPoint, cornerPoint):
+        dx = abs(cornerPoint.x - centerPoint.x)
+        dy = abs(cornerPoint.y - centerPoint.y)
+        return self.addTwoPointRectangle(
+            Point3D(centerPoint.x - dx, centerPoint.y - dy, 0),
+            Point3D(centerPoint.x + dx, centerPoint.y + dy, 0),
+        )
+
+    @property
+    def count(self):
+        return len(self._lines())
+
+    def item(self, index):
+        return self._lines()[index]
+
+    def __iter__(self):
+        return iter(self._lines())
+
+
+class SketchCircles(FusionBase):
+    def __init__(self, sketch: "Sketch"):
+        self._sketch = sketch
+
+    def _circles(self):
+        return [c for c in self._sketch._curves if isinstance(c, SketchCircle)]
+
+    @recorded
+    def addByCenterRadius(self, centerPoint, radius):
+        circle = SketchCircle(
+            self._sketch, _sketchPoint(self._sketch, centerPoint), radius
+        )
+        self._sketch._curves.append(circle)
+        return circle
+
+    @property
+    def count(self):
+        return len(self._circles())
+
+    def item(self, index):
+        return self._circles()[index]
+
+    def __iter__(self):
+        return iter(self._circles())
+
+
+class SketchArcs(FusionBase):
+    def __init__(self, sketch: "Sketch"):
+        self._sketch = sketch
+
+    def _arcs(self):
+        return [c for c in self._sketch._curves if isinstance(c, SketchArc)]
+
+    @recorded
+    def addByCenterStartSweep(self, centerPoint, startPoint, sweepAngle):
+        center = _sketchPoint(self._sketch, centerPoint)
+        start = _sketchPoint(self._sketch, startPoint)
+        dx = start.geometry.x - center.geometry.x
+        dy = start.geometry.y - center.geometry.y
+        end = SketchPoint(
+            self._sketch,
+            Point3D(
+                center.geometry.x
+                + dx * math.cos(sweepAngle)
+                - dy * math.sin(sweepAngle),
+                center.geometry.y
+                + dx * math.sin(sweepAngle)
+                + dy * math.cos(sweepAngle),
+                0,
+            ),
+        )
+        arc = SketchArc(self._sketch, center, start, end)
+        self._sketch._curves.append(arc)
+        return arc
+
+    @recorded
+    def addFillet(
+        self, firstEntity, firstEntityPoint, secondEntity, secondEntityPoint, radius
+    ):
+        # the stand-in doesn't trim, the arc connects the picked points
+        start = _sketchPoint(self._sketch, firstEntityPoint)
+        end = _sketchPoint(self._sketch, secondEntityPoint)
+        center = SketchPoint(
+            self._sketch,
+            Point3D(
+                (start.geometry.x + end.geometry.x) / 2,
+                (start.geometry.y + end.geometry.y) / 2,
+                0,
+            ),
+        )
+        arc = SketchArc(self._sketch, center, start, end)
+        self._sketch._curves.append(arc)
+        return arc
+
+    @property
+    def count(self):
+        return len(self._arcs())
+
+    def item(self, index):
+        return self._arcs()[index]
+
+    def __iter__(self):
+        return iter(self._arcs())
+
+
+class SketchCurves(FusionBase):
+    def __init__(self, sketch: "Sketch"):
+        self._sketch = sketch
+        self.sketchLines = SketchLines(sketch)
+        self.sketchCircles = SketchCircles(sketch)
+        self.sketchArcs = SketchArcs(sketch)
+
+    @property
+    def count(self):
+        return len(self._sketch._curves)
+
+    def item(self, index):
+        return self._sketch._curves[index]
+
+    def __iter__(self):
+        return iter(list(self._sketch._curves))
+
+
+class SketchDimension(FusionBase):
+    def __init__(self, entities):
+        self.entities = entities
+        self.parameter = ModelParameter("d", "0")
+
+
+class SketchDimensions(FusionBase):
+    def __init__(self, sketch: "Sketch"):
+        self._sketch = sketch
+        self._dimensions = []
+
+    def _add(self, *entities):
+        recorder.sketchDimensions += 1
+        dimension = SketchDimension(entities)
+        self._dimensions.append(dimension)
+        return dimension
+
+    @recorded
+    def addDistanceDimension(
+        self, pointOne, pointTwo, orientation, textPoint, isDriving=True
+    ):
+        return self._add(pointOne, pointTwo)
+
+    @recorded
+    def addDiameterDimension(self, entity, textPoint, isDriving=True):
+        return self._add(entity)
+
+    @recorded
+    def addRadialDimension(self, entity, textPoint, isDriving=True):
+        return self._add(entity)
+
+    @recorded
+    def addAngularDimension(self, lineOne, lineTwo, textPoint, isDriving=True):
+        return self._add(lineOne, lineTwo)
+
+    @recorded
+    def addOffsetDimension(self, line, entity, textPoint, isDriving=True):
+        return self._add(line, entity)
+
+    @property
+    def count(self):
+        return len(self._dimensions)
+
+
+class GeometricConstraints(FusionBase):
+    def __init__(self, sketch: "Sketch"):
+        self._sketch = sketch
+        self._count = 0
+
+    def _add(self):
+        recorder.sketchConstraints += 1
+        self._count += 1
+        return GeometricConstraint()
+
+    @property
+    def count(self):
+        return self._count
+
+    @recorded
+    def addHorizontal(self, line):
+        return self._add()
+
+    @recorded
+    def addVertical(self, line):
+        return self._add()
+
+    @recorded
+    def addCoincident(self, point, entity):
+        return self._add()
+
+    @recorded
+    def addPerpendicular(self, lineOne, lineTwo):
+        return self._add()
+
+    @recorded
+    def addParallel(self, lineOne, lineTwo):
+        return self._add()
+
+    @recorded
+    def addTangent(self, curveOne, curveTwo):
+        return self._add()
+
+    @recorded
+    def addEqual(self, curveOne, curveTwo):
+        return self._add()
+
+    @recorded
+    def addMidPoint(self, point, midPointCurve):
+        return self._add()
+
+    @recorded
+    def addConcentric(self, entityOne, entityTwo):
+        return self._add()
+
+    @recorded
+    def addOffset(self, curves, offset, directionPoint):
+        return self._add()
+
+
+class GeometricConstraint(FusionBase):
+    pass
+
+
+class ProfileAreaProperties(FusionBase):
+    def __init__(self, area: float, centroid: Point3D):
+        self.area = area
+        self.centroid = centroid
+
+
+class Profile(FusionBase):
+    def __init__(self, sketch: "Sketch", box: BoundingBox3D, area: float, curves):
+        self.parentSketch = sketch
+        self._box = box
+        self._area = area
+        self._curves = curves
+
+    @property
+    def boundingBox(self):
+        return self._box.copy()
+
+    def areaProperties(self, accuracy=0):
+        low = self._box.minPoint
+        high = self._box.maxPoint
+        return ProfileAreaProperties(
+            self._area,
+            Point3D((low.x + high.x) / 2, (low.y + high.y) / 2, 0),
+        )
+
+
+class Profiles(SketchEntityList):
+    pass
+
+
+class Sketch(FusionBase):
+    def __init__(self, component: "Component", spec: PlaneSpec, planarEntity):
+        self.parentComponent = component
+        self._spec = spec
+        self.referencePlane = planarEntity
+        self.name = "Sketch"
+        self.isVisible = True
+        self.isComputeDeferred = False
+        self.areDimensionsShown = True
+        self._curves: list[SketchCurve] = []
+        self.originPoint = SketchPoint(self, Point3D(0, 0, 0), True)
+        self.sketchCurves = SketchCurves(self)
+        self.sketchDimensions = SketchDimensions(self)
+        self.geometricConstraints = GeometricConstraints(self)
+        self.sketchPoints = SketchEntityList([self.originPoint])
+        if isinstance(planarEntity, BRepFace):
+            # Fusion projects the edges of the face the sketch is created on
+            for edge in planarEntity.edges:
+                self._curves.append(
+                    SketchLine(
+                        self,
+                        SketchPoint(self, self.modelToSketchSpace(edge._start)),
+                        SketchPoint(self, self.modelToSketchSpace(edge._end)),
+                    )
+                )
+
+    @property
+    def origin(self):
+        return self.sketchToModelSpace(Point3D(0, 0, 0))
+
+    def modelToSketchSpace(self, point: Point3D):
+        u, v = SKETCH_AXES[self._spec.axis]
+        values = point.asArray()
+        return Point3D(
+            values[u],
+            values[v],
+            self._spec.sign * (values[self._spec.axis] - self._spec.offset),
+        )
+
+    def sketchToModelSpace(self, point: Point3D):
+        u, v = SKETCH_AXES[self._spec.axis]
+        values = [0.0, 0.0, 0.0]
+        values[u] = point.x
+        values[v] = point.y
+        values[self._spec.axis] = self._spec.offset + self._spec.sign * point.z
+        return Point3D(*values)
+
+    @recorded
+    def offset(self, curves, directionPoint, offset):
+        points = [point for curve in curves for point in curve._points()]
+        low = Point3D(
+            min(p.x for p in points) - offset, min(p.y for p in points) - offset, 0
+        )
+        high = Point3D(
+            max(p.x for p in points) + offset, max(p.y for p in points) + offset, 0
+        )
+        return self.sketchCurves.sketchLines.addTwoPointRectangle(low, high)
+
+    @recorded
+    def project(self, entity):
+        return SketchEntityList([])
+
+    @property
+    def profiles(self):
+        curves = [curve for curve in self._curves if not curve.isConstruction]
+        profiles = []
+        circlesByCenter = {}
+        others = []
+        for curve in curves:
+            if isinstance(curve, SketchCircle):
+                center = curve.centerSketchPoint.geometry
+                key = (round(center.x, 6), round(center.y, 6))
+                circlesByCenter.setdefault(key, []).append(curve)
+            else:
+                others.append(curve)
+        for circles in circlesByCenter.values():
+            innerRadius = 0
+            for circle in sorted(circles, key=lambda c: c.radius):
+                profiles.append(
+                    Profile(
+                        self,
+                        circle.boundingBox,
+                        math.pi * (circle.radius**2 - innerRadius**2),
+                        [circle],
+                    )
+                )
+                innerRadius = circle.radius
+        # group connected curves, each group is one closed profile
+        parents = list(range(len(others)))
+
+        def find(index):
+            while parents[index] != index:
+                parents[index] = parents[parents[index]]
+                index = parents[index]
+            return index
+
+        pointOwners = {}
+        for index, curve in enumerate(others):
+            for point in curve._points():
+                key = (round(point.x, 6), round(point.y, 6))
+                if key in pointOwners:
+                    parents[find(index)] = find(pointOwners[key])
+                else:
+                    pointOwners[key] = index
+        groups = {}
+        for index, curve in enumerate(others):
+            groups.setdefault(find(index), []).append(curve)
+        for group in groups.values():
+            box = _unionBoxes([curve.boundingBox for curve in group])
+            area = (box.maxPoint.x - box.minPoint.x) * (box.maxPoint.y - box.minPoint.y)
+            profiles.append(Profile(self, box, area, group))
+        return Profiles(profiles)
+
+    def deleteMe(self):
+        return True
+
+
+class Sketches(FusionBase):
+    def __init__(self, component: "Component"):
+        self._component = component
+        self._sketches = []
+
+    @recorded
+    def add(self, planarEntity, occurrenceForCreation=None):
+        recorder.sketches += 1
+        sketch = Sketch(self._component, _planeSpecOf(planarEntity), planarEntity)
+        self._sketches.append(sketch)
+        sketch.timelineObject = self._component._timeline()._append(sketch)
+        return sketch
+
+    @recorded
+    def addWithoutEdges(self, planarEntity):
+        recorder.sketches += 1
+        sketch = Sketch(self._component, _planeSpecOf(planarEntity), None)
+        self._sketches.append(sketch)
+        sketch.timelineObject = self._component._timeline()._append(sketch)
+        return sketch
+
+    @property
+    def count(self):
+        return len(self._sketches)
+
+    def item(self, index):
+        return self._sketches[index]
+
+    def __iter__(self):
+        return iter(self._sketches)
+
+
+# construction geometry
+
+
+class ConstructionPlane(FusionBase):
+    def __init__(self, spec: PlaneSpec, name: str = ""):
+        self._spec = spec
+        self.name = name
+        self.isLightBulbOn = True
+        self.isVisible = True
+
+    @property
+    def geometry(self):
+        values = [0.0, 0.0, 0.0]
+        values[self._spec.axis] = self._spec.offset
+        return Plane(Point3D(*values), self._spec.normal)
+
+
+class ConstructionPlaneInput(FusionBase):
+    def __init__(self):
+        self._spec = None
+
+    @recorded
+    def setByOffset(self, planarEntity, offset):
+        self._spec = _planeSpecOf(planarEntity).offsetBy(_valueOf(offset))
+        return True
+
+    @recorded
+    def setByPlane(self, plane):
+        self._spec = PlaneSpec(2, plane.origin.z, 1)
+        return True
+
+
+class ConstructionPlanes(FusionBase):
+    def __init__(self, component: "Component"):
+        self._component = component
+        self._planes = []
+
+    @recorded
+    def createInput(self, occurrenceForCreation=None):
+        return ConstructionPlaneInput()
+
+    @recorded
+    def add(self, input: ConstructionPlaneInput):
+        recorder.constructionPlanes += 1
+        plane = ConstructionPlane(input._spec)
+        self._planes.append(plane)
+        plane.timelineObject = self._component._timeline()._append(plane)
+        return plane
+
+    @property
+    def count(self):
+        return len(self._planes)
+
+    def item(self, index):
+        return self._planes[index]
+
+    def __iter__(self):
+        return iter(self._planes)
+
+
+class ConstructionAxis(FusionBase):
+    def __init__(self, location: Point3D, direction: Vector3D, name: str = ""):
+        self._location = location
+        self._direction = direction
+        self.name = name
+        self.isLightBulbOn = True
+        self.isVisible = True
+
+
+class ConstructionAxisInput(FusionBase):
+    def __init__(self):
+        self._location = Point3D(0, 0, 0)
+        self._direction = Vector3D(0, 0, 1)
+
+    @recorded
+    def setByTwoPlanes(self, planarEntityOne, planarEntityTwo):
+        spec1 = _planeSpecOf(planarEntityOne)
+        spec2 = _planeSpecOf(planarEntityTwo)
+        location = [0.0, 0.0, 0.0]
+        location[spec1.axis] = spec1.offset
+        location[spec2.axis] = spec2.offset
+        direction = [0.0, 0.0, 0.0]
+        direction[3 - spec1.axis - spec2.axis] = 1.0
+        self._location = Point3D(*location)
+        self._direction = Vector3D(*direction)
+        return True
+
+    @recorded
+    def setByNormalToFaceAtPoint(self, face, pointEntity):
+        if isinstance(pointEntity, SketchPoint):
+            self._location = pointEntity.worldGeometry
+        else:
+            self._location = pointEntity.copy()
+        self._direction = _planeSpecOf(face).normal
+        return True
+
+    @recorded
+    def setByLine(self, line):
+        self._location = line._location.copy()
+        self._direction = line._direction.copy()
+        return True
+
+
+class ConstructionAxes(FusionBase):
+    def __init__(self, component: "Component"):
+        self._component = component
+        self._axes = []
+
+    @recorded
+    def createInput(self, occurrenceForCreation=None):
+        return ConstructionAxisInput()
+
+    @recorded
+    def add(self, input: ConstructionAxisInput):
+        recorder.constructionAxes += 1
+        axis = ConstructionAxis(input._location, input._direction)
+        self._axes.append(axis)
+        axis.timelineObject = self._component._timeline()._append(axis)
+        return axis
+
+    @property
+    def count(self):
+        return len(self._axes)
+
+    def item(self, index):
+        return self._axes[index]
+
+    def __iter__(self):
+        return iter(self._axes)
+
+
+class ConstructionPoint(FusionBase):
+    def __init__(self, geometry: Point3D):
+        self.geometry = geometry
+
+
+# features
+
+
+class Feature(FusionBase):
+    def __init__(self, component: "Component", bodies=()):
+        self.parentComponent = component
+        self.name = type(self).__name__
+        self._bodies = list(bodies)
+        self.isSuppressed = False
+        self.healthState = 0
+
+    @property
+    def bodies(self):
+        return BRepBodies(self.parentComponent, self._bodies)
+
+    @property
+    def faces(self):
+        return BRepFaces([face for body in self._bodies for face in body.faces])
+
+    def deleteMe(self):
+        self.parentComponent.features._remove(self)
+        return True
+
+    def _positionSpec(self):
+        return None
+
+
+class ExtrudeFeature(Feature):
+    def __init__(self, component, bodies, endSpec: PlaneSpec, startSpec: PlaneSpec):
+        super().__init__(component, bodies)
+        self._endSpec = endSpec
+        self._startSpec = startSpec
+
+    def _facesAt(self, spec: PlaneSpec):
+        return BRepFaces(
+            [
+                face
+                for body in self._bodies
+                for face in body.faces
+                if face._spec.axis == spec.axis
+                and face._spec.sign == spec.sign
+                and abs(face._spec.offset - spec.offset) < 1e-6
+            ]
+        )
+
+    @property
+    def endFaces(self):
+        return self._facesAt(self._endSpec)
+
+    @property
+    def startFaces(self):
+        return self._facesAt(self._startSpec)
+
+    @property
+    def sideFaces(self):
+        return BRepFaces(
+            [
+                face
+                for body in self._bodies
+                for face in body.faces
+                if face._spec.axis != self._endSpec.axis
+            ]
+        )
+
+
+class FeatureInput(FusionBase):
+    pass
+
+
+class DistanceExtentDefinition(FusionBase):
+    def __init__(self, distance):
+        self.distance = distance
+
+    @staticmethod
+    def create(distance):
+        recorder.call("DistanceExtentDefinition.create")
+        return DistanceExtentDefinition(distance)
+
+
+class OffsetStartDefinition(FusionBase):
+    def __init__(self, offset):
+        self.offset = offset
+
+    @staticmethod
+    def create(offset):
+        recorder.call("OffsetStartDefinition.create")
+        return OffsetStartDefinition(offset)
+
+
+class ExtrudeFeatureInput(FeatureInput):
+    def __init__(self, profile, operation):
+        self.profile = profile
+        self.operation = operation
+        self.participantBodies = []
+        self.startExtent = None
+        self.taperAngleOne = None
+        self.isSolid = True
+        self._extents = None
+
+    @recorded
+    def setOneSideExtent(self, extent, direction, taperAngle=None):
+        sign = -1 if direction == ExtentDirections.NegativeExtentDirection else 1
+        distance = _valueOf(extent.distance)
+        if direction == ExtentDirections.SymmetricExtentDirection:
+            self._extents = (-distance / 2, distance / 2)
+        else:
+            self._extents = (0.0, sign * distance)
+        self.taperAngleOne = taperAngle
+        return True
+
+    @recorded
+    def setTwoSidesExtent(
+        self,
+        sideOneExtent,
+        sideTwoExtent,
+        sideOneTaperAngle=None,
+        sideTwoTaperAngle=None,
+    ):
+        self._extents = (
+            -_valueOf(sideTwoExtent.distance),
+            _valueOf(sideOneExtent.distance),
+        )
+        return True
+
+    @recorded
+    def setSymmetricExtent(self, distance, isFullLength, taperAngle=None):
+        distance = _valueOf(distance)
+        self._extents = (
+            (-distance / 2, distance / 2) if isFullLength else (-distance, distance)
+        )
+        return True
+
+    @recorded
+    def setDistanceExtent(self, isSymmetric, distance):
+        distance = _valueOf(distance)
+        self._extents = (-distance, distance) if isSymmetric else (0.0, distance)
+        return True
+
+
+def _profileRegions(profile):
+    """Returns (spec, box) pairs of a profile, face or collection of them."""
+    if isinstance(profile, (ObjectCollection, list, tuple)):
+        return [region for item in profile for region in _profileRegions(item)]
+    if isinstance(profile, Profile):
+        sketch = profile.parentSketch
+        corners = [
+            sketch.sketchToModelSpace(Point3D(x, y, 0)).asArray()
+            for x in (profile._box.minPoint.x, profile._box.maxPoint.x)
+            for y in (profile._box.minPoint.y, profile._box.maxPoint.y)
+        ]
+        return [(sketch._spec, _boxFromCorners(corners))]
+    if isinstance(profile, BRepFace):
+        return [(profile._spec, profile.boundingBox)]
+    raise TypeError(f"Stand-in can't extrude {type(profile).__name__}")
+
+
+def _extrudedBox(spec: PlaneSpec, box: BoundingBox3D, start: float, end: float):
+    low = box.minPoint.asArray()
+    high = box.maxPoint.asArray()
+    values = [spec.offset + spec.sign * start, spec.offset + spec.sign * end]
+    low[spec.axis] = min(values)
+    high[spec.axis] = max(values)
+    return BoundingBox3D(Point3D(*low), Point3D(*high))
+
+
+def _mergeTouching(boxes):
+    groups = []
+    for box in boxes:
+        merged = [group for group in groups if any(_boxesTouch(box, b) for b in group)]
+        for group in merged:
+            groups.remove(group)
+        groups.append([box] + [b for group in merged for b in group])
+    return [_unionBoxes(group) for group in groups]
+
+
+class FeatureCollection(FusionBase):
+    featureType = Feature
+
+    def __init__(self, component: "Component"):
+        self._component = component
+        self._features = []
+
+    def _register(self, feature: Feature):
+        recorder.feature(type(feature).__name__)
+        self._features.append(feature)
+        feature.timelineObject = self._component._timeline()._append(feature)
+        return feature
+
+    @property
+    def count(self):
+        return len(self._features)
+
+    def item(self, index):
+        return self._features[index]
+
+    def itemByName(self, name):
+        for feature in self._features:
+            if feature.name == name:
+                return feature
+        return None
+
+    def __iter__(self):
+        return iter(self._features)
+
+
+class ExtrudeFeatures(FeatureCollection):
+    @recorded
+    def createInput(self, profile, operation):
+        return ExtrudeFeatureInput(profile, operation)
+
+    @recorded
+    def addSimple(self, profile, distance, operation):
+        input = ExtrudeFeatureInput(profile, operation)
+        input._extents = (0.0, _valueOf(distance))
+        return self._build(input)
+
+    @recorded
+    def add(self, input: ExtrudeFeatureInput):
+        return self._build(input)
+
+    def _build(self, input: ExtrudeFeatureInput):
+        start, end = input._extents
+        if input.startExtent is not None:
+            offset = _valueOf(input.startExtent.offset)
+            start, end = start + offset, end + offset
+        regions = _profileRegions(input.profile)
+        spec = regions[0][0]
+        boxes = [_extrudedBox(s, box, start, end) for s, box in regions]
+        direction = 1 if end >= start else -1
+        endSpec = PlaneSpec(
+            spec.axis, spec.offset + spec.sign * end, spec.sign * direction
+        )
+        startSpec = PlaneSpec(
+            spec.axis, spec.offset + spec.sign * start, -spec.sign * direction
+        )
+        component = self._component
+        operation = input.operation
+        participants = list(input.participantBodies or [])
+        if operation == FeatureOperations.NewBodyFeatureOperation:
+            bodies = [component._newBody(box) for box in _mergeTouching(boxes)]
+        else:
+            if not participants:
+                toolBox = _unionBoxes(boxes)
+                participants = [
+                    body
+                    for body in component.bRepBodies
+                    if _boxesTouch(body._box, toolBox)
+                ]
+            for body in participants:
+                if operation == FeatureOperations.JoinFeatureOperation:
+                    body._modified(_unionBoxes([body._box] + boxes))
+                elif operation == FeatureOperations.IntersectFeatureOperation:
+                    body._modified(_intersectBoxes(body._box, _unionBoxes(boxes)))
+                else:
+                    body._modified()
+            bodies = participants
+        return self._register(ExtrudeFeature(component, bodies, endSpec, startSpec))
+
+
+class FilletEdgeSetInputs(FusionBase):
+    def __init__(self):
+        self._edgeSets = []
+
+    @recorded
+    def addConstantRadiusEdgeSet(self, edges, radius, isTangentChain):
+        self._edgeSets.append((edges, radius, isTangentChain))
+        return True
+
+    @property
+    def count(self):
+        return len(self._edgeSets)
+
+
+class FilletFeatureInput(FeatureInput):
+    def __init__(self):
+        self.edgeSetInputs = FilletEdgeSetInputs()
+        self.isRollingBallCorner = True
+        self.isTangentChain = True
+
+    @recorded
+    def addConstantRadiusEdgeSet(self, edges, radius, isTangentChain):
+        return self.edgeSetInputs.addConstantRadiusEdgeSet(
+            edges, radius, isTangentChain
+        )
+
+
+class FilletFeature(Feature):
+    pass
+
+
+class FilletFeatures(FeatureCollection):
+    @recorded
+    def createInput(self):
+        return FilletFeatureInput()
+
+    @recorded
+    def add(self, input: FilletFeatureInput):
+        if input.edgeSetInputs.count == 0:
+            raise RuntimeError("Fillet feature requires at least one edge set")
+        for edges, _, _ in input.edgeSetInputs._edgeSets:
+            if len(list(edges)) == 0:
+                raise RuntimeError("Fillet edge set is empty")
+        bodies = []
+        for edges, _, _ in input.edgeSetInputs._edgeSets:
+            for edge in edges:
+                if edge.body not in bodies:
+                    bodies.append(edge.body)
+        for body in bodies:
+            body._modified(body._box)
+        return self._register(FilletFeature(self._component, bodies))
+
+
+class ChamferEdgeSets(FusionBase):
+    def __init__(self):
+        self._edgeSets = []
+
+    @recorded
+    def addEqualDistanceChamferEdgeSet(self, edges, distance, isTangentChain):
+        self._edgeSets.append((edges, distance, isTangentChain))
+        return True
+
+    @recorded
+    def addTwoDistancesChamferEdgeSet(
+        self, edges, distanceOne, distanceTwo, isFlipped, isTangentChain
+    ):
+        self._edgeSets.append((edges, distanceOne, isTangentChain))
+        return True
+
+    @property
+    def count(self):
+        return len(self._edgeSets)
+
+
+class ChamferFeatureInput(FeatureInput):
+    def __init__(self):
+        self.chamferEdgeSets = ChamferEdgeSets()
+
+
+class ChamferFeature(Feature):
+    pass
+
+
+class ChamferFeatures(FeatureCollection):
+    @recorded
+    def createInput2(self):
+        return ChamferFeatureInput()
+
+    @recorded
+    def add(self, input: ChamferFeatureInput):
+        if input.chamferEdgeSets.count == 0:
+            raise RuntimeError("Chamfer feature requires at least one edge set")
+        bodies = []
+        for edges, _, _ in input.chamferEdgeSets._edgeSets:
+            if len(list(edges)) == 0:
+                raise RuntimeError("Chamfer edge set is empty")
+            for edge in edges:
+                if edge.body not in bodies:
+                    bodies.append(edge.body)
+        for body in bodies:
+            body._modified(body._box)
+        return self._register(ChamferFeature(self._component, bodies))
+
+
+class CombineFeatureInput(FeatureInput):
+    def __init__(self, targetBody, toolBodies):
+        self.targetBody = targetBody
+        self.toolBodies = toolBodies
+        self.operation = FeatureOperations.JoinFeatureOperation
+        self.isKeepToolBodies = False
+        self.isNewComponent = False
+
+
+class CombineFeature(Feature):
+    pass
+
+
+class CombineFeatures(FeatureCollection):
+    @recorded
+    def createInput(self, targetBody, toolBodies):
+        return CombineFeatureInput(targetBody, toolBodies)
+
+    @recorded
+    def add(self, input: CombineFeatureInput):
+        target: BRepBody = input.targetBody
+        tools = list(input.toolBodies)
+        if len(tools) == 0:
+            raise RuntimeError("Combine feature requires at least one tool body")
+        for body in [target] + tools:
+            if body._removed:
+                raise RuntimeError(
+                    f"Combine feature references removed body {body.name}"
+                )
+        recorder.booleanTools += len(tools)
+        if input.operation == FeatureOperations.JoinFeatureOperation:
+            target._modified(_unionBoxes([target._box] + [tool._box for tool in tools]))
+        elif input.operation == FeatureOperations.IntersectFeatureOperation:
+            box = target._box
+            for tool in tools:
+                box = _intersectBoxes(box, tool._box)
+            target._modified(box)
+        else:
+            target._modified()
+        bodies = [target]
+        if input.isKeepToolBodies:
+            bodies = bodies + tools
+        else:
+            for tool in tools:
+                tool._removed = True
+        return self._register(CombineFeature(self._component, bodies))
+
+
+class PatternFeature(Feature):
+    pass
+
+
+class RectangularPatternFeature(PatternFeature):
+    pass
+
+
+class CircularPatternFeature(PatternFeature):
+    pass
+
+
+class MirrorFeature(PatternFeature):
+    pass
+
+
+def _directionOf(entity):
+    if isinstance(entity, ConstructionAxis):
+        direction = entity._direction.copy()
+    elif isinstance(entity, BRepEdge):
+        direction = entity._start.asVector()
+        direction.subtract(entity._end.asVector())
+        direction.scaleBy(-1)
+    elif isinstance(entity, SketchLine):
+        start = entity.startSketchPoint.worldGeometry
+        end = entity.endSketchPoint.worldGeometry
+        direction = Vector3D(end.x - start.x, end.y - start.y, end.z - start.z)
+    else:
+        raise TypeError(f"Stand-in can't use {type(entity).__name__} as a direction")
+    direction.normalize()
+    return direction
+
+
+def _translatedBox(box: BoundingBox3D, vector: Vector3D):
+    low = box.minPoint.copy()
+    high = box.maxPoint.copy()
+    low.translateBy(vector)
+    high.translateBy(vector)
+    return BoundingBox3D(low, high)
+
+
+def _transformedBox(box: BoundingBox3D, matrix: core.Matrix3D):
+    return _boxFromCorners(
+        [list(matrix.transformPoint(*corner)) for corner in _boxCorners(box)]
+    )
+
+
+def _patternEntities(entities):
+    bodies = []
+    for entity in entities:
+        if isinstance(entity, BRepBody):
+            bodies.append(entity)
+        elif isinstance(entity, Feature):
+            bodies.extend(entity._bodies)
+        else:
+            raise TypeError(f"Stand-in can't pattern {type(entity).__name__}")
+    return bodies
+
+
+class RectangularPatternFeatureInput(FeatureInput):
+    def __init__(
+        self,
+        inputEntities,
+        directionOneEntity,
+        quantityOne,
+        distanceOne,
+        patternDistanceType,
+    ):
+        self.inputEntities = inputEntities
+        self.directionOneEntity = directionOneEntity
+        self.quantityOne = quantityOne
+        self.distanceOne = distanceOne
+        self.patternDistanceType = patternDistanceType
+        self.directionTwoEntity = None
+        self.quantityTwo = ValueInput.createByReal(1)
+        self.distanceTwo = ValueInput.createByReal(0)
+        self.isSymmetricInDirectionOne = False
+        self.isSymmetricInDirectionTwo = False
+
+    @recorded
+    def setDirectionTwo(self, directionTwoEntity, quantityTwo, distanceTwo):
+        self.directionTwoEntity = directionTwoEntity
+        self.quantityTwo = quantityTwo
+        self.distanceTwo = distanceTwo
+        return True
+
+
+class RectangularPatternFeatures(FeatureCollection):
+    @recorded
+    def createInput(
+        self,
+        inputEntities,
+        directionOneEntity,
+        quantityOne,
+        distanceOne,
+        patternDistanceType,
+    ):
+        return RectangularPatternFeatureInput(
+            inputEntities,
+            directionOneEntity,
+            quantityOne,
+            distanceOne,
+            patternDistanceType,
+        )
+
+    @recorded
+    def add(self, input: RectangularPatternFeatureInput):
+        quantityOne = int(round(_valueOf(input.quantityOne)))
+        quantityTwo = int(round(_valueOf(input.quantityTwo)))
+        if quantityOne < 1 or quantityTwo < 1:
+            raise RuntimeError("Pattern quantity must be at least 1")
+        directionOne = _directionOf(input.directionOneEntity)
+        directionTwo = (
+            _directionOf(input.directionTwoEntity)
+            if input.directionTwoEntity is not None
+            else Vector3D(0, 0, 0)
+        )
+        distanceOne = _valueOf(input.distanceOne)
+        distanceTwo = _valueOf(input.distanceTwo)
+        if input.patternDistanceType == PatternDistanceType.ExtentPatternDistanceType:
+            distanceOne = distanceOne / max(1, quantityOne - 1)
+            distanceTwo = distanceTwo / max(1, quantityTwo - 1)
+        bodies = []
+        for body in _patternEntities(input.inputEntities):
+            for i in range(quantityOne):
+                for j in range(quantityTwo):
+                    if i == 0 and j == 0:
+                        continue
+                    vector = Vector3D(
+                        directionOne.x * distanceOne * i
+                        + directionTwo.x * distanceTwo * j,
+                        directionOne.y * distanceOne * i
+                        + directionTwo.y * distanceTwo * j,
+                        directionOne.z * distanceOne * i
+                        + directionTwo.z * distanceTwo * j,
+                    )
+                    bodies.append(
+                        self._component._newBody(_translatedBox(body._box, vector))
+                    )
+        return self._register(RectangularPatternFeature(self._component, bodies))
+
+
+class CircularPatternFeatureInput(FeatureInput):
+    def __init__(self, inputEntities, axis):
+        self.inputEntities = inputEntities
+        self.axis = axis
+        self.quantity = ValueInput.createByReal(3)
+        self.totalAngle = ValueInput.createByString("360 deg")
+        self.isSymmetric = False
+
+
+class CircularPatternFeatures(FeatureCollection):
+    @recorded
+    def createInput(self, inputEntities, axis):
+        return CircularPatternFeatureInput(inputEntities, axis)
+
+    @recorded
+    def add(self, input: CircularPatternFeatureInput):
+        quantity = int(round(_valueOf(input.quantity)))
+        axis = input.axis
+        bodies = []
+        for body in _patternEntities(input.inputEntities):
+            for i in range(1, quantity):
+                rotation = core.Matrix3D.create()
+                rotation.setToRotation(
+                    math.radians(360 / quantity * i), axis._direction, axis._location
+                )
+                bodies.append(
+                    self._component._newBody(_transformedBox(body._box, rotation))
+                )
+        return self._register(CircularPatternFeature(self._component, bodies))
+
+
+class MirrorFeatureInput(FeatureInput):
+    def __init__(self, inputEntities, mirrorPlane):
+        self.inputEntities = inputEntities
+        self.mirrorPlane = mirrorPlane
+        self.isCombine = False
+
+
+class MirrorFeatures(FeatureCollection):
+    @recorded
+    def createInput(self, inputEntities, mirrorPlane):
+        return MirrorFeatureInput(inputEntities, mirrorPlane)
+
+    @recorded
+    def add(self, input: MirrorFeatureInput):
+        spec = _planeSpecOf(input.mirrorPlane)
+        bodies = []
+        for body in _patternEntities(input.inputEntities):
+            low = body._box.minPoint.asArray()
+            high = body._box.maxPoint.asArray()
+            low[spec.axis], high[spec.axis] = (
+                2 * spec.offset - high[spec.axis],
+                2 * spec.offset - low[spec.axis],
+            )
+            bodies.append(
+                self._component._newBody(BoundingBox3D(Point3D(*low), Point3D(*high)))
+            )
+        return self._register(MirrorFeature(self._component, bodies))
+
+
+class MoveFeatureInput(FeatureInput):
+    def __init__(self, inputEntities):
+        self.inputEntities = inputEntities
+        self._transform = core.Matrix3D.create()
+
+    @recorded
+    def defineAsFreeMove(self, transform):
+        self._transform = transform
+        return True
+
+    @recorded
+    def defineAsTranslateXYZ(self, xDistance, yDistance, zDistance, isDesignSpace):
+        self._transform = core.Matrix3D.create()
+        self._transform.translation = Vector3D(
+            _valueOf(xDistance), _valueOf(yDistance), _valueOf(zDistance)
+        )
+        return True
+
+
+class MoveFeature(Feature):
+    pass
+
+
+class MoveFeatures(FeatureCollection):
+    @recorded
+    def createInput2(self, inputEntities):
+        return MoveFeatureInput(inputEntities)
+
+    @recorded
+    def createInput(self, inputEntities, transform):
+        input = MoveFeatureInput(inputEntities)
+        input._transform = transform
+        return input
+
+    @recorded
+    def add(self, input: MoveFeatureInput):
+        bodies = _patternEntities(input.inputEntities)
+        for body in bodies:
+            body._modified(_transformedBox(body._box, input._transform))
+        return self._register(MoveFeature(self._component, bodies))
+
+
+class CopyPasteBody(Feature):
+    pass
+
+
+class CopyPasteBodies(FeatureCollection):
+    @recorded
+    def add(self, sourceBodies):
+        if isinstance(sourceBodies, BRepBody):
+            sourceBodies = [sourceBodies]
+        bodies = [
+            self._component._newBody(body._box.copy(), f"{body.name} (1)")
+            for body in sourceBodies
+        ]
+        return self._register(CopyPasteBody(self._component, bodies))
+
+
+class SplitBodyFeatureInput(FeatureInput):
+    def __init__(self, splitBodies, splittingTool, isSplittingToolExtended):
+        self.splitBodies = splitBodies
+        self.splittingTool = splittingTool
+        self.isSplittingToolExtended = isSplittingToolExtended
+
+
+class SplitBodyFeature(Feature):
+    pass
+
+
+class SplitBodyFeatures(FeatureCollection):
+    @recorded
+    def createInput(self, splitBodies, splittingTool, isSplittingToolExtended):
+        return SplitBodyFeatureInput(
+            splitBodies, splittingTool, isSplittingToolExtended
+        )
+
+    @recorded
+    def add(self, input: SplitBodyFeatureInput):
+        spec = _planeSpecOf(input.splittingTool)
+        splitBodies = input.splitBodies
+        if isinstance(splitBodies, BRepBody):
+            splitBodies = [splitBodies]
+        bodies = []
+        for body in _patternEntities(splitBodies):
+            low = body._box.minPoint.asArray()
+            high = body._box.maxPoint.asArray()
+            bodies.append(body)
+            if not low[spec.axis] < spec.offset < high[spec.axis]:
+                continue
+            upperLow = list(low)
+            upperLow[spec.axis] = spec.offset
+            high[spec.axis] = spec.offset
+            bodies.append(
+                self._component._newBody(
+                    BoundingBox3D(Point3D(*upperLow), body._box.maxPoint.copy()),
+                    body.name,
+                )
+            )
+            body._modified(BoundingBox3D(body._box.minPoint.copy(), Point3D(*high)))
+        return self._register(SplitBodyFeature(self._component, bodies))
+
+
+class RemoveFeature(Feature):
+    pass
+
+
+class RemoveFeatures(FeatureCollection):
+    @recorded
+    def add(self, itemToRemove):
+        itemToRemove._removed = True
+        return self._register(RemoveFeature(self._component, []))
+
+
+class ShellFeatureInput(FeatureInput):
+    def __init__(self, inputEntities, isTangentChain):
+        self.inputEntities = inputEntities
+        self.isTangentChain = isTangentChain
+        self.insideThickness = None
+        self.outsideThickness = None
+        self.shellType = ShellTypes.SharpOffsetShellType
+
+
+class ShellFeature(Feature):
+    pass
+
+
+class ShellFeatures(FeatureCollection):
+    @recorded
+    def createInput(self, inputEntities, isTangentChain=True):
+        return ShellFeatureInput(inputEntities, isTangentChain)
+
+    @recorded
+    def add(self, input: ShellFeatureInput):
+        bodies = []
+        for entity in input.inputEntities:
+            body = entity.body if isinstance(entity, BRepFace) else entity
+            if body not in bodies:
+                bodies.append(body)
+                body._modified()
+        return self._register(ShellFeature(self._component, bodies))
+
+
+class BaseFeature(Feature):
+    def __init__(self, component):
+        super().__init__(component, [])
+        self.isEditing = False
+
+    @recorded
+    def startEdit(self):
+        self.isEditing = True
+        return True
+
+    @recorded
+    def finishEdit(self):
+        self.isEditing = False
+        return True
+
+
+class BaseFeatures(FeatureCollection):
+    @recorded
+    def add(self):
+        return self._register(BaseFeature(self._component))
+
+
+class GenericFeatureCollection(FeatureCollection):
+    @recorded
+    def createInput(self, *args, **kwargs):
+        raise NotImplementedError(
+            f"{type(self).__name__} is not implemented by the adsk stand-in"
+        )
+
+
+class Features(FusionBase):
+    def __init__(self, component: "Component"):
+        self._component = component
+        self.extrudeFeatures = ExtrudeFeatures(component)
+        self.filletFeatures = FilletFeatures(component)
+        self.chamferFeatures = ChamferFeatures(component)
+        self.combineFeatures = CombineFeatures(component)
+        self.rectangularPatternFeatures = RectangularPatternFeatures(component)
+        self.circularPatternFeatures = CircularPatternFeatures(component)
+        self.mirrorFeatures = MirrorFeatures(component)
+        self.moveFeatures = MoveFeatures(component)
+        self.copyPasteBodies = CopyPasteBodies(component)
+        self.removeFeatures = RemoveFeatures(component)
+        self.splitBodyFeatures = SplitBodyFeatures(component)
+        self.shellFeatures = ShellFeatures(component)
+        self.baseFeatures = BaseFeatures(component)
+        self.offsetFeatures = GenericFeatureCollection(component)
+        self.extendFeatures = GenericFeatureCollection(component)
+        self.thickenFeatures = GenericFeatureCollection(component)
+
+    def _collections(self):
+        return [
+            value
+            for value in vars(self).values()
+            if isinstance(value, FeatureCollection)
+        ]
+
+    def _remove(self, feature):
+        for collection in self._collections():
+            if feature in collection._features:
+                collection._features.remove(feature)
+
+    @property
+    def count(self):
+        return sum(collection.count for collection in self._collections())
+
+    def item(self, index):
+        return list(self)[index]
+
+    def __iter__(self):
+        return iter(
+            [feature for collection in self._collections() for feature in collection]
+        )
+
+
+# temporary b-rep
+
+
+class TemporaryBRepManager(FusionBase):
+    _instance = None
+
+    @staticmethod
+    def get():
+        if TemporaryBRepManager._instance is None:
+            TemporaryBRepManager._instance = TemporaryBRepManager()
+        return TemporaryBRepManager._instance
+
+    @recorded
+    def createCylinderOrCone(self, pointOne, pointOneRadius, pointTwo, pointTwoRadius):
+        radius = max(pointOneRadius, pointTwoRadius)
+        corners = []
+        for point in (pointOne, pointTwo):
+            for offset in (-radius, radius):
+                corners.append([point.x + offset, point.y + offset, point.z + offset])
+        body = BRepBody(None, _boxFromCorners(corners), "Temporary body")
+        body.isTemporary = True
+        return body
+
+    @recorded
+    def createBox(self, box):
+        body = BRepBody(None, box.copy(), "Temporary body")
+        body.isTemporary = True
+        return body
+
+    @recorded
+    def copy(self, body):
+        result = BRepBody(None, body._box.copy(), body.name)
+        result.isTemporary = True
+        return result
+
+    @recorded
+    def booleanOperation(self, targetBody, toolBody, booleanType):
+        if booleanType == BooleanTypes.UnionBooleanType:
+            targetBody._modified(_unionBoxes([targetBody._box, toolBody._box]))
+        elif booleanType == BooleanTypes.IntersectionBooleanType:
+            targetBody._modified(_intersectBoxes(targetBody._box, toolBody._box))
+        else:
+            targetBody._modified()
+        return True
+
+
+# parameters and attributes
+
+
+class ModelParameter(FusionBase):
+    def __init__(self, name: str, expression: str, unit: str = "cm", comment: str = ""):
+        self.name = name
+        self.expression = expression
+        self.unit = unit
+        self.comment = comment
+
+    @property
+    def value(self):
+        try:
+            return float(str(self.expression).split(" ")[0])
+        except ValueError:
+            return 0.0
+
+
+class UserParameter(ModelParameter):
+    def deleteMe(self):
+        return True
+
+
+class ParameterList(FusionBase):
+    def __init__(self):
+        self._parameters = []
+
+    @property
+    def count(self):
+        return len(self._parameters)
+
+    def item(self, index):
+        return self._parameters[index]
+
+    def itemByName(self, name):
+        for parameter in self._parameters:
+            if parameter.name == name:
+                return parameter
+        return None
+
+    def __iter__(self):
+        return iter(self._parameters)
+
+
+class UserParameters(ParameterList):
+    @recorded
+    def add(self, name, value, units, comment):
+        parameter = UserParameter(name, value.stringValue, units, comment)
+        self._parameters.append(parameter)
+        return parameter
+
+
+class ModelParameters(ParameterList):
+    pass
+
+
+class Attribute(FusionBase):
+    def __init__(self, groupName, name, value):
+        self.groupName = groupName
+        self.name = name
+        self.value = value
+
+    def deleteMe(self):
+        return True
+
+
+class Attributes(FusionBase):
+    def __init__(self):
+        self._attributes = {}
+
+    @recorded
+    def add(self, groupName, name, value):
+        attribute = Attribute(groupName, name, value)
+        self._attributes[(groupName, name)] = attribute
+        return attribute
+
+    def itemByName(self, groupName, name):
+        return self._attributes.get((groupName, name))
+
+    @property
+    def count(self):
+        return len(self._attributes)
+
+    def item(self, index):
+        return list(self._attributes.values())[index]
+
+    def __iter__(self):
+        return iter(list(self._attributes.values()))
+
+
+# components and design
+
+
+class Occurrence(FusionBase):
+    def __init__(self, component: "Component", transform):
+        self.component = component
+        self.transform = transform
+        self.isLightBulbOn = True
+        self.attributes = Attributes()
+
+    @property
+    def name(self):
+        return f"{self.component.name}:1"
+
+    def activate(self):
+        return True
+
+    def deleteMe(self):
+        return True
+
+
+class Occurrences(FusionBase):
+    def __init__(self, component: "Component"):
+        self._component = component
+        self._occurrences = []
+
+    @recorded
+    def addNewComponent(self, transform):
+        component = Component(self._component._design)
+        occurrence = Occurrence(component, transform)
+        self._occurrences.append(occurrence)
+        occurrence.timelineObject = self._component._timeline()._append(occurrence)
+        return occurrence
+
+    @recorded
+    def addNewComponentCopy(self, sourceComponent, transform):
+        component = Component(self._component._design)
+        component.name = sourceComponent.name
+        for body in sourceComponent.bRepBodies:
+            component._newBody(body._box.copy(), body.name)
+        occurrence = Occurrence(component, transform)
+        self._occurrences.append(occurrence)
+        occurrence.timelineObject = self._component._timeline()._append(occurrence)
+        return occurrence
+
+    @property
+    def count(self):
+        return len(self._occurrences)
+
+    def item(self, index):
+        return self._occurrences[index]
+
+    def __iter__(self):
+        return iter(self._occurrences)
+
+
+class Component(FusionBase):
+    def __init__(self, design: "Design"):
+        self._design = design
+        self.name = "Component"
+        self.features = Features(self)
+        self.sketches = Sketches(self)
+        self.constructionPlanes = ConstructionPlanes(self)
+        self.constructionAxes = ConstructionAxes(self)
+        self.bRepBodies = BRepBodies(self)
+        self.occurrences = Occurrences(self)
+        self.attributes = Attributes()
+        self.modelParameters = ModelParameters()
+        self.xYConstructionPlane = ConstructionPlane(PlaneSpec(2, 0.0), "XY")
+        self.xZConstructionPlane = ConstructionPlane(PlaneSpec(1, 0.0), "XZ")
+        self.yZConstructionPlane = ConstructionPlane(PlaneSpec(0, 0.0), "YZ")
+        self.xConstructionAxis = ConstructionAxis(
+            Point3D(0, 0, 0), Vector3D(1, 0, 0), "X"
+        )
+        self.yConstructionAxis = ConstructionAxis(
+            Point3D(0, 0, 0), Vector3D(0, 1, 0), "Y"
+        )
+        self.zConstructionAxis = ConstructionAxis(
+            Point3D(0, 0, 0), Vector3D(0, 0, 1), "Z"
+        )
+        self.originConstructionPoint = ConstructionPoint(Point3D(0, 0, 0))
+
+    def _timeline(self):
+        return self._design.timeline
+
+    def _newBody(self, box: BoundingBox3D, name: str = ""):
+        body = BRepBody(self, box, name)
+        self.bRepBodies._bodies.append(body)
+        return body
+
+    @property
+    def parentDesign(self):
+        return self._design
+
+
+class ExportOptions(FusionBase):
+    def __init__(self, filename, geometry):
+        self.filename = filename
+        self.geometry = geometry
+
+
+class ExportManager(FusionBase):
+    @recorded
+    def createFusionArchiveExportOptions(self, filename, geometry=None):
+        return ExportOptions(filename, geometry)
+
+    @recorded
+    def execute(self, exportOptions):
+        with open(exportOptions.filename, "w") as exportFile:
+            exportFile.write(getattr(exportOptions.geometry, "name", "design"))
+        return True
+
+
+class Design(FusionBase):
+    def __init__(self):
+        self.designType = DesignTypes.ParametricDesignType
+        self.timeline = Timeline()
+        self.exportManager = ExportManager()
+        self.userParameters = UserParameters()
+        self.attributes = Attributes()
+        self.rootComponent = Component(self)
+        self.rootComponent.name = "Root"
+
+    @property
+    def allComponents(self):
+        components = [self.rootComponent]
+        for occurrence in self.rootComponent.occurrences:
+            components.append(occurrence.component)
+        return components
+
+    @property
+    def activeComponent(self):
+        return self.rootComponent
+
+
+class BRepFaceList(BRepFaces):
+    pass
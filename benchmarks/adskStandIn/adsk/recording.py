@@ -0,0 +1,54 @@
+"""Operation recorder of the adsk stand-in.
+
+Not part of the real Fusion API. Every stand-in method that would cross the
+process boundary in Fusion is counted here, so generator runs can be compared
+by the work they request from Fusion rather than by Python time.
+"""
+
+import collections
+import functools
+
+
+class Recorder:
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.calls = collections.Counter()
+        self.features = collections.Counter()
+        self.sketches = 0
+        self.constructionPlanes = 0
+        self.constructionAxes = 0
+        self.booleanTools = 0
+        self.sketchConstraints = 0
+        self.sketchDimensions = 0
+
+    def call(self, name: str):
+        self.calls[name] += 1
+
+    def feature(self, featureType: str):
+        self.features[featureType] += 1
+
+    def summary(self):
+        return {
+            "calls": sum(self.calls.values()),
+            "features": sum(self.features.values()),
+            "sketches": self.sketches,
+            "constructionPlanes": self.constructionPlanes,
+            "constructionAxes": self.constructionAxes,
+            "booleanTools": self.booleanTools,
+            "sketchConstraints": self.sketchConstraints,
+            "sketchDimensions": self.sketchDimensions,
+        }
+
+
+recorder = Recorder()
+
+
+def recorded(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        recorder.call(f"{type(self).__name__}.{method.__name__}")
+        return method(self, *args, **kwargs)
+
+    return wrapper
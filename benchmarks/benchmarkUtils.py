@@ -0,0 +1,219 @@
+"""Helpers to run the add-in generators outside of Fusion.
+
+The generators are loaded against the adsk stand-in from `adskStandIn`, which
+records every call that would go to Fusion. Timings measured here only cover
+the Python side of the add-in, counts of features, sketches and calls are the
+numbers to compare between runs.
+"""
+
+import os
+import sys
+import time
+import types
+import importlib
+
+BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+ADDIN_DIR = os.path.dirname(BENCHMARKS_DIR)
+ADSK_STAND_IN_DIR = os.path.join(BENCHMARKS_DIR, "adskStandIn")
+ADDIN_PACKAGE_NAME = "gridfinityAddin"
+
+
+def loadAddin():
+    """Makes the add-in folder importable as `gridfinityAddin` package."""
+    if ADDIN_PACKAGE_NAME in sys.modules:
+        return sys.modules[ADDIN_PACKAGE_NAME]
+    installedAdsk = sys.modules.get("adsk")
+    if installedAdsk is not None and not getattr(
+        installedAdsk, "__file__", ""
+    ).startswith(ADSK_STAND_IN_DIR):
+        raise RuntimeError(
+            "Real adsk module is loaded, benchmarks must run outside of Fusion"
+        )
+    if ADSK_STAND_IN_DIR not in sys.path:
+        sys.path.insert(0, ADSK_STAND_IN_DIR)
+    package = types.ModuleType(ADDIN_PACKAGE_NAME)
+    package.__path__ = [ADDIN_DIR]
+    sys.modules[ADDIN_PACKAGE_NAME] = package
+    return package
+
+
+def importAddinModule(name: str):
+    loadAddin()
+    return importlib.import_module(f"{ADDIN_PACKAGE_NAME}.{name}")
+
+
+def recorder():
+    loadAddin()
+    from adsk.recording import recorder
+
+    return recorder
+
+
+def newComponent(name: str):
+    """Creates a fresh design with one component occurrence, as commands do."""
+    loadAddin()
+    import adsk.core, adsk.fusion
+
+    design = adsk.core.Application.get().newDesign()
+    occurrence = design.rootComponent.occurrences.addNewComponent(
+        adsk.core.Matrix3D.create()
+    )
+    occurrence.component.name = name
+    return occurrence.component
+
+
+def binInputs(
+    binWidth: int = 2,
+    binLength: int = 2,
+    binHeight: int = 5,
+    compartments: list = None,
+    compartmentsByX: int = 1,
+    compartmentsByY: int = 1,
+    binType: str = "hollow",
+    hasLip: bool = True,
+    hasLipNotches: bool = False,
+    hasScoop: bool = False,
+    hasTab: bool = False,
+    hasCompartmentsLip: bool = False,
+    hasScrewHoles: bool = False,
+    hasMagnetCutouts: bool = False,
+    hasMagnetCutoutsTabs: bool = False,
+):
+    """Builds generator inputs the same way the create bin command does."""
+    const = importAddinModule("lib.gridfinityUtils.const")
+    geometryUtils = importAddinModule("lib.gridfinityUtils.geometryUtils")
+    baseGeneratorInput = importAddinModule("lib.gridfinityUtils.baseGeneratorInput")
+    binBodyGeneratorInput = importAddinModule(
+        "lib.gridfinityUtils.binBodyGeneratorInput"
+    )
+    import adsk.core
+
+    isShelled = binType == "shelled"
+    isSolid = binType == "solid"
+    isHollow = binType == "hollow"
+    xyClearance = const.BIN_XY_CLEARANCE
+
+    baseInput = baseGeneratorInput.BaseGeneratorInput()
+    baseInput.originPoint = geometryUtils.createOffsetPoint(
+        adsk.core.Point3D.create(0, 0, 0), byX=-xyClearance, byY=-xyClearance
+    )
+    baseInput.baseWidth = const.DIMENSION_DEFAULT_WIDTH_UNIT
+    baseInput.baseLength = const.DIMENSION_DEFAULT_WIDTH_UNIT
+    baseInput.xyClearance = xyClearance
+    baseInput.hasScrewHoles = hasScrewHoles and not isShelled
+    baseInput.hasMagnetCutouts = hasMagnetCutouts and not isShelled
+    baseInput.hasMagnetCutoutsTabs = hasMagnetCutoutsTabs and not isShelled
+    baseInput.screwHolesDiameter = const.DIMENSION_SCREW_HOLE_DIAMETER
+    baseInput.magnetCutoutsDiameter = const.DIMENSION_MAGNET_CUTOUT_DIAMETER
+    baseInput.magnetCutoutsDepth = const.DIMENSION_MAGNET_CUTOUT_DEPTH
+
+    bodyInput = binBodyGeneratorInput.BinBodyGeneratorInput()
+    bodyInput.hasLip = hasLip
+    bodyInput.hasLipNotches = hasLipNotches
+    bodyInput.binWidth = binWidth
+    bodyInput.binLength = binLength
+    bodyInput.binHeight = binHeight
+    bodyInput.baseWidth = const.DIMENSION_DEFAULT_WIDTH_UNIT
+    bodyInput.baseLength = const.DIMENSION_DEFAULT_WIDTH_UNIT
+    bodyInput.heightUnit = const.DIMENSION_DEFAULT_HEIGHT_UNIT
+    bodyInput.xyClearance = xyClearance
+    bodyInput.binCornerFilletRadius = const.BIN_CORNER_FILLET_RADIUS - xyClearance
+    bodyInput.isSolid = isSolid
+    bodyInput.isShelled = isShelled
+    bodyInput.isHollow = isHollow
+    bodyInput.wallThickness = const.BIN_WALL_THICKNESS
+    bodyInput.hasScoop = hasScoop and isHollow
+    bodyInput.scoopMaxRadius = const.BIN_SCOOP_MAX_RADIUS
+    bodyInput.hasTab = hasTab and not isSolid
+    bodyInput.tabLength = 1
+    bodyInput.tabWidth = const.BIN_TAB_WIDTH
+    bodyInput.tabPosition = 0
+    bodyInput.tabOverhangAngle = const.BIN_TAB_OVERHANG_ANGLE
+    bodyInput.compartmentsByX = compartmentsByX
+    bodyInput.compartmentsByY = compartmentsByY
+    bodyInput.hasCompartmentsLip = hasCompartmentsLip and hasLip
+    if compartments is None:
+        compartments = [
+            binBodyGeneratorInput.BinBodyCompartmentDefinition(i, j, 1, 1, 0)
+            for i in range(compartmentsByX)
+            for j in range(compartmentsByY)
+        ]
+    bodyInput.compartments = compartments
+    return baseInput, bodyInput
+
+
+def generateBin(
+    baseInput, bodyInput, generateBase: bool = True, generateBody: bool = True
+):
+    """Runs the same generator sequence as the create bin command."""
+    baseGenerator = importAddinModule("lib.gridfinityUtils.baseGenerator")
+    binBodyGenerator = importAddinModule("lib.gridfinityUtils.binBodyGenerator")
+    component = newComponent("Benchmark bin")
+    baseBodies = None
+    if generateBase:
+        baseBodies = baseGenerator.createBaseBodyPattern(
+            baseInput, bodyInput.binWidth, bodyInput.binLength, component
+        )
+    if generateBody:
+        binBodyGenerator.createGridfinityBinBody(bodyInput, component, baseBodies)
+    if generateBase or generateBody:
+        baseGenerator.cutBaseClearance(
+            baseInput, bodyInput.binWidth, bodyInput.binLength, component
+        )
+    return component
+
+
+def baseplateInput(
+    plateWidth: int = 2,
+    plateLength: int = 2,
+    hasSkeletonizedBottom: bool = True,
+    hasMagnetCutouts: bool = False,
+    hasScrewHoles: bool = False,
+    hasConnectionHoles: bool = False,
+    hasPadding: bool = False,
+):
+    """Builds baseplate generator input the same way the baseplate command does."""
+    const = importAddinModule("lib.gridfinityUtils.const")
+    baseplateGeneratorInput = importAddinModule(
+        "lib.gridfinityUtils.baseplateGeneratorInput"
+    )
+    plateInput = baseplateGeneratorInput.BaseplateGeneratorInput()
+    plateInput.baseWidth = const.DIMENSION_DEFAULT_WIDTH_UNIT
+    plateInput.baseLength = const.DIMENSION_DEFAULT_WIDTH_UNIT
+    plateInput.xyClearance = const.BIN_XY_CLEARANCE
+    plateInput.baseplateWidth = plateWidth
+    plateInput.baseplateLength = plateLength
+    plateInput.hasExtendedBottom = (
+        hasSkeletonizedBottom or hasMagnetCutouts or hasScrewHoles
+    )
+    plateInput.hasSkeletonizedBottom = hasSkeletonizedBottom
+    plateInput.hasMagnetCutouts = hasMagnetCutouts
+    plateInput.hasScrewHoles = hasScrewHoles
+    plateInput.hasConnectionHoles = hasConnectionHoles
+    plateInput.hasPadding = hasPadding
+    padding = 0.5 if hasPadding else 0
+    plateInput.paddingLeft = padding
+    plateInput.paddingTop = padding
+    plateInput.paddingRight = padding
+    plateInput.paddingBottom = padding
+    return plateInput
+
+
+def generateBaseplate(plateInput):
+    baseplateGenerator = importAddinModule("lib.gridfinityUtils.baseplateGenerator")
+    component = newComponent("Benchmark baseplate")
+    baseplateGenerator.createGridfinityBaseplate(plateInput, component)
+    return component
+
+
+def measure(generate, *args, **kwargs):
+    """Runs `generate` with a clean recorder, returns recorded counts and time."""
+    callRecorder = recorder()
+    callRecorder.reset()
+    startTime = time.perf_counter()
+    generate(*args, **kwargs)
+    elapsed = time.perf_counter() - startTime
+    result = callRecorder.summary()
+    result["featuresByType"] = dict(callRecorder.features)
+    result["seconds"] = elapsed
+    return result
@@ -0,0 +1,114 @@
+"""Counts compartments the text layout merge produces for a few layouts.
+
+Usage: python benchmarks/compartmentMerge.py
+
+For every layout prints the number of cells, the number of compartment
+rectangles built for its regions, parse time, and generated bin feature counts
+of the merged compartments next to one compartment per cell.
+"""
+
+import random
+import time
+
+import benchmarkUtils
+
+LAYOUTS = {
+    "4x4 L shapes": "\n".join(["AAAB", "A..B", "A.BB", "CCCC"]),
+    "6x6 ring and center": "\n".join(
+        ["AAAAAA", "A....A", "A.BB.A", "A.BB.A", "A....A", "AAAAAA"]
+    ),
+    "8x8 blocks": "\n".join(
+        ["".join("ABCD"[x // 4 + y // 4 * 2] for x in range(8)) for y in range(8)]
+    ),
+}
+FINE_GRID_SIZE = 48
+# features are only generated for grids up to this size, the stand-in is slow
+# with thousands of compartments
+GENERATE_MAX_CELLS = 100
+
+
+def fineGridLayout(size: int, seed: int = 1):
+    random.seed(seed)
+    # blobs of a few labels, neighbours often share a label
+    rows = []
+    for y in range(size):
+        row = ""
+        for x in range(size):
+            if x > 0 and random.random() < 0.7:
+                row += row[-1]
+            elif y > 0 and random.random() < 0.7:
+                row += rows[-1][x]
+            else:
+                row += random.choice("ABCD")
+        rows.append(row)
+    return "\n".join(rows)
+
+
+def binFeatures(compartments, gridWidth, gridLength):
+    baseInput, bodyInput = benchmarkUtils.binInputs(
+        binWidth=4,
+        binLength=4,
+        compartments=compartments,
+        compartmentsByX=gridWidth,
+        compartmentsByY=gridLength,
+    )
+    result = benchmarkUtils.measure(
+        benchmarkUtils.generateBin, baseInput, bodyInput, True, True
+    )
+    return result["features"]
+
+
+def main():
+    compartmentLayout = benchmarkUtils.importAddinModule(
+        "lib.gridfinityUtils.compartmentLayout"
+    )
+    binBodyGeneratorInput = benchmarkUtils.importAddinModule(
+        "lib.gridfinityUtils.binBodyGeneratorInput"
+    )
+    layouts = dict(LAYOUTS)
+    layouts[f"{FINE_GRID_SIZE}x{FINE_GRID_SIZE} random blobs"] = fineGridLayout(
+        FINE_GRID_SIZE
+    )
+
+    print(
+        "{:<26} {:>7} {:>13} {:>9} {:>10} {:>15}".format(
+            "layout", "cells", "compartments", "parse ms", "features", "cell features"
+        )
+    )
+    for name, text in layouts.items():
+        startTime = time.perf_counter()
+        layout = compartmentLayout.parseLayout(text)
+        parseMs = (time.perf_counter() - startTime) * 1000
+        cells = [
+            (x, gridY)
+            for gridY, row in enumerate(reversed(text.split("\n")))
+            for x, cell in enumerate(row)
+            if cell != compartmentLayout.EMPTY_CELL
+        ]
+        features = perCellFeatures = "-"
+        if len(cells) <= GENERATE_MAX_CELLS:
+            features = binFeatures(
+                layout.compartments, layout.gridWidth, layout.gridLength
+            )
+            perCellFeatures = binFeatures(
+                [
+                    binBodyGeneratorInput.BinBodyCompartmentDefinition(x, y, 1, 1)
+                    for x, y in cells
+                ],
+                layout.gridWidth,
+                layout.gridLength,
+            )
+        print(
+            "{:<26} {:>7} {:>13} {:>9.1f} {:>10} {:>15}".format(
+                name,
+                len(cells),
+                len(layout.compartments),
+                parseMs,
+                features,
+                perCellFeatures,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
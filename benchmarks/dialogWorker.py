@@ -0,0 +1,87 @@
+"""Measures how long bursts of text layout edits block the calling thread.
+
+Usage: python benchmarks/dialogWorker.py
+
+Submits a burst of layout parse jobs, one per simulated keystroke, to the
+dialog worker, once run in place as with the worker disabled and once with
+the worker thread started. Prints time spent in submit calls, total time until
+the last result is applied and how many results were applied and dropped.
+"""
+
+import random
+import threading
+import time
+
+import benchmarkUtils
+
+GRID_SIZES = [8, 24, 48]
+KEYSTROKES = 20
+
+
+def layoutText(size: int, seed: int):
+    random.seed(seed)
+    return "\n".join(
+        "".join(random.choice("AB") * 4 for x in range(size // 4)) for y in range(size)
+    )
+
+
+def runBurst(worker, compartmentLayout, size: int):
+    texts = [layoutText(size, seed) for seed in range(KEYSTROKES)]
+    applied = []
+    done = threading.Event()
+
+    def onResult(result):
+        applied.append(result)
+        if result is texts[-1]:
+            done.set()
+
+    def parse(text):
+        compartmentLayout.parseLayout(text)
+        return text
+
+    submitSeconds = 0
+    startTime = time.perf_counter()
+    for text in texts:
+        submitStart = time.perf_counter()
+        worker.submit("layout", lambda text=text: parse(text), onResult)
+        submitSeconds += time.perf_counter() - submitStart
+    done.wait()
+    totalSeconds = time.perf_counter() - startTime
+    return submitSeconds, totalSeconds, len(applied)
+
+
+def main():
+    backgroundWorker = benchmarkUtils.importAddinModule("lib.backgroundWorker")
+    compartmentLayout = benchmarkUtils.importAddinModule(
+        "lib.gridfinityUtils.compartmentLayout"
+    )
+    print(
+        "{:<7} {:<10} {:>10} {:>10} {:>8} {:>8}".format(
+            "grid", "worker", "submit ms", "total ms", "applied", "dropped"
+        )
+    )
+    for size in GRID_SIZES:
+        for useThread in [False, True]:
+            worker = backgroundWorker.BackgroundWorker("benchmark")
+            if useThread:
+                worker.start()
+            try:
+                submitSeconds, totalSeconds, applied = runBurst(
+                    worker, compartmentLayout, size
+                )
+            finally:
+                worker.stop()
+            print(
+                "{:<7} {:<10} {:>10.1f} {:>10.1f} {:>8} {:>8}".format(
+                    f"{size}x{size}",
+                    "thread" if useThread else "in place",
+                    submitSeconds * 1000,
+                    totalSeconds * 1000,
+                    applied,
+                    KEYSTROKES - applied,
+                )
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,186 @@
+"""Checks generated feature counts against the checked-in budgets.
+
+Usage:
+    python benchmarks/featureBudget.py           check all configurations
+    python benchmarks/featureBudget.py --update  rewrite featureBudgets.json
+
+Every configuration of the matrix is generated against the adsk stand-in and
+its feature, sketch, construction geometry and boolean tool counts are compared
+with featureBudgets.json. Exits with non zero status when any count goes over
+its budget or a configuration or one of its counts has no budget. Counts going
+down are reported, run with --update to lock the improvement in.
+
+The full product of all sizes, compartment counts and feature combinations is
+too large to run, the matrix covers each dimension separately instead:
+- every combination of lip, scoop, tab, magnets and screws for each bin type
+  on a 2x2 bin with 2x2 compartments
+- every bin size from 1x1 to 8x8, and square ones with lip notches
+- compartment grids from 1x1 to 8x8 on an 8x8 bin
+- compartment lips on square compartment grids of an 8x8 bin, with and
+  without lip notches
+- baseplate sizes from 1x1 to 8x8 for each plate type and feature combination
+"""
+
+import itertools
+import json
+import os
+import sys
+
+import benchmarkUtils
+
+BUDGETS_FILE_PATH = os.path.join(benchmarkUtils.BENCHMARKS_DIR, "featureBudgets.json")
+BUDGET_METRICS = [
+    "features",
+    "sketches",
+    "constructionPlanes",
+    "constructionAxes",
+    "booleanTools",
+]
+BIN_TYPES = ["hollow", "solid", "shelled"]
+BIN_OPTIONS = ["hasLip", "hasScoop", "hasTab", "hasMagnetCutouts", "hasScrewHoles"]
+MAX_SIZE = 8
+
+
+def binMatrix():
+    for binType in BIN_TYPES:
+        for values in itertools.product([False, True], repeat=len(BIN_OPTIONS)):
+            options = dict(zip(BIN_OPTIONS, values))
+            name = "bin 2x2 c2x2 {} {}".format(
+                binType,
+                "+".join(option for option, value in options.items() if value)
+                or "plain",
+            )
+            yield name, dict(
+                binType=binType, compartmentsByX=2, compartmentsByY=2, **options
+            )
+    for width in range(1, MAX_SIZE + 1):
+        for length in range(1, MAX_SIZE + 1):
+            yield f"bin {width}x{length}", dict(binWidth=width, binLength=length)
+    for size in range(1, MAX_SIZE + 1):
+        yield f"bin {size}x{size} lip notches", dict(
+            binWidth=size, binLength=size, hasLipNotches=True
+        )
+    for countX in range(1, MAX_SIZE + 1):
+        for countY in range(1, MAX_SIZE + 1):
+            yield f"bin 8x8 c{countX}x{countY} tab", dict(
+                binWidth=MAX_SIZE,
+                binLength=MAX_SIZE,
+                compartmentsByX=countX,
+                compartmentsByY=countY,
+                hasTab=True,
+            )
+    for count in range(1, MAX_SIZE + 1):
+        for hasLipNotches in [False, True]:
+            yield "bin 8x8 c{0}x{0} compartments lip{1}".format(
+                count, " notches" if hasLipNotches else ""
+            ), dict(
+                binWidth=MAX_SIZE,
+                binLength=MAX_SIZE,
+                compartmentsByX=count,
+                compartmentsByY=count,
+                hasCompartmentsLip=True,
+                hasLipNotches=hasLipNotches,
+            )
+
+
+def baseplateMatrix():
+    plateTypes = {
+        "light": dict(hasSkeletonizedBottom=False),
+        "skeletonized": dict(hasSkeletonizedBottom=True),
+        "full": dict(hasSkeletonizedBottom=False, hasMagnetCutouts=True),
+    }
+    featureSets = {
+        "plain": dict(),
+        "magnets+screws": dict(hasMagnetCutouts=True, hasScrewHoles=True),
+        "connection holes+padding": dict(hasConnectionHoles=True, hasPadding=True),
+    }
+    for size in range(1, MAX_SIZE + 1):
+        for typeName, typeOptions in plateTypes.items():
+            for featuresName, featureOptions in featureSets.items():
+                options = dict(typeOptions)
+                options.update(featureOptions)
+                yield f"baseplate {size}x{size} {typeName} {featuresName}", dict(
+                    plateWidth=size, plateLength=size, **options
+                )
+
+
+def measureAll():
+    results = {}
+    for name, options in binMatrix():
+        baseInput, bodyInput = benchmarkUtils.binInputs(**options)
+        results[name] = benchmarkUtils.measure(
+            benchmarkUtils.generateBin, baseInput, bodyInput
+        )
+    for name, options in baseplateMatrix():
+        plateInput = benchmarkUtils.baseplateInput(**options)
+        results[name] = benchmarkUtils.measure(
+            benchmarkUtils.generateBaseplate, plateInput
+        )
+    return {
+        name: {metric: result[metric] for metric in BUDGET_METRICS}
+        for name, result in results.items()
+    }
+
+
+def readBudgets():
+    if not os.path.exists(BUDGETS_FILE_PATH):
+        return {}
+    with open(BUDGETS_FILE_PATH) as budgetsFile:
+        return json.load(budgetsFile)
+
+
+def writeBudgets(counts):
+    # one configuration per line keeps budget changes readable in diffs
+    lines = [
+        "  {}: {}".format(json.dumps(name), json.dumps(counts[name], sort_keys=True))
+        for name in sorted(counts)
+    ]
+    with open(BUDGETS_FILE_PATH, "w") as budgetsFile:
+        budgetsFile.write("{\n" + ",\n".join(lines) + "\n}\n")
+
+
+def compare(counts, budgets):
+    overBudget = []
+    underBudget = []
+    missing = []
+    for name, configCounts in counts.items():
+        budget = budgets.get(name)
+        if budget is None:
+            missing.append(name)
+            continue
+        for metric in BUDGET_METRICS:
+            metricBudget = budget.get(metric)
+            if metricBudget is None:
+                missing.append(f"{name}: {metric}")
+            elif configCounts[metric] > metricBudget:
+                overBudget.append((name, metric, configCounts[metric], metricBudget))
+            elif configCounts[metric] < metricBudget:
+                underBudget.append((name, metric, configCounts[metric], metricBudget))
+    return overBudget, underBudget, missing
+
+
+def main(args):
+    counts = measureAll()
+    if "--update" in args:
+        writeBudgets(counts)
+        print(f"Wrote budgets of {len(counts)} configurations to {BUDGETS_FILE_PATH}")
+        return 0
+    overBudget, underBudget, missing = compare(counts, readBudgets())
+    for name, metric, count, budget in underBudget:
+        print(f"under budget: {name}: {metric} {count} < {budget}")
+    for name in missing:
+        print(f"no budget: {name}")
+    for name, metric, count, budget in overBudget:
+        print(f"OVER BUDGET: {name}: {metric} {count} > {budget}")
+    print(
+        "{} configurations, {} over budget, {} under budget, {} without budget".format(
+            len(counts), len(overBudget), len(underBudget), len(missing)
+        )
+    )
+    if underBudget and not overBudget:
+        print("Counts went down, run with --update to lower the budgets")
+    return 1 if overBudget or missing else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -0,0 +1,52 @@
+"""Compares fillet features of bins with and without consolidated fillets.
+
+Usage: python benchmarks/filletConsolidation.py
+
+Generates 8x8 bins with scoop and lip, 1x1 to 8x8 compartments, once with a
+fillet feature per cutout and once with config.FILLETS_CONSOLIDATED, fillets
+collected into one feature with an edge set per radius.
+"""
+
+import benchmarkUtils
+
+COMPARTMENT_GRIDS = [1, 2, 4, 8]
+
+
+def main():
+    config = benchmarkUtils.importAddinModule("config")
+    defaultMode = config.FILLETS_CONSOLIDATED
+    print(
+        "{:<14} {:<13} {:>8} {:>9} {:>7} {:>7}".format(
+            "compartments", "fillets", "fillets", "features", "calls", "ms"
+        )
+    )
+    try:
+        for grid in COMPARTMENT_GRIDS:
+            for consolidated in [False, True]:
+                config.FILLETS_CONSOLIDATED = consolidated
+                baseInput, bodyInput = benchmarkUtils.binInputs(
+                    binWidth=8,
+                    binLength=8,
+                    compartmentsByX=grid,
+                    compartmentsByY=grid,
+                    hasScoop=True,
+                )
+                result = benchmarkUtils.measure(
+                    benchmarkUtils.generateBin, baseInput, bodyInput, False, True
+                )
+                print(
+                    "{:<14} {:<13} {:>8} {:>9} {:>7} {:>7.1f}".format(
+                        f"{grid}x{grid}",
+                        "consolidated" if consolidated else "per cutout",
+                        result["featuresByType"].get("FilletFeature", 0),
+                        result["features"],
+                        result["calls"],
+                        result["seconds"] * 1000,
+                    )
+                )
+    finally:
+        config.FILLETS_CONSOLIDATED = defaultMode
+
+
+if __name__ == "__main__":
+    main()
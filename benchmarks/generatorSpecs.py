@@ -0,0 +1,65 @@
+"""Measures copying and hashing bin inputs as mutable inputs and as frozen specs.
+
+Usage: python benchmarks/generatorSpecs.py
+
+For bins with up to 10x10 compartments prints per call times of a deep copy
+of the input classes, dataclasses.replace of a spec, conversions between the
+two and the generation cache key built from specs.
+"""
+
+import copy
+import dataclasses
+import time
+
+import benchmarkUtils
+
+COMPARTMENTS = [1, 4, 10]
+REPEATS = 200
+
+
+def perCallMs(function):
+    startTime = time.perf_counter()
+    for _ in range(REPEATS):
+        function()
+    return (time.perf_counter() - startTime) / REPEATS * 1000
+
+
+def main():
+    baseGeneratorInput = benchmarkUtils.importAddinModule(
+        "lib.gridfinityUtils.baseGeneratorInput"
+    )
+    binBodyGeneratorInput = benchmarkUtils.importAddinModule(
+        "lib.gridfinityUtils.binBodyGeneratorInput"
+    )
+    generationCache = benchmarkUtils.importAddinModule("lib.generationCache")
+    print(
+        "{:<14} {:>10} {:>10} {:>10} {:>10} {:>10}".format(
+            "compartments", "deepcopy", "replace", "to spec", "to input", "cache key"
+        )
+    )
+    for count in COMPARTMENTS:
+        baseInput, bodyInput = benchmarkUtils.binInputs(
+            count, count, 5, compartmentsByX=count, compartmentsByY=count
+        )
+        baseSpec = baseGeneratorInput.BaseGeneratorSpec.fromInput(baseInput)
+        bodySpec = binBodyGeneratorInput.BinBodyGeneratorSpec.fromInput(bodyInput)
+        print(
+            "{:<14} {:>10.3f} {:>10.3f} {:>10.3f} {:>10.3f} {:>10.3f}".format(
+                f"{count}x{count}",
+                perCallMs(lambda: copy.deepcopy((baseInput, bodyInput))),
+                perCallMs(lambda: dataclasses.replace(bodySpec)),
+                perCallMs(
+                    lambda: binBodyGeneratorInput.BinBodyGeneratorSpec.fromInput(
+                        bodyInput
+                    )
+                ),
+                perCallMs(bodySpec.toInput),
+                perCallMs(
+                    lambda: generationCache.getCacheKey("bin", baseSpec, bodySpec)
+                ),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
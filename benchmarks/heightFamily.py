@@ -0,0 +1,92 @@
+"""Compares generating bins of several heights in full and as stretched copies.
+
+Usage: python benchmarks/heightFamily.py
+
+For a few bin configurations prints features, API calls and time of bins at
+heights 3, 6 and 9 generated one by one next to the height family: the first
+bin generated in full and the taller ones copied from it and stretched with
+`createStretchedBinCopy`.
+"""
+
+import dataclasses
+
+import benchmarkUtils
+
+HEIGHTS = [3, 6, 9]
+CONFIGS = {
+    "2x2 hollow": {},
+    "3x2 tab, scoop": {"binWidth": 3, "hasTab": True, "hasScoop": True},
+    "4x4 4x4 compartments": {
+        "binWidth": 4,
+        "binLength": 4,
+        "compartmentsByX": 4,
+        "compartmentsByY": 4,
+    },
+    "2x2 solid": {"binType": "solid"},
+}
+
+
+def generateSeparately(baseInput, bodySpec):
+    for height in HEIGHTS:
+        benchmarkUtils.generateBin(
+            baseInput, dataclasses.replace(bodySpec, binHeight=height).toInput()
+        )
+
+
+def generateFamily(baseInput, bodySpec, binHeightFamily):
+    import adsk.core
+
+    bodyInput = bodySpec.toInput()
+    component = benchmarkUtils.generateBin(baseInput, bodyInput)
+    sourceOccurrence = component.parentDesign.rootComponent.occurrences.item(0)
+    splitHeight = binHeightFamily.stretchHeight(bodyInput, max(HEIGHTS))
+    for height in HEIGHTS[1:]:
+        if splitHeight is None:
+            benchmarkUtils.generateBin(
+                baseInput, dataclasses.replace(bodySpec, binHeight=height).toInput()
+            )
+            continue
+        binHeightFamily.createStretchedBinCopy(
+            sourceOccurrence,
+            bodyInput,
+            splitHeight,
+            height,
+            f"Benchmark bin {height}",
+            adsk.core.Matrix3D.create(),
+        )
+
+
+def main():
+    binHeightFamily = benchmarkUtils.importAddinModule(
+        "lib.gridfinityUtils.binHeightFamily"
+    )
+    binBodyGeneratorInput = benchmarkUtils.importAddinModule(
+        "lib.gridfinityUtils.binBodyGeneratorInput"
+    )
+    print(
+        "{:<22} {:>9} {:>8} {:>8} {:>9} {:>8} {:>8}".format(
+            "bins", "features", "calls", "ms", "family f", "calls", "ms"
+        )
+    )
+    for name, options in CONFIGS.items():
+        baseInput, bodyInput = benchmarkUtils.binInputs(binHeight=HEIGHTS[0], **options)
+        bodySpec = binBodyGeneratorInput.BinBodyGeneratorSpec.fromInput(bodyInput)
+        separate = benchmarkUtils.measure(generateSeparately, baseInput, bodySpec)
+        family = benchmarkUtils.measure(
+            generateFamily, baseInput, bodySpec, binHeightFamily
+        )
+        print(
+            "{:<22} {:>9} {:>8} {:>8.1f} {:>9} {:>8} {:>8.1f}".format(
+                name,
+                separate["features"],
+                separate["calls"],
+                separate["seconds"] * 1000,
+                family["features"],
+                family["calls"],
+                family["seconds"] * 1000,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
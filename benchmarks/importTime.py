@@ -0,0 +1,84 @@
+"""Measures import time of the add-in commands at startup and first use.
+
+Usage: python benchmarks/importTime.py [runs]
+
+Every run imports `commands` in a fresh interpreter, as `run()` does when
+Fusion starts the add-in, then imports the dialog modules loaded the first
+time a command button is clicked. Prints median times and how many add-in
+modules, generator modules among them, each step loads.
+"""
+
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+import benchmarkUtils
+
+DEFAULT_RUNS = 10
+DIALOG_MODULES = [
+    "commands.commandCreateBin.dialog",
+    "commands.commandCreateBaseplate.dialog",
+]
+
+
+def addinModules():
+    prefix = benchmarkUtils.ADDIN_PACKAGE_NAME + "."
+    return [name for name in sys.modules if name.startswith(prefix)]
+
+
+def countModules(names: list[str]):
+    generators = [name for name in names if ".lib.gridfinityUtils." in name]
+    return len(names), len(generators)
+
+
+def measureOnce():
+    benchmarkUtils.loadAddin()
+    import adsk.core  # stand-in import isn't part of the add-in startup
+
+    startTime = time.perf_counter()
+    benchmarkUtils.importAddinModule("commands")
+    startupSeconds = time.perf_counter() - startTime
+    startupModules = addinModules()
+
+    startTime = time.perf_counter()
+    for name in DIALOG_MODULES:
+        try:
+            benchmarkUtils.importAddinModule(name)
+        except ModuleNotFoundError:
+            # commands which still load everything at startup
+            pass
+    firstUseSeconds = time.perf_counter() - startTime
+    firstUseModules = [name for name in addinModules() if name not in startupModules]
+    return {
+        "startup": (startupSeconds, *countModules(startupModules)),
+        "first use": (firstUseSeconds, *countModules(firstUseModules)),
+    }
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else DEFAULT_RUNS
+    results = []
+    for _ in range(runs):
+        output = subprocess.check_output(
+            [sys.executable, __file__, "--measure-once"], text=True
+        )
+        results.append(json.loads(output))
+
+    print("{:<10} {:>10} {:>8} {:>11}".format("step", "ms", "modules", "generators"))
+    for step in results[0]:
+        seconds = statistics.median(result[step][0] for result in results)
+        _, modules, generators = results[0][step]
+        print(
+            "{:<10} {:>10.1f} {:>8} {:>11}".format(
+                step, seconds * 1000, modules, generators
+            )
+        )
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--measure-once"]:
+        print(json.dumps(measureOnce()))
+    else:
+        main()
@@ -0,0 +1,169 @@
+"""Times input validation rule sets of the bin and baseplate commands.
+
+Usage: python benchmarks/inputValidation.py
+
+Validates input state snapshots like the ones taken on every validate inputs
+event, without Fusion. Prints time per validation and the errors reported for
+a few invalid snapshots.
+"""
+
+import dataclasses
+import math
+import time
+
+import benchmarkUtils
+
+ITERATIONS = 20000
+
+
+def timePerCall(function, iterations=ITERATIONS):
+    startTime = time.perf_counter()
+    for i in range(iterations):
+        function()
+    return (time.perf_counter() - startTime) / iterations * 1e6
+
+
+def binState(binInputState, **changes):
+    state = binInputState.InputState(
+        baseWidth=4.2,
+        baseLength=4.2,
+        heightUnit=0.7,
+        xyClearance=0.025,
+        binWidth=2,
+        binLength=3,
+        binHeight=5,
+        heightFamily="",
+        wallThickness=0.12,
+        generateBase=True,
+        hasScrewHoles=True,
+        screwHoleDiameter=0.3,
+        hasMagnetCutouts=True,
+        hasMagnetCutoutsTabs=False,
+        magnetCutoutDiameter=0.65,
+        magnetCutoutDepth=0.24,
+        generateBody=True,
+        binType=binInputState.BIN_TYPE_HOLLOW,
+        hasLip=True,
+        hasLipNotches=False,
+        hasScoop=True,
+        scoopMaxRadius=2.5,
+        hasTab=True,
+        tabLength=1,
+        tabWidth=1.3,
+        tabPosition=0,
+        tabAngle=math.radians(45),
+        compartmentsGridType=binInputState.BIN_COMPARTMENTS_GRID_TYPE_UNIFORM,
+        compartmentsGridWidth=1,
+        compartmentsGridLength=1,
+        hasCompartmentsLip=False,
+        compartmentsLayout="",
+        compartments=(),
+    )
+    return dataclasses.replace(state, **changes)
+
+
+def customGrid(binInputState, size):
+    return dict(
+        compartmentsGridType=binInputState.BIN_COMPARTMENTS_GRID_TYPE_CUSTOM,
+        compartmentsGridWidth=size,
+        compartmentsGridLength=size,
+        compartments=tuple(
+            binInputState.CompartmentState(x, y, 1, 1, 3.0)
+            for x in range(size)
+            for y in range(size)
+        ),
+    )
+
+
+def baseplateState(baseplateInputState, **changes):
+    state = baseplateInputState.InputState(
+        baseWidth=4.2,
+        baseLength=4.2,
+        xyClearance=0.025,
+        plateWidth=4,
+        plateLength=4,
+        plateType="Skeletonized",
+        hasMagnetSockets=True,
+        magnetSocketSize=0.65,
+        magnetSocketDepth=0.24,
+        hasScrewHoles=True,
+        screwHoleSize=0.32,
+        screwHeadSize=0.65,
+        hasPadding=False,
+        paddingLeft=0,
+        paddingTop=0,
+        paddingRight=0,
+        paddingBottom=0,
+        extraBottomThickness=0.1,
+        verticalClearance=0.05,
+        hasConnectionHoles=False,
+        connectionHoleSize=0.3,
+    )
+    return dataclasses.replace(state, **changes)
+
+
+def main():
+    binInputState = benchmarkUtils.importAddinModule(
+        "commands.commandCreateBin.inputState"
+    )
+    binRules = benchmarkUtils.importAddinModule("commands.commandCreateBin.inputRules")
+    baseplateInputState = benchmarkUtils.importAddinModule(
+        "commands.commandCreateBaseplate.inputState"
+    )
+    baseplateRules = benchmarkUtils.importAddinModule(
+        "commands.commandCreateBaseplate.inputRules"
+    )
+    binValidate = binRules.BIN_INPUT_RULES.validate
+    baseplateValidate = baseplateRules.BASEPLATE_INPUT_RULES.validate
+
+    rows = [
+        ("bin, uniform grid", binValidate, binState(binInputState)),
+        (
+            "bin, 8x8 custom grid",
+            binValidate,
+            binState(binInputState, **customGrid(binInputState, 8)),
+        ),
+        (
+            "bin, 8x8 text layout",
+            binValidate,
+            binState(
+                binInputState,
+                compartmentsGridType=binInputState.BIN_COMPARTMENTS_GRID_TYPE_TEXT,
+                compartmentsLayout="\n".join(["AABBCCDD", "AABBCCDD", "EEFFGGHH"] * 2)
+                + "\nIIIIJJJJ\nIIIIJJJJ\nA = 20\nB = 25",
+            ),
+        ),
+        (
+            "bin, invalid",
+            binValidate,
+            binState(
+                binInputState,
+                wallThickness=0.5,
+                screwHoleDiameter=0.7,
+                tabAngle=math.radians(80),
+                **dict(
+                    customGrid(binInputState, 2),
+                    compartmentsGridWidth=1,
+                ),
+            ),
+        ),
+        ("baseplate", baseplateValidate, baseplateState(baseplateInputState)),
+        (
+            "baseplate, invalid",
+            baseplateValidate,
+            baseplateState(baseplateInputState, screwHeadSize=0.2, xyClearance=0.1),
+        ),
+    ]
+    print("{:<30} {:>12} {:>8}".format("snapshot", "us / call", "errors"))
+    errors = []
+    for name, validate, state in rows:
+        perCall = timePerCall(lambda: validate(state))
+        result = validate(state)
+        print("{:<30} {:>12.2f} {:>8}".format(name, perCall, len(result.messages())))
+        errors += [f"{name}: {message}" for message in result.messages()]
+    print()
+    print("\n".join(errors))
+
+
+if __name__ == "__main__":
+    main()
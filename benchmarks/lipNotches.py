@@ -0,0 +1,55 @@
+"""Times bins with lip notches from 1x1 to 10x10, and 1xN and Nx1 strips.
+
+Usage: python benchmarks/lipNotches.py
+
+Prints the number of lip cutouts patterned for the notches next to the number
+of bin cells, with feature and boolean tool counts and generation time.
+"""
+
+import benchmarkUtils
+
+MAX_SIZE = 10
+SIZES = [(size, size) for size in range(1, MAX_SIZE + 1)] + [
+    (1, 2),
+    (1, MAX_SIZE),
+    (2, 1),
+    (MAX_SIZE, 1),
+]
+
+
+def main():
+    lipNotchGenerator = benchmarkUtils.importAddinModule(
+        "lib.gridfinityUtils.binBodyLipNotchGenerator"
+    )
+    print(
+        "{:<8} {:>7} {:>9} {:>10} {:>8} {:>6}".format(
+            "bin", "cells", "cutouts", "features", "tools", "ms"
+        )
+    )
+    for width, length in SIZES:
+        baseInput, bodyInput = benchmarkUtils.binInputs(
+            binWidth=width, binLength=length, hasLipNotches=True
+        )
+        result = benchmarkUtils.measure(
+            benchmarkUtils.generateBin, baseInput, bodyInput
+        )
+        print(
+            "{:<8} {:>7} {:>9} {:>10} {:>8} {:>6.1f}".format(
+                f"{width}x{length}",
+                width * length,
+                1
+                + sum(
+                    quantityX * quantityY - 1
+                    for (quantityX, stepX), (quantityY, stepY) in (
+                        lipNotchGenerator.perimeterPatterns(width, length)
+                    )
+                ),
+                result["features"],
+                result["booleanTools"],
+                result["seconds"] * 1000,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
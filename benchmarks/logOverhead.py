@@ -0,0 +1,105 @@
+"""Measures the cost of futil.log calls against the adsk stand-in.
+
+Usage: python benchmarks/logOverhead.py
+
+Reports time per call for records below every sink level, records written to
+the log file and records written to the Text Command window, together with the
+number of console writes (calls into Fusion) a CommandUiState refresh of a
+dialog sized like the bin command causes.
+"""
+
+import os
+import tempfile
+import time
+
+import benchmarkUtils
+
+ITERATIONS = 20000
+DIALOG_INPUTS_COUNT = 60
+
+
+def timePerCall(function, iterations=ITERATIONS):
+    startTime = time.perf_counter()
+    for i in range(iterations):
+        function(i)
+    return (time.perf_counter() - startTime) / iterations * 1e6
+
+
+def main():
+    futil = benchmarkUtils.importAddinModule("lib.fusion360utils")
+    generalUtils = benchmarkUtils.importAddinModule("lib.fusion360utils.general_utils")
+    commandUiState = benchmarkUtils.importAddinModule("lib.ui.commandUiState")
+    import adsk.core
+
+    app = adsk.core.Application.get()
+    logFolder = tempfile.mkdtemp()
+    generalUtils.FILE_PATH = os.path.join(logFolder, "benchmark.log")
+    generalUtils.CONSOLE_LEVEL = adsk.core.LogLevels.WarningLogLevel
+    generalUtils.FILE_LEVEL = adsk.core.LogLevels.InfoLogLevel
+    # keep print out of the measurement, it depends on the terminal
+    generalUtils.print = lambda *args: None
+
+    value = {"binWidth": 2, "binLength": 3, "compartments": list(range(10))}
+    rows = [
+        (
+            "debug, lazy % args",
+            lambda i: futil.log_debug("Input %s changed to %s", i, value),
+        ),
+        (
+            "debug, eager f-string",
+            lambda i: futil.log(
+                f"Input {i} changed to {value}", level=generalUtils.DEBUG_LOG_LEVEL
+            ),
+        ),
+        (
+            "info, file sink",
+            lambda i: futil.log(
+                "Input %s changed to %s",
+                i,
+                value,
+                level=adsk.core.LogLevels.InfoLogLevel,
+            ),
+        ),
+        (
+            "info, forced console",
+            lambda i: futil.log(
+                "Input %s changed to %s",
+                i,
+                value,
+                level=adsk.core.LogLevels.InfoLogLevel,
+                force_console=True,
+            ),
+        ),
+    ]
+    print("{:<30} {:>12} {:>16}".format("record", "us / call", "console writes"))
+    for name, function in rows:
+        app.logMessages.clear()
+        perCall = timePerCall(function)
+        consoleWrites = len(
+            [
+                item
+                for item in app.logMessages
+                if item[1] == adsk.core.LogTypes.ConsoleLogType
+            ]
+        )
+        print("{:<30} {:>12.2f} {:>16}".format(name, perCall, consoleWrites))
+
+    uiState = commandUiState.CommandUiState("Benchmark")
+    for index in range(DIALOG_INPUTS_COUNT):
+        commandInput = adsk.core.BoolValueCommandInput(
+            f"input{index}", f"Input {index}"
+        )
+        uiState.initValue(commandInput.id, True, commandInput.objectType)
+        uiState.registerCommandInput(commandInput)
+    app.logMessages.clear()
+    perRefresh = timePerCall(lambda i: uiState.forceUIRefresh(), 200)
+    print(
+        "forceUIRefresh of {} inputs: {:.1f} us, {} console writes per refresh".format(
+            DIALOG_INPUTS_COUNT, perRefresh, len(app.logMessages) // 200
+        )
+    )
+    futil.stop_logging()
+
+
+if __name__ == "__main__":
+    main()
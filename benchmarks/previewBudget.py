@@ -0,0 +1,52 @@
+"""Compares a full bin preview with the outline shown when it runs out of time.
+
+Usage: python benchmarks/previewBudget.py
+
+Generates hollow bins with scoop, tab and a compartment per cell up to 10x10,
+prints features and time of the full bin next to the outline preview falls
+back to when PREVIEW_TIME_BUDGET_SECONDS in config.py is exceeded.
+"""
+
+import benchmarkUtils
+
+SIZES = [2, 4, 6, 8, 10]
+
+
+def main():
+    binEnvelopeGenerator = benchmarkUtils.importAddinModule(
+        "lib.gridfinityUtils.binEnvelopeGenerator"
+    )
+
+    def generateEnvelope(bodyInput):
+        component = benchmarkUtils.newComponent("Benchmark bin outline")
+        binEnvelopeGenerator.createGridfinityBinEnvelope(bodyInput, True, component)
+
+    print(
+        "{:<6} {:>14} {:>9} {:>17} {:>12}".format(
+            "bin", "bin features", "bin ms", "outline features", "outline ms"
+        )
+    )
+    for size in SIZES:
+        baseInput, bodyInput = benchmarkUtils.binInputs(
+            binWidth=size,
+            binLength=size,
+            compartmentsByX=size,
+            compartmentsByY=size,
+            hasScoop=True,
+            hasTab=True,
+        )
+        full = benchmarkUtils.measure(benchmarkUtils.generateBin, baseInput, bodyInput)
+        outline = benchmarkUtils.measure(generateEnvelope, bodyInput)
+        print(
+            "{:<6} {:>14} {:>9.1f} {:>17} {:>12.1f}".format(
+                f"{size}x{size}",
+                full["features"],
+                full["seconds"] * 1000,
+                outline["features"],
+                outline["seconds"] * 1000,
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,91 @@
+"""Runs bin and baseplate generators against the adsk stand-in.
+
+Usage: python benchmarks/runGenerators.py
+
+Prints recorded Fusion operation counts for a few representative
+configurations. Meant for quick before/after comparisons of generator changes,
+see featureBudget.py for the full configuration matrix.
+"""
+
+import benchmarkUtils
+
+BIN_CONFIGURATIONS = {
+    "bin 1x1 default": dict(binWidth=1, binLength=1),
+    "bin 2x2 lip notches": dict(hasLipNotches=True),
+    "bin 2x2 2x2 compartments, scoop, tab": dict(
+        compartmentsByX=2, compartmentsByY=2, hasScoop=True, hasTab=True
+    ),
+    "bin 2x2 compartments lip": dict(
+        compartmentsByX=2, compartmentsByY=2, hasCompartmentsLip=True
+    ),
+    "bin 2x2 magnets, screws": dict(
+        hasMagnetCutouts=True, hasMagnetCutoutsTabs=True, hasScrewHoles=True
+    ),
+    "bin 2x2 shelled": dict(binType="shelled"),
+    "bin 2x2 solid": dict(binType="solid"),
+    "bin 4x4 4x4 compartments, everything": dict(
+        binWidth=4,
+        binLength=4,
+        compartmentsByX=4,
+        compartmentsByY=4,
+        hasLipNotches=True,
+        hasScoop=True,
+        hasTab=True,
+        hasCompartmentsLip=True,
+        hasMagnetCutouts=True,
+        hasScrewHoles=True,
+    ),
+}
+
+BASEPLATE_CONFIGURATIONS = {
+    "baseplate 2x2 light": dict(hasSkeletonizedBottom=False),
+    "baseplate 2x2 skeletonized": dict(),
+    "baseplate 2x2 magnets, screws": dict(hasMagnetCutouts=True, hasScrewHoles=True),
+    "baseplate 4x4 connection holes, padding": dict(
+        plateWidth=4, plateLength=4, hasConnectionHoles=True, hasPadding=True
+    ),
+}
+
+COLUMNS = [
+    "features",
+    "sketches",
+    "constructionPlanes",
+    "constructionAxes",
+    "booleanTools",
+    "calls",
+]
+HEADERS = ["features", "sketches", "planes", "axes", "tools", "calls", "py ms"]
+
+
+def formatRow(name, values):
+    return "{:<45}".format(name) + "".join("{:>10}".format(value) for value in values)
+
+
+def main():
+    print(formatRow("configuration", HEADERS))
+    for name, options in BIN_CONFIGURATIONS.items():
+        baseInput, bodyInput = benchmarkUtils.binInputs(**options)
+        result = benchmarkUtils.measure(
+            benchmarkUtils.generateBin, baseInput, bodyInput
+        )
+        print(
+            formatRow(
+                name,
+                [result[column] for column in COLUMNS]
+                + ["{:.1f}".format(result["seconds"] * 1000)],
+            )
+        )
+    for name, options in BASEPLATE_CONFIGURATIONS.items():
+        plateInput = benchmarkUtils.baseplateInput(**options)
+        result = benchmarkUtils.measure(benchmarkUtils.generateBaseplate, plateInput)
+        print(
+            formatRow(
+                name,
+                [result[column] for column in COLUMNS]
+                + ["{:.1f}".format(result["seconds"] * 1000)],
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
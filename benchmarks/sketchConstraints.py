@@ -0,0 +1,67 @@
+"""Counts sketch constraints and dimensions with and without sketch constraints.
+
+Usage: python benchmarks/sketchConstraints.py
+
+Generates a skeletonized 10x10 baseplate, also with connection holes, and a
+4x4 bin with label tabs, once with config.SKETCH_CONSTRAINTS_ENABLED and once
+without. The stand-in has no sketch solver, times only show the API calls
+saved, solver time saved in Fusion shows up in profiling reports.
+"""
+
+import benchmarkUtils
+
+REPEATS = 3
+
+
+def generate(name):
+    if name == "bin 4x4 tabs":
+        baseInput, bodyInput = benchmarkUtils.binInputs(
+            4, 4, 5, compartmentsByX=4, compartmentsByY=4, hasTab=True
+        )
+        return benchmarkUtils.measure(benchmarkUtils.generateBin, baseInput, bodyInput)
+    plateInput = benchmarkUtils.baseplateInput(
+        10,
+        10,
+        hasSkeletonizedBottom=True,
+        hasConnectionHoles=name == "baseplate 10x10 holes",
+    )
+    return benchmarkUtils.measure(benchmarkUtils.generateBaseplate, plateInput)
+
+
+def main():
+    config = benchmarkUtils.importAddinModule("config")
+    defaultMode = config.SKETCH_CONSTRAINTS_ENABLED
+    print(
+        "{:<22} {:<12} {:>11} {:>10} {:>9} {:>7} {:>7}".format(
+            "model",
+            "constraints",
+            "constraints",
+            "dimensions",
+            "features",
+            "calls",
+            "ms",
+        )
+    )
+    try:
+        for name in ["baseplate 10x10", "baseplate 10x10 holes", "bin 4x4 tabs"]:
+            for enabled in [True, False]:
+                config.SKETCH_CONSTRAINTS_ENABLED = enabled
+                results = [generate(name) for _ in range(REPEATS)]
+                result = results[0]
+                print(
+                    "{:<22} {:<12} {:>11} {:>10} {:>9} {:>7} {:>7.1f}".format(
+                        name,
+                        "enabled" if enabled else "skipped",
+                        result["sketchConstraints"],
+                        result["sketchDimensions"],
+                        result["features"],
+                        result["calls"],
+                        min(result["seconds"] for result in results) * 1000,
+                    )
+                )
+    finally:
+        config.SKETCH_CONSTRAINTS_ENABLED = defaultMode
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Counts command input writes of CommandUiState refreshes.
+
+Usage: python benchmarks/uiRefresh.py
+
+Every write to a command input crosses into Fusion and may fire more input
+changed events. Builds a CommandUiState with inputs of every type the bin
+command uses and reports how many inputs each refresh writes to after the
+dialog is created, after nothing changed and after a single value changed.
+"""
+
+import time
+
+import benchmarkUtils
+
+INPUTS_BY_TYPE_COUNT = 12
+REFRESHES_COUNT = 200
+
+
+def createInputs(uiState, adsk):
+    for index in range(INPUTS_BY_TYPE_COUNT):
+        inputs = [
+            (adsk.core.BoolValueCommandInput(f"bool{index}", "Bool"), True),
+            (adsk.core.ValueCommandInput(f"value{index}", "Value"), 4.2),
+            (adsk.core.IntegerSpinnerCommandInput(f"spinner{index}", "Spinner"), 2),
+            (adsk.core.GroupCommandInput(f"group{index}", "Group"), False),
+            (adsk.core.StringValueCommandInput(f"string{index}", "String"), "text"),
+        ]
+        for commandInput, value in inputs:
+            uiState.initValue(commandInput.id, value, commandInput.objectType)
+            uiState.registerCommandInput(commandInput)
+
+
+def measureRefresh(uiState, change=None, refreshesCount=REFRESHES_COUNT):
+    writes = []
+    updateInputFromState = uiState.updateInputFromState
+    uiState.updateInputFromState = lambda input: (
+        writes.append(input.id),
+        updateInputFromState(input),
+    )
+    startTime = time.perf_counter()
+    for index in range(refreshesCount):
+        if change is not None:
+            change(index)
+        uiState.forceUIRefresh()
+    seconds = time.perf_counter() - startTime
+    del uiState.updateInputFromState
+    return len(writes) / refreshesCount, seconds / refreshesCount * 1e6
+
+
+def main():
+    commandUiState = benchmarkUtils.importAddinModule("lib.ui.commandUiState")
+    import adsk.core
+
+    uiState = commandUiState.CommandUiState("Benchmark")
+    createInputs(uiState, adsk)
+    inputsCount = len(uiState.commandInputs)
+
+    print("{:<30} {:>18} {:>12}".format("refresh", "inputs written", "us"))
+    rows = [
+        ("after dialog created", lambda: measureRefresh(uiState, refreshesCount=1)),
+        ("nothing changed", lambda: measureRefresh(uiState)),
+        (
+            "one value changed",
+            lambda: measureRefresh(
+                uiState, lambda index: uiState.updateValue("spinner0", index + 3)
+            ),
+        ),
+        (
+            "one state entry changed",
+            lambda: measureRefresh(
+                uiState,
+                lambda index: uiState.initValue(
+                    "value0", index / 10, adsk.core.ValueCommandInput.classType()
+                ),
+            ),
+        ),
+    ]
+    for name, function in rows:
+        writes, perRefresh = function()
+        print(
+            "{:<30} {:>18} {:>12.1f}".format(
+                name, "{:g} / {}".format(writes, inputsCount), perRefresh
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -4,13 +4,17 @@
 # If you want to add an additional command, duplicate one of the existing directories and import it here.
 # You need to use aliases (import "entry" as "my_module") assuming you have the default module named "entry".
 from .commandCreateBin import entry as commandCreateBin
+from .commandEditBin import entry as commandEditBin
 from .commandCreateBaseplate import entry as commandCreateBaseplate
+from .commandCancelGeneration import entry as commandCancelGeneration
 
 # TODO add imported modules to this list.
 # Fusion will automatically call the start() and stop() functions.
 commands = [
     commandCreateBin,
+    commandEditBin,
     commandCreateBaseplate,
+    commandCancelGeneration,
 ]
 
 
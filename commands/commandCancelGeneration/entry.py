@@ -0,0 +1,84 @@
+import adsk.core, adsk.fusion, traceback
+
+from ...lib import fusion360utils as futil
+from ...lib.jobQueue import getJobQueue
+from ... import config
+
+app = adsk.core.Application.get()
+ui = app.userInterface
+
+
+# *** The command identity information. ***
+CMD_ID = f"{config.COMPANY_NAME}_{config.ADDIN_NAME}_cmdCancelGeneration"
+CMD_NAME = "Cancel gridfinity generation"
+CMD_Description = "Stop generating queued gridfinity bins after the current one"
+
+# Button is shown in the panel next to the generator commands, not promoted.
+WORKSPACE_ID = "FusionSolidEnvironment"
+PANEL_ID = "SolidCreatePanel"
+COMMAND_BESIDE_ID = "ScriptsManagerCommand"
+
+# Local list of event handlers used to maintain a reference so
+# they are not released and garbage collected.
+local_handlers = []
+
+
+# Executed when add-in is run.
+def start():
+    try:
+        futil.log(f"{CMD_NAME} Command Start Event")
+        cmd_def = ui.commandDefinitions.itemById(CMD_ID)
+        if not cmd_def:
+            cmd_def = ui.commandDefinitions.addButtonDefinition(
+                CMD_ID, CMD_NAME, CMD_Description
+            )
+            futil.add_handler(cmd_def.commandCreated, command_created)
+
+            workspace = ui.workspaces.itemById(WORKSPACE_ID)
+            panel = workspace.toolbarPanels.itemById(PANEL_ID)
+            control = panel.controls.addCommand(cmd_def, COMMAND_BESIDE_ID, False)
+            control.isPromoted = False
+    except Exception as err:
+        futil.log(f"{CMD_NAME} Error occurred at the start, {err}")
+
+
+# Executed when add-in is stopped.
+def stop():
+    futil.log(f"{CMD_NAME} Command Stop Event")
+    workspace = ui.workspaces.itemById(WORKSPACE_ID)
+    panel = workspace.toolbarPanels.itemById(PANEL_ID)
+    command_control: adsk.core.CommandControl = panel.controls.itemById(CMD_ID)
+    command_definition = ui.commandDefinitions.itemById(CMD_ID)
+
+    # Delete the button command control
+    if command_control:
+        command_control.deleteMe()
+
+    # Delete the command definition
+    if command_definition:
+        command_definition.deleteMe()
+
+
+# Runs right away, the command has no dialog.
+def command_created(args: adsk.core.CommandCreatedEventArgs):
+    futil.add_handler(
+        args.command.execute, command_execute, local_handlers=local_handlers
+    )
+    futil.add_handler(
+        args.command.destroy, command_destroy, local_handlers=local_handlers
+    )
+
+
+def command_execute(args: adsk.core.CommandEventArgs):
+    futil.log(f"{CMD_NAME} Command Execute Event")
+    jobQueue = getJobQueue()
+    if jobQueue.isBusy:
+        jobQueue.cancel()
+        ui.statusMessage = "Gridfinity generation cancelled"
+    else:
+        ui.statusMessage = "No gridfinity generation is running"
+
+
+def command_destroy(args: adsk.core.CommandEventArgs):
+    global local_handlers
+    local_handlers = []
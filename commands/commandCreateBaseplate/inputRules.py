@@ -0,0 +1,110 @@
+from ...lib.ui.inputValidation import (
+    RuleSet,
+    atLeast,
+    atMost,
+    formatMillimeters,
+    greaterThan,
+    greaterThanField,
+    inRange,
+)
+from .inputState import InputState
+
+
+def hasMagnetSockets(state: InputState):
+    return state.hasMagnetSockets
+
+
+def hasScrewHoles(state: InputState):
+    return state.hasScrewHoles
+
+
+def hasConnectionHoles(state: InputState):
+    return state.hasConnectionHoles
+
+
+BASEPLATE_INPUT_RULES = RuleSet(
+    [
+        atLeast("baseWidth", 1, formatValue=formatMillimeters, label="Base width unit"),
+        atLeast(
+            "baseLength", 1, formatValue=formatMillimeters, label="Base length unit"
+        ),
+        inRange(
+            "xyClearance",
+            0.01,
+            0.05,
+            formatValue=formatMillimeters,
+            label="Bin xy clearance",
+        ),
+        greaterThan("plateWidth", 0, label="Plate width"),
+        greaterThan("plateLength", 0, label="Plate length"),
+        greaterThan(
+            "magnetSocketSize",
+            0,
+            when=hasMagnetSockets,
+            formatValue=formatMillimeters,
+            label="Magnet cutout diameter",
+        ),
+        atMost(
+            "magnetSocketSize",
+            1,
+            when=hasMagnetSockets,
+            formatValue=formatMillimeters,
+            label="Magnet cutout diameter",
+        ),
+        greaterThan(
+            "magnetSocketDepth",
+            0,
+            when=hasMagnetSockets,
+            formatValue=formatMillimeters,
+            label="Magnet cutout depth",
+        ),
+        greaterThan(
+            "screwHoleSize",
+            0,
+            when=hasScrewHoles,
+            formatValue=formatMillimeters,
+            label="Screw hole diameter",
+        ),
+        atMost(
+            "screwHoleSize",
+            1,
+            when=hasScrewHoles,
+            formatValue=formatMillimeters,
+            label="Screw hole diameter",
+        ),
+        greaterThanField(
+            "screwHeadSize",
+            "screwHoleSize",
+            when=hasScrewHoles,
+            label="Screw head cutout diameter",
+            otherLabel="screw hole diameter",
+        ),
+        atMost(
+            "screwHeadSize",
+            1.5,
+            when=hasScrewHoles,
+            formatValue=formatMillimeters,
+            label="Screw head cutout diameter",
+        ),
+        greaterThan(
+            "connectionHoleSize",
+            0,
+            when=hasConnectionHoles,
+            formatValue=formatMillimeters,
+            label="Connection hole diameter",
+        ),
+        atMost(
+            "connectionHoleSize",
+            0.5,
+            when=hasConnectionHoles,
+            formatValue=formatMillimeters,
+            label="Connection hole diameter",
+        ),
+        greaterThan(
+            "extraBottomThickness",
+            0,
+            formatValue=formatMillimeters,
+            label="Extra bottom thickness",
+        ),
+    ]
+)
@@ -2,7 +2,7 @@ from typing import Dict
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(frozen=True)
 class InputState:
     baseWidth: float
     baseLength: float
@@ -0,0 +1,2343 @@
+import adsk.core, adsk.fusion, traceback
+import os
+import math
+import dataclasses
+
+
+from ...lib import configUtils
+from ...lib import fusion360utils as futil
+from ...lib.generationCache import (
+    flushGenerationCache,
+    getCacheKey,
+    getGenerationCache,
+)
+from ...lib import stageTimer, apiCallTracer
+from ...lib.backgroundWorker import BackgroundWorker
+from ...lib.jobQueue import getJobQueue
+from ... import config
+from ...lib.gridfinityUtils import combineUtils
+from ...lib.gridfinityUtils import geometryUtils
+from ...lib.gridfinityUtils import faceUtils
+from ...lib.gridfinityUtils import shellUtils
+from ...lib.gridfinityUtils import commonUtils
+from ...lib.gridfinityUtils import const
+from ...lib.gridfinityUtils.baseGenerator import (
+    createSingleGridfinityBaseBody,
+    createBaseBodyPattern,
+    cutBaseClearance,
+)
+from ...lib.gridfinityUtils.baseGeneratorInput import (
+    BaseGeneratorInput,
+    BaseGeneratorSpec,
+)
+from ...lib.gridfinityUtils.binBodyGenerator import (
+    createGridfinityBinBody,
+    uniformCompartments,
+)
+from ...lib.gridfinityUtils.binBodyGeneratorInput import (
+    BinBodyGeneratorInput,
+    BinBodyGeneratorSpec,
+    BinBodyCompartmentDefinition,
+)
+from ...lib.gridfinityUtils.compartmentLayout import (
+    CompartmentLayoutError,
+    formatLayout,
+    parseLayout,
+)
+from ...lib.gridfinityUtils.compartmentMerge import markOutlineEdges
+from ...lib.gridfinityUtils.binBodyTabGeneratorInput import BinBodyTabGeneratorInput
+from ...lib.gridfinityUtils.binBodyTabGenerator import createGridfinityBinBodyTab
+from ...lib.gridfinityUtils.binEnvelopeGenerator import createGridfinityBinEnvelope
+from ...lib.gridfinityUtils.binSnapshot import (
+    BIN_STAGES,
+    BIN_STAGE_BASE,
+    BIN_STAGE_BODY,
+    BinSnapshot,
+    findStageGroups,
+    firstChangedStage,
+    readBinSnapshot,
+    writeBinSnapshot,
+)
+from ...lib.gridfinityUtils.binHeightFamily import (
+    createStretchedBinCopy,
+    parseHeightFamily,
+    stretchHeight,
+)
+from ...lib.ui.commandUiState import CommandUiState
+from ...lib.ui.inputValidation import ValidationResult
+from .inputState import (
+    InputState,
+    CompartmentState,
+    BIN_TYPE_HOLLOW,
+    BIN_TYPE_SHELLED,
+    BIN_TYPE_SOLID,
+    BIN_COMPARTMENTS_GRID_TYPE_UNIFORM,
+    BIN_COMPARTMENTS_GRID_TYPE_CUSTOM,
+    BIN_COMPARTMENTS_GRID_TYPE_TEXT,
+)
+from .inputRules import BIN_INPUT_RULES
+from ...lib.ui.unsupportedDesignTypeException import UnsupportedDesignTypeException
+from .entry import CMD_NAME, CONFIG_FOLDER_PATH, getErrorMessage, showErrorInMessageBox
+
+app = adsk.core.Application.get()
+ui = app.userInterface
+
+
+commandUIState = CommandUiState(CMD_NAME)
+actualDimensionsTableUiState = CommandUiState(CMD_NAME)
+actualCompartmentDimensionsUiState = CommandUiState(CMD_NAME)
+# layout parsing and dimension math of the dialog, see config.py
+dialogWorker = BackgroundWorker("binDialog")
+commandCompartmentsTableUIState: list[CommandUiState] = []
+showPreviewManualState = False
+# bin regenerated in place on OK, set while the dialog edits an existing bin
+editedOccurrence: adsk.fusion.Occurrence = None
+# dialog state replaced by the edited bin snapshot, put back when the edit ends
+uiStateBeforeEdit: dict = None
+
+UI_INPUT_DEFAULTS_CONFIG_PATH = os.path.join(
+    CONFIG_FOLDER_PATH, "ui_input_defaults.json"
+)
+
+# Local list of event handlers used to maintain a reference so
+# they are not released and garbage collected.
+local_handlers = []
+
+# Constants
+BIN_BASIC_SIZES_GROUP = "bin_basic_sizes_group"
+BIN_DIMENSIONS_GROUP = "bin_dimensions_group"
+BIN_FEATURES_GROUP = "bin_features_group"
+BIN_COMPARTMENTS_GROUP_ID = "compartments_group"
+BIN_SCOOP_GROUP_ID = "bin_scoop_group"
+BIN_TAB_FEATURES_GROUP_ID = "bin_tab_features_group"
+BIN_BASE_FEATURES_GROUP_ID = "bin_base_features_group"
+USER_CHANGES_GROUP_ID = "user_changes_group"
+PREVIEW_GROUP_ID = "preview_group"
+INFO_GROUP = "info_group"
+
+BIN_BASE_WIDTH_UNIT_INPUT_ID = "base_width_unit"
+BIN_BASE_LENGTH_UNIT_INPUT_ID = "base_length_unit"
+BIN_HEIGHT_UNIT_INPUT_ID = "height_unit"
+BIN_XY_CLEARANCE_INPUT_ID = "bin_xy_tolerance"
+BIN_WIDTH_INPUT_ID = "bin_width"
+BIN_LENGTH_INPUT_ID = "bin_length"
+BIN_HEIGHT_INPUT_ID = "bin_height"
+BIN_WIDTH_INPUT_ID = "bin_width"
+BIN_QUANTITY_INPUT_ID = "bin_quantity"
+BIN_HEIGHT_FAMILY_INPUT_ID = "bin_height_family"
+BIN_REAL_DIMENSIONS_TABLE = "real_dimensions"
+BIN_REAL_DIMENSIONS_TABLE_TOTAL_WIDTH = "total_real_width"
+BIN_REAL_DIMENSIONS_TABLE_TOTAL_LENGTH = "total_real_length"
+BIN_REAL_DIMENSIONS_TABLE_TOTAL_HEIGHT = "total_real_height"
+BIN_WALL_THICKNESS_INPUT_ID = "bin_wall_thickness"
+BIN_GENERATE_BASE_INPUT_ID = "bin_generate_base"
+BIN_GENERATE_BODY_INPUT_ID = "bin_generate_body"
+BIN_SCREW_HOLES_INPUT_ID = "bin_screw_holes"
+BIN_MAGNET_CUTOUTS_INPUT_ID = "bin_magnet_cutouts"
+BIN_MAGNET_CUTOUTS_TABS_INPUT_ID = "bin_magnet_cutouts_tabs"
+BIN_SCREW_DIAMETER_INPUT = "screw_diameter"
+BIN_MAGNET_DIAMETER_INPUT = "magnet_diameter"
+BIN_MAGNET_HEIGHT_INPUT = "magnet_height"
+BIN_HAS_SCOOP_INPUT_ID = "bin_has_scoop"
+BIN_SCOOP_MAX_RADIUS_INPUT_ID = "bin_scoop_max_radius"
+BIN_HAS_TAB_INPUT_ID = "bin_has_tab"
+BIN_TAB_LENGTH_INPUT_ID = "bin_tab_length"
+BIN_TAB_WIDTH_INPUT_ID = "bin_tab_width"
+BIN_TAB_POSITION_INPUT_ID = "bin_tab_position"
+BIN_TAB_ANGLE_INPUT_ID = "bin_tab_angle"
+BIN_WITH_LIP_INPUT_ID = "with_lip"
+BIN_WITH_LIP_NOTCHES_INPUT_ID = "with_lip_notches"
+BIN_COMPARTMENTS_LIP_INPUT_ID = "compartments_lip"
+BIN_COMPARTMENT_REAL_DIMENSIONS_TABLE = "compartment_real_dimensions"
+BIN_COMPARTMENT_REAL_DIMENSIONS_WIDTH = "compartment_width_u"
+BIN_COMPARTMENT_REAL_DIMENSIONS_LENGTH = "compartment_length_u"
+BIN_COMPARTMENTS_GRID_TYPE_ID = "compartments_grid_type"
+BIN_COMPARTMENTS_GRID_TYPE_INFO = "grid_type_info"
+BIN_COMPARTMENTS_GRID_TYPE_INFO_UNIFORM = (
+    "Divide bin uniformly along length and width dimensions"
+)
+BIN_COMPARTMENTS_GRID_TYPE_INFO_CUSTOM = "Input each compartment size and location. Grid size defines units for each compartment location (x, y) and dimensions (w, l)"
+BIN_COMPARTMENTS_GRID_BASE_WIDTH_ID = "compartments_grid_w"
+BIN_COMPARTMENTS_GRID_BASE_LENGTH_ID = "compartments_grid_l"
+BIN_COMPARTMENTS_TABLE_ID = "compartments_table"
+BIN_COMPARTMENTS_TABLE_ADD_ID = "compartments_table_add"
+BIN_COMPARTMENTS_TABLE_REMOVE_ID = "compartments_table_remove"
+BIN_COMPARTMENTS_TABLE_UNIFORM_ID = "compartments_table_uniform"
+BIN_COMPARTMENTS_LAYOUT_ID = "compartments_layout"
+BIN_TYPE_DROPDOWN_ID = "bin_type"
+
+INPUT_CHANGES_SAVE_DEFAULTS = "input_changes_buttons_save_new_defaults"
+INPUT_CHANGES_RESET_TO_DEFAULTS = "input_changes_button_reset_to_defaults"
+INPUT_CHANGES_RESET_TO_FACTORY = "input_changes_button_factory_reset"
+PRESERVE_CHAGES_RADIO_GROUP = "preserve_changes"
+PRESERVE_CHAGES_RADIO_GROUP_PRESERVE = "Preserve inputs"
+PRESERVE_CHAGES_RADIO_GROUP_RESET = "Reset inputs after creation"
+RESET_CHAGES_INPUT = "reset_changes"
+SHOW_PREVIEW_INPUT = "show_preview"
+SHOW_PREVIEW_MANUAL_INPUT = "show_preview_manual"
+
+# gap between copies of a bin generated together, cm
+BIN_QUANTITY_SPACING = 1
+
+INFO_TEXT = (
+    "<b>Help:</b> Info for inputs can be found "
+    '<a href="https://github.com/Le0Michine/FusionGridfinityGenerator/wiki/Bin-generator-options">'
+    "Here on our GitHub</a>."
+)
+
+
+def refreshUi():
+    global commandUIState
+    commandUIState.forceUIRefresh()
+    refreshCompartmentsTable()
+    update_actual_compartment_unit_dimensions()
+    update_actual_bin_dimensions()
+    onChangeValidate()
+
+
+def initDefaultUiState():
+    global commandUIState
+    global actualDimensionsTableUiState
+    global commandCompartmentsTableUIState
+    commandUIState.initValue(INFO_GROUP, True, adsk.core.GroupCommandInput.classType())
+    commandUIState.initValue(
+        BIN_BASIC_SIZES_GROUP, True, adsk.core.GroupCommandInput.classType()
+    )
+    commandUIState.initValue(
+        BIN_DIMENSIONS_GROUP, True, adsk.core.GroupCommandInput.classType()
+    )
+    commandUIState.initValue(
+        BIN_FEATURES_GROUP, True, adsk.core.GroupCommandInput.classType()
+    )
+    commandUIState.initValue(
+        BIN_COMPARTMENTS_GROUP_ID, True, adsk.core.GroupCommandInput.classType()
+    )
+    commandUIState.initValue(
+        BIN_SCOOP_GROUP_ID, True, adsk.core.GroupCommandInput.classType()
+    )
+    commandUIState.initValue(
+        BIN_TAB_FEATURES_GROUP_ID, True, adsk.core.GroupCommandInput.classType()
+    )
+    commandUIState.initValue(
+        BIN_BASE_FEATURES_GROUP_ID, True, adsk.core.GroupCommandInput.classType()
+    )
+    commandUIState.initValue(
+        USER_CHANGES_GROUP_ID, True, adsk.core.GroupCommandInput.classType()
+    )
+    commandUIState.initValue(
+        PREVIEW_GROUP_ID, True, adsk.core.GroupCommandInput.classType()
+    )
+
+    commandUIState.initValue(
+        BIN_BASE_WIDTH_UNIT_INPUT_ID,
+        const.DIMENSION_DEFAULT_WIDTH_UNIT,
+        adsk.core.ValueCommandInput.classType(),
+    )
+    commandUIState.initValue(
+        BIN_BASE_LENGTH_UNIT_INPUT_ID,
+        const.DIMENSION_DEFAULT_WIDTH_UNIT,
+        adsk.core.ValueCommandInput.classType(),
+    )
+    commandUIState.initValue(
+        BIN_HEIGHT_UNIT_INPUT_ID,
+        const.DIMENSION_DEFAULT_HEIGHT_UNIT,
+        adsk.core.ValueCommandInput.classType(),
+    )
+    commandUIState.initValue(
+        BIN_XY_CLEARANCE_INPUT_ID,
+        const.BIN_XY_CLEARANCE,
+        adsk.core.ValueCommandInput.classType(),
+    )
+    commandUIState.initValue(
+        BIN_WIDTH_INPUT_ID, 2, adsk.core.IntegerSpinnerCommandInput.classType()
+    )
+    commandUIState.initValue(
+        BIN_LENGTH_INPUT_ID, 3, adsk.core.IntegerSpinnerCommandInput.classType()
+    )
+    commandUIState.initValue(
+        BIN_HEIGHT_INPUT_ID, 5, adsk.core.ValueCommandInput.classType()
+    )
+    commandUIState.initValue(
+        BIN_QUANTITY_INPUT_ID, 1, adsk.core.IntegerSpinnerCommandInput.classType()
+    )
+    commandUIState.initValue(
+        BIN_HEIGHT_FAMILY_INPUT_ID, "", adsk.core.StringValueCommandInput.classType()
+    )
+
+    commandUIState.initValue(
+        BIN_GENERATE_BODY_INPUT_ID, True, adsk.core.BoolValueCommandInput.classType()
+    )
+    commandUIState.initValue(
+        BIN_TYPE_DROPDOWN_ID,
+        BIN_TYPE_HOLLOW,
+        adsk.core.DropDownCommandInput.classType(),
+    )
+    commandUIState.initValue(
+        BIN_WALL_THICKNESS_INPUT_ID,
+        const.BIN_WALL_THICKNESS,
+        adsk.core.ValueCommandInput.classType(),
+    )
+    commandUIState.initValue(
+        BIN_WITH_LIP_INPUT_ID, True, adsk.core.BoolValueCommandInput.classType()
+    )
+    commandUIState.initValue(
+        BIN_WITH_LIP_NOTCHES_INPUT_ID,
+        False,
+        adsk.core.BoolValueCommandInput.classType(),
+    )
+
+    commandUIState.initValue(
+        BIN_COMPARTMENTS_GRID_BASE_WIDTH_ID,
+        1,
+        adsk.core.IntegerSpinnerCommandInput.classType(),
+    )
+    commandUIState.initValue(
+        BIN_COMPARTMENTS_GRID_BASE_LENGTH_ID,
+        1,
+        adsk.core.IntegerSpinnerCommandInput.classType(),
+    )
+    commandUIState.initValue(
+        BIN_COMPARTMENTS_GRID_TYPE_ID,
+        BIN_COMPARTMENTS_GRID_TYPE_UNIFORM,
+        adsk.core.DropDownCommandInput.classType(),
+    )
+    commandUIState.initValue(
+        BIN_COMPARTMENTS_LAYOUT_ID,
+        "",
+        adsk.core.TextBoxCommandInput.classType(),
+    )
+
+    commandUIState.initValue(
+        BIN_COMPARTMENTS_LIP_INPUT_ID,
+        False,
+        adsk.core.BoolValueCommandInput.classType(),
+    )
+
+    commandUIState.initValue(
+        BIN_HAS_SCOOP_INPUT_ID, False, adsk.core.BoolValueCommandInput.classType()
+    )
+    commandUIState.initValue(
+        BIN_SCOOP_MAX_RADIUS_INPUT_ID,
+        const.BIN_SCOOP_MAX_RADIUS,
+        adsk.core.ValueCommandInput.classType(),
+    )
+
+    commandUIState.initValue(
+        BIN_HAS_TAB_INPUT_ID, False, adsk.core.BoolValueCommandInput.classType()
+    )
+    commandUIState.initValue(
+        BIN_TAB_LENGTH_INPUT_ID, 1, adsk.core.ValueCommandInput.classType()
+    )
+    commandUIState.initValue(
+        BIN_TAB_WIDTH_INPUT_ID,
+        const.BIN_TAB_WIDTH,
+        adsk.core.ValueCommandInput.classType(),
+    )
+    commandUIState.initValue(
+        BIN_TAB_POSITION_INPUT_ID, 0, adsk.core.ValueCommandInput.classType()
+    )
+    commandUIState.initValue(
+        BIN_TAB_ANGLE_INPUT_ID, "45 deg", adsk.core.ValueCommandInput.classType()
+    )
+
+    commandUIState.initValue(
+        BIN_GENERATE_BASE_INPUT_ID, True, adsk.core.BoolValueCommandInput.classType()
+    )
+    commandUIState.initValue(
+        BIN_SCREW_HOLES_INPUT_ID, False, adsk.core.BoolValueCommandInput.classType()
+    )
+    commandUIState.initValue(
+        BIN_SCREW_DIAMETER_INPUT,
+        const.DIMENSION_SCREW_HOLE_DIAMETER,
+        adsk.core.ValueCommandInput.classType(),
+    )
+    commandUIState.initValue(
+        BIN_SCREW_DIAMETER_INPUT,
+        const.DIMENSION_SCREW_HOLE_DIAMETER,
+        adsk.core.ValueCommandInput.classType(),
+    )
+    commandUIState.initValue(
+        BIN_MAGNET_CUTOUTS_INPUT_ID, False, adsk.core.BoolValueCommandInput.classType()
+    )
+    commandUIState.initValue(
+        BIN_MAGNET_CUTOUTS_TABS_INPUT_ID,
+        False,
+        adsk.core.BoolValueCommandInput.classType(),
+    )
+    commandUIState.initValue(
+        BIN_MAGNET_DIAMETER_INPUT,
+        const.DIMENSION_MAGNET_CUTOUT_DIAMETER,
+        adsk.core.ValueCommandInput.classType(),
+    )
+    commandUIState.initValue(
+        BIN_MAGNET_HEIGHT_INPUT,
+        const.DIMENSION_MAGNET_CUTOUT_DEPTH,
+        adsk.core.ValueCommandInput.classType(),
+    )
+
+    commandCompartmentsTableUIState = []
+    restoreUiState(configUtils.readJsonConfig(UI_INPUT_DEFAULTS_CONFIG_PATH))
+    futil.log(f"{CMD_NAME} UI state initialized")
+
+
+def restoreUiState(recordedState: dict):
+    """Restores dialog state saved by uiStateDict, over the current state."""
+    global commandUIState
+    global commandCompartmentsTableUIState
+    if (
+        recordedState is not None
+        and "static_ui" in recordedState
+        and "compartments_table" in recordedState
+    ):
+        staticUiState = recordedState["static_ui"]
+        compartmentsTableState = recordedState["compartments_table"]
+        if staticUiState is not None:
+            futil.log(
+                f"{CMD_NAME} Found previously saved default values, restoring {staticUiState}"
+            )
+
+            try:
+                commandUIState.initValues(staticUiState)
+                futil.log(f"{CMD_NAME} Successfully restored default values")
+            except Exception as err:
+                futil.log(f"{CMD_NAME} Failed to restore default values, err: {err}")
+        if compartmentsTableState is not None and isinstance(
+            compartmentsTableState, list
+        ):
+            futil.log(
+                f"{CMD_NAME} Found previously saving default values for compartments table, restoring {compartmentsTableState}"
+            )
+            try:
+                commandCompartmentsTableUIState = []
+                for row in compartmentsTableState:
+                    commandCompartmentsTableUIState.append(CommandUiState(CMD_NAME))
+                    commandCompartmentsTableUIState[-1].initValues(row)
+                futil.log(
+                    f"{CMD_NAME} Successfully restored compartments table default values"
+                )
+            except Exception as err:
+                futil.log(f"{CMD_NAME} Failed to restore default values, err: {err}")
+
+
+# Executed the first time the command is created.
+def load():
+    initDefaultUiState()
+    if config.DIALOG_BACKGROUND_WORKER_ENABLED:
+        dialogWorker.start()
+
+
+# Executed when add-in is stopped, if the command was used.
+def unload():
+    dialogWorker.stop()
+
+
+def render_actual_bin_dimensions_table(inputs: adsk.core.CommandInputs):
+    global actualDimensionsTableUiState
+    actualDimensionsTable = inputs.addTableCommandInput(
+        BIN_REAL_DIMENSIONS_TABLE, "Actual dimensions (mm)", 3, "1:1:1"
+    )
+    totalWidth = actualDimensionsTable.commandInputs.addStringValueInput(
+        BIN_REAL_DIMENSIONS_TABLE_TOTAL_WIDTH, "", "Width"
+    )
+    totalWidth.isReadOnly = True
+    actualDimensionsTableUiState.registerCommandInput(totalWidth)
+    actualDimensionsTableUiState.initValue(totalWidth.id, "", totalWidth.objectType)
+    totalLength = actualDimensionsTable.commandInputs.addStringValueInput(
+        BIN_REAL_DIMENSIONS_TABLE_TOTAL_LENGTH, "", "Length"
+    )
+    totalLength.isReadOnly = True
+    actualDimensionsTableUiState.registerCommandInput(totalLength)
+    actualDimensionsTableUiState.initValue(totalLength.id, "", totalLength.objectType)
+    totalHeight = actualDimensionsTable.commandInputs.addStringValueInput(
+        BIN_REAL_DIMENSIONS_TABLE_TOTAL_HEIGHT, "", "Height"
+    )
+    totalHeight.isReadOnly = True
+    actualDimensionsTableUiState.registerCommandInput(totalHeight)
+    actualDimensionsTableUiState.initValue(totalHeight.id, "", totalHeight.objectType)
+    actualDimensionsTable.addCommandInput(totalWidth, 0, 0)
+    actualDimensionsTable.addCommandInput(totalLength, 0, 1)
+    actualDimensionsTable.addCommandInput(totalHeight, 0, 2)
+    actualDimensionsTable.tooltip = "Actual bin dimensions"
+    actualDimensionsTable.tablePresentationStyle = (
+        adsk.core.TablePresentationStyles.transparentBackgroundTablePresentationStyle
+    )
+    actualDimensionsTable.hasGrid = False
+    actualDimensionsTable.minimumVisibleRows = 1
+    actualDimensionsTable.maximumVisibleRows = 1
+    return actualDimensionsTable
+
+
+def render_actual_compartment_dimension_units_table(inputs: adsk.core.CommandInputs):
+    global actualCompartmentDimensionsUiState
+    actualDimensionsTable = inputs.addTableCommandInput(
+        BIN_COMPARTMENT_REAL_DIMENSIONS_TABLE, "Actual dimensions (mm)", 2, "1:1"
+    )
+    totalWidth = actualDimensionsTable.commandInputs.addTextBoxCommandInput(
+        BIN_COMPARTMENT_REAL_DIMENSIONS_WIDTH, "", "Grid cell width", 1, True
+    )
+    actualCompartmentDimensionsUiState.registerCommandInput(totalWidth)
+    actualCompartmentDimensionsUiState.initValue(
+        totalWidth.id, "", totalWidth.objectType
+    )
+    totalLength = actualDimensionsTable.commandInputs.addTextBoxCommandInput(
+        BIN_COMPARTMENT_REAL_DIMENSIONS_LENGTH, "", "Grid cell length", 1, True
+    )
+    actualCompartmentDimensionsUiState.registerCommandInput(totalLength)
+    actualCompartmentDimensionsUiState.initValue(
+        totalLength.id, "", totalLength.objectType
+    )
+    actualDimensionsTable.addCommandInput(totalWidth, 0, 0)
+    actualDimensionsTable.addCommandInput(totalLength, 0, 1)
+    actualDimensionsTable.tablePresentationStyle = (
+        adsk.core.TablePresentationStyles.transparentBackgroundTablePresentationStyle
+    )
+    actualDimensionsTable.hasGrid = False
+    actualDimensionsTable.minimumVisibleRows = 1
+    actualDimensionsTable.maximumVisibleRows = 1
+    return actualDimensionsTable
+
+
+def formatString(text: str, color: str = ""):
+    if len(color) > 0:
+        return f"<p style='color:{color}'>{text}</p>"
+    return text
+
+
+def compartmentCellSizes(
+    baseWidth: float,
+    baseLength: float,
+    binWidth: float,
+    binLength: float,
+    gridWidth: int,
+    gridLength: int,
+    wallThickness: float,
+    xyClearance: float,
+):
+    """Returns grid cell width, length and the smallest cell size allowed in mm."""
+    minCompartmentDimensionLimit = (
+        (const.BIN_CORNER_FILLET_RADIUS - wallThickness) * 2 * 10
+    )
+    cellWidth = round(
+        (
+            baseWidth * binWidth
+            - wallThickness * 2
+            - xyClearance * 2
+            - wallThickness * (gridWidth - 1)
+        )
+        / gridWidth
+        * 10,
+        2,
+    )
+    cellLength = round(
+        (
+            baseLength * binLength
+            - wallThickness * 2
+            - xyClearance * 2
+            - wallThickness * (gridLength - 1)
+        )
+        / gridLength
+        * 10,
+        2,
+    )
+    return cellWidth, cellLength, minCompartmentDimensionLimit
+
+
+def update_actual_compartment_unit_dimensions():
+    global commandUIState
+    state = commandUIState.getState
+    sizesArgs = (
+        state(BIN_BASE_WIDTH_UNIT_INPUT_ID),
+        state(BIN_BASE_LENGTH_UNIT_INPUT_ID),
+        state(BIN_WIDTH_INPUT_ID),
+        state(BIN_LENGTH_INPUT_ID),
+        state(BIN_COMPARTMENTS_GRID_BASE_WIDTH_ID),
+        state(BIN_COMPARTMENTS_GRID_BASE_LENGTH_ID),
+        state(BIN_WALL_THICKNESS_INPUT_ID),
+        state(BIN_WITH_LIP_INPUT_ID),
+    )
+    dialogWorker.submit(
+        "compartmentCellSizes",
+        lambda: compartmentCellSizes(*sizesArgs),
+        show_actual_compartment_unit_dimensions,
+    )
+
+
+def show_actual_compartment_unit_dimensions(cellSizes: tuple[float, float, float]):
+    global actualCompartmentDimensionsUiState
+    try:
+        cellWidth, cellLength, minCompartmentDimensionLimit = cellSizes
+        actualCompartmentDimensionsUiState.updateValue(
+            BIN_COMPARTMENT_REAL_DIMENSIONS_WIDTH,
+            formatString(
+                f"Grid cell width: {cellWidth}mm",
+                "" if cellWidth >= minCompartmentDimensionLimit else "red",
+            ),
+        )
+        actualCompartmentDimensionsUiState.updateValue(
+            BIN_COMPARTMENT_REAL_DIMENSIONS_LENGTH,
+            formatString(
+                f"Grid cell length: {cellLength}mm",
+                "" if cellLength >= minCompartmentDimensionLimit else "red",
+            ),
+        )
+    except:
+        showErrorInMessageBox()
+
+
+def actualBinDimensions(
+    baseWidth: float,
+    baseLength: float,
+    binWidth: float,
+    binLength: float,
+    heightUnit: float,
+    binHeight: float,
+    hasLip: bool,
+):
+    """Returns total bin width, length and height in mm."""
+    actualWidth = baseWidth * binWidth - const.BIN_XY_CLEARANCE * 2
+    actualLength = baseLength * binLength - const.BIN_XY_CLEARANCE * 2
+    actualHeight = heightUnit * binHeight + (
+        (const.BIN_LIP_EXTRA_HEIGHT - const.BIN_LIP_TOP_RECESS_HEIGHT) if hasLip else 0
+    )
+    return (
+        round(actualWidth * 10, 2),
+        round(actualLength * 10, 2),
+        round(actualHeight * 10, 2),
+    )
+
+
+def update_actual_bin_dimensions():
+    state = commandUIState.getState
+    dimensionsArgs = (
+        state(BIN_BASE_WIDTH_UNIT_INPUT_ID),
+        state(BIN_BASE_LENGTH_UNIT_INPUT_ID),
+        state(BIN_WIDTH_INPUT_ID),
+        state(BIN_LENGTH_INPUT_ID),
+        state(BIN_HEIGHT_UNIT_INPUT_ID),
+        state(BIN_HEIGHT_INPUT_ID),
+        state(BIN_WITH_LIP_INPUT_ID),
+    )
+    dialogWorker.submit(
+        "binDimensions",
+        lambda: actualBinDimensions(*dimensionsArgs),
+        show_actual_bin_dimensions,
+    )
+
+
+def show_actual_bin_dimensions(dimensions: tuple[float, float, float]):
+    global actualDimensionsTableUiState
+    try:
+        totalWidthValue, totalLengthValue, totalHeightValue = dimensions
+        actualDimensionsTableUiState.updateValue(
+            BIN_REAL_DIMENSIONS_TABLE_TOTAL_WIDTH, f"Width: {totalWidthValue}mm"
+        )
+        actualDimensionsTableUiState.getInput(
+            BIN_REAL_DIMENSIONS_TABLE_TOTAL_WIDTH
+        ).tooltip = f"Total bin height: {totalWidthValue}mm"
+        actualDimensionsTableUiState.updateValue(
+            BIN_REAL_DIMENSIONS_TABLE_TOTAL_LENGTH, f"Length: {totalLengthValue}mm"
+        )
+        actualDimensionsTableUiState.getInput(
+            BIN_REAL_DIMENSIONS_TABLE_TOTAL_LENGTH
+        ).tooltip = f"Total bin length: {totalLengthValue}mm"
+        actualDimensionsTableUiState.updateValue(
+            BIN_REAL_DIMENSIONS_TABLE_TOTAL_HEIGHT, f"Height: {totalHeightValue}mm"
+        )
+        actualDimensionsTableUiState.getInput(
+            BIN_REAL_DIMENSIONS_TABLE_TOTAL_HEIGHT
+        ).tooltip = f"Total bin height: {totalHeightValue}mm"
+    except:
+        showErrorInMessageBox()
+
+
+def render_compartments_table(inputs: adsk.core.CommandInputs):
+    global commandUIState
+    initiallyVisible: bool = (
+        commandUIState.getState(BIN_COMPARTMENTS_GRID_TYPE_ID)
+        == BIN_COMPARTMENTS_GRID_TYPE_CUSTOM
+    )
+    compartmentsGroup: adsk.core.GroupCommandInput = commandUIState.getInput(
+        BIN_COMPARTMENTS_GROUP_ID
+    )
+    binCompartmentsTable = compartmentsGroup.children.addTableCommandInput(
+        BIN_COMPARTMENTS_TABLE_ID, "Compartments", 5, "1:1:1:1:1"
+    )
+    addButton = compartmentsGroup.commandInputs.addBoolValueInput(
+        BIN_COMPARTMENTS_TABLE_ADD_ID, "Add", False, "", False
+    )
+    removeButton = compartmentsGroup.commandInputs.addBoolValueInput(
+        BIN_COMPARTMENTS_TABLE_REMOVE_ID, "Remove", False, "", False
+    )
+    populateUniform = compartmentsGroup.commandInputs.addBoolValueInput(
+        BIN_COMPARTMENTS_TABLE_UNIFORM_ID, "Reset to uniform", False, "", False
+    )
+    binCompartmentsTable.addToolbarCommandInput(addButton)
+    binCompartmentsTable.addToolbarCommandInput(removeButton)
+    binCompartmentsTable.addToolbarCommandInput(populateUniform)
+    binCompartmentsTable.hasGrid = False
+    binCompartmentsTable.tablePresentationStyle = (
+        adsk.core.TablePresentationStyles.nameValueTablePresentationStyle
+    )
+    commandUIState.registerCommandInput(binCompartmentsTable)
+    x_input_label = binCompartmentsTable.commandInputs.addStringValueInput(
+        "x_input_0_label", "", "X position"
+    )
+    x_input_label.isReadOnly = True
+    x_input_label.isFullWidth = True
+    y_input_label = binCompartmentsTable.commandInputs.addStringValueInput(
+        "y_input_0_label", "", "Y position"
+    )
+    y_input_label.isReadOnly = True
+    y_input_label.isFullWidth = True
+    w_input_label = binCompartmentsTable.commandInputs.addStringValueInput(
+        "w_input_0_label", "", "Width"
+    )
+    w_input_label.isFullWidth = True
+    w_input_label.isReadOnly = True
+    l_input_label = binCompartmentsTable.commandInputs.addStringValueInput(
+        "l_input_0_label", "", "Length"
+    )
+    l_input_label.isReadOnly = True
+    l_input_label.isFullWidth = True
+    d_input_label = binCompartmentsTable.commandInputs.addStringValueInput(
+        "d_input_0_label", "", "Depth"
+    )
+    d_input_label.isReadOnly = True
+    d_input_label.isFullWidth = True
+    binCompartmentsTable.addCommandInput(x_input_label, 0, 0)
+    binCompartmentsTable.addCommandInput(y_input_label, 0, 1)
+    binCompartmentsTable.addCommandInput(w_input_label, 0, 2)
+    binCompartmentsTable.addCommandInput(l_input_label, 0, 3)
+    binCompartmentsTable.addCommandInput(d_input_label, 0, 4)
+    binCompartmentsTable.maximumVisibleRows = 20
+    binCompartmentsTable.isVisible = initiallyVisible
+    addButton.isVisible = initiallyVisible
+    removeButton.isVisible = initiallyVisible
+    populateUniform.isVisible = initiallyVisible
+
+    append_compartments_from_state()
+
+
+def append_compartments_from_state():
+    global commandCompartmentsTableUIState
+    for i, rowState in enumerate(commandCompartmentsTableUIState, 1):
+        append_compartment_table_row(
+            rowState.getState(f"x_input_{i}"),
+            rowState.getState(f"y_input_{i}"),
+            rowState.getState(f"w_input_{i}"),
+            rowState.getState(f"l_input_{i}"),
+            rowState.getState(f"d_input_{i}"),
+        )
+
+
+def append_compartment_table_row(x: int, y: int, w: int, l: int, defaultDepth: float):
+    global commandUIState
+    binCompartmentsTable: adsk.core.TableCommandInput = commandUIState.getInput(
+        BIN_COMPARTMENTS_TABLE_ID
+    )
+    commandUIState.registerCommandInput(binCompartmentsTable)
+    newRow = binCompartmentsTable.rowCount
+    x_input = binCompartmentsTable.commandInputs.addIntegerSpinnerCommandInput(
+        f"x_input_{newRow}", "X (u)", 0, 100, 1, x
+    )
+    x_input.isFullWidth = True
+    y_input = binCompartmentsTable.commandInputs.addIntegerSpinnerCommandInput(
+        f"y_input_{newRow}", "Y (u)", 0, 100, 1, y
+    )
+    y_input.isFullWidth = True
+    w_input = binCompartmentsTable.commandInputs.addIntegerSpinnerCommandInput(
+        f"w_input_{newRow}", "W (u)", 1, 100, 1, w
+    )
+    w_input.isFullWidth = True
+    l_input = binCompartmentsTable.commandInputs.addIntegerSpinnerCommandInput(
+        f"l_input_{newRow}", "L (u)", 1, 100, 1, l
+    )
+    l_input.isFullWidth = True
+    d_input = binCompartmentsTable.commandInputs.addValueInput(
+        f"d_input_{newRow}",
+        "Depth (mm)",
+        app.activeProduct.unitsManager.defaultLengthUnits,
+        adsk.core.ValueInput.createByReal(defaultDepth),
+    )
+    d_input.isFullWidth = True
+    binCompartmentsTable.addCommandInput(x_input, newRow, 0)
+    binCompartmentsTable.addCommandInput(y_input, newRow, 1)
+    binCompartmentsTable.addCommandInput(w_input, newRow, 2)
+    binCompartmentsTable.addCommandInput(l_input, newRow, 3)
+    binCompartmentsTable.addCommandInput(d_input, newRow, 4)
+
+
+def getCompartmentsState() -> tuple[CompartmentState, ...]:
+    binCompartmentsTable: adsk.core.TableCommandInput = commandUIState.getInput(
+        BIN_COMPARTMENTS_TABLE_ID
+    )
+    compartments = []
+    for i in range(1, binCompartmentsTable.rowCount):
+        compartments.append(
+            CompartmentState(
+                *[binCompartmentsTable.getInputAtPosition(i, j).value for j in range(5)]
+            )
+        )
+    return tuple(compartments)
+
+
+def getInputsState() -> InputState:
+    global commandUIState
+    state = commandUIState.getState
+    gridType = state(BIN_COMPARTMENTS_GRID_TYPE_ID)
+    return InputState(
+        baseWidth=state(BIN_BASE_WIDTH_UNIT_INPUT_ID),
+        baseLength=state(BIN_BASE_LENGTH_UNIT_INPUT_ID),
+        heightUnit=state(BIN_HEIGHT_UNIT_INPUT_ID),
+        xyClearance=state(BIN_XY_CLEARANCE_INPUT_ID),
+        binWidth=state(BIN_WIDTH_INPUT_ID),
+        binLength=state(BIN_LENGTH_INPUT_ID),
+        binHeight=state(BIN_HEIGHT_INPUT_ID),
+        heightFamily=state(BIN_HEIGHT_FAMILY_INPUT_ID),
+        wallThickness=state(BIN_WALL_THICKNESS_INPUT_ID),
+        generateBase=state(BIN_GENERATE_BASE_INPUT_ID),
+        hasScrewHoles=state(BIN_SCREW_HOLES_INPUT_ID),
+        screwHoleDiameter=state(BIN_SCREW_DIAMETER_INPUT),
+        hasMagnetCutouts=state(BIN_MAGNET_CUTOUTS_INPUT_ID),
+        hasMagnetCutoutsTabs=state(BIN_MAGNET_CUTOUTS_TABS_INPUT_ID),
+        magnetCutoutDiameter=state(BIN_MAGNET_DIAMETER_INPUT),
+        magnetCutoutDepth=state(BIN_MAGNET_HEIGHT_INPUT),
+        generateBody=state(BIN_GENERATE_BODY_INPUT_ID),
+        binType=state(BIN_TYPE_DROPDOWN_ID),
+        hasLip=state(BIN_WITH_LIP_INPUT_ID),
+        hasLipNotches=state(BIN_WITH_LIP_NOTCHES_INPUT_ID),
+        hasScoop=state(BIN_HAS_SCOOP_INPUT_ID),
+        scoopMaxRadius=state(BIN_SCOOP_MAX_RADIUS_INPUT_ID),
+        hasTab=state(BIN_HAS_TAB_INPUT_ID),
+        tabLength=state(BIN_TAB_LENGTH_INPUT_ID),
+        tabWidth=state(BIN_TAB_WIDTH_INPUT_ID),
+        tabPosition=state(BIN_TAB_POSITION_INPUT_ID),
+        # angle state keeps the expression, use the evaluated value
+        tabAngle=commandUIState.getInput(BIN_TAB_ANGLE_INPUT_ID).value,
+        compartmentsGridType=gridType,
+        compartmentsGridWidth=state(BIN_COMPARTMENTS_GRID_BASE_WIDTH_ID),
+        compartmentsGridLength=state(BIN_COMPARTMENTS_GRID_BASE_LENGTH_ID),
+        hasCompartmentsLip=state(BIN_COMPARTMENTS_LIP_INPUT_ID),
+        compartmentsLayout=state(BIN_COMPARTMENTS_LAYOUT_ID),
+        compartments=(
+            getCompartmentsState()
+            if gridType == BIN_COMPARTMENTS_GRID_TYPE_CUSTOM
+            else ()
+        ),
+    )
+
+
+def validateInputs() -> ValidationResult:
+    result = BIN_INPUT_RULES.validate(getInputsState())
+    if not result.isValid:
+        futil.log_debug("%s Invalid inputs: %s", CMD_NAME, result.messages())
+    return result
+
+
+# Function that is called when a user clicks the corresponding button in the UI.
+# This defines the contents of the command dialog and connects to the command related events.
+# editOccurrence is a generated bin when the dialog is opened by the edit bin command.
+def command_created(
+    args: adsk.core.CommandCreatedEventArgs,
+    editOccurrence: adsk.fusion.Occurrence = None,
+):
+    # General logging for debug.
+    futil.log(f"{CMD_NAME} Command Created Event")
+    global commandUIState
+    global actualDimensionsTableUiState
+    global editedOccurrence
+    global uiStateBeforeEdit
+
+    editedOccurrence = editOccurrence
+    if editOccurrence is not None:
+        uiStateBeforeEdit = uiStateDict()
+        restoreUiState(readBinSnapshot(editOccurrence.component).uiState)
+
+    args.command.setDialogInitialSize(400, 500)
+
+    # https://help.autodesk.com/view/fusion360/ENU/?contextId=CommandInputs
+    inputs = args.command.commandInputs
+    # Create a value input field and set the default using 1 unit of the default length unit.
+    defaultLengthUnits = app.activeProduct.unitsManager.defaultLengthUnits
+
+    infoGroup = inputs.addGroupCommandInput(INFO_GROUP, "Info")
+    infoGroup.children.addTextBoxCommandInput("info_text", "Info", INFO_TEXT, 3, True)
+    infoGroup.isExpanded = commandUIState.getState(INFO_GROUP)
+    commandUIState.registerCommandInput(infoGroup)
+
+    basicSizesGroup = inputs.addGroupCommandInput(BIN_BASIC_SIZES_GROUP, "Basic sizes")
+    basicSizesGroup.isExpanded = commandUIState.getState(BIN_BASIC_SIZES_GROUP)
+    commandUIState.registerCommandInput(basicSizesGroup)
+    baseWidthUnitInput = basicSizesGroup.children.addValueInput(
+        BIN_BASE_WIDTH_UNIT_INPUT_ID,
+        "Base width unit (mm)",
+        defaultLengthUnits,
+        adsk.core.ValueInput.createByReal(
+            commandUIState.getState(BIN_BASE_WIDTH_UNIT_INPUT_ID)
+        ),
+    )
+    baseWidthUnitInput.minimumValue = 1
+    baseWidthUnitInput.isMinimumInclusive = True
+    commandUIState.registerCommandInput(baseWidthUnitInput)
+    baseLengthUnitInput = basicSizesGroup.children.addValueInput(
+        BIN_BASE_LENGTH_UNIT_INPUT_ID,
+        "Base length unit (mm)",
+        defaultLengthUnits,
+        adsk.core.ValueInput.createByReal(
+            commandUIState.getState(BIN_BASE_LENGTH_UNIT_INPUT_ID)
+        ),
+    )
+    baseLengthUnitInput.minimumValue = 1
+    baseLengthUnitInput.isMinimumInclusive = True
+    commandUIState.registerCommandInput(baseLengthUnitInput)
+    binHeightUnitInput = basicSizesGroup.children.addValueInput(
+        BIN_HEIGHT_UNIT_INPUT_ID,
+        "Bin height unit (mm)",
+        defaultLengthUnits,
+        adsk.core.ValueInput.createByReal(
+            commandUIState.getState(BIN_HEIGHT_UNIT_INPUT_ID)
+        ),
+    )
+    binHeightUnitInput.minimumValue = 0.5
+    binHeightUnitInput.isMinimumInclusive = True
+    commandUIState.registerCommandInput(binHeightUnitInput)
+    xyClearanceInput = basicSizesGroup.children.addValueInput(
+        BIN_XY_CLEARANCE_INPUT_ID,
+        "Bin xy clearance (mm)",
+        defaultLengthUnits,
+        adsk.core.ValueInput.createByReal(
+            commandUIState.getState(BIN_XY_CLEARANCE_INPUT_ID)
+        ),
+    )
+    xyClearanceInput.minimumValue = 0.01
+    xyClearanceInput.isMinimumInclusive = True
+    xyClearanceInput.maximumValue = 0.05
+    xyClearanceInput.isMaximumInclusive = True
+    commandUIState.registerCommandInput(xyClearanceInput)
+
+    binDimensionsGroup = inputs.addGroupCommandInput(
+        BIN_DIMENSIONS_GROUP, "Main dimensions"
+    )
+    binDimensionsGroup.tooltipDescription = "Set in base units"
+    binDimensionsGroup.isExpanded = commandUIState.getState(BIN_DIMENSIONS_GROUP)
+    commandUIState.registerCommandInput(binDimensionsGroup)
+    binWidthInput = binDimensionsGroup.children.addIntegerSpinnerCommandInput(
+        BIN_WIDTH_INPUT_ID,
+        "Bin width, X (u)",
+        1,
+        100,
+        1,
+        commandUIState.getState(BIN_WIDTH_INPUT_ID),
+    )
+    commandUIState.registerCommandInput(binWidthInput)
+    binLengthInput = binDimensionsGroup.children.addIntegerSpinnerCommandInput(
+        BIN_LENGTH_INPUT_ID,
+        "Bin length, Y (u)",
+        1,
+        100,
+        1,
+        commandUIState.getState(BIN_LENGTH_INPUT_ID),
+    )
+    commandUIState.registerCommandInput(binLengthInput)
+    binHeightInput = binDimensionsGroup.children.addValueInput(
+        BIN_HEIGHT_INPUT_ID,
+        "Bin height, Z (u)",
+        "",
+        adsk.core.ValueInput.createByReal(commandUIState.getState(BIN_HEIGHT_INPUT_ID)),
+    )
+    binHeightInput.minimumValue = 1
+    binHeightInput.isMinimumInclusive = True
+    commandUIState.registerCommandInput(binHeightInput)
+    binQuantityInput = binDimensionsGroup.children.addIntegerSpinnerCommandInput(
+        BIN_QUANTITY_INPUT_ID,
+        "Quantity",
+        1,
+        100,
+        1,
+        commandUIState.getState(BIN_QUANTITY_INPUT_ID),
+    )
+    binQuantityInput.tooltip = "Number of copies to generate"
+    binQuantityInput.tooltipDescription = "Copies after the first one are generated one by one once the dialog is closed, preview shows a single bin"
+    binQuantityInput.isVisible = editOccurrence is None
+    commandUIState.registerCommandInput(binQuantityInput)
+    binHeightFamilyInput = binDimensionsGroup.children.addStringValueInput(
+        BIN_HEIGHT_FAMILY_INPUT_ID,
+        "Other heights (u)",
+        commandUIState.getState(BIN_HEIGHT_FAMILY_INPUT_ID),
+    )
+    binHeightFamilyInput.tooltip = (
+        "Comma separated heights of more bins, e.g. '3, 6, 9'"
+    )
+    binHeightFamilyInput.tooltipDescription = "Bins taller than the first one are its copies stretched to the height, which is kept in a user parameter. Other bins are generated in full. Bins are generated one by one once the dialog is closed."
+    binHeightFamilyInput.isVisible = editOccurrence is None
+    commandUIState.registerCommandInput(binHeightFamilyInput)
+
+    render_actual_bin_dimensions_table(binDimensionsGroup.children)
+
+    binFeaturesGroup = inputs.addGroupCommandInput(BIN_FEATURES_GROUP, "Bin features")
+    binFeaturesGroup.isExpanded = commandUIState.getState(BIN_FEATURES_GROUP)
+    commandUIState.registerCommandInput(binFeaturesGroup)
+    generateBodyCheckboxInput = binFeaturesGroup.children.addBoolValueInput(
+        BIN_GENERATE_BODY_INPUT_ID,
+        "Generate body",
+        True,
+        "",
+        commandUIState.getState(BIN_GENERATE_BODY_INPUT_ID),
+    )
+    commandUIState.registerCommandInput(generateBodyCheckboxInput)
+    binTypeDropdown = binFeaturesGroup.children.addDropDownCommandInput(
+        BIN_TYPE_DROPDOWN_ID,
+        "Bin type",
+        adsk.core.DropDownStyles.LabeledIconDropDownStyle,
+    )
+    binTypeDropdownDefaultValue = commandUIState.getState(BIN_TYPE_DROPDOWN_ID)
+    binTypeDropdown.listItems.add(
+        BIN_TYPE_HOLLOW, binTypeDropdownDefaultValue == BIN_TYPE_HOLLOW
+    )
+    binTypeDropdown.listItems.add(
+        BIN_TYPE_SHELLED, binTypeDropdownDefaultValue == BIN_TYPE_SHELLED
+    )
+    binTypeDropdown.listItems.add(
+        BIN_TYPE_SOLID, binTypeDropdownDefaultValue == BIN_TYPE_SOLID
+    )
+    commandUIState.registerCommandInput(binTypeDropdown)
+
+    binWallThicknessInput = binFeaturesGroup.children.addValueInput(
+        BIN_WALL_THICKNESS_INPUT_ID,
+        "Bin wall thickness",
+        defaultLengthUnits,
+        adsk.core.ValueInput.createByReal(
+            commandUIState.getState(BIN_WALL_THICKNESS_INPUT_ID)
+        ),
+    )
+    binWallThicknessInput.minimumValue = 0.04
+    binWallThicknessInput.isMinimumInclusive = True
+    binWallThicknessInput.maximumValue = 0.2
+    binWallThicknessInput.isMaximumInclusive = True
+    commandUIState.registerCommandInput(binWallThicknessInput)
+    generateLipCheckboxInput = binFeaturesGroup.children.addBoolValueInput(
+        BIN_WITH_LIP_INPUT_ID,
+        "Generate lip for stackability",
+        True,
+        "",
+        commandUIState.getState(BIN_WITH_LIP_INPUT_ID),
+    )
+    commandUIState.registerCommandInput(generateLipCheckboxInput)
+    hasLipNotches = binFeaturesGroup.children.addBoolValueInput(
+        BIN_WITH_LIP_NOTCHES_INPUT_ID,
+        "Generate lip notches",
+        True,
+        "",
+        commandUIState.getState(BIN_WITH_LIP_NOTCHES_INPUT_ID),
+    )
+    hasLipNotches.isEnabled = commandUIState.getState(BIN_WITH_LIP_INPUT_ID)
+    commandUIState.registerCommandInput(hasLipNotches)
+
+    compartmentsGroup: adsk.core.GroupCommandInput = inputs.addGroupCommandInput(
+        BIN_COMPARTMENTS_GROUP_ID, "Bin compartments"
+    )
+    compartmentsGroup.isExpanded = commandUIState.getState(BIN_COMPARTMENTS_GROUP_ID)
+    commandUIState.registerCommandInput(compartmentsGroup)
+    binCompartmentsWidthInput = (
+        compartmentsGroup.children.addIntegerSpinnerCommandInput(
+            BIN_COMPARTMENTS_GRID_BASE_WIDTH_ID,
+            "Grid width, X (n per bin width)",
+            1,
+            100,
+            1,
+            commandUIState.getState(BIN_COMPARTMENTS_GRID_BASE_WIDTH_ID),
+        )
+    )
+    commandUIState.registerCommandInput(binCompartmentsWidthInput)
+    binCompartmentsLengthInput = (
+        compartmentsGroup.children.addIntegerSpinnerCommandInput(
+            BIN_COMPARTMENTS_GRID_BASE_LENGTH_ID,
+            "Grid length, Y (n per bin length)",
+            1,
+            100,
+            1,
+            commandUIState.getState(BIN_COMPARTMENTS_GRID_BASE_LENGTH_ID),
+        )
+    )
+    commandUIState.registerCommandInput(binCompartmentsLengthInput)
+    render_actual_compartment_dimension_units_table(compartmentsGroup.children)
+
+    compartmentGridDropdown = compartmentsGroup.children.addDropDownCommandInput(
+        BIN_COMPARTMENTS_GRID_TYPE_ID,
+        "Grid type",
+        adsk.core.DropDownStyles.LabeledIconDropDownStyle,
+    )
+    compartmentGridDropdownDefaultValue = commandUIState.getState(
+        BIN_COMPARTMENTS_GRID_TYPE_ID
+    )
+    compartmentGridDropdown.listItems.add(
+        BIN_COMPARTMENTS_GRID_TYPE_UNIFORM,
+        compartmentGridDropdownDefaultValue == BIN_COMPARTMENTS_GRID_TYPE_UNIFORM,
+    )
+    compartmentGridDropdown.listItems.add(
+        BIN_COMPARTMENTS_GRID_TYPE_CUSTOM,
+        compartmentGridDropdownDefaultValue == BIN_COMPARTMENTS_GRID_TYPE_CUSTOM,
+    )
+    compartmentGridDropdown.listItems.add(
+        BIN_COMPARTMENTS_GRID_TYPE_TEXT,
+        compartmentGridDropdownDefaultValue == BIN_COMPARTMENTS_GRID_TYPE_TEXT,
+    )
+    commandUIState.registerCommandInput(compartmentGridDropdown)
+    render_compartments_table(inputs)
+
+    compartmentsLayoutInput = compartmentsGroup.children.addTextBoxCommandInput(
+        BIN_COMPARTMENTS_LAYOUT_ID,
+        "Layout",
+        commandUIState.getState(BIN_COMPARTMENTS_LAYOUT_ID),
+        8,
+        False,
+    )
+    compartmentsLayoutInput.tooltip = "One text row per grid row, back of the bin first. Cells with the same letter form one compartment, '.' leaves a cell solid."
+    compartmentsLayoutInput.tooltipDescription = (
+        "Optional depth per letter in mm, one per line, e.g. 'A = 20'"
+    )
+    compartmentsLayoutInput.isVisible = (
+        compartmentGridDropdownDefaultValue == BIN_COMPARTMENTS_GRID_TYPE_TEXT
+    )
+    commandUIState.registerCommandInput(compartmentsLayoutInput)
+
+    compartmentsLipInput = compartmentsGroup.children.addBoolValueInput(
+        BIN_COMPARTMENTS_LIP_INPUT_ID,
+        "Generate lip for each compartment",
+        True,
+        "",
+        commandUIState.getState(BIN_COMPARTMENTS_LIP_INPUT_ID),
+    )
+    commandUIState.registerCommandInput(compartmentsLipInput)
+
+    binScoopGroup = compartmentsGroup.children.addGroupCommandInput(
+        BIN_SCOOP_GROUP_ID, "Scoop"
+    )
+    binScoopGroup.isExpanded = commandUIState.getState(BIN_SCOOP_GROUP_ID)
+    commandUIState.registerCommandInput(binScoopGroup)
+    generateScoopCheckboxInput = binScoopGroup.children.addBoolValueInput(
+        BIN_HAS_SCOOP_INPUT_ID,
+        "Add scoop (along bin width)",
+        True,
+        "",
+        commandUIState.getState(BIN_HAS_SCOOP_INPUT_ID),
+    )
+    commandUIState.registerCommandInput(generateScoopCheckboxInput)
+    binScoopMaxRadiusInput = binScoopGroup.children.addValueInput(
+        BIN_SCOOP_MAX_RADIUS_INPUT_ID,
+        "Scoop max radius (mm)",
+        defaultLengthUnits,
+        adsk.core.ValueInput.createByReal(
+            commandUIState.getState(BIN_SCOOP_MAX_RADIUS_INPUT_ID)
+        ),
+    )
+    commandUIState.registerCommandInput(binScoopMaxRadiusInput)
+    for input in binScoopGroup.children:
+        if not input.id == BIN_HAS_SCOOP_INPUT_ID:
+            input.isEnabled = commandUIState.getState(BIN_HAS_SCOOP_INPUT_ID)
+
+    binTabFeaturesGroup = compartmentsGroup.children.addGroupCommandInput(
+        BIN_TAB_FEATURES_GROUP_ID, "Label tab"
+    )
+    binTabFeaturesGroup.isExpanded = commandUIState.getState(BIN_TAB_FEATURES_GROUP_ID)
+    commandUIState.registerCommandInput(binTabFeaturesGroup)
+    generateTabCheckboxinput = binTabFeaturesGroup.children.addBoolValueInput(
+        BIN_HAS_TAB_INPUT_ID,
+        "Add label tab (along bin width)",
+        True,
+        "",
+        commandUIState.getState(BIN_HAS_TAB_INPUT_ID),
+    )
+    commandUIState.registerCommandInput(generateTabCheckboxinput)
+    binTabLengthInput = binTabFeaturesGroup.children.addValueInput(
+        BIN_TAB_LENGTH_INPUT_ID,
+        "Tab length (u)",
+        "",
+        adsk.core.ValueInput.createByReal(
+            commandUIState.getState(BIN_TAB_LENGTH_INPUT_ID)
+        ),
+    )
+    commandUIState.registerCommandInput(binTabLengthInput)
+    binTabWidthInput = binTabFeaturesGroup.children.addValueInput(
+        BIN_TAB_WIDTH_INPUT_ID,
+        "Tab width (mm)",
+        defaultLengthUnits,
+        adsk.core.ValueInput.createByReal(
+            commandUIState.getState(BIN_TAB_WIDTH_INPUT_ID)
+        ),
+    )
+    commandUIState.registerCommandInput(binTabWidthInput)
+    binTabPostionInput = binTabFeaturesGroup.children.addValueInput(
+        BIN_TAB_POSITION_INPUT_ID,
+        "Tab offset (u)",
+        "",
+        adsk.core.ValueInput.createByReal(
+            commandUIState.getState(BIN_TAB_POSITION_INPUT_ID)
+        ),
+    )
+    commandUIState.registerCommandInput(binTabPostionInput)
+    tabObverhangAngleInput = binTabFeaturesGroup.children.addValueInput(
+        BIN_TAB_ANGLE_INPUT_ID,
+        "Tab overhang angle",
+        "deg",
+        adsk.core.ValueInput.createByString(
+            str(commandUIState.getState(BIN_TAB_ANGLE_INPUT_ID))
+        ),
+    )
+    tabObverhangAngleInput.minimumValue = math.radians(30)
+    tabObverhangAngleInput.isMinimumInclusive = True
+    tabObverhangAngleInput.maximumValue = math.radians(65)
+    tabObverhangAngleInput.isMaximumInclusive = True
+    commandUIState.registerCommandInput(tabObverhangAngleInput)
+    for input in binTabFeaturesGroup.children:
+        if not input.id == BIN_HAS_TAB_INPUT_ID:
+            input.isEnabled = commandUIState.getState(BIN_HAS_TAB_INPUT_ID)
+
+    baseFeaturesGroup = inputs.addGroupCommandInput(
+        BIN_BASE_FEATURES_GROUP_ID, "Base interface features"
+    )
+    baseFeaturesGroup.isExpanded = commandUIState.getState(BIN_BASE_FEATURES_GROUP_ID)
+    commandUIState.registerCommandInput(baseFeaturesGroup)
+    generateBaseCheckboxInput = baseFeaturesGroup.children.addBoolValueInput(
+        BIN_GENERATE_BASE_INPUT_ID,
+        "Generate base",
+        True,
+        "",
+        commandUIState.getState(BIN_GENERATE_BASE_INPUT_ID),
+    )
+    commandUIState.registerCommandInput(generateBaseCheckboxInput)
+    generateScrewHolesCheckboxInput = baseFeaturesGroup.children.addBoolValueInput(
+        BIN_SCREW_HOLES_INPUT_ID,
+        "Add screw holes",
+        True,
+        "",
+        commandUIState.getState(BIN_SCREW_HOLES_INPUT_ID),
+    )
+    commandUIState.registerCommandInput(generateScrewHolesCheckboxInput)
+    screwSizeInput = baseFeaturesGroup.children.addValueInput(
+        BIN_SCREW_DIAMETER_INPUT,
+        "Screw hole diameter",
+        defaultLengthUnits,
+        adsk.core.ValueInput.createByReal(
+            commandUIState.getState(BIN_SCREW_DIAMETER_INPUT)
+        ),
+    )
+    screwSizeInput.minimumValue = 0.1
+    screwSizeInput.isMinimumInclusive = True
+    screwSizeInput.maximumValue = 1
+    screwSizeInput.isMaximumInclusive = True
+    commandUIState.registerCommandInput(screwSizeInput)
+    generateMagnetSocketCheckboxInput = baseFeaturesGroup.children.addBoolValueInput(
+        BIN_MAGNET_CUTOUTS_INPUT_ID,
+        "Add magnet sockets",
+        True,
+        "",
+        commandUIState.getState(BIN_MAGNET_CUTOUTS_INPUT_ID),
+    )
+    commandUIState.registerCommandInput(generateMagnetSocketCheckboxInput)
+    generateMagnetsTabCheckboxInput = baseFeaturesGroup.children.addBoolValueInput(
+        BIN_MAGNET_CUTOUTS_TABS_INPUT_ID,
+        "Add tabs to magnet sockets",
+        True,
+        "",
+        commandUIState.getState(BIN_MAGNET_CUTOUTS_TABS_INPUT_ID),
+    )
+    commandUIState.registerCommandInput(generateMagnetsTabCheckboxInput)
+    magnetSizeInput = baseFeaturesGroup.children.addValueInput(
+        BIN_MAGNET_DIAMETER_INPUT,
+        "Magnet cutout diameter",
+        defaultLengthUnits,
+        adsk.core.ValueInput.createByReal(
+            commandUIState.getState(BIN_MAGNET_DIAMETER_INPUT)
+        ),
+    )
+    magnetSizeInput.minimumValue = 0.1
+    magnetSizeInput.isMinimumInclusive = True
+    magnetSizeInput.maximumValue = 1
+    magnetSizeInput.isMaximumInclusive = True
+    commandUIState.registerCommandInput(magnetSizeInput)
+    magnetHeightInput = baseFeaturesGroup.children.addValueInput(
+        BIN_MAGNET_HEIGHT_INPUT,
+        "Magnet cutout depth",
+        defaultLengthUnits,
+        adsk.core.ValueInput.createByReal(
+            commandUIState.getState(BIN_MAGNET_HEIGHT_INPUT)
+        ),
+    )
+    magnetHeightInput.minimumValue = 0.1
+    magnetHeightInput.isMinimumInclusive = True
+    commandUIState.registerCommandInput(magnetHeightInput)
+
+    userChangesGroup = inputs.addGroupCommandInput(USER_CHANGES_GROUP_ID, "Changes")
+    userChangesGroup.isExpanded = commandUIState.getState(USER_CHANGES_GROUP_ID)
+    commandUIState.registerCommandInput(userChangesGroup)
+    saveAsDefaultsButtonInput = userChangesGroup.children.addBoolValueInput(
+        INPUT_CHANGES_SAVE_DEFAULTS, "Save as new defaults", False, "", False
+    )
+    saveAsDefaultsButtonInput.text = "Save"
+    resetToDefaultsButtonInput = userChangesGroup.children.addBoolValueInput(
+        INPUT_CHANGES_RESET_TO_DEFAULTS, "Reset to defaults", False, "", False
+    )
+    resetToDefaultsButtonInput.text = "Reset"
+    factoryResetButtonInput = userChangesGroup.children.addBoolValueInput(
+        INPUT_CHANGES_RESET_TO_FACTORY, "Wipe saved settings", False, "", False
+    )
+    factoryResetButtonInput.text = "Factory reset"
+
+    previewGroup = inputs.addGroupCommandInput(PREVIEW_GROUP_ID, "Preview")
+    previewGroup.isExpanded = commandUIState.getState(PREVIEW_GROUP_ID)
+    commandUIState.registerCommandInput(userChangesGroup)
+    showPreviewCheckboxInput = previewGroup.children.addBoolValueInput(
+        SHOW_PREVIEW_INPUT, "Show auto update preview (slow)", True, "", False
+    )
+    commandUIState.registerCommandInput(showPreviewCheckboxInput)
+    showPreviewManual = previewGroup.children.addBoolValueInput(
+        SHOW_PREVIEW_MANUAL_INPUT,
+        "Update preview once",
+        False,
+        "",
+        showPreviewManualState,
+    )
+    showPreviewManual.isFullWidth = True
+    commandUIState.registerCommandInput(showPreviewManual)
+
+    refreshUi()
+
+    futil.add_handler(
+        args.command.execute, command_execute, local_handlers=local_handlers
+    )
+    futil.add_handler(
+        args.command.inputChanged, command_input_changed, local_handlers=local_handlers
+    )
+    futil.add_handler(
+        args.command.executePreview, command_preview, local_handlers=local_handlers
+    )
+    futil.add_handler(
+        args.command.validateInputs,
+        command_validate_input,
+        local_handlers=local_handlers,
+    )
+    futil.add_handler(
+        args.command.destroy, command_destroy, local_handlers=local_handlers
+    )
+
+
+# This event handler is called when the user clicks the OK button in the command dialog or
+# is immediately called after the created event not command inputs were created for the dialog.
+def command_execute(args: adsk.core.CommandEventArgs):
+    futil.log(f"{CMD_NAME} Command Execute Event")
+    sessionName = f"{CMD_NAME} execute"
+    with stageTimer.session(sessionName), apiCallTracer.session(sessionName):
+        generateBin(args)
+
+
+# This event handler is called when the command needs to compute a new preview in the graphics window.
+def command_preview(args: adsk.core.CommandEventArgs):
+    futil.log(f"{CMD_NAME} Command Preview Event")
+    global showPreviewManualState
+    validation = validateInputs()
+    if validation.isValid:
+        showPreview: adsk.core.BoolValueCommandInput = commandUIState.getInput(
+            SHOW_PREVIEW_INPUT
+        )
+        showPreviewManual: adsk.core.BoolValueCommandInput = commandUIState.getInput(
+            SHOW_PREVIEW_MANUAL_INPUT
+        )
+        if showPreview.value or (showPreviewManual.value != showPreviewManualState):
+            if showPreview.value:
+                futil.log(
+                    f"{CMD_NAME} Command Preview Event - generating preview because showPreview.value is {showPreview.value}"
+                )
+            if showPreviewManual.value != showPreviewManualState:
+                futil.log(
+                    f"{CMD_NAME} Command Preview Event - generating preview because showPreviewManual.value is {showPreviewManual.value}"
+                )
+
+            sessionName = f"{CMD_NAME} preview"
+            with stageTimer.session(sessionName), apiCallTracer.session(sessionName):
+                args.isValidResult = generateBin(
+                    args,
+                    isPreview=True,
+                    timeBudget=config.PREVIEW_TIME_BUDGET_SECONDS,
+                )
+            showPreviewManualState = showPreviewManual.value
+    else:
+        args.executeFailed = True
+        args.executeFailedMessage = (
+            "Some inputs are invalid, unable to generate preview: "
+            + ", ".join(validation.messages())
+        )
+
+
+def cache_compartments_table_state(inputs: adsk.core.CommandInputs):
+    binCompartmentsTable: adsk.core.TableCommandInput = commandUIState.getInput(
+        BIN_COMPARTMENTS_TABLE_ID
+    )
+    global commandCompartmentsTableUIState
+    commandCompartmentsTableUIState = []
+    for i in range(1, binCompartmentsTable.rowCount):
+        commandCompartmentsTableUIState.append(CommandUiState(CMD_NAME))
+        for j in range(binCompartmentsTable.numberOfColumns):
+            input = binCompartmentsTable.getInputAtPosition(i, j)
+            commandCompartmentsTableUIState[-1].initValue(
+                input.id, input.value, input.objectType
+            )
+            commandCompartmentsTableUIState[-1].registerCommandInput(input)
+
+
+def command_input_changed(args: adsk.core.InputChangedEventArgs):
+    changed_input = args.input
+    inputs = args.inputs
+    global commandUIState
+    futil.log(
+        f"{CMD_NAME} Input Changed Event fired from a change to {changed_input.id}"
+    )
+    if changed_input.id == INPUT_CHANGES_SAVE_DEFAULTS:
+        saveUIInputsAsDefaults()
+    elif changed_input.id == INPUT_CHANGES_RESET_TO_DEFAULTS:
+        initDefaultUiState()
+        refreshUi()
+    elif changed_input.id == INPUT_CHANGES_RESET_TO_FACTORY:
+        configUtils.deleteConfigFile(UI_INPUT_DEFAULTS_CONFIG_PATH)
+        initDefaultUiState()
+        refreshUi()
+    elif (
+        changed_input.parentCommandInput
+        and changed_input.parentCommandInput.id == BIN_COMPARTMENTS_TABLE_ID
+    ):
+        cache_compartments_table_state(inputs)
+    else:
+        previousGridType = commandUIState.getState(BIN_COMPARTMENTS_GRID_TYPE_ID)
+        commandUIState.onInputUpdate(changed_input)
+        if changed_input.id == BIN_COMPARTMENTS_GRID_TYPE_ID:
+            convert_compartments_layout(
+                previousGridType, commandUIState.getState(BIN_COMPARTMENTS_GRID_TYPE_ID)
+            )
+        elif changed_input.id == BIN_COMPARTMENTS_LAYOUT_ID:
+            update_grid_size_from_layout()
+        refreshUi()
+
+    if (
+        isinstance(changed_input, adsk.core.GroupCommandInput)
+        and changed_input.isExpanded == True
+    ):
+        for input in changed_input.children:
+            commandUIState.registerCommandInput(input)
+        refreshUi()
+
+    binCompartmentsTable: adsk.core.TableCommandInput = commandUIState.getInput(
+        BIN_COMPARTMENTS_TABLE_ID
+    )
+
+    try:
+        binHeightUnit = commandUIState.getState(BIN_HEIGHT_UNIT_INPUT_ID)
+        binHeight = commandUIState.getState(BIN_HEIGHT_INPUT_ID)
+        compartmentsGridWidth = commandUIState.getState(
+            BIN_COMPARTMENTS_GRID_BASE_WIDTH_ID
+        )
+        compartmentsGridLength = commandUIState.getState(
+            BIN_COMPARTMENTS_GRID_BASE_LENGTH_ID
+        )
+
+        if changed_input.id == BIN_COMPARTMENTS_TABLE_ADD_ID:
+            append_compartment_table_row(
+                0, 0, 1, 1, (binHeight + 1) * binHeightUnit - const.BIN_BASE_HEIGHT
+            )
+            cache_compartments_table_state(inputs)
+        elif changed_input.id == BIN_COMPARTMENTS_TABLE_REMOVE_ID:
+            if binCompartmentsTable.selectedRow > 0:
+                deleteTableRow(
+                    binCompartmentsTable.selectedRow,
+                    binCompartmentsTable,
+                    commandCompartmentsTableUIState,
+                )
+            elif binCompartmentsTable.rowCount > 1:
+                deleteTableRow(
+                    binCompartmentsTable.rowCount - 1,
+                    binCompartmentsTable,
+                    commandCompartmentsTableUIState,
+                )
+        elif changed_input.id == BIN_COMPARTMENTS_TABLE_UNIFORM_ID:
+            for i in range(binCompartmentsTable.rowCount - 1, 0, -1):
+                deleteTableRow(i, binCompartmentsTable, commandCompartmentsTableUIState)
+            for i in range(compartmentsGridWidth):
+                for j in range(compartmentsGridLength):
+                    append_compartment_table_row(
+                        i,
+                        j,
+                        1,
+                        1,
+                        (binHeight + 1) * binHeightUnit - const.BIN_BASE_HEIGHT,
+                    )
+                cache_compartments_table_state(inputs)
+
+    except:
+        showErrorInMessageBox()
+
+
+# This event handler is called when the user interacts with any of the inputs in the dialog
+# which allows you to verify that all of the inputs are valid and enables the OK button.
+def command_validate_input(args: adsk.core.ValidateInputsEventArgs):
+    # General logging for debug.
+    futil.log(f"{CMD_NAME} Validate Input Event")
+
+    # Verify the validity of the input values. This controls if the OK button is enabled or not.
+    args.areInputsValid = validateInputs().isValid
+    futil.log(f'{CMD_NAME} Inputs are {"valid" if args.areInputsValid else "invalid"}')
+
+
+# This event handler is called when the command terminates.
+def command_destroy(args: adsk.core.CommandEventArgs):
+    # General logging for debug.
+    futil.log(f'{CMD_NAME} Command Destroy Event "{args.terminationReason}"')
+    # inputs of the dialog are gone, drop results still on the way
+    dialogWorker.cancelAll()
+    # counters of lookups made by previews
+    flushGenerationCache()
+    global local_handlers
+    global editedOccurrence
+    global uiStateBeforeEdit
+    local_handlers = []
+    if editedOccurrence is not None and uiStateBeforeEdit is not None:
+        # the next create bin dialog opens with its own values, not the edited bin's
+        restoreUiState(uiStateBeforeEdit)
+    uiStateBeforeEdit = None
+    editedOccurrence = None
+
+
+def deleteTableRow(
+    rowToDelete: int,
+    tableInput: adsk.core.TableCommandInput,
+    inputState: list[CommandUiState],
+):
+    inputState.pop(rowToDelete - 1)
+    tableInput.deleteRow(rowToDelete)
+
+
+def refreshCompartmentsTable():
+    global commandUIState
+    binCompartmentsTable: adsk.core.TableCommandInput = commandUIState.getInput(
+        BIN_COMPARTMENTS_TABLE_ID
+    )
+    for i in range(binCompartmentsTable.rowCount - 1, 0, -1):
+        binCompartmentsTable.deleteRow(i)
+    append_compartments_from_state()
+
+
+def full_compartment_depth() -> float:
+    return (commandUIState.getState(BIN_HEIGHT_INPUT_ID) + 1) * commandUIState.getState(
+        BIN_HEIGHT_UNIT_INPUT_ID
+    ) - const.BIN_BASE_HEIGHT
+
+
+def compartments_from_table_state() -> list[BinBodyCompartmentDefinition]:
+    compartments = []
+    for i, rowState in enumerate(commandCompartmentsTableUIState, 1):
+        compartments.append(
+            BinBodyCompartmentDefinition(
+                rowState.getState(f"x_input_{i}"),
+                rowState.getState(f"y_input_{i}"),
+                rowState.getState(f"w_input_{i}"),
+                rowState.getState(f"l_input_{i}"),
+                rowState.getState(f"d_input_{i}"),
+            )
+        )
+    return compartments
+
+
+def set_table_state_from_compartments(
+    compartments: list[BinBodyCompartmentDefinition],
+):
+    global commandCompartmentsTableUIState
+    fullDepth = full_compartment_depth()
+    commandCompartmentsTableUIState = []
+    for i, compartment in enumerate(compartments, 1):
+        rowState = CommandUiState(CMD_NAME)
+        spinnerType = adsk.core.IntegerSpinnerCommandInput.classType()
+        rowState.initValue(f"x_input_{i}", compartment.positionX, spinnerType)
+        rowState.initValue(f"y_input_{i}", compartment.positionY, spinnerType)
+        rowState.initValue(f"w_input_{i}", compartment.width, spinnerType)
+        rowState.initValue(f"l_input_{i}", compartment.length, spinnerType)
+        rowState.initValue(
+            f"d_input_{i}",
+            min(compartment.depth, fullDepth),
+            adsk.core.ValueCommandInput.classType(),
+        )
+        commandCompartmentsTableUIState.append(rowState)
+
+
+def convert_compartments_layout(previousGridType: str, gridType: str):
+    # carry compartments over between the table and the text layout
+    global commandUIState
+    gridWidth = commandUIState.getState(BIN_COMPARTMENTS_GRID_BASE_WIDTH_ID)
+    gridLength = commandUIState.getState(BIN_COMPARTMENTS_GRID_BASE_LENGTH_ID)
+    try:
+        if (
+            gridType == BIN_COMPARTMENTS_GRID_TYPE_TEXT
+            and not commandUIState.getState(BIN_COMPARTMENTS_LAYOUT_ID).strip()
+        ):
+            compartments = (
+                compartments_from_table_state()
+                if previousGridType == BIN_COMPARTMENTS_GRID_TYPE_CUSTOM
+                else uniformCompartments(gridWidth, gridLength)
+            )
+            commandUIState.updateValue(
+                BIN_COMPARTMENTS_LAYOUT_ID,
+                formatLayout(
+                    gridWidth, gridLength, compartments, full_compartment_depth()
+                ),
+            )
+        elif (
+            gridType == BIN_COMPARTMENTS_GRID_TYPE_CUSTOM
+            and previousGridType == BIN_COMPARTMENTS_GRID_TYPE_TEXT
+        ):
+            layout = parseLayout(commandUIState.getState(BIN_COMPARTMENTS_LAYOUT_ID))
+            set_table_state_from_compartments(layout.compartments)
+            update_grid_size_from_layout()
+    except CompartmentLayoutError as err:
+        futil.log(f"{CMD_NAME} Compartments not converted to {gridType}: {err}")
+
+
+def layoutGridSize(text: str):
+    try:
+        layout = parseLayout(text)
+    except CompartmentLayoutError:
+        # reported by validation
+        return None
+    return layout.gridWidth, layout.gridLength
+
+
+def update_grid_size_from_layout():
+    global commandUIState
+    text = commandUIState.getState(BIN_COMPARTMENTS_LAYOUT_ID)
+    dialogWorker.submit(
+        "layoutGridSize", lambda: layoutGridSize(text), show_layout_grid_size
+    )
+
+
+def show_layout_grid_size(gridSize: tuple[int, int]):
+    global commandUIState
+    if gridSize is None:
+        return
+    gridWidth, gridLength = gridSize
+    if (
+        commandUIState.getState(BIN_COMPARTMENTS_GRID_BASE_WIDTH_ID) == gridWidth
+        and commandUIState.getState(BIN_COMPARTMENTS_GRID_BASE_LENGTH_ID) == gridLength
+    ):
+        return
+    commandUIState.updateValue(BIN_COMPARTMENTS_GRID_BASE_WIDTH_ID, gridWidth)
+    commandUIState.updateValue(BIN_COMPARTMENTS_GRID_BASE_LENGTH_ID, gridLength)
+    # cell sizes depend on the grid size
+    update_actual_compartment_unit_dimensions()
+
+
+def onChangeValidate():
+    global commandUIState
+
+    generateBase: bool = commandUIState.getState(BIN_GENERATE_BASE_INPUT_ID)
+    commandUIState.getInput(BIN_SCREW_HOLES_INPUT_ID).isEnabled = generateBase
+    commandUIState.getInput(BIN_MAGNET_CUTOUTS_INPUT_ID).isEnabled = generateBase
+    commandUIState.getInput(BIN_MAGNET_CUTOUTS_TABS_INPUT_ID).isEnabled = generateBase
+    commandUIState.getInput(BIN_MAGNET_DIAMETER_INPUT).isEnabled = generateBase
+    commandUIState.getInput(BIN_MAGNET_HEIGHT_INPUT).isEnabled = generateBase
+    commandUIState.getInput(BIN_SCREW_DIAMETER_INPUT).isEnabled = generateBase
+
+    generateBody: bool = commandUIState.getState(BIN_GENERATE_BODY_INPUT_ID)
+    binType: str = commandUIState.getState(BIN_TYPE_DROPDOWN_ID)
+    commandUIState.getInput(BIN_WALL_THICKNESS_INPUT_ID).isEnabled = (
+        generateBody and not binType == BIN_TYPE_SOLID
+    )
+    commandUIState.getInput(BIN_WITH_LIP_INPUT_ID).isEnabled = generateBody
+    commandUIState.getInput(BIN_WITH_LIP_NOTCHES_INPUT_ID).isEnabled = generateBody
+    commandUIState.getInput(BIN_HAS_TAB_INPUT_ID).isEnabled = generateBody
+    generateTab: bool = commandUIState.getState(BIN_HAS_TAB_INPUT_ID)
+    for input in commandUIState.getInput(BIN_TAB_FEATURES_GROUP_ID).children:
+        if not input.id == BIN_HAS_TAB_INPUT_ID:
+            input.isEnabled = generateBody and generateTab
+
+    generateLip: bool = commandUIState.getState(BIN_WITH_LIP_INPUT_ID)
+    commandUIState.getInput(BIN_WITH_LIP_NOTCHES_INPUT_ID).isEnabled = generateLip
+
+    generateScoop: bool = commandUIState.getState(BIN_HAS_SCOOP_INPUT_ID)
+    commandUIState.getInput(BIN_SCOOP_MAX_RADIUS_INPUT_ID).isEnabled = generateScoop
+
+    generateTab: bool = commandUIState.getState(BIN_HAS_TAB_INPUT_ID)
+    commandUIState.getInput(BIN_TAB_LENGTH_INPUT_ID).isEnabled = generateTab
+    commandUIState.getInput(BIN_TAB_WIDTH_INPUT_ID).isEnabled = generateTab
+    commandUIState.getInput(BIN_TAB_ANGLE_INPUT_ID).isEnabled = generateTab
+    commandUIState.getInput(BIN_TAB_POSITION_INPUT_ID).isEnabled = generateTab
+
+    compartmentsGridType: str = commandUIState.getState(BIN_COMPARTMENTS_GRID_TYPE_ID)
+    commandUIState.getInput(BIN_COMPARTMENTS_TABLE_ID).isVisible = (
+        compartmentsGridType == BIN_COMPARTMENTS_GRID_TYPE_CUSTOM
+    )
+    isTextLayout = compartmentsGridType == BIN_COMPARTMENTS_GRID_TYPE_TEXT
+    commandUIState.getInput(BIN_COMPARTMENTS_LAYOUT_ID).isVisible = isTextLayout
+    # grid size follows the text layout
+    commandUIState.getInput(BIN_COMPARTMENTS_GRID_BASE_WIDTH_ID).isEnabled = (
+        not isTextLayout
+    )
+    commandUIState.getInput(BIN_COMPARTMENTS_GRID_BASE_LENGTH_ID).isEnabled = (
+        not isTextLayout
+    )
+
+    commandUIState.getInput(BIN_COMPARTMENTS_LIP_INPUT_ID).isEnabled = generateLip
+
+    showPreview: bool = commandUIState.getInput(SHOW_PREVIEW_INPUT).value
+    commandUIState.getInput(SHOW_PREVIEW_MANUAL_INPUT).isVisible = not showPreview
+
+
+def uiStateDict() -> dict:
+    """Dialog state saved as defaults and in generated bin snapshots."""
+    return {
+        "static_ui": commandUIState.toDict(
+            ignoreKeys=[
+                SHOW_PREVIEW_MANUAL_INPUT,
+                SHOW_PREVIEW_INPUT,
+                BIN_QUANTITY_INPUT_ID,
+                BIN_HEIGHT_FAMILY_INPUT_ID,
+            ]
+        ),
+        "compartments_table": [x.toDict() for x in commandCompartmentsTableUIState],
+    }
+
+
+def saveUIInputsAsDefaults():
+    futil.log(f"{CMD_NAME} Saving UI state to file")
+    result = configUtils.dumpJsonConfig(UI_INPUT_DEFAULTS_CONFIG_PATH, uiStateDict())
+    if result:
+        futil.log(f"{CMD_NAME} Saved successfully")
+    else:
+        futil.log(f"{CMD_NAME} UI state failed to save")
+
+
+def generateBin(
+    args: adsk.core.CommandEventArgs, isPreview: bool = False, timeBudget: float = 0
+):
+    base_width_unit: adsk.core.ValueCommandInput = commandUIState.getInput(
+        BIN_BASE_WIDTH_UNIT_INPUT_ID
+    )
+    base_length_unit: adsk.core.ValueCommandInput = commandUIState.getInput(
+        BIN_BASE_LENGTH_UNIT_INPUT_ID
+    )
+    height_unit: adsk.core.ValueCommandInput = commandUIState.getInput(
+        BIN_HEIGHT_UNIT_INPUT_ID
+    )
+    xy_clearance: adsk.core.ValueCommandInput = commandUIState.getInput(
+        BIN_XY_CLEARANCE_INPUT_ID
+    )
+    bin_width: adsk.core.ValueCommandInput = commandUIState.getInput(BIN_WIDTH_INPUT_ID)
+    bin_length: adsk.core.ValueCommandInput = commandUIState.getInput(
+        BIN_LENGTH_INPUT_ID
+    )
+    bin_height: adsk.core.ValueCommandInput = commandUIState.getInput(
+        BIN_HEIGHT_INPUT_ID
+    )
+    bin_wall_thickness: adsk.core.ValueCommandInput = commandUIState.getInput(
+        BIN_WALL_THICKNESS_INPUT_ID
+    )
+    bin_screw_holes: adsk.core.BoolValueCommandInput = commandUIState.getInput(
+        BIN_SCREW_HOLES_INPUT_ID
+    )
+    bin_generate_base: adsk.core.BoolValueCommandInput = commandUIState.getInput(
+        BIN_GENERATE_BASE_INPUT_ID
+    )
+    bin_generate_body: adsk.core.BoolValueCommandInput = commandUIState.getInput(
+        BIN_GENERATE_BODY_INPUT_ID
+    )
+    bin_magnet_cutouts: adsk.core.BoolValueCommandInput = commandUIState.getInput(
+        BIN_MAGNET_CUTOUTS_INPUT_ID
+    )
+    bin_screw_hole_diameter: adsk.core.ValueCommandInput = commandUIState.getInput(
+        BIN_SCREW_DIAMETER_INPUT
+    )
+    bin_magnet_cutouts_tabs: adsk.core.BoolValueCommandInput = commandUIState.getInput(
+        BIN_MAGNET_CUTOUTS_TABS_INPUT_ID
+    )
+    bin_magnet_cutout_diameter: adsk.core.ValueCommandInput = commandUIState.getInput(
+        BIN_MAGNET_DIAMETER_INPUT
+    )
+    bin_magnet_cutout_depth: adsk.core.ValueCommandInput = commandUIState.getInput(
+        BIN_MAGNET_HEIGHT_INPUT
+    )
+    with_lip: adsk.core.BoolValueCommandInput = commandUIState.getInput(
+        BIN_WITH_LIP_INPUT_ID
+    )
+    with_lip_notches: adsk.core.BoolValueCommandInput = commandUIState.getInput(
+        BIN_WITH_LIP_NOTCHES_INPUT_ID
+    )
+    has_scoop: adsk.core.BoolValueCommandInput = commandUIState.getInput(
+        BIN_HAS_SCOOP_INPUT_ID
+    )
+    binScoopMaxRadius: adsk.core.ValueCommandInput = commandUIState.getInput(
+        BIN_SCOOP_MAX_RADIUS_INPUT_ID
+    )
+    hasTabInput: adsk.core.BoolValueCommandInput = commandUIState.getInput(
+        BIN_HAS_TAB_INPUT_ID
+    )
+    binTabLength: adsk.core.ValueCommandInput = commandUIState.getInput(
+        BIN_TAB_LENGTH_INPUT_ID
+    )
+    binTabWidth: adsk.core.ValueCommandInput = commandUIState.getInput(
+        BIN_TAB_WIDTH_INPUT_ID
+    )
+    binTabPosition: adsk.core.ValueCommandInput = commandUIState.getInput(
+        BIN_TAB_POSITION_INPUT_ID
+    )
+    binTabAngle: adsk.core.ValueCommandInput = commandUIState.getInput(
+        BIN_TAB_ANGLE_INPUT_ID
+    )
+    binTypeDropdownInput: adsk.core.DropDownCommandInput = commandUIState.getInput(
+        BIN_TYPE_DROPDOWN_ID
+    )
+    binCompartmentGridTypeDropdownInput: adsk.core.DropDownCommandInput = (
+        commandUIState.getInput(BIN_COMPARTMENTS_GRID_TYPE_ID)
+    )
+    binCompartmentsTable: adsk.core.TableCommandInput = commandUIState.getInput(
+        BIN_COMPARTMENTS_TABLE_ID
+    )
+    compartmentsX: adsk.core.IntegerSpinnerCommandInput = commandUIState.getInput(
+        BIN_COMPARTMENTS_GRID_BASE_WIDTH_ID
+    )
+    compartmentsY: adsk.core.IntegerSpinnerCommandInput = commandUIState.getInput(
+        BIN_COMPARTMENTS_GRID_BASE_LENGTH_ID
+    )
+
+    compartments_lip: adsk.core.BoolValueCommandInput = commandUIState.getInput(
+        BIN_COMPARTMENTS_LIP_INPUT_ID
+    )
+
+    isHollow = binTypeDropdownInput.selectedItem.name == BIN_TYPE_HOLLOW
+    isSolid = binTypeDropdownInput.selectedItem.name == BIN_TYPE_SOLID
+    isShelled = binTypeDropdownInput.selectedItem.name == BIN_TYPE_SHELLED
+
+    try:
+        des = adsk.fusion.Design.cast(app.activeProduct)
+        if des.designType == 0:
+            raise UnsupportedDesignTypeException(
+                "Timeline must be enabled for the generator to work, projects with disabled design history currently are not supported"
+            )
+        root = adsk.fusion.Component.cast(des.rootComponent)
+        xyClearance = xy_clearance.value
+        binName = "Gridfinity bin {}x{}x{}".format(
+            int(bin_length.value), int(bin_width.value), int(bin_height.value)
+        )
+
+        # create base interface
+        baseGeneratorInput = BaseGeneratorInput()
+        baseGeneratorInput.originPoint = geometryUtils.createOffsetPoint(
+            adsk.core.Point3D.create(0, 0, 0),
+            byX=-xyClearance,
+            byY=-xyClearance,
+        )
+        baseGeneratorInput.baseWidth = base_width_unit.value
+        baseGeneratorInput.baseLength = base_length_unit.value
+        baseGeneratorInput.xyClearance = xyClearance
+        baseGeneratorInput.hasScrewHoles = bin_screw_holes.value and not isShelled
+        baseGeneratorInput.hasMagnetCutouts = bin_magnet_cutouts.value and not isShelled
+        baseGeneratorInput.hasMagnetCutoutsTabs = (
+            bin_magnet_cutouts_tabs.value and not isShelled
+        )
+        baseGeneratorInput.screwHolesDiameter = bin_screw_hole_diameter.value
+        baseGeneratorInput.magnetCutoutsDiameter = bin_magnet_cutout_diameter.value
+        baseGeneratorInput.magnetCutoutsDepth = bin_magnet_cutout_depth.value
+
+        # create bin body
+        binBodyInput = BinBodyGeneratorInput()
+        binBodyInput.hasLip = with_lip.value
+        binBodyInput.hasLipNotches = with_lip_notches.value
+        binBodyInput.binWidth = bin_width.value
+        binBodyInput.binLength = bin_length.value
+        binBodyInput.binHeight = bin_height.value
+        binBodyInput.baseWidth = base_width_unit.value
+        binBodyInput.baseLength = base_length_unit.value
+        binBodyInput.heightUnit = height_unit.value
+        binBodyInput.xyClearance = xyClearance
+        binBodyInput.binCornerFilletRadius = (
+            const.BIN_CORNER_FILLET_RADIUS - xyClearance
+        )
+        binBodyInput.isSolid = isSolid
+        binBodyInput.isShelled = isShelled
+        binBodyInput.isHollow = isHollow
+        binBodyInput.wallThickness = bin_wall_thickness.value
+        binBodyInput.hasScoop = has_scoop.value and isHollow
+        binBodyInput.scoopMaxRadius = binScoopMaxRadius.value
+        binBodyInput.hasTab = hasTabInput.value and not isSolid
+        binBodyInput.tabLength = binTabLength.value
+        binBodyInput.tabWidth = binTabWidth.value
+        binBodyInput.tabPosition = binTabPosition.value
+        binBodyInput.tabOverhangAngle = binTabAngle.value
+        binBodyInput.compartmentsByX = compartmentsX.value
+        binBodyInput.compartmentsByY = compartmentsY.value
+        binBodyInput.hasCompartmentsLip = compartments_lip.value and with_lip.value
+
+        if (
+            binCompartmentGridTypeDropdownInput.selectedItem.name
+            == BIN_COMPARTMENTS_GRID_TYPE_UNIFORM
+        ):
+            binBodyInput.compartments = uniformCompartments(
+                binBodyInput.compartmentsByX, binBodyInput.compartmentsByY
+            )
+        elif (
+            binCompartmentGridTypeDropdownInput.selectedItem.name
+            == BIN_COMPARTMENTS_GRID_TYPE_TEXT
+        ):
+            layout = parseLayout(commandUIState.getState(BIN_COMPARTMENTS_LAYOUT_ID))
+            binBodyInput.compartmentsByX = layout.gridWidth
+            binBodyInput.compartmentsByY = layout.gridLength
+            binBodyInput.compartments = layout.compartments
+        else:
+            binBodyInput.compartments = []
+            for i in range(1, binCompartmentsTable.rowCount):
+                positionX: adsk.core.IntegerSpinnerCommandInput = (
+                    binCompartmentsTable.getInputAtPosition(i, 0)
+                )
+                positionY: adsk.core.IntegerSpinnerCommandInput = (
+                    binCompartmentsTable.getInputAtPosition(i, 1)
+                )
+                width: adsk.core.IntegerSpinnerCommandInput = (
+                    binCompartmentsTable.getInputAtPosition(i, 2)
+                )
+                length: adsk.core.IntegerSpinnerCommandInput = (
+                    binCompartmentsTable.getInputAtPosition(i, 3)
+                )
+                depth: adsk.core.ValueCommandInput = (
+                    binCompartmentsTable.getInputAtPosition(i, 4)
+                )
+                binBodyInput.compartments.append(
+                    BinBodyCompartmentDefinition(
+                        positionX.value,
+                        positionY.value,
+                        width.value,
+                        length.value,
+                        depth.value,
+                    )
+                )
+            markOutlineEdges(binBodyInput.compartments)
+
+        quantity = commandUIState.getState(BIN_QUANTITY_INPUT_ID)
+        familyHeights = parseHeightFamily(
+            commandUIState.getState(BIN_HEIGHT_FAMILY_INPUT_ID)
+        )
+        uiState = uiStateDict()
+        binOccurrence = None
+        try:
+            with stageTimer.budget(timeBudget):
+                if editedOccurrence is not None:
+                    binOccurrence = editBin(
+                        editedOccurrence,
+                        baseGeneratorInput,
+                        binBodyInput,
+                        bin_generate_base.value,
+                        bin_generate_body.value,
+                        binName,
+                        isPreview,
+                        uiState,
+                    )
+                else:
+                    binOccurrence = createBin(
+                        baseGeneratorInput,
+                        binBodyInput,
+                        bin_generate_base.value,
+                        bin_generate_body.value,
+                        binName,
+                        isPreview,
+                        uiState=uiState,
+                    )
+        except stageTimer.BudgetExceeded:
+            createBinEnvelope(binBodyInput, bin_generate_base.value, binName)
+            ui.statusMessage = f"{binName} preview took over {timeBudget:g} s, showing its outline, OK generates the full bin"
+            futil.log(f"{CMD_NAME} Preview time budget exceeded, showing outline")
+        if not isPreview and editedOccurrence is None and quantity > 1:
+            queueBinCopies(
+                quantity - 1,
+                baseGeneratorInput,
+                binBodyInput,
+                bin_generate_base.value,
+                bin_generate_body.value,
+                binName,
+                uiState,
+            )
+        if not isPreview and editedOccurrence is None and familyHeights:
+            queueHeightFamily(
+                familyHeights,
+                binOccurrence,
+                baseGeneratorInput,
+                binBodyInput,
+                bin_generate_base.value,
+                bin_generate_body.value,
+                uiState,
+            )
+    except UnsupportedDesignTypeException as err:
+        args.executeFailed = True
+        args.executeFailedMessage = "Design type is unsupported. Projects with disabled design history are unsupported, please enable timeline feature to proceed."
+        return False
+    except Exception as err:
+        args.executeFailed = True
+        args.executeFailedMessage = getErrorMessage()
+        futil.log(f"{CMD_NAME} Error occurred, {err}, {getErrorMessage()}")
+        return False
+    return True
+
+
+def createBin(
+    baseGeneratorInput: BaseGeneratorInput,
+    binBodyInput: BinBodyGeneratorInput,
+    generateBase: bool,
+    generateBody: bool,
+    binName: str,
+    isPreview: bool = False,
+    offsetX: float = 0,
+    offsetY: float = 0,
+    uiState: dict = None,
+) -> adsk.fusion.Occurrence:
+    des = adsk.fusion.Design.cast(app.activeProduct)
+    root = adsk.fusion.Component.cast(des.rootComponent)
+    binTransform = adsk.core.Matrix3D.create()
+    binTransform.translation = adsk.core.Vector3D.create(offsetX, offsetY, 0)
+    snapshot = BinSnapshot.create(
+        BaseGeneratorSpec.fromInput(baseGeneratorInput),
+        BinBodyGeneratorSpec.fromInput(binBodyInput),
+        generateBase,
+        generateBody,
+        uiState or {},
+    )
+
+    generationCache = None
+    cacheKey = None
+    if config.GENERATION_CACHE_ENABLED:
+        generationCache = getGenerationCache(
+            config.GENERATION_CACHE_FOLDER_PATH,
+            config.GENERATION_CACHE_MAX_SIZE_MB * 1024 * 1024,
+        )
+        cacheKey = getCacheKey(
+            "bin",
+            BaseGeneratorSpec.fromInput(baseGeneratorInput),
+            BinBodyGeneratorSpec.fromInput(binBodyInput),
+            generateBase,
+            generateBody,
+        )
+        cachedOccurrence = generationCache.importInto(cacheKey, root)
+        generationCache.logStats()
+        if cachedOccurrence is not None:
+            cachedOccurrence.component.name = binName
+            if offsetX != 0 or offsetY != 0:
+                cachedOccurrence.transform = binTransform
+            if not isPreview:
+                # imported bin has no stage groups, edits regenerate all of it
+                writeBinSnapshot(cachedOccurrence.component, snapshot)
+            futil.log(f"{CMD_NAME} Imported {binName} from generation cache")
+            return cachedOccurrence
+
+    # create new component
+    newCmpOcc = adsk.fusion.Occurrences.cast(root.occurrences).addNewComponent(
+        binTransform
+    )
+    newCmpOcc.component.name = binName
+    newCmpOcc.activate()
+    gridfinityBinComponent: adsk.fusion.Component = newCmpOcc.component
+
+    try:
+        stageGroups = createBinStages(
+            baseGeneratorInput,
+            binBodyInput,
+            generateBase,
+            generateBody,
+            binName,
+            gridfinityBinComponent,
+        )
+    except stageTimer.BudgetExceeded:
+        # half built bin is replaced by its outline
+        newCmpOcc.deleteMe()
+        raise
+
+    if generationCache is not None and not isPreview:
+        generationCache.store(cacheKey, gridfinityBinComponent)
+    if not isPreview:
+        writeBinSnapshot(
+            gridfinityBinComponent,
+            dataclasses.replace(snapshot, stageGroups=stageGroups),
+        )
+    return newCmpOcc
+
+
+def createBinStages(
+    baseGeneratorInput: BaseGeneratorInput,
+    binBodyInput: BinBodyGeneratorInput,
+    generateBase: bool,
+    generateBody: bool,
+    binName: str,
+    component: adsk.fusion.Component,
+    firstStage: str = BIN_STAGE_BASE,
+    baseBodies: list[adsk.fusion.BRepBody] = None,
+) -> dict[str, str]:
+    """Generates bin stages from firstStage on at the timeline marker.
+
+    Features of every stage are grouped in the timeline, returns group names by
+    stage. baseBodies are bodies of the base stage when it isn't generated.
+    """
+    des = adsk.fusion.Design.cast(app.activeProduct)
+    timeline = des.timeline
+    stageGroups = {}
+    for stage in BIN_STAGES[BIN_STAGES.index(firstStage) :]:
+        stageStart = timeline.markerPosition
+        if stage == BIN_STAGE_BASE:
+            if generateBase:
+                baseBodies = createBaseBodyPattern(
+                    baseGeneratorInput,
+                    binBodyInput.binWidth,
+                    binBodyInput.binLength,
+                    component,
+                )
+        elif stage == BIN_STAGE_BODY:
+            if generateBody:
+                createGridfinityBinBody(
+                    binBodyInput,
+                    component,
+                    baseBodies if generateBase else None,
+                )
+        elif generateBody or generateBase:
+            cutBaseClearance(
+                baseGeneratorInput,
+                binBodyInput.binWidth,
+                binBodyInput.binLength,
+                component,
+            )
+
+        # group features in timeline
+        if timeline.markerPosition > stageStart:
+            with stageTimer.stage("timeline grouping"):
+                stageGroup = timeline.timelineGroups.add(
+                    stageStart, timeline.markerPosition - 1
+                )
+                stageGroup.name = f"{binName} {stage}"
+                stageGroups[stage] = stageGroup.name
+    return stageGroups
+
+
+def editBin(
+    occurrence: adsk.fusion.Occurrence,
+    baseGeneratorInput: BaseGeneratorInput,
+    binBodyInput: BinBodyGeneratorInput,
+    generateBase: bool,
+    generateBody: bool,
+    binName: str,
+    isPreview: bool = False,
+    uiState: dict = None,
+) -> adsk.fusion.Occurrence:
+    """Regenerates stages of a generated bin whose inputs changed, in place."""
+    des = adsk.fusion.Design.cast(app.activeProduct)
+    component = occurrence.component
+    stored = readBinSnapshot(component)
+    edited = BinSnapshot.create(
+        BaseGeneratorSpec.fromInput(baseGeneratorInput),
+        BinBodyGeneratorSpec.fromInput(binBodyInput),
+        generateBase,
+        generateBody,
+        uiState or {},
+    )
+    component.name = binName
+    firstStage = firstChangedStage(stored, edited) if stored is not None else None
+    if stored is not None and firstStage is None:
+        futil.log(f"{CMD_NAME} {binName} inputs didn't change, nothing to regenerate")
+        if not isPreview:
+            writeBinSnapshot(
+                component, dataclasses.replace(edited, stageGroups=stored.stageGroups)
+            )
+        return occurrence
+
+    occurrence.activate()
+    stageGroups = {}
+    baseBodies = None
+    groups = {}
+    rebuiltGroups = []
+    if stored is not None:
+        groups = findStageGroups(des.timeline, occurrence, stored.stageGroups)
+        rebuiltStages = BIN_STAGES[BIN_STAGES.index(firstStage) :]
+        rebuiltGroups = [groups[stage] for stage in rebuiltStages if stage in groups]
+    if stored is not None and len(groups) == len(stored.stageGroups) and rebuiltGroups:
+        futil.log(f"{CMD_NAME} Regenerating {binName} from the {firstStage} stage")
+        rebuiltGroups[0].rollTo(True)
+        for group in rebuiltGroups:
+            group.deleteMe(True)
+        stageGroups = {
+            stage: name
+            for stage, name in stored.stageGroups.items()
+            if stage not in rebuiltStages
+        }
+        if generateBase and BIN_STAGE_BASE not in rebuiltStages:
+            # with later stages removed the component has base bodies only
+            baseBodies = list(component.bRepBodies)
+    else:
+        # bins imported from the cache or with changed timeline groups
+        futil.log(f"{CMD_NAME} Regenerating all of {binName}")
+        firstStage = BIN_STAGE_BASE
+        for body in list(component.bRepBodies):
+            component.features.removeFeatures.add(body)
+
+    try:
+        stageGroups.update(
+            createBinStages(
+                baseGeneratorInput,
+                binBodyInput,
+                generateBase,
+                generateBody,
+                binName,
+                component,
+                firstStage,
+                baseBodies,
+            )
+        )
+    finally:
+        des.timeline.moveToEnd()
+
+    if not isPreview:
+        writeBinSnapshot(
+            component, dataclasses.replace(edited, stageGroups=stageGroups)
+        )
+    return occurrence
+
+
+def queueBinCopies(
+    count: int,
+    baseGeneratorInput: BaseGeneratorInput,
+    binBodyInput: BinBodyGeneratorInput,
+    generateBase: bool,
+    generateBody: bool,
+    binName: str,
+    uiState: dict,
+):
+    """Generates copies of the bin next to it along X, one copy per job step."""
+    # steps run later, each copy gets fresh inputs made from a frozen snapshot
+    baseSpec = BaseGeneratorSpec.fromInput(baseGeneratorInput)
+    binBodySpec = BinBodyGeneratorSpec.fromInput(binBodyInput)
+    pitch = (
+        binBodyInput.binWidth * binBodyInput.baseWidth
+        - binBodyInput.xyClearance * 2
+        + BIN_QUANTITY_SPACING
+    )
+
+    def createCopy(index: int):
+        sessionName = f"{CMD_NAME} copy {index + 1}"
+        with stageTimer.session(sessionName), apiCallTracer.session(sessionName):
+            createBin(
+                baseSpec.toInput(),
+                binBodySpec.toInput(),
+                generateBase,
+                generateBody,
+                binName,
+                offsetX=pitch * index,
+                uiState=uiState,
+            )
+
+    getJobQueue().submit(
+        f"{binName} x {count + 1}",
+        [
+            (f"copy {index + 1}", lambda index=index: createCopy(index))
+            for index in range(1, count + 1)
+        ],
+    )
+
+
+def queueHeightFamily(
+    heights: list[float],
+    sourceOccurrence: adsk.fusion.Occurrence,
+    baseGeneratorInput: BaseGeneratorInput,
+    binBodyInput: BinBodyGeneratorInput,
+    generateBase: bool,
+    generateBody: bool,
+    uiState: dict,
+):
+    """Generates bins of other heights behind the bin along Y, one bin per job step."""
+    baseSpec = BaseGeneratorSpec.fromInput(baseGeneratorInput)
+    binBodySpec = BinBodyGeneratorSpec.fromInput(binBodyInput)
+    heights = [height for height in heights if height != binBodyInput.binHeight]
+    if not heights:
+        return
+    maxHeight = max(heights)
+    splitHeight = (
+        stretchHeight(binBodyInput, maxHeight)
+        if generateBody and sourceOccurrence is not None
+        else None
+    )
+    pitch = (
+        binBodyInput.binLength * binBodyInput.baseLength
+        - binBodyInput.xyClearance * 2
+        + BIN_QUANTITY_SPACING
+    )
+
+    def createFamilyBin(index: int, height: float):
+        binName = "Gridfinity bin {}x{}x{:g}".format(
+            int(binBodyInput.binLength), int(binBodyInput.binWidth), height
+        )
+        sessionName = f"{CMD_NAME} height {height:g}"
+        with stageTimer.session(sessionName), apiCallTracer.session(sessionName):
+            if splitHeight is None or height < binBodyInput.binHeight:
+                createBin(
+                    baseSpec.toInput(),
+                    dataclasses.replace(binBodySpec, binHeight=height).toInput(),
+                    generateBase,
+                    generateBody,
+                    binName,
+                    offsetY=pitch * index,
+                    uiState=heightUiState(uiState, height),
+                )
+                return
+            des = adsk.fusion.Design.cast(app.activeProduct)
+            binTransform = adsk.core.Matrix3D.create()
+            binTransform.translation = adsk.core.Vector3D.create(0, pitch * index, 0)
+            copyOccurrence = createStretchedBinCopy(
+                sourceOccurrence,
+                binBodySpec.toInput(),
+                splitHeight,
+                height,
+                binName,
+                binTransform,
+            )
+            component = copyOccurrence.component
+            with stageTimer.stage("timeline grouping"):
+                binGroup = des.timeline.timelineGroups.add(
+                    copyOccurrence.timelineObject.index,
+                    copyOccurrence.timelineObject.index
+                    + component.features.count
+                    + component.constructionPlanes.count
+                    + component.constructionAxes.count
+                    + component.sketches.count,
+                )
+                binGroup.name = binName
+
+    getJobQueue().submit(
+        f"{CMD_NAME} heights {', '.join(f'{height:g}' for height in heights)}",
+        [
+            (
+                f"height {height:g}",
+                lambda index=index, height=height: createFamilyBin(index, height),
+            )
+            for index, height in enumerate(heights, 1)
+        ],
+    )
+
+
+def heightUiState(uiState: dict, height: float) -> dict:
+    """Copy of a saved dialog state with another bin height."""
+    staticUiState = dict(uiState["static_ui"])
+    staticUiState[BIN_HEIGHT_INPUT_ID] = {
+        **staticUiState[BIN_HEIGHT_INPUT_ID],
+        "value": height,
+    }
+    return {**uiState, "static_ui": staticUiState}
+
+
+def createBinEnvelope(
+    binBodyInput: BinBodyGeneratorInput, generateBase: bool, binName: str
+):
+    des = adsk.fusion.Design.cast(app.activeProduct)
+    root = adsk.fusion.Component.cast(des.rootComponent)
+    envelopeOccurrence = adsk.fusion.Occurrences.cast(root.occurrences).addNewComponent(
+        adsk.core.Matrix3D.create()
+    )
+    envelopeOccurrence.component.name = f"{binName} outline"
+    envelopeOccurrence.activate()
+    createGridfinityBinEnvelope(
+        binBodyInput, generateBase, envelopeOccurrence.component
+    )
@@ -0,0 +1,184 @@
+import math
+
+from ...lib.gridfinityUtils.compartmentLayout import (
+    CompartmentLayoutError,
+    parseLayout,
+)
+from ...lib.gridfinityUtils.binHeightFamily import (
+    HeightFamilyError,
+    parseHeightFamily,
+)
+from ...lib.ui.inputValidation import (
+    RuleSet,
+    ValidationRule,
+    atLeast,
+    eachItem,
+    formatDegrees,
+    formatMillimeters,
+    greaterThan,
+    inRange,
+    lessThanField,
+)
+from .inputState import (
+    InputState,
+    CompartmentState,
+    BIN_TYPE_HOLLOW,
+    BIN_COMPARTMENTS_GRID_TYPE_CUSTOM,
+    BIN_COMPARTMENTS_GRID_TYPE_TEXT,
+)
+
+
+def hasBase(state: InputState):
+    return state.generateBase
+
+
+def hasScrewHoles(state: InputState):
+    return state.generateBase and state.hasScrewHoles
+
+
+def hasMagnetCutouts(state: InputState):
+    return state.generateBase and state.hasMagnetCutouts
+
+
+def isHollowBody(state: InputState):
+    return state.generateBody and state.binType == BIN_TYPE_HOLLOW
+
+
+def hasScoop(state: InputState):
+    return isHollowBody(state) and state.hasScoop
+
+
+def hasTab(state: InputState):
+    return isHollowBody(state) and state.hasTab
+
+
+def hasCustomCompartments(state: InputState):
+    return (
+        isHollowBody(state)
+        and state.compartmentsGridType == BIN_COMPARTMENTS_GRID_TYPE_CUSTOM
+    )
+
+
+def hasTextLayout(state: InputState):
+    return (
+        isHollowBody(state)
+        and state.compartmentsGridType == BIN_COMPARTMENTS_GRID_TYPE_TEXT
+    )
+
+
+def compartmentsLayoutErrors(state: InputState):
+    try:
+        parseLayout(state.compartmentsLayout)
+    except CompartmentLayoutError as err:
+        return [str(err)]
+    return []
+
+
+def heightFamilyErrors(state: InputState):
+    try:
+        parseHeightFamily(state.heightFamily)
+    except HeightFamilyError as err:
+        return [str(err)]
+    return []
+
+
+def isCompartmentInGrid(compartment: CompartmentState, state: InputState):
+    return (
+        compartment.positionX >= 0
+        and compartment.positionY >= 0
+        and compartment.width > 0
+        and compartment.length > 0
+        and compartment.positionX + compartment.width <= state.compartmentsGridWidth
+        and compartment.positionY + compartment.length <= state.compartmentsGridLength
+    )
+
+
+BIN_INPUT_RULES = RuleSet(
+    [
+        greaterThan(
+            "baseWidth", 1, formatValue=formatMillimeters, label="Base width unit"
+        ),
+        greaterThan(
+            "baseLength", 1, formatValue=formatMillimeters, label="Base length unit"
+        ),
+        greaterThan(
+            "heightUnit", 0.5, formatValue=formatMillimeters, label="Bin height unit"
+        ),
+        inRange(
+            "xyClearance",
+            0.01,
+            0.05,
+            formatValue=formatMillimeters,
+            label="Bin xy clearance",
+        ),
+        greaterThan("binWidth", 0, label="Bin width"),
+        greaterThan("binLength", 0, label="Bin length"),
+        atLeast("binHeight", 1, label="Bin height"),
+        ValidationRule("heightFamily", heightFamilyErrors, label="Other heights"),
+        inRange(
+            "wallThickness",
+            0.04,
+            0.2,
+            formatValue=formatMillimeters,
+            label="Bin wall thickness",
+        ),
+        greaterThan(
+            "screwHoleDiameter",
+            0.1,
+            when=hasScrewHoles,
+            formatValue=formatMillimeters,
+            label="Screw hole diameter",
+        ),
+        lessThanField(
+            "screwHoleDiameter",
+            "magnetCutoutDiameter",
+            when=hasMagnetCutouts,
+            label="Screw hole diameter",
+            otherLabel="magnet cutout diameter",
+        ),
+        greaterThan(
+            "magnetCutoutDepth",
+            0,
+            when=hasBase,
+            formatValue=formatMillimeters,
+            label="Magnet cutout depth",
+        ),
+        greaterThan(
+            "scoopMaxRadius",
+            0,
+            when=hasScoop,
+            formatValue=formatMillimeters,
+            label="Scoop max radius",
+        ),
+        greaterThan("tabLength", 0, when=hasTab, label="Tab length"),
+        greaterThan(
+            "tabWidth",
+            0,
+            when=hasTab,
+            formatValue=formatMillimeters,
+            label="Tab width",
+        ),
+        atLeast("tabPosition", 0, when=hasTab, label="Tab offset"),
+        inRange(
+            "tabAngle",
+            math.radians(30),
+            math.radians(65),
+            when=hasTab,
+            formatValue=formatDegrees,
+            label="Tab overhang angle",
+        ),
+        eachItem(
+            "compartments",
+            isCompartmentInGrid,
+            "row {} doesn't fit the grid",
+            when=hasCustomCompartments,
+            label="Compartments table",
+        ),
+        ValidationRule(
+            "compartmentsLayout",
+            compartmentsLayoutErrors,
+            hasTextLayout,
+            label="Layout",
+        ),
+    ]
+)
@@ -0,0 +1,60 @@
+from dataclasses import dataclass
+
+BIN_TYPE_HOLLOW = "Hollow"
+BIN_TYPE_SHELLED = "Shelled"
+BIN_TYPE_SOLID = "Solid"
+BIN_COMPARTMENTS_GRID_TYPE_UNIFORM = "Uniform"
+BIN_COMPARTMENTS_GRID_TYPE_CUSTOM = "Custom grid"
+BIN_COMPARTMENTS_GRID_TYPE_TEXT = "Text layout"
+
+
+@dataclass(frozen=True)
+class CompartmentState:
+    positionX: int
+    positionY: int
+    width: int
+    length: int
+    depth: float
+
+
+@dataclass(frozen=True)
+class InputState:
+    baseWidth: float
+    baseLength: float
+    heightUnit: float
+    xyClearance: float
+    binWidth: float
+    binLength: float
+    binHeight: float
+    heightFamily: str
+    wallThickness: float
+
+    generateBase: bool
+    hasScrewHoles: bool
+    screwHoleDiameter: float
+    hasMagnetCutouts: bool
+    hasMagnetCutoutsTabs: bool
+    magnetCutoutDiameter: float
+    magnetCutoutDepth: float
+
+    generateBody: bool
+    binType: str
+    hasLip: bool
+    hasLipNotches: bool
+
+    hasScoop: bool
+    scoopMaxRadius: float
+
+    hasTab: bool
+    tabLength: float
+    tabWidth: float
+    tabPosition: float
+    # radians
+    tabAngle: float
+
+    compartmentsGridType: str
+    compartmentsGridWidth: int
+    compartmentsGridLength: int
+    hasCompartmentsLip: bool
+    compartmentsLayout: str
+    compartments: tuple[CompartmentState, ...]
@@ -0,0 +1,84 @@
+import adsk.core, adsk.fusion, traceback
+
+from ...lib import fusion360utils as futil
+from ... import config
+from ..commandCreateBin import entry as binEntry
+
+app = adsk.core.Application.get()
+ui = app.userInterface
+
+# Opens the bin dialog for a selected bin with the inputs stored in its
+# snapshot, see lib/gridfinityUtils/binSnapshot.py. The dialog regenerates the
+# bin in place on OK.
+
+# *** The command identity information. ***
+CMD_ID = f"{config.COMPANY_NAME}_{config.ADDIN_NAME}_cmdEditBin"
+CMD_NAME = "Edit gridfinity bin"
+CMD_Description = "Change inputs of a generated gridfinity bin, select the bin first"
+
+# Button is shown in the panel next to the generator commands, not promoted.
+WORKSPACE_ID = "FusionSolidEnvironment"
+PANEL_ID = "SolidCreatePanel"
+COMMAND_BESIDE_ID = "ScriptsManagerCommand"
+
+
+# Executed when add-in is run.
+def start():
+    try:
+        futil.log(f"{CMD_NAME} Command Start Event")
+        cmd_def = ui.commandDefinitions.itemById(CMD_ID)
+        if not cmd_def:
+            cmd_def = ui.commandDefinitions.addButtonDefinition(
+                CMD_ID, CMD_NAME, CMD_Description, binEntry.ICON_FOLDER
+            )
+            futil.add_handler(cmd_def.commandCreated, command_created)
+
+            workspace = ui.workspaces.itemById(WORKSPACE_ID)
+            panel = workspace.toolbarPanels.itemById(PANEL_ID)
+            control = panel.controls.addCommand(cmd_def, COMMAND_BESIDE_ID, False)
+            control.isPromoted = False
+    except Exception as err:
+        futil.log(f"{CMD_NAME} Error occurred at the start, {err}")
+
+
+# Executed when add-in is stopped.
+def stop():
+    futil.log(f"{CMD_NAME} Command Stop Event")
+    workspace = ui.workspaces.itemById(WORKSPACE_ID)
+    panel = workspace.toolbarPanels.itemById(PANEL_ID)
+    command_control: adsk.core.CommandControl = panel.controls.itemById(CMD_ID)
+    command_definition = ui.commandDefinitions.itemById(CMD_ID)
+
+    # Delete the button command control
+    if command_control:
+        command_control.deleteMe()
+
+    # Delete the command definition
+    if command_definition:
+        command_definition.deleteMe()
+
+
+def selectedOccurrence() -> adsk.fusion.Occurrence:
+    """Occurrence of the selected component, body or face, if any."""
+    for selection in ui.activeSelections:
+        entity = selection.entity
+        occurrence = adsk.fusion.Occurrence.cast(entity)
+        if occurrence is None and hasattr(entity, "assemblyContext"):
+            occurrence = entity.assemblyContext
+        if occurrence is not None:
+            return occurrence
+    return None
+
+
+def command_created(args: adsk.core.CommandCreatedEventArgs):
+    futil.log(f"{CMD_NAME} Command Created Event")
+    from ...lib.gridfinityUtils.binSnapshot import readBinSnapshot
+
+    occurrence = selectedOccurrence()
+    if occurrence is None or readBinSnapshot(occurrence.component) is None:
+        ui.messageBox(
+            "Select a bin generated by the gridfinity bin command, then run the command again",
+            CMD_NAME,
+        )
+        return
+    binEntry.loadDialog().command_created(args, editOccurrence=occurrence)
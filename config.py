@@ -4,12 +4,24 @@
 
 import os
 
-# Flag that indicates to run in Debug mode or not. When running in Debug mode
-# more information is written to the Text Command window. Generally, it's useful
+# Flag that indicates to run in Debug mode or not. Generally, it's useful
 # to set this to True while developing an add-in and set it to False when you
-# are ready to distribute it.
+# are ready to distribute it. How much is written to the Text Command window is
+# controlled by LOG_CONSOLE_LEVEL below.
 DEBUG = True
 
+# Logging. Every log record is kept in an in-memory buffer of the last
+# LOG_BUFFER_SIZE records. Records at LOG_FILE_LEVEL and above are appended to
+# LOG_FILE_PATH by a background thread, only records at LOG_CONSOLE_LEVEL and
+# above are written to the Text Command window, as each console write is a call
+# into Fusion. Levels are "debug", "info", "warning" and "error".
+LOG_CONSOLE_LEVEL = "warning"
+LOG_FILE_LEVEL = "info"
+LOG_FILE_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "logs", "gridfinityGenerator.log"
+)
+LOG_BUFFER_SIZE = 2000
+
 # Gets the name of the add-in from the name of the folder the py file is in.
 # This is used when defining unique internal names for various UI elements
 # that need a unique name. It's also recommended to use a company name as
@@ -19,3 +31,51 @@ COMPANY_NAME = "LevMishin"
 
 # Palettes
 sample_palette_id = f"{COMPANY_NAME}_{ADDIN_NAME}_palette_id"
+
+# Bin fillets. When enabled, constant radius fillets of the bin body, lip and
+# compartment cutouts are collected while the bodies are built and created as
+# one fillet feature with an edge set per radius, before the bodies are
+# combined. Fillets followed by a chamfer are still created right away.
+FILLETS_CONSOLIDATED = False
+
+# Sketch constraints. When disabled, generator sketches get no dimensions and
+# no geometric constraints, their curves are placed at their final positions
+# and stay fixed geometry. Saves the sketch solver time, the sketches can't be
+# edited by changing their dimensions afterwards.
+SKETCH_CONSTRAINTS_ENABLED = True
+
+# Command dialogs. When enabled, text layout parsing and dimension math of the
+# bin dialog run on a worker thread, results are applied to the dialog inputs
+# from a custom event on the main thread. Results of inputs changed again in
+# the meantime are dropped.
+DIALOG_BACKGROUND_WORKER_ENABLED = False
+
+# Preview time budget in seconds. When a bin preview is still generating after
+# the budget, it stops at the next generator stage and shows an outline of the
+# bin instead, OK always generates the full bin. 0 disables the budget.
+PREVIEW_TIME_BUDGET_SECONDS = 10
+
+# Local library of generated components. When enabled, bins and baseplates
+# generated with the same inputs are imported from the cache folder instead of
+# being generated again. Least recently used files are evicted once the folder
+# grows over the size limit.
+GENERATION_CACHE_ENABLED = False
+GENERATION_CACHE_FOLDER_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "generationCache"
+)
+GENERATION_CACHE_MAX_SIZE_MB = 500
+
+# Generation timings. When enabled, every generated bin and baseplate writes a
+# per stage breakdown of where the generation time was spent to the Text
+# Command window and saves it as a json report into the reports folder.
+PROFILING_ENABLED = False
+PROFILING_REPORT_FOLDER_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "profilingReports"
+)
+
+# Fusion API call tracing. When enabled, calls to adsk.core and adsk.fusion made
+# during generation are counted by API method and by the generator function
+# they come from, together with created features, sketches and construction
+# geometry. The table is written to the Text Command window. Tracing slows the
+# generation down noticeably, only enable it while investigating performance.
+API_TRACING_ENABLED = False
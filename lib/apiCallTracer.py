@@ -0,0 +1,187 @@
+import adsk.core, adsk.fusion, traceback
+import collections
+import functools
+import os
+import sys
+import time
+
+from . import fusion360utils as futil
+from .. import config
+
+# members every swig wrapped class has, not part of the Fusion API
+IGNORED_MEMBERS = ["this", "thisown", "cast", "classType"]
+TABLE_TOP_METHODS_COUNT = 25
+
+
+class ApiCallTracer:
+    def __init__(self, name: str):
+        self.name = name
+        self.depth = 0
+        self.seconds = 0.0
+        self.callsByMethod = collections.Counter()
+        self.callsByCaller = collections.Counter()
+        self.featuresByType = collections.Counter()
+        self.featuresByCaller = collections.Counter()
+        self.sketchesByCaller = collections.Counter()
+        self.constructionPlanesByCaller = collections.Counter()
+        self.constructionAxesByCaller = collections.Counter()
+
+    def record(self, label: str, result: any):
+        caller = findCaller()
+        self.callsByMethod[label] += 1
+        self.callsByCaller[caller] += 1
+        if isinstance(result, adsk.fusion.Feature):
+            self.featuresByType[type(result).__name__] += 1
+            self.featuresByCaller[caller] += 1
+        elif isinstance(result, adsk.fusion.Sketch):
+            self.sketchesByCaller[caller] += 1
+        elif isinstance(result, adsk.fusion.ConstructionPlane):
+            self.constructionPlanesByCaller[caller] += 1
+        elif isinstance(result, adsk.fusion.ConstructionAxis):
+            self.constructionAxesByCaller[caller] += 1
+
+    def formatReport(self):
+        lines = [
+            "API calls: {}, {} calls, {} features, {} sketches, {} planes, {} axes in {:.1f} ms".format(
+                self.name,
+                sum(self.callsByCaller.values()),
+                sum(self.featuresByCaller.values()),
+                sum(self.sketchesByCaller.values()),
+                sum(self.constructionPlanesByCaller.values()),
+                sum(self.constructionAxesByCaller.values()),
+                self.seconds * 1000,
+            ),
+            "{:<60} {:>7} {:>8} {:>8} {:>6} {:>5}".format(
+                "Caller", "Calls", "Features", "Sketches", "Planes", "Axes"
+            ),
+        ]
+        for caller, calls in self.callsByCaller.most_common():
+            lines.append(
+                "{:<60} {:>7} {:>8} {:>8} {:>6} {:>5}".format(
+                    caller,
+                    calls,
+                    self.featuresByCaller[caller],
+                    self.sketchesByCaller[caller],
+                    self.constructionPlanesByCaller[caller],
+                    self.constructionAxesByCaller[caller],
+                )
+            )
+        lines.append("{:<60} {:>7}".format("Feature type", "Count"))
+        for featureType, count in self.featuresByType.most_common():
+            lines.append("{:<60} {:>7}".format(featureType, count))
+        lines.append("{:<60} {:>7}".format("API method", "Calls"))
+        for method, calls in self.callsByMethod.most_common(TABLE_TOP_METHODS_COUNT):
+            lines.append("{:<60} {:>7}".format(method, calls))
+        return "\n".join(lines)
+
+
+_activeTracer: ApiCallTracer = None
+# (class, member name, original member) of every patched member
+_patchedMembers = []
+
+
+def findCaller():
+    # attribute calls to the closest generator function, utils are shared
+    # between generators and wouldn't tell where the cost comes from
+    frame = sys._getframe(2)
+    fallback = None
+    while frame is not None:
+        if frame.f_code.co_name.startswith("<"):
+            # comprehensions and lambdas, attribute to the enclosing function
+            frame = frame.f_back
+            continue
+        fileName = os.path.basename(frame.f_code.co_filename)
+        if fileName.endswith("Generator.py"):
+            return "{}.{}".format(fileName[: -len(".py")], frame.f_code.co_name)
+        if fallback is None and frame.f_code.co_filename != __file__:
+            fallback = "{}.{}".format(fileName[: -len(".py")], frame.f_code.co_name)
+        frame = frame.f_back
+    return fallback
+
+
+def traceMember(label: str, function):
+    @functools.wraps(function)
+    def traced(*args, **kwargs):
+        tracer = _activeTracer
+        # calls made by the api wrappers themselves are not counted
+        if tracer is None or tracer.depth > 0:
+            return function(*args, **kwargs)
+        tracer.depth += 1
+        try:
+            result = function(*args, **kwargs)
+        finally:
+            tracer.depth -= 1
+        tracer.record(label, result)
+        return result
+
+    return traced
+
+
+def patchClass(cls: type):
+    for name, member in list(vars(cls).items()):
+        if name.startswith("_") or name in IGNORED_MEMBERS:
+            continue
+        label = f"{cls.__name__}.{name}"
+        if isinstance(member, property):
+            patched = property(
+                traceMember(label, member.fget) if member.fget else None,
+                traceMember(label, member.fset) if member.fset else None,
+                member.fdel,
+                member.__doc__,
+            )
+        elif isinstance(member, staticmethod):
+            patched = staticmethod(traceMember(label, member.__func__))
+        elif callable(member) and not isinstance(member, (type, classmethod)):
+            patched = traceMember(label, member)
+        else:
+            continue
+        _patchedMembers.append((cls, name, member))
+        setattr(cls, name, patched)
+
+
+def patchApi():
+    for module in [adsk.core, adsk.fusion]:
+        for item in list(vars(module).values()):
+            if isinstance(item, type) and issubclass(item, adsk.core.Base):
+                patchClass(item)
+
+
+def unpatchApi():
+    while _patchedMembers:
+        cls, name, member = _patchedMembers.pop()
+        setattr(cls, name, member)
+
+
+class SessionContext:
+    def __init__(self, name: str):
+        self.name = name
+        self.tracer: ApiCallTracer = None
+
+    def __enter__(self):
+        global _activeTracer
+        if not config.API_TRACING_ENABLED or _activeTracer is not None:
+            return self
+        try:
+            patchApi()
+        except Exception:
+            unpatchApi()
+            futil.log(f"Couldn't enable API tracing, {traceback.format_exc()}")
+            return self
+        self.tracer = ApiCallTracer(self.name)
+        _activeTracer = self.tracer
+        self.startTime = time.perf_counter()
+        return self
+
+    def __exit__(self, excType, excValue, excTraceback):
+        global _activeTracer
+        if self.tracer is None:
+            return False
+        self.tracer.seconds = time.perf_counter() - self.startTime
+        _activeTracer = None
+        unpatchApi()
+        futil.log(self.tracer.formatReport(), force_console=True)
+        return False
+
+
+def session(name: str):
+    return SessionContext(name)
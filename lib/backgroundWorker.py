@@ -0,0 +1,137 @@
+import adsk.core, adsk.fusion, traceback
+import itertools
+import queue
+import threading
+
+from . import fusion360utils as futil
+from .. import config
+
+app = adsk.core.Application.get()
+
+# Runs pure python work of command dialogs, like text layout parsing or
+# dimension math, on a worker thread so the Fusion UI thread isn't blocked
+# while inputs change. The Fusion API may only be used from the main thread:
+# work functions must not touch adsk objects, their results are handed back
+# through a custom event and result callbacks run on the main thread.
+#
+# Jobs are submitted under a key. Submitting a job makes older jobs with the
+# same key stale, stale jobs are skipped if they haven't started yet and their
+# results are dropped, so only the result of the latest input is applied.
+
+WORKER_STOP_TIMEOUT = 2
+
+
+class Job:
+    def __init__(self, key: str, generation: int, work, onResult):
+        self.key = key
+        self.generation = generation
+        self.work = work
+        self.onResult = onResult
+
+
+class BackgroundWorker:
+    def __init__(self, name: str):
+        self.name = name
+        self.eventId = f"{config.COMPANY_NAME}_{config.ADDIN_NAME}_{name}_worker"
+        self._generations: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._jobs = queue.Queue()
+        self._jobIds = itertools.count(1)
+        self._results: dict[int, tuple[Job, any, str]] = {}
+        self._thread: threading.Thread = None
+        self._handlers = []
+
+    @property
+    def isRunning(self):
+        return self._thread is not None
+
+    def start(self):
+        if self.isRunning:
+            return
+        customEvent = app.registerCustomEvent(self.eventId)
+        futil.add_handler(
+            customEvent,
+            self._onResultEvent,
+            name=f"{self.name} worker result",
+            local_handlers=self._handlers,
+        )
+        self._thread = threading.Thread(
+            target=self._run, name=f"Gridfinity {self.name} worker", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        if not self.isRunning:
+            return
+        self.cancelAll()
+        self._jobs.put(None)
+        self._thread.join(WORKER_STOP_TIMEOUT)
+        self._thread = None
+        app.unregisterCustomEvent(self.eventId)
+        self._handlers = []
+        self._results.clear()
+
+    def submit(self, key: str, work, onResult):
+        """Runs work() on the worker thread and onResult(result) on the main thread.
+
+        Older jobs submitted with the same key are cancelled. Without a running
+        worker, both are called right away.
+        """
+        with self._lock:
+            generation = self._generations.get(key, 0) + 1
+            self._generations[key] = generation
+        job = Job(key, generation, work, onResult)
+        if not self.isRunning:
+            self._deliver(job, *self._runJob(job))
+            return
+        self._jobs.put(job)
+
+    def cancel(self, key: str):
+        with self._lock:
+            self._generations[key] = self._generations.get(key, 0) + 1
+
+    def cancelAll(self):
+        with self._lock:
+            for key in self._generations:
+                self._generations[key] += 1
+
+    def isStale(self, job: Job):
+        with self._lock:
+            return self._generations.get(job.key) != job.generation
+
+    def _run(self):
+        while True:
+            job: Job = self._jobs.get()
+            if job is None:
+                return
+            if self.isStale(job):
+                continue
+            jobId = next(self._jobIds)
+            self._results[jobId] = (job, *self._runJob(job))
+            app.fireCustomEvent(self.eventId, str(jobId))
+
+    def _runJob(self, job: Job):
+        try:
+            return job.work(), None
+        except:
+            return None, traceback.format_exc()
+
+    def _onResultEvent(self, args: adsk.core.CustomEventArgs):
+        # results of jobs finished while the worker stopped are already gone
+        jobResult = self._results.pop(int(args.additionalInfo), None)
+        if jobResult is None:
+            return
+        job, result, error = jobResult
+        if self.isStale(job):
+            futil.log_debug("%s worker dropped stale %s result", self.name, job.key)
+            return
+        self._deliver(job, result, error)
+
+    def _deliver(self, job: Job, result, error: str):
+        if error is not None:
+            futil.log(
+                f"{self.name} worker {job.key} job failed\n{error}",
+                level=adsk.core.LogLevels.ErrorLogLevel,
+            )
+            return
+        job.onResult(result)
@@ -10,45 +10,196 @@
 #  UNINTERRUPTED OR ERROR FREE.
 
 import os
+import collections
+import threading
+import time
 import traceback
 import adsk.core
 
 app = adsk.core.Application.get()
 ui = app.userInterface
 
-# Attempt to read DEBUG flag from parent config.
+# Below adsk.core.LogLevels.InfoLogLevel, never written to the Fusion log file.
+DEBUG_LOG_LEVEL = -1
+LOG_LEVELS_BY_NAME = {
+    "debug": DEBUG_LOG_LEVEL,
+    "info": adsk.core.LogLevels.InfoLogLevel,
+    "warning": adsk.core.LogLevels.WarningLogLevel,
+    "error": adsk.core.LogLevels.ErrorLogLevel,
+}
+LOG_LEVEL_NAMES = {value: name for name, value in LOG_LEVELS_BY_NAME.items()}
+LOG_FILE_FLUSH_INTERVAL = 0.5
+
+# Attempt to read DEBUG flag and logging settings from parent config.
 try:
     from ... import config
 
     DEBUG = config.DEBUG
+    CONSOLE_LEVEL = LOG_LEVELS_BY_NAME[config.LOG_CONSOLE_LEVEL]
+    FILE_LEVEL = LOG_LEVELS_BY_NAME[config.LOG_FILE_LEVEL]
+    FILE_PATH = config.LOG_FILE_PATH
+    BUFFER_SIZE = config.LOG_BUFFER_SIZE
 except:
     DEBUG = False
+    CONSOLE_LEVEL = adsk.core.LogLevels.WarningLogLevel
+    FILE_LEVEL = adsk.core.LogLevels.InfoLogLevel
+    FILE_PATH = None
+    BUFFER_SIZE = 1000
+
+
+class LogRecord:
+    def __init__(self, message, args: tuple, level: int):
+        self.created = time.time()
+        self.level = level
+        self._message = message
+        self._args = args
+        self._text = None
+
+    @property
+    def text(self) -> str:
+        # messages are only formatted once something reads them
+        if self._text is None:
+            message = self._message() if callable(self._message) else self._message
+            self._text = str(message) % self._args if self._args else str(message)
+            self._message = None
+            self._args = None
+        return self._text
+
+    def format(self) -> str:
+        return "{}.{:03d} {:<7} {}".format(
+            time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(self.created)),
+            int(self.created * 1000) % 1000,
+            LOG_LEVEL_NAMES.get(self.level, self.level),
+            self.text,
+        )
+
+
+class FileSink:
+    """Appends formatted log lines to a file from a background thread."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._pending = collections.deque()
+        # the writer thread and stop can both write pending lines
+        self._writeLock = threading.Lock()
+        self._wakeUp = threading.Event()
+        self._stopped = False
+        self._thread = threading.Thread(
+            target=self._run, name="Gridfinity log writer", daemon=True
+        )
+        self._thread.start()
+
+    def write(self, line: str):
+        self._pending.append(line)
+        self._wakeUp.set()
+
+    def _writePending(self):
+        with self._writeLock:
+            self._writePendingLocked()
+
+    def _writePendingLocked(self):
+        if not self._pending:
+            return
+        lines = []
+        while self._pending:
+            lines.append(self._pending.popleft())
+        try:
+            folder = os.path.dirname(self.path)
+            if folder and not os.path.exists(folder):
+                os.makedirs(folder)
+            with open(self.path, "a", encoding="utf-8") as logFile:
+                logFile.write("\n".join(lines) + "\n")
+        except Exception as err:
+            print(f"Couldn't write log file {self.path}, {err}")
+
+    def _run(self):
+        while not self._stopped:
+            self._wakeUp.wait()
+            self._wakeUp.clear()
+            # batch messages arriving in quick succession into a single write
+            time.sleep(LOG_FILE_FLUSH_INTERVAL)
+            self._writePending()
+
+    def stop(self):
+        self._stopped = True
+        self._wakeUp.set()
+        self._thread.join(LOG_FILE_FLUSH_INTERVAL * 4)
+        # lines added after the last write of the thread, or all of them when
+        # the thread is still busy writing, the lock keeps lines in order
+        self._writePending()
+
+
+_records: collections.deque = collections.deque(maxlen=BUFFER_SIZE)
+_fileSink: FileSink = None
+
+
+def _get_file_sink():
+    global _fileSink
+    if _fileSink is None and FILE_PATH:
+        _fileSink = FileSink(FILE_PATH)
+    return _fileSink
 
 
 def log(
     message: str,
+    *args,
     level: adsk.core.LogLevels = adsk.core.LogLevels.InfoLogLevel,
     force_console: bool = False,
 ):
     """Utility function to easily handle logging in your app.
 
     Arguments:
-    message -- The message to log.
-    level -- The logging severity level.
-    force_console -- Forces the message to be written to the Text Command window.
+    message -- The message to log. Either a string, formatted with `args` using
+               the % operator, or a callable returning the message. Formatting
+               only happens when the record is written somewhere.
+    args -- Values for % placeholders in the message.
+    level -- Keyword only, the logging severity level, DEBUG_LOG_LEVEL or
+             adsk.core.LogLevels.
+    force_console -- Keyword only, forces the message to be written to the Text
+                     Command window.
     """
-    # Always print to console, only seen through IDE.
-    print(message)
+    record = LogRecord(message, args, level)
+    # Recent records of every level are kept in memory, see recent_records.
+    _records.append(record)
 
     # Log all errors to Fusion log file.
     if level == adsk.core.LogLevels.ErrorLogLevel:
         log_type = adsk.core.LogTypes.FileLogType
-        app.log(message, level, log_type)
+        app.log(record.text, level, log_type)
+
+    if level >= FILE_LEVEL:
+        sink = _get_file_sink()
+        if sink is not None:
+            sink.write(record.format())
 
-    # If config.DEBUG is True write all log messages to the console.
-    if DEBUG or force_console:
+    # Write to the console only above the configured level, every console
+    # write is a call into Fusion.
+    if level >= CONSOLE_LEVEL or force_console:
+        # Print is only seen through IDE.
+        print(record.text)
         log_type = adsk.core.LogTypes.ConsoleLogType
-        app.log(message, level, log_type)
+        app.log(record.text, max(level, adsk.core.LogLevels.InfoLogLevel), log_type)
+
+
+def log_debug(message: str, *args):
+    """Logs a debug message, see log for the meaning of arguments."""
+    log(message, *args, level=DEBUG_LOG_LEVEL)
+
+
+def recent_records(count: int = None) -> list[str]:
+    """Returns formatted recent log records of all levels, oldest first."""
+    records = list(_records)
+    if count is not None:
+        records = records[-count:]
+    return [record.format() for record in records]
+
+
+def stop_logging():
+    """Writes pending log lines and stops the log writer thread."""
+    global _fileSink
+    if _fileSink is not None:
+        _fileSink.stop()
+        _fileSink = None
 
 
 def handle_error(name: str, show_message_box: bool = False):
@@ -61,8 +212,8 @@ def handle_error(name: str, show_message_box: bool = False):
                         and logged to the log file.
     """
 
-    log("===== Error =====", adsk.core.LogLevels.ErrorLogLevel)
-    log(f"{name}\n{traceback.format_exc()}", adsk.core.LogLevels.ErrorLogLevel)
+    log("===== Error =====", level=adsk.core.LogLevels.ErrorLogLevel)
+    log(f"{name}\n{traceback.format_exc()}", level=adsk.core.LogLevels.ErrorLogLevel)
 
     # If desired you could show an error as a message box.
     if show_message_box:
@@ -0,0 +1,213 @@
+import adsk.core, adsk.fusion, traceback
+import hashlib
+import json
+import os
+import time
+
+from . import fusion360utils as futil
+from .gridfinityUtils import const
+from .gridfinityUtils.generatorSpec import canonicalValue
+
+app = adsk.core.Application.get()
+
+CACHE_FORMAT_VERSION = 2
+CACHE_INDEX_FILE_NAME = "index.json"
+CACHE_FILE_EXTENSION = ".f3d"
+
+
+def constProfile():
+    return {
+        name: canonicalValue(getattr(const, name))
+        for name in dir(const)
+        if name.isupper()
+    }
+
+
+def getCacheKey(kind: str, *generatorSpecs):
+    payload = json.dumps(
+        {
+            "version": CACHE_FORMAT_VERSION,
+            "kind": kind,
+            "const": constProfile(),
+            "inputs": [canonicalValue(item) for item in generatorSpecs],
+        },
+        sort_keys=True,
+        separators=(",", ":"),
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class GenerationCache:
+    def __init__(self, folderPath: str, maxSizeBytes: int):
+        self.folderPath = folderPath
+        self.maxSizeBytes = maxSizeBytes
+        self.indexPath = os.path.join(folderPath, CACHE_INDEX_FILE_NAME)
+        self.index = self._readIndex()
+        # lookups only update counters and access times, the index is written
+        # on store and when the command finishes, see flush
+        self.isDirty = False
+
+    def _emptyIndex(self):
+        return {
+            "version": CACHE_FORMAT_VERSION,
+            "entries": {},
+            "stats": {"hits": 0, "misses": 0, "stores": 0, "evictions": 0},
+        }
+
+    def _readIndex(self):
+        try:
+            if os.path.exists(self.indexPath):
+                with open(self.indexPath) as indexFile:
+                    index = json.load(indexFile)
+                if index.get("version") == CACHE_FORMAT_VERSION:
+                    return index
+                futil.log("Generation cache index version mismatch, resetting cache")
+        except Exception as err:
+            futil.log(f"Couldn't read generation cache index, {err}")
+        return self._emptyIndex()
+
+    def _writeIndex(self):
+        try:
+            if not os.path.exists(self.folderPath):
+                os.makedirs(self.folderPath)
+            tempPath = self.indexPath + ".tmp"
+            with open(tempPath, "w") as indexFile:
+                json.dump(self.index, indexFile, indent=True)
+            os.replace(tempPath, self.indexPath)
+            self.isDirty = False
+            return True
+        except Exception as err:
+            futil.log(f"Couldn't write generation cache index, {err}")
+            return False
+
+    def _entryPath(self, key: str):
+        return os.path.join(self.folderPath, key + CACHE_FILE_EXTENSION)
+
+    def _removeEntry(self, key: str):
+        self.index["entries"].pop(key, None)
+        try:
+            if os.path.exists(self._entryPath(key)):
+                os.remove(self._entryPath(key))
+        except Exception as err:
+            futil.log(f"Couldn't delete cached file for {key}, {err}")
+
+    def totalSize(self):
+        return sum(entry["size"] for entry in self.index["entries"].values())
+
+    def stats(self):
+        stats = dict(self.index["stats"])
+        stats["entries"] = len(self.index["entries"])
+        stats["sizeBytes"] = self.totalSize()
+        lookups = stats["hits"] + stats["misses"]
+        stats["hitRate"] = stats["hits"] / lookups if lookups > 0 else 0.0
+        return stats
+
+    def logStats(self):
+        stats = self.stats()
+        futil.log(
+            "Generation cache: {} hits, {} misses ({:.0%} hit rate), {} entries, {:.1f} MB".format(
+                stats["hits"],
+                stats["misses"],
+                stats["hitRate"],
+                stats["entries"],
+                stats["sizeBytes"] / (1024 * 1024),
+            )
+        )
+
+    def lookup(self, key: str):
+        entry = self.index["entries"].get(key)
+        if entry is not None and not os.path.exists(self._entryPath(key)):
+            # file was removed outside of the add-in
+            self._removeEntry(key)
+            entry = None
+        if entry is None:
+            self.index["stats"]["misses"] += 1
+            self.isDirty = True
+            return None
+        entry["lastAccess"] = time.time()
+        entry["hits"] = entry.get("hits", 0) + 1
+        self.index["stats"]["hits"] += 1
+        self.isDirty = True
+        return self._entryPath(key)
+
+    def flush(self):
+        if self.isDirty:
+            self._writeIndex()
+
+    def evict(self):
+        entriesByAge = sorted(
+            self.index["entries"].items(), key=lambda item: item[1]["lastAccess"]
+        )
+        totalSize = self.totalSize()
+        for key, entry in entriesByAge:
+            if totalSize <= self.maxSizeBytes:
+                break
+            totalSize -= entry["size"]
+            self._removeEntry(key)
+            self.index["stats"]["evictions"] += 1
+            futil.log(f"Generation cache evicted {entry['name']} ({key})")
+
+    def store(self, key: str, component: adsk.fusion.Component):
+        try:
+            if not os.path.exists(self.folderPath):
+                os.makedirs(self.folderPath)
+            design = adsk.fusion.Design.cast(app.activeProduct)
+            tempPath = os.path.join(
+                self.folderPath, key + ".tmp" + CACHE_FILE_EXTENSION
+            )
+            exportOptions = design.exportManager.createFusionArchiveExportOptions(
+                tempPath, component
+            )
+            if not design.exportManager.execute(exportOptions):
+                futil.log(f"Generation cache export of {component.name} failed")
+                return False
+            os.replace(tempPath, self._entryPath(key))
+            now = time.time()
+            self.index["entries"][key] = {
+                "name": component.name,
+                "size": os.path.getsize(self._entryPath(key)),
+                "created": now,
+                "lastAccess": now,
+                "hits": 0,
+            }
+            self.index["stats"]["stores"] += 1
+            self.evict()
+            self._writeIndex()
+            return True
+        except Exception as err:
+            futil.log(f"Generation cache couldn't store {key}, {err}")
+            return False
+
+    def importInto(self, key: str, targetComponent: adsk.fusion.Component):
+        path = self.lookup(key)
+        if path is None:
+            return None
+        try:
+            importOptions = app.importManager.createFusionArchiveImportOptions(path)
+            occurrences = app.importManager.importToTarget2(
+                importOptions, targetComponent
+            )
+            if occurrences is None or occurrences.count == 0:
+                return None
+            return adsk.fusion.Occurrence.cast(occurrences.item(0))
+        except Exception as err:
+            futil.log(f"Generation cache couldn't import {key}, {err}")
+            self._removeEntry(key)
+            self._writeIndex()
+            return None
+
+
+_cache: GenerationCache = None
+
+
+def getGenerationCache(folderPath: str, maxSizeBytes: int):
+    global _cache
+    if _cache is None or _cache.folderPath != folderPath:
+        _cache = GenerationCache(folderPath, maxSizeBytes)
+    _cache.maxSizeBytes = maxSizeBytes
+    return _cache
+
+
+def flushGenerationCache():
+    if _cache is not None:
+        _cache.flush()
@@ -1,6 +1,7 @@
 import adsk.core, adsk.fusion, traceback, math
 import os
 
+from ...lib import stageTimer
 from .sketchUtils import createRectangle
 from ...lib.gridfinityUtils.baseGeneratorInput import BaseGeneratorInput
 from . import (
@@ -30,7 +31,9 @@ def createCircleAtPointSketch(
     sketches: adsk.fusion.Sketches = targetComponent.sketches
     circleSketch: adsk.fusion.Sketch = sketches.add(plane)
     circleCenterOnSketch = circleSketch.modelToSketchSpace(circleCenterPoint)
-    dimensions: adsk.fusion.SketchDimensions = circleSketch.sketchDimensions
+    dimensions: adsk.fusion.SketchDimensions = sketchUtils.sketchDimensions(
+        circleSketch
+    )
     sketchUtils.convertToConstruction(circleSketch.sketchCurves)
     circle = circleSketch.sketchCurves.sketchCircles.addByCenterRadius(
         adsk.core.Point3D.create(circleCenterOnSketch.x, circleCenterOnSketch.y, 0),
@@ -80,8 +83,12 @@ def createTabAtCircleEdgeSketch(
             )
         )
     )
-    dimensions: adsk.fusion.SketchDimensions = circleSketch.sketchDimensions
-    constraints: adsk.fusion.GeometricConstraints = circleSketch.geometricConstraints
+    dimensions: adsk.fusion.SketchDimensions = sketchUtils.sketchDimensions(
+        circleSketch
+    )
+    constraints: adsk.fusion.GeometricConstraints = sketchUtils.geometricConstraints(
+        circleSketch
+    )
     sketchUtils.convertToConstruction(circleSketch.sketchCurves)
     verticalConstructionLine = circleSketch.sketchCurves.sketchLines.addByTwoPoints(
         circleCenterOnSketch,
@@ -92,8 +99,16 @@ def createTabAtCircleEdgeSketch(
         ),
     )
     verticalConstructionLine.isConstruction = True
+    # diagonal at 45 degrees ending on the circle
     diagonalConstructionLine = circleSketch.sketchCurves.sketchLines.addByTwoPoints(
-        circleCenterOnSketch, angularPointOnSketch
+        circleCenterOnSketch,
+        adsk.core.Point3D.create(
+            circleCenterOnSketch.x
+            + (angularPointOnSketch.x - circleCenterOnSketch.x) / math.sqrt(2),
+            circleCenterOnSketch.y
+            + (angularPointOnSketch.y - circleCenterOnSketch.y) / math.sqrt(2),
+            circleCenterOnSketch.z,
+        ),
     )
     diagonalConstructionLine.isConstruction = True
     constraints.addVertical(verticalConstructionLine)
@@ -116,6 +131,7 @@ def createTabAtCircleEdgeSketch(
     return circleSketch
 
 
+@stageTimer.timed
 def createSingleGridfinityBaseBody(
     input: BaseGeneratorInput, targetComponent: adsk.fusion.Component
 ):
@@ -214,11 +230,30 @@ def createSingleGridfinityBaseBody(
         )
         chamferFeatures.add(chamferInput)
 
+    holeTools = createBaseHoleTools(
+        input, baseBottomExtrude.endFaces.item(0), targetComponent
+    )
+    if len(holeTools) > 0:
+        combineUtils.cutBody(
+            baseBody,
+            commonUtils.objectCollectionFromList(holeTools),
+            targetComponent,
+        )
+    return baseBody
+
+
+@stageTimer.timed
+def createBaseHoleTools(
+    input: BaseGeneratorInput,
+    baseBottomPlane: adsk.fusion.BRepFace,
+    targetComponent: adsk.fusion.Component,
+) -> list[adsk.fusion.BRepBody]:
+    """Builds screw hole and magnet cutout tool bodies for the 4 corners of one base."""
+    features: adsk.fusion.Features = targetComponent.features
     # screw holes
     circularPatternFeatures = features.circularPatternFeatures
     cutoutBodies = adsk.core.ObjectCollection.create()
 
-    baseBottomPlane = baseBottomExtrude.endFaces.item(0)
     baseHoleCenterPoint = adsk.core.Point3D.create(
         const.DIMENSION_SCREW_HOLES_OFFSET - input.xyClearance,
         const.DIMENSION_SCREW_HOLES_OFFSET - input.xyClearance,
@@ -338,12 +373,12 @@ def createSingleGridfinityBaseBody(
 
     if input.hasScrewHoles or input.hasMagnetCutouts:
         if cutoutBodies.count > 1:
-            joinFeature = combineUtils.joinBodies(
+            joinedCutoutBody = combineUtils.joinBodies(
                 cutoutBodies.item(0),
                 commonUtils.objectCollectionFromList(list(cutoutBodies)[1:]),
                 targetComponent,
             )
-            cutoutBodies = commonUtils.objectCollectionFromList(joinFeature.bodies)
+            cutoutBodies = commonUtils.objectCollectionFromList([joinedCutoutBody])
 
         baseXZMidPlaneInput = targetComponent.constructionPlanes.createInput()
         baseXZMidPlaneInput.setByOffset(
@@ -369,15 +404,9 @@ def createSingleGridfinityBaseBody(
         patternInput = circularPatternFeatures.createInput(cutoutBodies, baseCenterAxis)
         patternInput.quantity = adsk.core.ValueInput.createByString("4")
         patternFeature = circularPatternFeatures.add(patternInput)
-        combineUtils.cutBody(
-            baseBody,
-            commonUtils.objectCollectionFromList(
-                list(cutoutBodies) + list(patternFeature.bodies)
-            ),
-            targetComponent,
-        )
+        return list(cutoutBodies) + list(patternFeature.bodies)
 
-    return baseBody
+    return []
 
 
 def createSingleBaseBodyWithClearance(
@@ -464,6 +493,7 @@ def createSingleBaseBodyWithClearance(
     return baseBody
 
 
+@stageTimer.timed
 def createBaseBodyPattern(
     baseConfiguration: BaseGeneratorInput,
     basesXCount,
@@ -494,6 +524,7 @@ def createBaseBodyPattern(
     return list(rectangularPattern.bodies) + [baseBody]
 
 
+@stageTimer.timed
 def cutBaseClearance(
     baseConfiguration: BaseGeneratorInput,
     basesXCount,
@@ -531,8 +562,8 @@ def cutBaseClearance(
         baseClearanceCutSketch,
     )
     sketchArcs = baseClearanceCutSketch.sketchCurves.sketchArcs
-    geometricConstraints = baseClearanceCutSketch.geometricConstraints
-    sketchDimensions = baseClearanceCutSketch.sketchDimensions
+    geometricConstraints = sketchUtils.geometricConstraints(baseClearanceCutSketch)
+    sketchDimensions = sketchUtils.sketchDimensions(baseClearanceCutSketch)
 
     [side1, side2, side3, side4] = list(innerRectangle)
     filletRadius = baseConfiguration.cornerFilletRadius - baseConfiguration.xyClearance
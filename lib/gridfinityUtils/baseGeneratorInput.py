@@ -1,4 +1,6 @@
 import adsk.core, adsk.fusion, traceback
+import dataclasses
+import typing
 
 from .const import (
     DIMENSION_MAGNET_CUTOUT_DEPTH,
@@ -6,6 +8,7 @@ from .const import (
     DIMENSION_SCREW_HOLE_DIAMETER,
     BIN_CORNER_FILLET_RADIUS,
 )
+from .generatorSpec import GeneratorSpec, pointField
 
 
 class BaseGeneratorInput:
@@ -105,3 +108,23 @@ class BaseGeneratorInput:
     @magnetCutoutsDepth.setter
     def magnetCutoutsDepth(self, value: float):
         self._magnetCutoutsDepth = value
+
+
+@dataclasses.dataclass(frozen=True, slots=True, eq=False)
+class BaseGeneratorSpec(GeneratorSpec):
+    """Frozen mirror of BaseGeneratorInput."""
+
+    inputType: typing.ClassVar[type] = BaseGeneratorInput
+
+    originPoint: tuple[float, float, float] = pointField()
+    baseWidth: float = None
+    baseLength: float = None
+    cornerFilletRadius: float = BIN_CORNER_FILLET_RADIUS
+    xyClearance: float = None
+    hasBottomChamfer: bool = True
+    hasScrewHoles: bool = False
+    screwHolesDiameter: float = DIMENSION_SCREW_HOLE_DIAMETER
+    hasMagnetCutouts: bool = False
+    magnetCutoutsDiameter: float = DIMENSION_MAGNET_CUTOUT_DIAMETER
+    magnetCutoutsDepth: float = DIMENSION_MAGNET_CUTOUT_DEPTH
+    hasMagnetCutoutsTabs: bool = None
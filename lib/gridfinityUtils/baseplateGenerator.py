@@ -2,6 +2,7 @@ import math
 import adsk.core, adsk.fusion, traceback
 import os
 
+from ...lib import stageTimer
 from . import (
     const,
     commonUtils,
@@ -19,6 +20,7 @@ from .baseGeneratorInput import BaseGeneratorInput
 from .baseplateGeneratorInput import BaseplateGeneratorInput
 
 
+@stageTimer.timed
 def createGridfinityBaseplate(
     input: BaseplateGeneratorInput, targetComponent: adsk.fusion.Component
 ):
@@ -46,8 +48,7 @@ def createGridfinityBaseplate(
         0,
     )
 
-    connectionHoleYTool = None
-    connectionHoleXTool = None
+    connectionHoleAxes: list[tuple[tuple, tuple]] = []
 
     if input.hasSkeletonizedBottom:
         (
@@ -62,8 +63,8 @@ def createGridfinityBaseplate(
         centerCutoutSketch.name = "center bottom cutout"
         sketchUtils.convertToConstruction(centerCutoutSketch.sketchCurves)
         sketchCurves = centerCutoutSketch.sketchCurves
-        dimensions = centerCutoutSketch.sketchDimensions
-        constraints = centerCutoutSketch.geometricConstraints
+        dimensions = sketchUtils.sketchDimensions(centerCutoutSketch)
+        constraints = sketchUtils.geometricConstraints(centerCutoutSketch)
         sketchLines = sketchCurves.sketchLines
         screwHoleCircle = sketchCurves.sketchCircles.item(0)
         arcStartingPoint = screwHoleCircle.centerSketchPoint.geometry.asVector()
@@ -191,59 +192,51 @@ def createGridfinityBaseplate(
                 [face for face in centerCutoutBody.faces if faceUtils.isYNormal(face)],
                 key=lambda x: x.boundingBox.minPoint.y,
             )
-            connectionHoleYTool = createConnectionHoleTool(
-                connectionHoleFaceY,
-                input.connectionScrewHolesDiameter / 2,
-                input.baseWidth / 2,
-                targetComponent,
-            )
             connectionHoleFaceX = min(
                 [face for face in centerCutoutBody.faces if faceUtils.isXNormal(face)],
                 key=lambda x: x.boundingBox.minPoint.x,
             )
-            connectionHoleXTool = createConnectionHoleTool(
-                connectionHoleFaceX,
-                input.connectionScrewHolesDiameter / 2,
-                input.baseWidth / 2,
-                targetComponent,
+            connectionHoleAxes = getConnectionHoleAxes(
+                input,
+                connectionHoleFaceX.boundingBox,
+                connectionHoleFaceY.boundingBox,
             )
 
     holeCuttingBodies: list[adsk.fusion.BRepBody] = []
-
+    # magnet socket, screw hole and screw head, all at the hole center
+    holeCylinders: list[tuple[float, float, float]] = []
     if input.hasExtendedBottom and input.hasMagnetCutouts:
-        magnetSocketBody = shapeUtils.simpleCylinder(
-            faceUtils.getBottomFace(baseBody),
-            0,
-            input.magnetCutoutsDepth,
-            input.magnetCutoutsDiameter / 2,
-            holeCenterPoint,
-            targetComponent,
+        holeCylinders.append(
+            (input.magnetCutoutsDiameter / 2, 0, input.magnetCutoutsDepth)
         )
-        holeCuttingBodies.append(magnetSocketBody)
-
     if input.hasExtendedBottom and input.hasScrewHoles:
-        screwHoleBody = shapeUtils.simpleCylinder(
-            faceUtils.getBottomFace(baseBody),
-            0,
-            input.bottomExtensionHeight,
-            input.screwHolesDiameter / 2,
-            holeCenterPoint,
-            targetComponent,
+        holeCylinders.append(
+            (input.screwHolesDiameter / 2, 0, input.bottomExtensionHeight)
         )
-        holeCuttingBodies.append(screwHoleBody)
-
         screwHeadHeight = (
             const.DIMENSION_SCREW_HEAD_CUTOUT_OFFSET_HEIGHT
             + (input.screwHeadCutoutDiameter - input.screwHolesDiameter) / 2
         )
-        screwHeadBody = shapeUtils.simpleCylinder(
-            faceUtils.getBottomFace(screwHoleBody),
-            -screwHeadHeight,
-            screwHeadHeight,
-            input.screwHeadCutoutDiameter / 2,
+        # screw head ends at the bottom of the screw hole
+        holeCylinders.append(
+            (
+                input.screwHeadCutoutDiameter / 2,
+                input.bottomExtensionHeight - screwHeadHeight,
+                screwHeadHeight,
+            )
+        )
+
+    if len(holeCylinders) > 0:
+        holeCuttingBodies = shapeUtils.coaxialCylinders(
+            faceUtils.getBottomFace(baseBody),
             holeCenterPoint,
+            holeCylinders,
             targetComponent,
+            "Magnet and screw hole",
         )
+
+    if input.hasExtendedBottom and input.hasScrewHoles:
+        screwHeadBody = holeCuttingBodies[-1]
         filletUtils.createChamfer(
             commonUtils.objectCollectionFromList(
                 faceUtils.getTopFace(screwHeadBody).edges
@@ -251,7 +244,6 @@ def createGridfinityBaseplate(
             (input.screwHeadCutoutDiameter - input.screwHolesDiameter) / 2,
             targetComponent,
         )
-        holeCuttingBodies.append(screwHeadBody)
 
     if len(holeCuttingBodies) > 0:
         patternSpacingX = input.baseWidth - const.DIMENSION_SCREW_HOLES_OFFSET * 2
@@ -401,13 +393,11 @@ def createGridfinityBaseplate(
             paddingBottomBody.name = "Padding bottom"
             mergeTools.append(paddingBottomBody)
         if len(mergeTools) > 0:
-            paddingCombineFeature = combineUtils.joinBodies(
+            binInterfaceBody = combineUtils.joinBodies(
                 binInterfaceBody,
                 commonUtils.objectCollectionFromList(mergeTools),
                 targetComponent,
             )
-            paddingCombineFeature.name = "Combine base with padding bodies"
-            binInterfaceBody = paddingCombineFeature.bodies.item(0)
 
     cornerFillet = filletUtils.filletEdgesByLength(
         binInterfaceBody.faces,
@@ -443,80 +433,12 @@ def createGridfinityBaseplate(
     )
     bottomChamfer.name = "Bottom chamfer"
 
-    if not connectionHoleYTool is None and not connectionHoleXTool is None:
-        holeToolsXFeature = patternUtils.recPattern(
-            commonUtils.objectCollectionFromList(connectionHoleXTool.bodies),
-            (targetComponent.xConstructionAxis, targetComponent.yConstructionAxis),
-            (input.baseWidth, input.baseLength),
-            (1, input.baseplateLength),
-            targetComponent,
-        )
-        connectionHoleXToolList = list(connectionHoleXTool.bodies) + list(
-            holeToolsXFeature.bodies
-        )
-
-        holeToolsYFeature = patternUtils.recPattern(
-            commonUtils.objectCollectionFromList(connectionHoleYTool.bodies),
-            (targetComponent.xConstructionAxis, targetComponent.yConstructionAxis),
-            (input.baseLength, input.baseLength),
-            (input.baseplateWidth, 1),
+    if len(connectionHoleAxes) > 0:
+        cuttingTools = cuttingTools + createConnectionHoleTools(
+            connectionHoleAxes,
+            input.connectionScrewHolesDiameter / 2,
             targetComponent,
         )
-        connectionHoleYToolList = list(connectionHoleYTool.bodies) + list(
-            holeToolsYFeature.bodies
-        )
-
-        constructionPlaneXZInput: adsk.fusion.ConstructionPlaneInput = (
-            targetComponent.constructionPlanes.createInput()
-        )
-        constructionPlaneXZInput.setByOffset(
-            targetComponent.xZConstructionPlane,
-            adsk.core.ValueInput.createByReal(
-                input.baseplateLength * input.baseLength / 2 - input.xyClearance
-            ),
-        )
-        constructionPlaneXZ = targetComponent.constructionPlanes.add(
-            constructionPlaneXZInput
-        )
-        constructionPlaneXZ.isLightBulbOn = False
-
-        constructionPlaneYZInput: adsk.fusion.ConstructionPlaneInput = (
-            targetComponent.constructionPlanes.createInput()
-        )
-        constructionPlaneYZInput.setByOffset(
-            targetComponent.yZConstructionPlane,
-            adsk.core.ValueInput.createByReal(
-                input.baseplateWidth * input.baseWidth / 2 - input.xyClearance
-            ),
-        )
-        constructionPlaneYZ = targetComponent.constructionPlanes.add(
-            constructionPlaneYZInput
-        )
-        constructionPlaneYZ.isLightBulbOn = False
-
-        mirrorConnectionHolesYZInput = features.mirrorFeatures.createInput(
-            commonUtils.objectCollectionFromList(connectionHoleXToolList),
-            constructionPlaneYZ,
-        )
-        mirrorConnectionHolesYZ = features.mirrorFeatures.add(
-            mirrorConnectionHolesYZInput
-        )
-
-        mirrorConnectionHolesXZInput = features.mirrorFeatures.createInput(
-            commonUtils.objectCollectionFromList(connectionHoleYToolList),
-            constructionPlaneXZ,
-        )
-        mirrorConnectionHolesXZ = features.mirrorFeatures.add(
-            mirrorConnectionHolesXZInput
-        )
-
-        cuttingTools = (
-            cuttingTools
-            + list(mirrorConnectionHolesYZ.bodies)
-            + list(mirrorConnectionHolesXZ.bodies)
-            + connectionHoleYToolList
-            + connectionHoleXToolList
-        )
 
     # cut everything
     toolBodies = commonUtils.objectCollectionFromList(cuttingTools)
@@ -530,42 +452,60 @@ def createGridfinityBaseplate(
     return binInterfaceBody
 
 
-def createConnectionHoleTool(
-    connectionHoleFace: adsk.fusion.BRepFace,
-    diameter: float,
-    depth: float,
+def getConnectionHoleAxes(
+    input: BaseplateGeneratorInput,
+    faceXBox: adsk.core.BoundingBox3D,
+    faceYBox: adsk.core.BoundingBox3D,
+) -> list[tuple[tuple, tuple]]:
+    """Start and end points of every connection hole of the plate.
+
+    Holes start in the middle of the outer faces of the first cell skeleton
+    cutout, given by their bounding boxes, and go half a cell towards the plate
+    edge. They repeat along the edges every cell and are mirrored to the
+    opposite edges.
+    """
+    depth = input.baseWidth / 2
+    # mirror planes are in the middle of the plate
+    mirroredX = input.baseplateWidth * input.baseWidth - input.xyClearance * 2
+    mirroredY = input.baseplateLength * input.baseLength - input.xyClearance * 2
+    axes: list[tuple[tuple, tuple]] = []
+
+    x = faceXBox.minPoint.x
+    firstY = (faceXBox.minPoint.y + faceXBox.maxPoint.y) / 2
+    z = (faceXBox.minPoint.z + faceXBox.maxPoint.z) / 2
+    for index in range(int(input.baseplateLength)):
+        y = firstY + index * input.baseLength
+        axes.append(((x, y, z), (x - depth, y, z)))
+        axes.append(((mirroredX - x, y, z), (mirroredX - x + depth, y, z)))
+
+    y = faceYBox.minPoint.y
+    firstX = (faceYBox.minPoint.x + faceYBox.maxPoint.x) / 2
+    z = (faceYBox.minPoint.z + faceYBox.maxPoint.z) / 2
+    for index in range(int(input.baseplateWidth)):
+        # spaced by base length along x as well, like the pattern it replaces
+        x = firstX + index * input.baseLength
+        axes.append(((x, y, z), (x, y - depth, z)))
+        axes.append(((x, mirroredY - y, z), (x, mirroredY - y + depth, z)))
+    return axes
+
+
+def createConnectionHoleTools(
+    holeAxes: list[tuple[tuple, tuple]],
+    radius: float,
     targetComponent: adsk.fusion.Component,
-):
-    connectionHoleSketch: adsk.fusion.Sketch = targetComponent.sketches.add(
-        connectionHoleFace
-    )
-    connectionHoleSketch.name = "side connector hole"
-    sketchCurves = connectionHoleSketch.sketchCurves
-    dimensions = connectionHoleSketch.sketchDimensions
-    constraints = connectionHoleSketch.geometricConstraints
-    sketchUtils.convertToConstruction(sketchCurves)
-    [sketchHorizontalEdge1, sketchHorizontalEdge2] = [
-        line for line in sketchCurves.sketchLines if sketchUtils.isHorizontal(line)
-    ]
-    line1 = sketchCurves.sketchLines.addByTwoPoints(
-        sketchHorizontalEdge1.startSketchPoint.geometry,
-        sketchHorizontalEdge2.endSketchPoint.geometry,
-    )
-    line1.isConstruction = True
-    constraints.addMidPoint(line1.startSketchPoint, sketchHorizontalEdge1)
-    constraints.addMidPoint(line1.endSketchPoint, sketchHorizontalEdge2)
-
-    circle = sketchCurves.sketchCircles.addByCenterRadius(
-        connectionHoleSketch.originPoint.geometry, diameter
-    )
-    constraints.addMidPoint(circle.centerSketchPoint, line1)
-    dimensions.addRadialDimension(circle, line1.startSketchPoint.geometry, True)
-    connectionHoleTool = extrudeUtils.simpleDistanceExtrude(
-        connectionHoleSketch.profiles.item(0),
-        adsk.fusion.FeatureOperations.NewBodyFeatureOperation,
-        depth,
-        adsk.fusion.ExtentDirections.PositiveExtentDirection,
-        [],
-        targetComponent,
-    )
-    return connectionHoleTool
+) -> list[adsk.fusion.BRepBody]:
+    """Creates cylinders of all connection holes in one base feature."""
+    temporaryBRep = adsk.fusion.TemporaryBRepManager.get()
+    baseFeature = targetComponent.features.baseFeatures.add()
+    baseFeature.name = "Connection hole tools"
+    baseFeature.startEdit()
+    for start, end in holeAxes:
+        cylinder = temporaryBRep.createCylinderOrCone(
+            adsk.core.Point3D.create(*start),
+            radius,
+            adsk.core.Point3D.create(*end),
+            radius,
+        )
+        targetComponent.bRepBodies.add(cylinder, baseFeature)
+    baseFeature.finishEdit()
+    return list(baseFeature.bodies)
@@ -1,6 +1,9 @@
 import adsk.core, adsk.fusion, traceback
+import dataclasses
+import typing
 
 from . import const
+from .generatorSpec import GeneratorSpec, pointField
 
 
 class BaseplateGeneratorInput:
@@ -203,3 +206,36 @@ class BaseplateGeneratorInput:
     @magnetCutoutsDepth.setter
     def magnetCutoutsDepth(self, value: float):
         self._magnetCutoutsDepth = value
+
+
+@dataclasses.dataclass(frozen=True, slots=True, eq=False)
+class BaseplateGeneratorSpec(GeneratorSpec):
+    """Frozen mirror of BaseplateGeneratorInput."""
+
+    inputType: typing.ClassVar[type] = BaseplateGeneratorInput
+
+    baseWidth: float = None
+    baseLength: float = None
+    baseplateWidth: float = None
+    baseplateLength: float = None
+    cornerFilletRadius: float = const.BIN_CORNER_FILLET_RADIUS
+    xyClearance: float = const.BIN_XY_CLEARANCE
+    binZClearance: float = const.BASEPLATE_BIN_Z_CLEARANCE
+    hasExtendedBottom: bool = None
+    bottomExtensionHeight: float = const.BASEPLATE_EXTRA_HEIGHT
+    hasSkeletonizedBottom: bool = True
+    hasScrewHoles: bool = False
+    hasPadding: bool = None
+    paddingLeft: float = None
+    paddingTop: float = None
+    paddingRight: float = None
+    paddingBottom: float = None
+    hasConnectionHoles: bool = None
+    connectionScrewHolesDiameter: float = (
+        const.DIMENSION_PLATE_CONNECTION_SCREW_HOLE_DIAMETER
+    )
+    screwHolesDiameter: float = const.DIMENSION_SCREW_HOLE_DIAMETER
+    screwHeadCutoutDiameter: float = const.DIMENSION_SCREW_HEAD_CUTOUT_DIAMETER
+    hasMagnetCutouts: bool = False
+    magnetCutoutsDiameter: float = const.DIMENSION_MAGNET_CUTOUT_DIAMETER
+    magnetCutoutsDepth: float = const.DIMENSION_MAGNET_CUTOUT_DEPTH
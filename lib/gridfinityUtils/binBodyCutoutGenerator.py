@@ -2,6 +2,7 @@ import adsk.core, adsk.fusion, traceback
 import os
 import math
 
+from ...lib import stageTimer
 from ...lib.gridfinityUtils import geometryUtils
 from ...lib import fusion360utils as futil
 from ...lib.gridfinityUtils import filletUtils
@@ -34,9 +35,11 @@ def getInnerCutoutScoopFace(
     return (scoopFace, oppositeFace)
 
 
+@stageTimer.timed
 def createGridfinityBinBodyCutout(
     input: BinBodyCutoutGeneratorInput,
     targetComponent: adsk.fusion.Component,
+    deferredFillets: filletUtils.DeferredFillets = None,
 ):
     cutoutPlaneInput: adsk.fusion.ConstructionPlaneInput = (
         targetComponent.constructionPlanes.createInput()
@@ -69,6 +72,10 @@ def createGridfinityBinBodyCutout(
     innerCutoutBody = innerCutout.bodies.item(0)
     innerCutoutBody.name = "Inner cutout"
 
+    if deferredFillets is not None:
+        deferCutoutFillets(input, innerCutoutBody, deferredFillets)
+        return innerCutoutBody
+
     # scoop
     if input.hasScoop:
         [innerCutoutScoopFace, innerCutoputScoopOppositeFace] = getInnerCutoutScoopFace(
@@ -103,3 +110,36 @@ def createGridfinityBinBodyCutout(
         )
 
     return innerCutoutBody
+
+
+def deferCutoutFillets(
+    input: BinBodyCutoutGeneratorInput,
+    innerCutoutBody: adsk.fusion.BRepBody,
+    deferredFillets: filletUtils.DeferredFillets,
+):
+    # same edges as the fillets above, picked on the box before any of them
+    # is applied
+    [innerCutoutScoopFace, innerCutoputScoopOppositeFace] = getInnerCutoutScoopFace(
+        innerCutoutBody
+    )
+    scoopEdge = faceUtils.getBottomHorizontalEdge(innerCutoutScoopFace.edges)
+    if input.hasScoop:
+        scoopMaxRadius = (
+            min(input.scoopMaxRadius, input.height)
+            if min(input.scoopMaxRadius, input.height) >= input.filletRadius
+            else input.filletRadius
+        )
+        deferredFillets.add([scoopEdge], scoopMaxRadius, False)
+    deferredFillets.add(
+        faceUtils.getVerticalEdges(innerCutoutBody.faces), input.filletRadius, True
+    )
+    if input.hasBottomFillet:
+        # the fillet above starts at the edge opposite to the scoop and runs
+        # along the filleted corners, on the box the bottom edges meet at right
+        # angles and have to be picked one by one
+        bottomEdges = list(faceUtils.getBottomFace(innerCutoutBody).edges)
+        if input.hasScoop:
+            bottomEdges = [
+                edge for edge in bottomEdges if not edgeUtils.matches(edge, scoopEdge)
+            ]
+        deferredFillets.add(bottomEdges, input.filletRadius, True)
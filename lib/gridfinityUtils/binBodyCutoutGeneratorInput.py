@@ -1,6 +1,9 @@
 import adsk.core, adsk.fusion, traceback
+import dataclasses
+import typing
 
 from . import const
+from .generatorSpec import GeneratorSpec, pointField
 
 
 class BinBodyCutoutGeneratorInput:
@@ -116,3 +119,24 @@ class BinBodyCutoutGeneratorInput:
     @tabOverhangAngle.setter
     def tabOverhangAngle(self, value: float):
         self._tabOverhangAngle = value
+
+
+@dataclasses.dataclass(frozen=True, slots=True, eq=False)
+class BinBodyCutoutGeneratorSpec(GeneratorSpec):
+    """Frozen mirror of BinBodyCutoutGeneratorInput."""
+
+    inputType: typing.ClassVar[type] = BinBodyCutoutGeneratorInput
+
+    width: float = None
+    length: float = None
+    height: float = None
+    origin: tuple[float, float, float] = pointField()
+    hasScoop: bool = False
+    scoopMaxRadius: float = const.BIN_SCOOP_MAX_RADIUS
+    hasBottomFillet: bool = True
+    filletRadius: float = None
+    hasTab: bool = None
+    tabWidth: float = const.BIN_TAB_WIDTH
+    tabLength: float = 1
+    tabPosition: float = 0
+    tabOverhangAngle: float = const.BIN_TAB_OVERHANG_ANGLE
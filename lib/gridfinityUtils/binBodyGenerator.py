@@ -3,6 +3,7 @@ import os
 import math
 import copy
 
+from ...lib import stageTimer
 from ...lib import fusion360utils as futil
 from . import (
     const,
@@ -22,7 +23,10 @@ from .binBodyCutoutGeneratorInput import BinBodyCutoutGeneratorInput
 from .baseGeneratorInput import BaseGeneratorInput
 from .binBodyGeneratorInput import BinBodyGeneratorInput, BinBodyCompartmentDefinition
 from .binBodyTabGeneratorInput import BinBodyTabGeneratorInput
-from .binBodyTabGenerator import createGridfinityBinBodyTab
+from .binBodyTabGenerator import (
+    createGridfinityBinBodyTab,
+    createGridfinityBinBodyRowTab,
+)
 from .binBodyLipGeneratorInput import BinBodyLipGeneratorInput
 from .binBodyLipGenerator import createGridfinityBinBodyLip
 from ... import config
@@ -39,6 +43,7 @@ def uniformCompartments(countX, countY):
     return compartments
 
 
+@stageTimer.timed
 def createGridfinityBinBody(
     input: BinBodyGeneratorInput,
     targetComponent: adsk.fusion.Component,
@@ -65,14 +70,24 @@ def createGridfinityBinBody(
     lipBodiesToSubtract: list[adsk.fusion.BRepBody] = []
     compartmentLipBodiesToMerge: list[adsk.fusion.BRepBody] = []
     compartmentLipBodiesToSubtract: list[adsk.fusion.BRepBody] = []
+    # tabs are built once per row of compartments sharing the back edge
+    tabRows: dict[float, list] = {}
+    deferredFillets = (
+        filletUtils.DeferredFillets() if config.FILLETS_CONSOLIDATED else None
+    )
 
     # round corners
-    filletUtils.filletEdgesByLength(
-        binBodyExtrude.faces,
-        input.binCornerFilletRadius,
-        binBodyTotalHeight,
-        targetComponent,
-    ).name = "Bin body corner fillets"
+    if deferredFillets is None:
+        filletUtils.filletEdgesByLength(
+            binBodyExtrude.faces,
+            input.binCornerFilletRadius,
+            binBodyTotalHeight,
+            targetComponent,
+        ).name = "Bin body corner fillets"
+    else:
+        deferredFillets.addEdgesByLength(
+            binBodyExtrude.faces, input.binCornerFilletRadius, binBodyTotalHeight
+        )
 
     if input.hasLip:
         lipOriginPoint = adsk.core.Point3D.create(0, 0, binBodyTotalHeight)
@@ -86,7 +101,7 @@ def createGridfinityBinBody(
         lipInput.binCornerFilletRadius = input.binCornerFilletRadius
         lipInput.origin = lipOriginPoint
         lipBodiesToMerge, lipBodiesToSubtract = createGridfinityBinBodyLip(
-            lipInput, targetComponent
+            lipInput, targetComponent, deferredFillets
         )
 
         if input.wallThickness < const.BIN_LIP_WALL_THICKNESS:
@@ -111,9 +126,11 @@ def createGridfinityBinBody(
                 targetComponent,
                 adsk.core.Point3D.create(
                     input.wallThickness,
-                    (const.BIN_LIP_WALL_THICKNESS - input.xyClearance)
-                    if input.hasScoop
-                    else input.wallThickness,
+                    (
+                        (const.BIN_LIP_WALL_THICKNESS - input.xyClearance)
+                        if input.hasScoop
+                        else input.wallThickness
+                    ),
                     lipOriginPoint.z,
                 ),
                 "Lip bottom chamfer",
@@ -171,6 +188,7 @@ def createGridfinityBinBody(
         compartmentLengthUnit = (
             totalCompartmentsLength - (input.compartmentsByY - 1) * input.wallThickness
         ) / input.compartmentsByY
+        compartmentLipRectangles: list[tuple[float, float, float, float]] = []
 
         for compartment in input.compartments:
             compartmentX = compartmentsMinX + compartment.positionX * (
@@ -235,37 +253,67 @@ def createGridfinityBinBody(
                 compartmentDepth,
                 input.binCornerFilletRadius - input.wallThickness,
                 input.isShelled,
-                input.hasScoop,
+                input.hasScoop and compartment.hasScoop,
                 input.scoopMaxRadius,
-                input.hasTab,
+                False,
                 compartmentTabInput,
                 targetComponent,
+                deferredFillets,
             )
-            bodiesToSubtract = bodiesToSubtract + compartmentCuts
+            if input.hasTab and compartment.hasTab:
+                tabRows.setdefault(round(tabOriginPoint.y, 6), []).append(
+                    (
+                        compartmentCuts,
+                        compartmentTabInput,
+                        (compartmentX, compartmentWidth),
+                    )
+                )
+            else:
+                bodiesToSubtract = bodiesToSubtract + compartmentCuts
             bodiesToMerge = bodiesToMerge + compartmentMerges
 
             if input.hasCompartmentsLip:
-                compartmentLipX = compartmentX - input.wallThickness
-                compartmentLipY = compartmentY - input.wallThickness
-                compartmentLipOriginPoint = adsk.core.Point3D.create(
-                    compartmentLipX, compartmentLipY, binBodyTotalHeight
+                compartmentLipRectangles.append(
+                    (
+                        compartmentX - input.wallThickness,
+                        compartmentY - input.wallThickness,
+                        compartmentWidth + input.wallThickness * 2,
+                        compartmentLength + input.wallThickness * 2,
+                    )
                 )
-                compartmentLipWidth = compartmentWidth + input.wallThickness * 2
-                compartmentLipLength = compartmentLength + input.wallThickness * 2
+
+        if input.hasCompartmentsLip and input.hasLipNotches:
+            # notches are patterned per compartment, each compartment gets its
+            # own lip
+            for x, y, width, length in compartmentLipRectangles:
                 lipBodies = createCompartmentLip(
                     input.wallThickness,
-                    compartmentLipOriginPoint,
-                    compartmentLipWidth,
-                    compartmentLipLength,
+                    adsk.core.Point3D.create(x, y, binBodyTotalHeight),
+                    width,
+                    length,
                     input.binCornerFilletRadius,
                     input.hasScoop,
                     targetComponent,
                     input.baseWidth,
                     input.baseLength,
                     input.hasLipNotches,
+                    deferredFillets,
                 )
                 compartmentLipBodiesToMerge.extend(lipBodies[0])
                 compartmentLipBodiesToSubtract.extend(lipBodies[1])
+        elif input.hasCompartmentsLip:
+            lipBodies = createCompartmentsLip(
+                input.wallThickness,
+                compartmentLipRectangles,
+                lipCutoutGroups(input.compartments),
+                binBodyTotalHeight,
+                input.binCornerFilletRadius,
+                input.hasScoop,
+                targetComponent,
+                deferredFillets,
+            )
+            compartmentLipBodiesToMerge.extend(lipBodies[0])
+            compartmentLipBodiesToSubtract.extend(lipBodies[1])
 
         if len(input.compartments) > 1 and not input.hasCompartmentsLip:
             compartmentsTopClearance = createCompartmentCutout(
@@ -281,9 +329,24 @@ def createGridfinityBinBody(
                 0,
                 False,
                 targetComponent,
+                deferredFillets,
             )
             bodiesToSubtract.append(compartmentsTopClearance)
 
+    # deferred fillets go before anything joins or cuts the bodies they are on
+    if deferredFillets is not None:
+        deferredFillets.create(targetComponent)
+
+    for tabRow in tabRows.values():
+        [tabMerges, tabCuts] = createRowTab(
+            [cuts for cuts, tabInput, compartmentRange in tabRow],
+            [tabInput for cuts, tabInput, compartmentRange in tabRow],
+            [compartmentRange for cuts, tabInput, compartmentRange in tabRow],
+            targetComponent,
+        )
+        bodiesToSubtract = bodiesToSubtract + tabCuts
+        bodiesToMerge = bodiesToMerge + tabMerges
+
     if input.isShelled:
         # Create a copy of the bin body for shelled mode
         binBodyCopy = targetComponent.features.copyPasteBodies.add(binBody)
@@ -391,6 +454,7 @@ def createCompartmentCutout(
     scoopMaxRadius: float,
     hasBottomFillet: bool,
     targetComponent: adsk.fusion.Component,
+    deferredFillets: filletUtils.DeferredFillets = None,
 ) -> adsk.fusion.BRepBody:
     innerCutoutFilletRadius = max(
         const.BIN_BODY_CUTOUT_BOTTOM_FILLET_RADIUS, cornerFilletRadius
@@ -405,9 +469,12 @@ def createCompartmentCutout(
     innerCutoutInput.filletRadius = innerCutoutFilletRadius
     innerCutoutInput.hasBottomFillet = hasBottomFillet
 
-    return createGridfinityBinBodyCutout(innerCutoutInput, targetComponent)
+    return createGridfinityBinBodyCutout(
+        innerCutoutInput, targetComponent, deferredFillets
+    )
 
 
+@stageTimer.timed
 def createCompartment(
     wallThickness: float,
     originPoint: adsk.core.Point3D,
@@ -421,6 +488,7 @@ def createCompartment(
     hasTab: bool,
     tabInput: BinBodyTabGeneratorInput,
     targetComponent: adsk.fusion.Component,
+    deferredFillets: filletUtils.DeferredFillets = None,
 ) -> tuple[list[adsk.fusion.BRepBody], list[adsk.fusion.BRepBody]]:
     bodiesToMerge: list[adsk.fusion.BRepBody] = []
     bodiesToSubtract: list[adsk.fusion.BRepBody] = []
@@ -436,6 +504,7 @@ def createCompartment(
         scoopMaxRadius,
         not isShelled,
         targetComponent,
+        deferredFillets,
     )
     bodiesToSubtract.append(innerCutoutBody)
 
@@ -462,6 +531,52 @@ def createCompartment(
     return (bodiesToMerge, bodiesToSubtract)
 
 
+@stageTimer.timed
+def createRowTab(
+    compartmentsCuts: list[list[adsk.fusion.BRepBody]],
+    tabInputs: list[BinBodyTabGeneratorInput],
+    compartmentRanges: list[tuple[float, float]],
+    targetComponent: adsk.fusion.Component,
+) -> tuple[list[adsk.fusion.BRepBody], list[adsk.fusion.BRepBody]]:
+    """Label tabs of a row of compartments with one tab body and one intersect.
+
+    Cutouts of the row are joined into one body, so the intersect has a single
+    tool and the joined cutout is subtracted as before.
+    """
+    cutoutBodies = [body for cuts in compartmentsCuts for body in cuts]
+    rowCutoutBody = cutoutBodies[0]
+    if len(cutoutBodies) > 1:
+        rowCutoutBody = combineUtils.joinBodies(
+            rowCutoutBody,
+            commonUtils.objectCollectionFromList(cutoutBodies[1:]),
+            targetComponent,
+        )
+
+    tabBody = createGridfinityBinBodyRowTab(
+        tabInputs, compartmentRanges, targetComponent
+    )
+    if tabBody is None:
+        return ([], [rowCutoutBody])
+
+    intersectTabInput = targetComponent.features.combineFeatures.createInput(
+        tabBody, commonUtils.objectCollectionFromList([rowCutoutBody])
+    )
+    intersectTabInput.operation = (
+        adsk.fusion.FeatureOperations.IntersectFeatureOperation
+    )
+    intersectTabInput.isKeepToolBodies = True
+    intersectTabFeature = targetComponent.features.combineFeatures.add(
+        intersectTabInput
+    )
+    bodiesToMerge = [
+        body
+        for body in list(intersectTabFeature.bodies)
+        if not body.revisionId == rowCutoutBody.revisionId
+    ]
+    return (bodiesToMerge, [rowCutoutBody])
+
+
+@stageTimer.timed
 def createCompartmentLip(
     wallThickness: float,
     originPoint: adsk.core.Point3D,
@@ -473,6 +588,7 @@ def createCompartmentLip(
     baseWidth: float = 0,
     baseLength: float = 0,
     hasLipNotches: bool = False,
+    deferredFillets: filletUtils.DeferredFillets = None,
 ):
     lipInput = BinBodyLipGeneratorInput()
     lipInput.baseLength = baseLength
@@ -484,7 +600,7 @@ def createCompartmentLip(
     lipInput.binCornerFilletRadius = cornerFilletRadius
     lipInput.origin = originPoint
     lipBodiesToMerge, lipBodiesToSubtract = createGridfinityBinBodyLip(
-        lipInput, targetComponent
+        lipInput, targetComponent, deferredFillets
     )
 
     if wallThickness < const.BIN_LIP_WALL_THICKNESS:
@@ -504,9 +620,11 @@ def createCompartmentLip(
             targetComponent,
             adsk.core.Point3D.create(
                 originPoint.x + wallThickness,
-                originPoint.y + const.BIN_LIP_WALL_THICKNESS
-                if hasScoop
-                else originPoint.y + wallThickness,
+                (
+                    originPoint.y + const.BIN_LIP_WALL_THICKNESS
+                    if hasScoop
+                    else originPoint.y + wallThickness
+                ),
                 originPoint.z,
             ),
             "Lip bottom chamfer",
@@ -547,3 +665,181 @@ def createCompartmentLip(
         chamferFeatures.add(bottomLipChamferInput)
         lipBodiesToSubtract.extend(lipBottomChamferExtrude.bodies)
     return lipBodiesToMerge, lipBodiesToSubtract
+
+
+def compartmentsTouch(
+    first: BinBodyCompartmentDefinition, second: BinBodyCompartmentDefinition
+):
+    return (
+        first.positionX <= second.positionX + second.width
+        and second.positionX <= first.positionX + first.width
+        and first.positionY <= second.positionY + second.length
+        and second.positionY <= first.positionY + first.length
+    )
+
+
+def lipCutoutGroups(compartments: list[BinBodyCompartmentDefinition]):
+    """Splits compartment indices into groups of compartments which don't touch.
+
+    Lips of neighbour compartments share the wall between them, so their
+    cutouts overlap. Cutouts of one group are apart and can be built from one
+    sketch, a uniform grid needs 4 groups whatever its size.
+    """
+    groups: list[list[int]] = []
+    for index, compartment in enumerate(compartments):
+        for group in groups:
+            if not any(
+                compartmentsTouch(compartment, compartments[other]) for other in group
+            ):
+                group.append(index)
+                break
+        else:
+            groups.append([index])
+    return groups
+
+
+@stageTimer.timed
+def createCompartmentsLip(
+    wallThickness: float,
+    lipRectangles: list[tuple[float, float, float, float]],
+    cutoutGroups: list[list[int]],
+    z: float,
+    cornerFilletRadius: float,
+    hasScoop: bool,
+    targetComponent: adsk.fusion.Component,
+    deferredFillets: filletUtils.DeferredFillets = None,
+):
+    """Builds lips of all compartments with a fixed number of features.
+
+    Same shape as createCompartmentLip for every (x, y, width, length) lip
+    rectangle, but each step is done once for all compartments from a single
+    sketch, cutouts once per group of lipCutoutGroups.
+    """
+    lipBodyHeight = const.BIN_LIP_EXTRA_HEIGHT
+    lipTopZ = z + lipBodyHeight
+    features: adsk.fusion.Features = targetComponent.features
+    bodiesToSubtract: list[adsk.fusion.BRepBody] = []
+
+    lipBodyExtrude = extrudeUtils.createBoxesAtHeight(
+        lipRectangles, lipBodyHeight, z, targetComponent, "Compartments lip body"
+    )
+    # lips of touching compartments are one body, only its outer corners are
+    # rounded, concave corners where lips meet stay sharp
+    lipCornerEdges = [
+        edge
+        for edge in edgeUtils.selectEdgesByLength(
+            lipBodyExtrude.faces, lipBodyHeight, const.DEFAULT_FILTER_TOLERANCE
+        )
+        if edgeUtils.isConvexCornerEdge(edge, lipRectangles)
+    ]
+    if deferredFillets is None:
+        filletUtils.createFillet(
+            lipCornerEdges, cornerFilletRadius, True, targetComponent
+        ).name = "Compartments lip body corner fillets"
+    else:
+        deferredFillets.add(lipCornerEdges, cornerFilletRadius, True)
+
+    # same profile as the single base body lip cutout, top section narrowed by
+    # a chamfer, mid and bottom sections straight down
+    for groupIndex, group in enumerate(cutoutGroups):
+        topSectionExtrude = extrudeUtils.createBoxesAtHeight(
+            [lipRectangles[index] for index in group],
+            const.BIN_BASE_TOP_SECTION_HEIGH,
+            lipTopZ - const.BIN_BASE_TOP_SECTION_HEIGH,
+            targetComponent,
+            f"Compartments lip cutout {groupIndex + 1}",
+        )
+        cutoutBodies = list(topSectionExtrude.bodies)
+        filletUtils.filletEdgesByLength(
+            topSectionExtrude.faces,
+            cornerFilletRadius,
+            const.BIN_BASE_TOP_SECTION_HEIGH,
+            targetComponent,
+        )
+        # one edge per body, the rest of the loop is picked by tangent chain
+        filletUtils.createChamfer(
+            commonUtils.objectCollectionFromList(
+                [faceUtils.getBottomFace(body).edges.item(0) for body in cutoutBodies]
+            ),
+            const.BIN_BASE_TOP_SECTION_HEIGH,
+            targetComponent,
+        )
+        cutoutBottomExtrude = extrudeUtils.simpleDistanceExtrude(
+            commonUtils.objectCollectionFromList(
+                [faceUtils.getBottomFace(body) for body in cutoutBodies]
+            ),
+            adsk.fusion.FeatureOperations.JoinFeatureOperation,
+            const.BIN_BASE_MID_SECTION_HEIGH + const.BIN_BASE_BOTTOM_SECTION_HEIGH,
+            adsk.fusion.ExtentDirections.PositiveExtentDirection,
+            cutoutBodies,
+            targetComponent,
+        )
+        cutoutBottomExtrude.name = f"Compartments lip cutout {groupIndex + 1} bottom"
+        bodiesToSubtract.extend(cutoutBodies)
+
+    if const.BIN_LIP_TOP_RECESS_HEIGHT > const.DEFAULT_FILTER_TOLERANCE:
+        topChamferExtrude = extrudeUtils.createBoxesAtHeight(
+            lipRectangles,
+            const.BIN_LIP_TOP_RECESS_HEIGHT,
+            lipTopZ - const.BIN_LIP_TOP_RECESS_HEIGHT,
+            targetComponent,
+            "Compartments lip top chamfer",
+        )
+        bodiesToSubtract.extend(topChamferExtrude.bodies)
+
+    if wallThickness < const.BIN_LIP_WALL_THICKNESS:
+        lipBottomChamferHeight = max(
+            const.BIN_BODY_CUTOUT_BOTTOM_FILLET_RADIUS,
+            cornerFilletRadius - wallThickness,
+        )
+        lipBottomChamferExtrude = extrudeUtils.createBoxesAtHeight(
+            [
+                (
+                    x + wallThickness,
+                    y + (const.BIN_LIP_WALL_THICKNESS if hasScoop else wallThickness),
+                    width - wallThickness * 2,
+                    (
+                        (length - wallThickness - const.BIN_LIP_WALL_THICKNESS)
+                        if hasScoop
+                        else (length - wallThickness * 2)
+                    ),
+                )
+                for x, y, width, length in lipRectangles
+            ],
+            lipBottomChamferHeight,
+            z,
+            targetComponent,
+            "Compartments lip bottom chamfer",
+        )
+        filletUtils.filletEdgesByLength(
+            lipBottomChamferExtrude.faces,
+            lipBottomChamferHeight,
+            lipBottomChamferHeight,
+            targetComponent,
+        )
+        edgesToChamfer: list[adsk.fusion.BRepEdge] = []
+        for body in lipBottomChamferExtrude.bodies:
+            scoopSideEdge = min(
+                [
+                    edge
+                    for edge in faceUtils.getTopFace(body).edges
+                    if geometryUtils.isCollinearToX(edge)
+                ],
+                key=lambda x: x.boundingBox.minPoint.y,
+            )
+            edgesToChamfer.extend(
+                list(scoopSideEdge.tangentiallyConnectedEdges)[3:]
+                if hasScoop
+                else scoopSideEdge.tangentiallyConnectedEdges
+            )
+        chamferFeatures: adsk.fusion.ChamferFeatures = features.chamferFeatures
+        bottomLipChamferInput = chamferFeatures.createInput2()
+        bottomLipChamferInput.chamferEdgeSets.addEqualDistanceChamferEdgeSet(
+            commonUtils.objectCollectionFromList(edgesToChamfer),
+            adsk.core.ValueInput.createByReal(wallThickness),
+            False,
+        )
+        chamferFeatures.add(bottomLipChamferInput)
+        bodiesToSubtract.extend(lipBottomChamferExtrude.bodies)
+
+    return list(lipBodyExtrude.bodies), bodiesToSubtract
@@ -1,11 +1,21 @@
 import adsk.core, adsk.fusion, traceback
+import dataclasses
+import typing
 
 from . import const
+from .generatorSpec import GeneratorSpec, convertedField
 
 
 class BinBodyCompartmentDefinition:
     def __init__(
-        self, positionX=0, positionY=0, width=1, length=1, depth=9999999999999
+        self,
+        positionX=0,
+        positionY=0,
+        width=1,
+        length=1,
+        depth=9999999999999,
+        hasTab=True,
+        hasScoop=True,
     ):
         self.positionX = positionX
         self.positionY = positionY
@@ -13,6 +23,10 @@ class BinBodyCompartmentDefinition:
         self.length = length
         # set to something big so it would get limited by bin height
         self.depth = depth
+        # compartments merged into one cavity only get tabs and scoops on the
+        # outline of the cavity, the bin wide options still turn them on
+        self.hasTab = hasTab
+        self.hasScoop = hasScoop
 
     @property
     def positionX(self) -> float:
@@ -54,6 +68,22 @@ class BinBodyCompartmentDefinition:
     def depth(self, value: float):
         self._depth = value
 
+    @property
+    def hasTab(self) -> bool:
+        return self._hasTab
+
+    @hasTab.setter
+    def hasTab(self, value: bool):
+        self._hasTab = value
+
+    @property
+    def hasScoop(self) -> bool:
+        return self._hasScoop
+
+    @hasScoop.setter
+    def hasScoop(self, value: bool):
+        self._hasScoop = value
+
 
 class BinBodyGeneratorInput:
     def __init__(self):
@@ -250,3 +280,65 @@ class BinBodyGeneratorInput:
     @compartments.setter
     def compartments(self, value: list[BinBodyCompartmentDefinition]):
         self._compartments = value
+
+
+@dataclasses.dataclass(frozen=True, slots=True, eq=False)
+class BinBodyCompartmentSpec(GeneratorSpec):
+    """Frozen mirror of BinBodyCompartmentDefinition."""
+
+    inputType: typing.ClassVar[type] = BinBodyCompartmentDefinition
+
+    positionX: float = 0
+    positionY: float = 0
+    width: float = 1
+    length: float = 1
+    depth: float = 9999999999999
+    hasTab: bool = True
+    hasScoop: bool = True
+
+
+def compartmentSpecs(
+    compartments: list[BinBodyCompartmentDefinition],
+) -> tuple[BinBodyCompartmentSpec, ...]:
+    return tuple(BinBodyCompartmentSpec.fromInput(item) for item in compartments)
+
+
+def compartmentDefinitions(
+    compartments: tuple[BinBodyCompartmentSpec, ...],
+) -> list[BinBodyCompartmentDefinition]:
+    return [item.toInput() for item in compartments]
+
+
+@dataclasses.dataclass(frozen=True, slots=True, eq=False)
+class BinBodyGeneratorSpec(GeneratorSpec):
+    """Frozen mirror of BinBodyGeneratorInput."""
+
+    inputType: typing.ClassVar[type] = BinBodyGeneratorInput
+
+    baseWidth: float = None
+    baseLength: float = None
+    heightUnit: float = None
+    xyClearance: float = None
+    binWidth: float = None
+    binLength: float = None
+    binHeight: float = None
+    binCornerFilletRadius: float = const.BIN_CORNER_FILLET_RADIUS
+    wallThickness: float = const.BIN_WALL_THICKNESS
+    isSolid: bool = False
+    isShelled: bool = False
+    isHollow: bool = False
+    hasLip: bool = False
+    hasLipNotches: bool = False
+    hasScoop: bool = False
+    scoopMaxRadius: float = const.BIN_SCOOP_MAX_RADIUS
+    hasTab: bool = None
+    tabWidth: float = const.BIN_TAB_WIDTH
+    tabLength: float = 1
+    tabPosition: float = 0
+    tabOverhangAngle: float = const.BIN_TAB_OVERHANG_ANGLE
+    compartmentsByX: int = 1
+    compartmentsByY: int = 1
+    compartments: tuple[BinBodyCompartmentSpec, ...] = convertedField(
+        (BinBodyCompartmentSpec(),), compartmentSpecs, compartmentDefinitions
+    )
+    hasCompartmentsLip: bool = False
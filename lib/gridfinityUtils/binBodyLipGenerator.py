@@ -2,6 +2,7 @@ import adsk.core, adsk.fusion, traceback
 import os
 import math
 
+from ...lib import stageTimer
 from ...lib import fusion360utils as futil
 from . import (
     const,
@@ -17,6 +18,7 @@ from . import (
 )
 from .baseGeneratorInput import BaseGeneratorInput
 from .binBodyLipGeneratorInput import BinBodyLipGeneratorInput
+from .binBodyLipNotchGenerator import createLipNotchCutouts
 
 app = adsk.core.Application.get()
 ui = app.userInterface
@@ -33,8 +35,11 @@ def getInnerCutoutScoopFace(
     return (scoopFace, oppositeFace)
 
 
+@stageTimer.timed
 def createGridfinityBinBodyLip(
-    input: BinBodyLipGeneratorInput, targetComponent: adsk.fusion.Component
+    input: BinBodyLipGeneratorInput,
+    targetComponent: adsk.fusion.Component,
+    deferredFillets: filletUtils.DeferredFillets = None,
 ):
     actualLipBodyWidth = (input.baseWidth * input.binWidth) - input.xyClearance * 2.0
     actualLipBodyLength = (input.baseLength * input.binLength) - input.xyClearance * 2.0
@@ -55,12 +60,17 @@ def createGridfinityBinBodyLip(
     bodiesToSubtract: list[adsk.fusion.BRepBody] = []
 
     # round corners
-    filletUtils.filletEdgesByLength(
-        lipBodyExtrude.faces,
-        input.binCornerFilletRadius,
-        lipBodyHeight,
-        targetComponent,
-    ).name = "Lip body corner fillets"
+    if deferredFillets is None:
+        filletUtils.filletEdgesByLength(
+            lipBodyExtrude.faces,
+            input.binCornerFilletRadius,
+            lipBodyHeight,
+            targetComponent,
+        ).name = "Lip body corner fillets"
+    else:
+        deferredFillets.addEdgesByLength(
+            lipBodyExtrude.faces, input.binCornerFilletRadius, lipBodyHeight
+        )
 
     lipCutoutBodies: list[adsk.fusion.BRepBody] = []
     lipCutoutPlaneInput: adsk.fusion.ConstructionPlaneInput = (
@@ -71,40 +81,7 @@ def createGridfinityBinBodyLip(
     )
 
     if input.hasLipNotches:
-        lipCutoutInput = BaseGeneratorInput()
-        lipCutoutInput.originPoint = geometryUtils.createOffsetPoint(
-            input.origin,
-            byX=-input.xyClearance * 2,
-            byY=-input.xyClearance * 2,
-            byZ=lipBodyHeight,
-        )
-        lipCutoutInput.baseWidth = input.baseWidth + input.xyClearance * 2
-        lipCutoutInput.baseLength = input.baseLength + input.xyClearance * 2
-        lipCutoutInput.xyClearance = input.xyClearance
-        lipCutoutInput.hasBottomChamfer = False
-        lipCutoutInput.cornerFilletRadius = (
-            input.binCornerFilletRadius + input.xyClearance * 2
-        )
-        lipCutout = baseGenerator.createSingleGridfinityBaseBody(
-            lipCutoutInput, targetComponent
-        )
-        lipCutout.name = "Lip cutout"
-        lipCutoutBodies.append(lipCutout)
-
-        patternInputBodies = adsk.core.ObjectCollection.create()
-        patternInputBodies.add(lipCutout)
-        patternInput = features.rectangularPatternFeatures.createInput(
-            patternInputBodies,
-            targetComponent.xConstructionAxis,
-            adsk.core.ValueInput.createByReal(input.binWidth),
-            adsk.core.ValueInput.createByReal(input.baseWidth),
-            adsk.fusion.PatternDistanceType.SpacingPatternDistanceType,
-        )
-        patternInput.directionTwoEntity = targetComponent.yConstructionAxis
-        patternInput.quantityTwo = adsk.core.ValueInput.createByReal(input.binLength)
-        patternInput.distanceTwo = adsk.core.ValueInput.createByReal(input.baseLength)
-        rectangularPattern = features.rectangularPatternFeatures.add(patternInput)
-        lipCutoutBodies = lipCutoutBodies + list(rectangularPattern.bodies)
+        lipCutoutBodies = createLipNotchCutouts(input, lipBodyHeight, targetComponent)
 
         lipMiddleCutoutOrigin = geometryUtils.createOffsetPoint(
             input.origin,
@@ -120,12 +97,20 @@ def createGridfinityBinBodyLip(
             "Lip middle cutout",
         )
         lipMidCutout.name = "Lip middle cutout"
-        filletUtils.filletEdgesByLength(
-            lipMidCutout.faces,
-            input.binCornerFilletRadius - input.wallThickness + input.xyClearance,
-            lipBodyHeight,
-            targetComponent,
-        )
+        lipMidCutoutFilletRadius = (
+            input.binCornerFilletRadius - input.wallThickness + input.xyClearance
+        )
+        if deferredFillets is None:
+            filletUtils.filletEdgesByLength(
+                lipMidCutout.faces,
+                lipMidCutoutFilletRadius,
+                lipBodyHeight,
+                targetComponent,
+            )
+        else:
+            deferredFillets.addEdgesByLength(
+                lipMidCutout.faces, lipMidCutoutFilletRadius, lipBodyHeight
+            )
         bodiesToSubtract.append(lipMidCutout.bodies.item(0))
 
     else:
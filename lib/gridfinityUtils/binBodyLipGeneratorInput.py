@@ -1,6 +1,9 @@
 import adsk.core, adsk.fusion, traceback
+import dataclasses
+import typing
 
 from . import const
+from .generatorSpec import GeneratorSpec, pointField
 
 
 class BinBodyLipGeneratorInput:
@@ -81,3 +84,21 @@ class BinBodyLipGeneratorInput:
     @origin.setter
     def origin(self, value: adsk.core.Point3D):
         self._originUnit = value
+
+
+@dataclasses.dataclass(frozen=True, slots=True, eq=False)
+class BinBodyLipGeneratorSpec(GeneratorSpec):
+    """Frozen mirror of BinBodyLipGeneratorInput."""
+
+    inputType: typing.ClassVar[type] = BinBodyLipGeneratorInput
+
+    baseWidth: float = None
+    baseLength: float = None
+    binWidth: float = None
+    binLength: float = None
+    binCornerFilletRadius: float = const.BIN_CORNER_FILLET_RADIUS
+    xyClearance: float = None
+    wallThickness: float = const.BIN_LIP_WALL_THICKNESS
+    hasLip: bool = False
+    hasLipNotches: bool = False
+    origin: tuple[float, float, float] = pointField()
@@ -0,0 +1,68 @@
+import adsk.core, adsk.fusion, traceback
+
+from ...lib import stageTimer
+from . import baseGenerator, commonUtils, geometryUtils, patternUtils
+from .baseGeneratorInput import BaseGeneratorInput
+from .binBodyLipGeneratorInput import BinBodyLipGeneratorInput
+
+# Lip notches come from the rounded corners of per cell lip cutouts, which
+# leave a bit of lip between neighbour cells. Everything inside the lip wall is
+# removed by the lip middle cutout anyway, so only cells along the bin
+# perimeter get a cutout: 2 * (w + l) - 4 cells instead of w * l.
+
+
+def perimeterPatterns(cellsX: int, cellsY: int):
+    """Returns ((quantityX, stepX), (quantityY, stepY)) of patterns covering perimeter cells.
+
+    Steps are in cells, patterns start at the seed cell in the first corner.
+    Front and back rows are one pattern, side columns another, the cell at the
+    end of the front row is covered by both. A direction with a single cell
+    still gets a step of 1 cell, patterns can't have zero spacing.
+    """
+    patterns = []
+    if cellsX > 1 or cellsY > 1:
+        patterns.append(((cellsX, 1), (min(cellsY, 2), max(cellsY - 1, 1))))
+    if cellsY > 2:
+        patterns.append(((min(cellsX, 2), max(cellsX - 1, 1)), (cellsY - 1, 1)))
+    return patterns
+
+
+@stageTimer.timed
+def createLipNotchCutouts(
+    input: BinBodyLipGeneratorInput,
+    lipBodyHeight: float,
+    targetComponent: adsk.fusion.Component,
+) -> list[adsk.fusion.BRepBody]:
+    lipCutoutInput = BaseGeneratorInput()
+    lipCutoutInput.originPoint = geometryUtils.createOffsetPoint(
+        input.origin,
+        byX=-input.xyClearance * 2,
+        byY=-input.xyClearance * 2,
+        byZ=lipBodyHeight,
+    )
+    lipCutoutInput.baseWidth = input.baseWidth + input.xyClearance * 2
+    lipCutoutInput.baseLength = input.baseLength + input.xyClearance * 2
+    lipCutoutInput.xyClearance = input.xyClearance
+    lipCutoutInput.hasBottomChamfer = False
+    lipCutoutInput.cornerFilletRadius = (
+        input.binCornerFilletRadius + input.xyClearance * 2
+    )
+    lipCutout = baseGenerator.createSingleGridfinityBaseBody(
+        lipCutoutInput, targetComponent
+    )
+    lipCutout.name = "Lip cutout"
+    lipCutoutBodies = [lipCutout]
+
+    # compartment lips pass sizes which aren't whole cells
+    cellsX = max(1, round(input.binWidth))
+    cellsY = max(1, round(input.binLength))
+    for (quantityX, stepX), (quantityY, stepY) in perimeterPatterns(cellsX, cellsY):
+        rectangularPattern = patternUtils.recPattern(
+            commonUtils.objectCollectionFromList([lipCutout]),
+            (targetComponent.xConstructionAxis, targetComponent.yConstructionAxis),
+            (input.baseWidth * stepX, input.baseLength * stepY),
+            (quantityX, quantityY),
+            targetComponent,
+        )
+        lipCutoutBodies = lipCutoutBodies + list(rectangularPattern.bodies)
+    return lipCutoutBodies
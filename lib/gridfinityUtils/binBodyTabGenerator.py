@@ -2,6 +2,7 @@ import adsk.core, adsk.fusion, traceback
 import os
 import math
 
+from ...lib import stageTimer
 
 from .const import BIN_TAB_EDGE_FILLET_RADIUS
 from ...lib.gridfinityUtils import geometryUtils
@@ -36,6 +37,16 @@ def getInnerCutoutScoopFace(
     return (scoopFace, oppositeFace)
 
 
+def tabProfileSize(input: BinBodyTabGeneratorInput) -> tuple[float, float]:
+    """Returns (width, height) of the tab profile, including the rounded edge."""
+    actualTabWidth = input.width + BIN_TAB_EDGE_FILLET_RADIUS / math.tan(
+        (math.radians(90) - input.overhangAngle) / 2
+    )
+    actualTabHeight = actualTabWidth / math.tan(input.overhangAngle)
+    return actualTabWidth, actualTabHeight
+
+
+@stageTimer.timed
 def createGridfinityBinBodyTab(
     input: BinBodyTabGeneratorInput,
     targetComponent: adsk.fusion.Component,
@@ -52,10 +63,7 @@ def createGridfinityBinBodyTab(
     tabSketch.name = "label tab sketch"
     tabSketchLine = tabSketch.sketchCurves.sketchLines
     tabTopEdgeHeight = input.origin.z - input.topClearance
-    actualTabWidth = input.width + BIN_TAB_EDGE_FILLET_RADIUS / math.tan(
-        (math.radians(90) - input.overhangAngle) / 2
-    )
-    actualTabHeight = actualTabWidth / math.tan(input.overhangAngle)
+    actualTabWidth, actualTabHeight = tabProfileSize(input)
     line1 = tabSketchLine.addByTwoPoints(
         tabSketch.modelToSketchSpace(
             adsk.core.Point3D.create(input.origin.x, input.origin.y, tabTopEdgeHeight)
@@ -66,38 +74,25 @@ def createGridfinityBinBodyTab(
             )
         ),
     )
+    # lines share their end points, the triangle is closed without constraints
     line2 = tabSketchLine.addByTwoPoints(
-        tabSketch.modelToSketchSpace(
-            adsk.core.Point3D.create(input.origin.x, input.origin.y, tabTopEdgeHeight)
-        ),
-        tabSketch.modelToSketchSpace(
-            adsk.core.Point3D.create(
-                input.origin.x, input.origin.y - actualTabWidth, tabTopEdgeHeight
-            )
-        ),
-    )
-    line3 = tabSketchLine.addByTwoPoints(
-        tabSketch.modelToSketchSpace(
-            adsk.core.Point3D.create(
-                input.origin.x, input.origin.y, tabTopEdgeHeight - actualTabHeight
-            )
-        ),
+        line1.startSketchPoint,
         tabSketch.modelToSketchSpace(
             adsk.core.Point3D.create(
                 input.origin.x, input.origin.y - actualTabWidth, tabTopEdgeHeight
             )
         ),
     )
+    line3 = tabSketchLine.addByTwoPoints(line1.endSketchPoint, line2.endSketchPoint)
 
-    constraints: adsk.fusion.GeometricConstraints = tabSketch.geometricConstraints
-    dimensions: adsk.fusion.SketchDimensions = tabSketch.sketchDimensions
+    constraints: adsk.fusion.GeometricConstraints = sketchUtils.geometricConstraints(
+        tabSketch
+    )
+    dimensions: adsk.fusion.SketchDimensions = sketchUtils.sketchDimensions(tabSketch)
 
     # horizontal/vertical relative to local sketch XY coordinates
     constraints.addHorizontal(line1)
     constraints.addVertical(line2)
-    constraints.addCoincident(line1.startSketchPoint, line2.startSketchPoint)
-    constraints.addCoincident(line2.endSketchPoint, line3.endSketchPoint)
-    constraints.addCoincident(line1.endSketchPoint, line3.startSketchPoint)
 
     dimensions.addDistanceDimension(
         tabSketch.originPoint,
@@ -152,3 +147,104 @@ def createGridfinityBinBodyTab(
     fillet.name = "label tab fillet"
 
     return tabBody
+
+
+@stageTimer.timed
+def createGridfinityBinBodyRowTab(
+    tabInputs: list[BinBodyTabGeneratorInput],
+    compartmentRanges: list[tuple[float, float]],
+    targetComponent: adsk.fusion.Component,
+):
+    """Builds one tab body for a row of compartments sharing the back edge.
+
+    tabInputs are the inputs each compartment tab would be built from,
+    compartmentRanges their (x, width). The body spans the whole row, parts of
+    compartments the single tabs wouldn't cover are cut away. Walls between
+    compartments are left to the intersection with the compartment cutouts.
+    Returns None when no compartment has a tab.
+    """
+    # part of each compartment its own tab would cover
+    tabRanges: list[tuple[float, float]] = []
+    for tabInput, (compartmentX, compartmentWidth) in zip(tabInputs, compartmentRanges):
+        tabRanges.append(
+            (
+                max(
+                    min(tabInput.origin.x, tabInput.origin.x + tabInput.length),
+                    compartmentX,
+                ),
+                min(
+                    max(tabInput.origin.x, tabInput.origin.x + tabInput.length),
+                    compartmentX + compartmentWidth,
+                ),
+            )
+        )
+    coveredRanges = [
+        (start, end)
+        for start, end in tabRanges
+        if end - start > const.DEFAULT_FILTER_TOLERANCE
+    ]
+    if not coveredRanges:
+        return None
+    rowStart = min(start for start, end in coveredRanges)
+    rowEnd = max(end for start, end in coveredRanges)
+
+    firstInput = tabInputs[0]
+    rowTabInput = BinBodyTabGeneratorInput()
+    rowTabInput.origin = adsk.core.Point3D.create(
+        rowStart, firstInput.origin.y, firstInput.origin.z
+    )
+    rowTabInput.length = rowEnd - rowStart
+    rowTabInput.width = firstInput.width
+    rowTabInput.overhangAngle = firstInput.overhangAngle
+    rowTabInput.topClearance = firstInput.topClearance
+    tabBody = createGridfinityBinBodyTab(rowTabInput, targetComponent)
+
+    gaps: list[tuple[float, float]] = []
+    for (start, end), (compartmentX, compartmentWidth) in zip(
+        tabRanges, compartmentRanges
+    ):
+        compartmentStart = max(compartmentX, rowStart)
+        compartmentEnd = min(compartmentX + compartmentWidth, rowEnd)
+        if end - start > const.DEFAULT_FILTER_TOLERANCE:
+            compartmentGaps = [(compartmentStart, start), (end, compartmentEnd)]
+        else:
+            compartmentGaps = [(compartmentStart, compartmentEnd)]
+        # overlapping compartments may cover the gap with their own tab
+        for coveredStart, coveredEnd in coveredRanges:
+            compartmentGaps = [
+                part
+                for gapStart, gapEnd in compartmentGaps
+                for part in [
+                    (gapStart, min(gapEnd, coveredStart)),
+                    (max(gapStart, coveredEnd), gapEnd),
+                ]
+            ]
+        gaps.extend(
+            (gapStart, gapEnd)
+            for gapStart, gapEnd in compartmentGaps
+            if gapEnd - gapStart > const.DEFAULT_FILTER_TOLERANCE
+        )
+    if gaps:
+        actualTabWidth, actualTabHeight = tabProfileSize(rowTabInput)
+        tabTopEdgeHeight = rowTabInput.origin.z - rowTabInput.topClearance
+        gapsExtrude = extrudeUtils.createBoxesAtHeight(
+            [
+                (
+                    gapStart,
+                    rowTabInput.origin.y - actualTabWidth,
+                    gapEnd - gapStart,
+                    actualTabWidth,
+                )
+                for gapStart, gapEnd in gaps
+            ],
+            actualTabHeight,
+            tabTopEdgeHeight - actualTabHeight,
+            targetComponent,
+            "label tab gaps",
+        )
+        combineUtils.cutBody(
+            tabBody,
+            commonUtils.objectCollectionFromList(gapsExtrude.bodies),
+            targetComponent,
+        )
+    return tabBody
@@ -1,6 +1,9 @@
 import adsk.core, adsk.fusion, traceback
+import dataclasses
+import typing
 
 from . import const
+from .generatorSpec import GeneratorSpec, pointField
 
 
 class BinBodyTabGeneratorInput:
@@ -56,3 +59,18 @@ class BinBodyTabGeneratorInput:
     @labelAngle.setter
     def labelAngle(self, value: float):
         self._tablabelAngle = value
+
+
+@dataclasses.dataclass(frozen=True, slots=True, eq=False)
+class BinBodyTabGeneratorSpec(GeneratorSpec):
+    """Frozen mirror of BinBodyTabGeneratorInput."""
+
+    inputType: typing.ClassVar[type] = BinBodyTabGeneratorInput
+
+    topClearance: float = None
+    width: float = None
+    length: float = None
+    origin: tuple[float, float, float] = pointField()
+    overhangAngle: float = const.BIN_TAB_OVERHANG_ANGLE
+    labelAngle: float = const.BIN_TAB_LABEL_ANGLE
+    position: float = 0
@@ -0,0 +1,111 @@
+import adsk.core, adsk.fusion, traceback
+
+from ...lib import stageTimer
+from . import const, combineUtils, commonUtils, extrudeUtils
+from .binBodyGeneratorInput import BinBodyGeneratorInput
+
+# Cheap outline of a bin shown by preview when the full bin takes too long:
+# outer box, lip ring and compartment boxes, without base profile, fillets,
+# scoops or tabs. Takes a fixed number of features whatever the bin size.
+
+
+def compartmentBoxes(
+    input: BinBodyGeneratorInput, binBodyTotalHeight: float
+) -> dict[float, list[tuple[float, float, float, float]]]:
+    """Groups (x, y, width, length) of compartments by depth."""
+    actualBodyWidth = (input.baseWidth * input.binWidth) - input.xyClearance * 2.0
+    actualBodyLength = (input.baseLength * input.binLength) - input.xyClearance * 2.0
+    compartmentsMinX = input.wallThickness
+    compartmentsMinY = (
+        (const.BIN_LIP_WALL_THICKNESS - input.xyClearance)
+        if input.hasLip and input.hasScoop
+        else input.wallThickness
+    )
+    totalCompartmentsWidth = actualBodyWidth - input.wallThickness - compartmentsMinX
+    totalCompartmentsLength = actualBodyLength - input.wallThickness - compartmentsMinY
+    compartmentWidthUnit = (
+        totalCompartmentsWidth - (input.compartmentsByX - 1) * input.wallThickness
+    ) / input.compartmentsByX
+    compartmentLengthUnit = (
+        totalCompartmentsLength - (input.compartmentsByY - 1) * input.wallThickness
+    ) / input.compartmentsByY
+
+    boxesByDepth: dict[float, list[tuple[float, float, float, float]]] = {}
+    for compartment in input.compartments:
+        depth = min(
+            binBodyTotalHeight - const.BIN_COMPARTMENT_BOTTOM_THICKNESS,
+            compartment.depth,
+        )
+        boxesByDepth.setdefault(round(depth, 6), []).append(
+            (
+                compartmentsMinX
+                + compartment.positionX * (compartmentWidthUnit + input.wallThickness),
+                compartmentsMinY
+                + compartment.positionY * (compartmentLengthUnit + input.wallThickness),
+                compartmentWidthUnit * compartment.width
+                + (compartment.width - 1) * input.wallThickness,
+                compartmentLengthUnit * compartment.length
+                + (compartment.length - 1) * input.wallThickness,
+            )
+        )
+    return boxesByDepth
+
+
+@stageTimer.timed
+def createGridfinityBinEnvelope(
+    input: BinBodyGeneratorInput,
+    hasBase: bool,
+    targetComponent: adsk.fusion.Component,
+) -> adsk.fusion.BRepBody:
+    actualBodyWidth = (input.baseWidth * input.binWidth) - input.xyClearance * 2.0
+    actualBodyLength = (input.baseLength * input.binLength) - input.xyClearance * 2.0
+    binBodyTotalHeight = input.binHeight * input.heightUnit - const.BIN_BASE_HEIGHT
+    bottomZ = -const.BIN_BASE_HEIGHT if hasBase else 0
+    topZ = binBodyTotalHeight + (const.BIN_LIP_EXTRA_HEIGHT if input.hasLip else 0)
+
+    envelopeExtrude = extrudeUtils.createBoxesAtHeight(
+        [(0, 0, actualBodyWidth, actualBodyLength)],
+        topZ - bottomZ,
+        bottomZ,
+        targetComponent,
+        "Bin envelope",
+    )
+    envelopeBody = envelopeExtrude.bodies.item(0)
+    envelopeBody.name = "Bin envelope"
+
+    cutoutBodies: list[adsk.fusion.BRepBody] = []
+    if input.hasLip:
+        lipCutoutExtrude = extrudeUtils.createBoxesAtHeight(
+            [
+                (
+                    const.BIN_LIP_WALL_THICKNESS,
+                    const.BIN_LIP_WALL_THICKNESS,
+                    actualBodyWidth - const.BIN_LIP_WALL_THICKNESS * 2,
+                    actualBodyLength - const.BIN_LIP_WALL_THICKNESS * 2,
+                )
+            ],
+            const.BIN_LIP_EXTRA_HEIGHT,
+            binBodyTotalHeight,
+            targetComponent,
+            "Lip envelope cutout",
+        )
+        cutoutBodies.extend(lipCutoutExtrude.bodies)
+
+    if not input.isSolid:
+        for depth, boxes in compartmentBoxes(input, binBodyTotalHeight).items():
+            compartmentsExtrude = extrudeUtils.createBoxesAtHeight(
+                boxes,
+                depth,
+                binBodyTotalHeight - depth,
+                targetComponent,
+                "Compartments envelope",
+            )
+            cutoutBodies.extend(compartmentsExtrude.bodies)
+
+    if len(cutoutBodies) > 0:
+        combineUtils.cutBody(
+            envelopeBody,
+            commonUtils.objectCollectionFromList(cutoutBodies),
+            targetComponent,
+        )
+    return envelopeBody
@@ -0,0 +1,210 @@
+import adsk.core, adsk.fusion, traceback
+import math
+import re
+
+from ...lib import stageTimer
+from . import const, commonUtils, combineUtils, faceUtils
+from .binBodyGeneratorInput import BinBodyGeneratorInput
+from .binBodyTabGenerator import tabProfileSize
+from .binBodyTabGeneratorInput import BinBodyTabGeneratorInput
+from .binSnapshot import removeBinSnapshot
+
+# Taller bins of a family are copies of a generated bin stretched at a height
+# where the cross section doesn't change: the copy is split there, the part
+# above is moved up and the gap is filled by extruding the cut faces. Move and
+# fill distances are expressions of a user parameter holding the bin height,
+# changing the parameter only recomputes those few features.
+#
+# Everything below the split height has to depend on the bin bottom only, like
+# compartment floors, scoops and fillets, everything above it on the bin top
+# only, like lip, tabs and shallow compartments. stretchHeight returns None
+# when no such height exists, those bins are generated in full.
+
+# distance kept between the split plane and the closest feature, cm
+STRETCH_MARGIN = 0.05
+
+
+class HeightFamilyError(Exception):
+    pass
+
+
+def parseHeightFamily(text: str) -> list[float]:
+    """Parses comma separated bin heights in units, duplicates are dropped."""
+    heights: list[float] = []
+    for item in text.replace(";", ",").split(","):
+        item = item.strip()
+        if not item:
+            continue
+        try:
+            height = float(item)
+        except ValueError:
+            raise HeightFamilyError(f"'{item}' is not a number")
+        if height < 1:
+            raise HeightFamilyError(f"height {item} must be at least 1")
+        if height not in heights:
+            heights.append(height)
+    return heights
+
+
+def stretchHeight(input: BinBodyGeneratorInput, maxBinHeight: float) -> float | None:
+    """Returns height of the split plane of a bin stretched up to maxBinHeight."""
+    if input.isShelled:
+        return None
+    binBodyTotalHeight = input.binHeight * input.heightUnit - const.BIN_BASE_HEIGHT
+    maxBinBodyTotalHeight = maxBinHeight * input.heightUnit - const.BIN_BASE_HEIGHT
+    # compartment cutout fillets, lip bottom chamfer has the same height
+    cutoutFilletRadius = max(
+        const.BIN_BODY_CUTOUT_BOTTOM_FILLET_RADIUS,
+        input.binCornerFilletRadius - input.wallThickness,
+    )
+
+    bottomHeight = 0
+    topDepth = cutoutFilletRadius if input.hasLip else 0
+    if not input.isSolid:
+        bottomHeight = const.BIN_COMPARTMENT_BOTTOM_THICKNESS + max(
+            cutoutFilletRadius, input.scoopMaxRadius if input.hasScoop else 0
+        )
+        for compartment in input.compartments:
+            if (
+                compartment.depth
+                >= maxBinBodyTotalHeight - const.BIN_COMPARTMENT_BOTTOM_THICKNESS
+            ):
+                # full depth at every height, floor stays at the bottom
+                continue
+            if (
+                compartment.depth
+                >= binBodyTotalHeight - const.BIN_COMPARTMENT_BOTTOM_THICKNESS
+            ):
+                # full depth in this bin but not in taller ones
+                return None
+            topDepth = max(topDepth, compartment.depth)
+        if len(input.compartments) > 1 and not input.hasCompartmentsLip:
+            topDepth = max(topDepth, const.BIN_TAB_TOP_CLEARANCE + cutoutFilletRadius)
+        if input.hasTab:
+            tabInput = BinBodyTabGeneratorInput()
+            tabInput.width = input.tabWidth
+            tabInput.overhangAngle = input.tabOverhangAngle
+            topDepth = max(
+                topDepth,
+                const.BIN_TAB_TOP_CLEARANCE
+                + tabProfileSize(tabInput)[1]
+                + cutoutFilletRadius,
+            )
+
+    lowest = bottomHeight + STRETCH_MARGIN
+    highest = binBodyTotalHeight - topDepth - STRETCH_MARGIN
+    if highest <= lowest:
+        return None
+    return (lowest + highest) / 2
+
+
+def heightParameterName(design: adsk.fusion.Design, binName: str) -> str:
+    baseName = re.sub(r"\W", "_", binName) + "_height"
+    name = baseName
+    index = 1
+    while design.userParameters.itemByName(name) is not None:
+        index += 1
+        name = f"{baseName}_{index}"
+    return name
+
+
+@stageTimer.timed
+def createStretchedBinCopy(
+    sourceOccurrence: adsk.fusion.Occurrence,
+    input: BinBodyGeneratorInput,
+    splitHeight: float,
+    binHeight: float,
+    binName: str,
+    transform: adsk.core.Matrix3D,
+) -> adsk.fusion.Occurrence:
+    """Copies a generated bin and stretches the copy to binHeight units."""
+    design = adsk.fusion.Design.cast(sourceOccurrence.component.parentDesign)
+    root = design.rootComponent
+    copyOccurrence = root.occurrences.addNewComponentCopy(
+        sourceOccurrence.component, transform
+    )
+    component = copyOccurrence.component
+    component.name = binName
+    # the copy isn't made of generation stages, it can't be edited as a bin
+    removeBinSnapshot(component)
+
+    parameterName = heightParameterName(design, binName)
+    design.userParameters.add(
+        parameterName,
+        adsk.core.ValueInput.createByString(f"{binHeight:g}"),
+        "",
+        f"{binName} height (u), stretched from {input.binHeight:g}",
+    )
+    # height units above the source bin, in cm
+    distanceExpression = (
+        f"({parameterName} - {input.binHeight:g}) * {input.heightUnit:g} cm"
+    )
+
+    features = component.features
+    splitPlaneInput: adsk.fusion.ConstructionPlaneInput = (
+        component.constructionPlanes.createInput()
+    )
+    splitPlaneInput.setByOffset(
+        component.xYConstructionPlane,
+        adsk.core.ValueInput.createByReal(splitHeight),
+    )
+    splitPlane = component.constructionPlanes.add(splitPlaneInput)
+    splitPlane.name = "Height stretch plane"
+    splitPlane.isLightBulbOn = False
+
+    splitInput = features.splitBodyFeatures.createInput(
+        commonUtils.objectCollectionFromList(list(component.bRepBodies)),
+        splitPlane,
+        True,
+    )
+    splitFeature = features.splitBodyFeatures.add(splitInput)
+    splitFeature.name = "Height stretch split"
+    lowerBodies = [
+        body
+        for body in splitFeature.bodies
+        if body.boundingBox.maxPoint.z <= splitHeight + const.DEFAULT_FILTER_TOLERANCE
+    ]
+    upperBodies = [body for body in splitFeature.bodies if body not in lowerBodies]
+
+    moveInput = features.moveFeatures.createInput2(
+        commonUtils.objectCollectionFromList(upperBodies)
+    )
+    moveInput.defineAsTranslateXYZ(
+        adsk.core.ValueInput.createByReal(0),
+        adsk.core.ValueInput.createByReal(0),
+        adsk.core.ValueInput.createByString(distanceExpression),
+        True,
+    )
+    features.moveFeatures.add(moveInput).name = "Height stretch move"
+
+    cutFaces = [
+        face
+        for body in lowerBodies
+        for face in body.faces
+        if faceUtils.isZNormal(face)
+        and math.isclose(
+            face.boundingBox.maxPoint.z,
+            splitHeight,
+            abs_tol=const.DEFAULT_FILTER_TOLERANCE,
+        )
+    ]
+    fillInput = features.extrudeFeatures.createInput(
+        commonUtils.objectCollectionFromList(cutFaces),
+        adsk.fusion.FeatureOperations.JoinFeatureOperation,
+    )
+    fillInput.setOneSideExtent(
+        adsk.fusion.DistanceExtentDefinition.create(
+            adsk.core.ValueInput.createByString(distanceExpression)
+        ),
+        adsk.fusion.ExtentDirections.PositiveExtentDirection,
+    )
+    fillInput.participantBodies = lowerBodies
+    features.extrudeFeatures.add(fillInput).name = "Height stretch fill"
+
+    binBody = combineUtils.joinBodies(
+        lowerBodies[0],
+        commonUtils.objectCollectionFromList(lowerBodies[1:] + upperBodies),
+        component,
+    )
+    binBody.name = "Bin body"
+    return copyOccurrence
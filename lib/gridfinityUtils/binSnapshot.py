@@ -0,0 +1,148 @@
+import adsk.core, adsk.fusion, traceback
+import dataclasses
+import json
+
+from .baseGeneratorInput import BaseGeneratorSpec
+from .binBodyGeneratorInput import BinBodyGeneratorSpec
+
+# Generated bins keep the inputs they were made from in an attribute of their
+# component. The edit bin command restores the dialog from the stored UI state
+# and compares stored specs with the edited ones to find the first generation
+# stage to rebuild. Each stage is a timeline group following the bin
+# occurrence, groups of stages before the first changed one stay untouched.
+
+SNAPSHOT_ATTRIBUTE_GROUP = "GridfinityGenerator"
+SNAPSHOT_ATTRIBUTE_NAME = "binSnapshot"
+SNAPSHOT_FORMAT_VERSION = 1
+
+BIN_STAGE_BASE = "base"
+BIN_STAGE_BODY = "body"
+BIN_STAGE_BASE_CLEARANCE = "base clearance"
+# generation order, every stage works on bodies of the stages before it
+BIN_STAGES = [BIN_STAGE_BASE, BIN_STAGE_BODY, BIN_STAGE_BASE_CLEARANCE]
+
+# bin body fields the base pattern and base clearance depend on
+BASE_PATTERN_FIELDS = ["binWidth", "binLength"]
+
+
+@dataclasses.dataclass(frozen=True)
+class BinSnapshot:
+    # canonical fields of the generator specs, see GeneratorSpec.canonicalFields
+    baseSpec: dict
+    binBodySpec: dict
+    generateBase: bool
+    generateBody: bool
+    # dialog state in the saved defaults format, static_ui and compartments_table
+    uiState: dict
+    # timeline group name by stage, stages which created no features are missing
+    stageGroups: dict = dataclasses.field(default_factory=dict)
+    version: int = SNAPSHOT_FORMAT_VERSION
+
+    @classmethod
+    def create(
+        cls,
+        baseSpec: BaseGeneratorSpec,
+        binBodySpec: BinBodyGeneratorSpec,
+        generateBase: bool,
+        generateBody: bool,
+        uiState: dict,
+        stageGroups: dict = None,
+    ):
+        return cls(
+            baseSpec.canonicalFields(),
+            binBodySpec.canonicalFields(),
+            generateBase,
+            generateBody,
+            uiState,
+            dict(stageGroups or {}),
+        )
+
+    @classmethod
+    def fromJson(cls, text: str):
+        """Returns None for snapshots of other format versions."""
+        values = json.loads(text)
+        if values.get("version") != SNAPSHOT_FORMAT_VERSION:
+            return None
+        return cls(**values)
+
+    def toJson(self) -> str:
+        return json.dumps(dataclasses.asdict(self), sort_keys=True)
+
+    def stageInputs(self, stage: str) -> dict:
+        """Inputs the stage features are generated from."""
+        basePattern = {name: self.binBodySpec[name] for name in BASE_PATTERN_FIELDS}
+        if stage == BIN_STAGE_BASE:
+            return {
+                "base": self.baseSpec,
+                "generateBase": self.generateBase,
+                **basePattern,
+            }
+        if stage == BIN_STAGE_BODY:
+            # base bodies are joined to the body
+            return {
+                "body": self.binBodySpec,
+                "generateBase": self.generateBase,
+                "generateBody": self.generateBody,
+            }
+        return {
+            "base": self.baseSpec,
+            "generateBase": self.generateBase,
+            "generateBody": self.generateBody,
+            **basePattern,
+        }
+
+
+def firstChangedStage(stored: BinSnapshot, edited: BinSnapshot) -> str | None:
+    for stage in BIN_STAGES:
+        if stored.stageInputs(stage) != edited.stageInputs(stage):
+            return stage
+    return None
+
+
+def readBinSnapshot(component: adsk.fusion.Component) -> BinSnapshot | None:
+    attribute = component.attributes.itemByName(
+        SNAPSHOT_ATTRIBUTE_GROUP, SNAPSHOT_ATTRIBUTE_NAME
+    )
+    if attribute is None:
+        return None
+    try:
+        return BinSnapshot.fromJson(attribute.value)
+    except (ValueError, TypeError):
+        return None
+
+
+def writeBinSnapshot(component: adsk.fusion.Component, snapshot: BinSnapshot):
+    component.attributes.add(
+        SNAPSHOT_ATTRIBUTE_GROUP, SNAPSHOT_ATTRIBUTE_NAME, snapshot.toJson()
+    )
+
+
+def removeBinSnapshot(component: adsk.fusion.Component):
+    attribute = component.attributes.itemByName(
+        SNAPSHOT_ATTRIBUTE_GROUP, SNAPSHOT_ATTRIBUTE_NAME
+    )
+    if attribute is not None:
+        attribute.deleteMe()
+
+
+def findStageGroups(
+    timeline: adsk.fusion.Timeline,
+    occurrence: adsk.fusion.Occurrence,
+    stageGroups: dict,
+) -> dict[str, adsk.fusion.TimelineGroup]:
+    """Finds stage groups of the bin, the closest ones after its occurrence.
+
+    Copies of a bin share group names, the groups of each copy directly follow
+    its occurrence. Stages whose group isn't found are left out.
+    """
+    occurrenceIndex = occurrence.timelineObject.index
+    groups = {}
+    for stage, name in stageGroups.items():
+        candidates = [
+            group
+            for group in timeline.timelineGroups
+            if group.name == name and group.index > occurrenceIndex
+        ]
+        if candidates:
+            groups[stage] = min(candidates, key=lambda group: group.index)
+    return groups
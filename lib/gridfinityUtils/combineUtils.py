@@ -2,11 +2,13 @@ import math
 import adsk.core, adsk.fusion, traceback
 import os
 
+from ...lib import stageTimer
 from .const import DEFAULT_FILTER_TOLERANCE
 
 from .geometryUtils import boundingBoxVolume
 
 
+@stageTimer.timed
 def cutBody(
     targetBody: adsk.fusion.BRepBodies,
     toolBodies: adsk.core.ObjectCollection,
@@ -20,6 +22,7 @@ def cutBody(
     return combineFeature
 
 
+@stageTimer.timed
 def intersectBody(
     targetBody: adsk.fusion.BRepBody,
     toolBodies: adsk.core.ObjectCollection,
@@ -33,6 +36,7 @@ def intersectBody(
     return combineFeature
 
 
+@stageTimer.timed
 def joinBodies(
     targetBody: adsk.fusion.BRepBody,
     toolBodies: adsk.core.ObjectCollection,
@@ -0,0 +1,230 @@
+import html
+import re
+import string
+
+from . import compartmentMerge
+from .binBodyGeneratorInput import BinBodyCompartmentDefinition
+
+# Text layout of custom compartments, one text row per grid row, the first row
+# is the back of the bin. Cells with the same label connected by a side form
+# one compartment of any shape, built from as few overlapping rectangles as
+# compartmentMerge finds, "." marks a cell without compartment. Depths are optional,
+# one "<label> = <depth in mm>" line per label, compartments of labels without
+# depth are cut through the whole bin height. "#" starts a comment.
+#
+#   AAB
+#   AAC
+#   DDC
+#   B = 20
+#   C = 20
+
+EMPTY_CELL = "."
+LABELS = string.ascii_uppercase + string.ascii_lowercase + string.digits
+# depths are written in mm, generator inputs use cm
+DEPTH_TEXT_SCALE = 10
+DEPTH_DIGITS = 5
+
+
+class CompartmentLayoutError(Exception):
+    pass
+
+
+class CompartmentLayout:
+    def __init__(
+        self,
+        gridWidth: int,
+        gridLength: int,
+        compartments: list[BinBodyCompartmentDefinition],
+    ):
+        self.gridWidth = gridWidth
+        self.gridLength = gridLength
+        self.compartments = compartments
+
+
+def normalizeText(text: str) -> str:
+    # text box inputs may return html formatted text
+    text = re.sub(r"<br\s*/?>", "\n", text, flags=re.IGNORECASE)
+    text = re.sub(r"<[^>]*>", "", text)
+    return html.unescape(text).replace("\xa0", " ")
+
+
+def findRegions(grid: list[str]) -> list[tuple[str, list[tuple[int, int]]]]:
+    """Groups cells with the same label connected by a side, in row order."""
+    visited = set()
+    regions = []
+    for y, row in enumerate(grid):
+        for x, label in enumerate(row):
+            if label == EMPTY_CELL or (x, y) in visited:
+                continue
+            cells = []
+            pending = [(x, y)]
+            visited.add((x, y))
+            while pending:
+                cellX, cellY = pending.pop()
+                cells.append((cellX, cellY))
+                for nextX, nextY in [
+                    (cellX - 1, cellY),
+                    (cellX + 1, cellY),
+                    (cellX, cellY - 1),
+                    (cellX, cellY + 1),
+                ]:
+                    if (
+                        0 <= nextY < len(grid)
+                        and 0 <= nextX < len(grid[nextY])
+                        and (nextX, nextY) not in visited
+                        and grid[nextY][nextX] == label
+                    ):
+                        visited.add((nextX, nextY))
+                        pending.append((nextX, nextY))
+            regions.append((label, cells))
+    return regions
+
+
+def parseLayout(text: str) -> CompartmentLayout:
+    rows: list[tuple[int, str]] = []
+    depths: dict[str, float] = {}
+    for lineNumber, line in enumerate(normalizeText(text).split("\n"), 1):
+        line = line.split("#", 1)[0].strip()
+        if not line:
+            continue
+        if "=" in line:
+            label, value = [part.strip() for part in line.split("=", 1)]
+            if len(label) != 1 or label not in LABELS:
+                raise CompartmentLayoutError(
+                    f"line {lineNumber}: '{label}' is not a compartment label"
+                )
+            try:
+                depth = float(value)
+            except ValueError:
+                raise CompartmentLayoutError(
+                    f"line {lineNumber}: depth of {label} must be a number in mm"
+                )
+            if depth <= 0:
+                raise CompartmentLayoutError(
+                    f"line {lineNumber}: depth of {label} must be greater than 0"
+                )
+            depths[label] = depth / DEPTH_TEXT_SCALE
+            continue
+        cells = line.replace(" ", "")
+        for cell in cells:
+            if cell != EMPTY_CELL and cell not in LABELS:
+                raise CompartmentLayoutError(
+                    f"line {lineNumber}: '{cell}' is not a compartment label"
+                )
+        rows.append((lineNumber, cells))
+
+    if not rows:
+        raise CompartmentLayoutError("layout has no grid rows")
+    gridWidth = len(rows[0][1])
+    for lineNumber, cells in rows:
+        if len(cells) != gridWidth:
+            raise CompartmentLayoutError(
+                f"line {lineNumber}: expected {gridWidth} cells, found {len(cells)}"
+            )
+
+    # grid[y][x], the first text row is the back of the bin
+    grid = [cells for lineNumber, cells in reversed(rows)]
+    regions = [[None] * gridWidth for _ in grid]
+    regionDepths = {}
+    for region, (label, cells) in enumerate(findRegions(grid)):
+        for x, y in cells:
+            regions[y][x] = region
+        if label in depths:
+            regionDepths[region] = depths[label]
+    return CompartmentLayout(
+        gridWidth, len(grid), compartmentMerge.mergeCells(regions, regionDepths)
+    )
+
+
+def formatLayout(
+    gridWidth: int,
+    gridLength: int,
+    compartments: list[BinBodyCompartmentDefinition],
+    fullDepth: float,
+) -> str:
+    """Formats compartments as a text layout, depths of at least fullDepth are omitted."""
+    depths = [
+        (
+            None
+            if compartment.depth >= fullDepth
+            else round(compartment.depth * DEPTH_TEXT_SCALE, DEPTH_DIGITS)
+        )
+        for compartment in compartments
+    ]
+    # overlapping compartments are cut as one cavity, written as one region
+    parents = list(range(len(compartments)))
+
+    def findRegion(index: int) -> int:
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return index
+
+    grid: list[list[int]] = [[None] * gridWidth for _ in range(gridLength)]
+    for index, compartment in enumerate(compartments):
+        for y in range(
+            int(compartment.positionY), int(compartment.positionY + compartment.length)
+        ):
+            for x in range(
+                int(compartment.positionX),
+                int(compartment.positionX + compartment.width),
+            ):
+                if not (0 <= x < gridWidth and 0 <= y < gridLength):
+                    raise CompartmentLayoutError(
+                        f"compartment {index + 1} doesn't fit the {gridWidth}x{gridLength} grid"
+                    )
+                other = grid[y][x]
+                if other is None:
+                    grid[y][x] = index
+                elif depths[other] != depths[index]:
+                    raise CompartmentLayoutError(
+                        f"compartments {other + 1} and {index + 1} overlap with different depths"
+                    )
+                else:
+                    parents[findRegion(index)] = findRegion(other)
+    regions = [
+        [None if cell is None else findRegion(cell) for cell in row] for row in grid
+    ]
+
+    neighbours: dict[int, set[int]] = {}
+    for y in range(gridLength):
+        for x in range(gridWidth):
+            region = regions[y][x]
+            if region is None:
+                continue
+            for nextX, nextY in [(x + 1, y), (x, y + 1)]:
+                if nextX < gridWidth and nextY < gridLength:
+                    neighbour = regions[nextY][nextX]
+                    if neighbour is not None and neighbour != region:
+                        neighbours.setdefault(region, set()).add(neighbour)
+                        neighbours.setdefault(neighbour, set()).add(region)
+
+    # the same label is reused for regions which don't touch and have the same
+    # depth, only touching cells are merged when parsing
+    labels: dict[int, str] = {}
+    labelDepths: dict[str, float] = {}
+    for region in sorted(set(findRegion(index) for index in range(len(compartments)))):
+        neighbourLabels = set(
+            labels[neighbour]
+            for neighbour in neighbours.get(region, [])
+            if neighbour in labels
+        )
+        depth = depths[region]
+        for label in LABELS:
+            if label not in neighbourLabels and labelDepths.get(label, depth) == depth:
+                labels[region] = label
+                labelDepths[label] = depth
+                break
+        else:
+            raise CompartmentLayoutError(
+                f"too many different depths to label compartment {region + 1}"
+            )
+
+    lines = [
+        "".join(EMPTY_CELL if region is None else labels[region] for region in row)
+        for row in reversed(regions)
+    ]
+    for label, depth in labelDepths.items():
+        if depth is not None:
+            lines.append(f"{label} = {depth:g}")
+    return "\n".join(lines)
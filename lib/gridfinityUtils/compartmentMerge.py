@@ -0,0 +1,188 @@
+import heapq
+import itertools
+
+from .binBodyGeneratorInput import BinBodyCompartmentDefinition
+
+# Covers regions of grid cells with as few compartment rectangles as possible.
+# Cutouts of overlapping compartments merge into one cavity, compartments
+# which only touch get a wall between them. So rectangles of a region may
+# overlap, and every pair of neighbour cells of a region has to be inside one
+# rectangle, otherwise a wall would be left between them.
+#
+# Finding the minimum cover is NP-hard, the greedy set cover over maximal
+# rectangles used here is near-minimal for layouts people draw.
+
+
+def regionCells(regions: list[list]) -> dict[any, set[tuple[int, int]]]:
+    """Groups cells of a regions[y][x] grid by region, None cells are skipped."""
+    cellsByRegion: dict[any, set[tuple[int, int]]] = {}
+    for y, row in enumerate(regions):
+        for x, region in enumerate(row):
+            if region is not None:
+                cellsByRegion.setdefault(region, set()).add((x, y))
+    return cellsByRegion
+
+
+def boundingRectangle(cells: set[tuple[int, int]]) -> tuple[int, int, int, int]:
+    minX = min(x for x, y in cells)
+    minY = min(y for x, y in cells)
+    width = max(x for x, y in cells) - minX + 1
+    length = max(y for x, y in cells) - minY + 1
+    return minX, minY, width, length
+
+
+def maximalRectangles(cells: set[tuple[int, int]]) -> list[tuple[int, int, int, int]]:
+    """Returns (x, y, width, length) of rectangles of cells which can't grow in any direction."""
+    # number of consecutive cells upwards and to the right of each cell
+    up: dict[tuple[int, int], int] = {}
+    right: dict[tuple[int, int], int] = {}
+    for x, y in sorted(cells, key=lambda cell: (-cell[1], cell[0])):
+        up[(x, y)] = up.get((x, y + 1), 0) + 1
+    for x, y in sorted(cells, key=lambda cell: -cell[0]):
+        right[(x, y)] = right.get((x + 1, y), 0) + 1
+
+    rectangles = []
+    for x, y in cells:
+        length = None
+        width = 0
+        while (x + width, y) in cells:
+            length = min(up[(x + width, y)], length or up[(x + width, y)])
+            width += 1
+            canGrowRight = up.get((x + width, y), 0) >= length
+            canGrowLeft = up.get((x - 1, y), 0) >= length
+            canGrowDown = right.get((x, y - 1), 0) >= width
+            if not (canGrowRight or canGrowLeft or canGrowDown):
+                rectangles.append((x, y, width, length))
+    return rectangles
+
+
+def rectangleElements(rectangle: tuple[int, int, int, int]):
+    """Cells and neighbour cell pairs inside the rectangle."""
+    x, y, width, length = rectangle
+    for cellX in range(x, x + width):
+        for cellY in range(y, y + length):
+            yield (cellX, cellY)
+            if cellX + 1 < x + width:
+                yield ((cellX, cellY), (cellX + 1, cellY))
+            if cellY + 1 < y + length:
+                yield ((cellX, cellY), (cellX, cellY + 1))
+
+
+def coverRegion(cells: set[tuple[int, int]]) -> list[tuple[int, int, int, int]]:
+    """Returns rectangles covering all cells and neighbour pairs of the region."""
+    rectangle = boundingRectangle(cells)
+    if rectangle[2] * rectangle[3] == len(cells):
+        return [rectangle]
+
+    uncovered = set(cells)
+    for x, y in cells:
+        if (x + 1, y) in cells:
+            uncovered.add(((x, y), (x + 1, y)))
+        if (x, y + 1) in cells:
+            uncovered.add(((x, y), (x, y + 1)))
+
+    # lazy greedy, gains only go down as elements get covered
+    candidates = maximalRectangles(cells)
+    queue = [
+        (-rectangle[2] * rectangle[3] * 3, index)
+        for index, rectangle in enumerate(candidates)
+    ]
+    heapq.heapify(queue)
+    cover = []
+    while uncovered and queue:
+        negativeGain, index = heapq.heappop(queue)
+        gain = sum(
+            1
+            for element in rectangleElements(candidates[index])
+            if element in uncovered
+        )
+        if gain == 0:
+            continue
+        if queue and gain < -queue[0][0]:
+            heapq.heappush(queue, (-gain, index))
+            continue
+        cover.append(candidates[index])
+        uncovered.difference_update(rectangleElements(candidates[index]))
+    return cover
+
+
+def outlineEdges(
+    rectangle: tuple[int, int, int, int], cells: set[tuple[int, int]]
+) -> tuple[bool, bool]:
+    """Returns whether the tab and the scoop of the rectangle lie on the region outline.
+
+    Tabs are joined after the cutouts are subtracted, so a tab over any cell of
+    the region behind the rectangle would hang in the cavity. Parts of a scoop
+    over region cells in front of the rectangle are cut away by the rectangle
+    covering both cells, so the scoop is only dropped when all of the front edge
+    is inside the region.
+    """
+    x, y, width, length = rectangle
+    columns = range(x, x + width)
+    hasTab = not any((column, y + length) in cells for column in columns)
+    hasScoop = not all((column, y - 1) in cells for column in columns)
+    return hasTab, hasScoop
+
+
+def markOutlineEdges(compartments: list[BinBodyCompartmentDefinition]):
+    """Sets tab and scoop flags of compartments drawn overlapping in the table.
+
+    Overlapping compartments are cut as one cavity, like the rectangles of a
+    region, see outlineEdges.
+    """
+    rectangles = [
+        (
+            int(compartment.positionX),
+            int(compartment.positionY),
+            int(compartment.width),
+            int(compartment.length),
+        )
+        for compartment in compartments
+    ]
+    # compartments sharing a cell belong to the same cavity
+    parents = list(range(len(compartments)))
+
+    def findCavity(index: int) -> int:
+        while parents[index] != index:
+            parents[index] = parents[parents[index]]
+            index = parents[index]
+        return index
+
+    owners: dict[tuple[int, int], int] = {}
+    for index, (x, y, width, length) in enumerate(rectangles):
+        for cell in itertools.product(range(x, x + width), range(y, y + length)):
+            if cell in owners:
+                parents[findCavity(index)] = findCavity(owners[cell])
+            else:
+                owners[cell] = index
+    cavityCells: dict[int, set[tuple[int, int]]] = {}
+    for cell, index in owners.items():
+        cavityCells.setdefault(findCavity(index), set()).add(cell)
+    for index, compartment in enumerate(compartments):
+        compartment.hasTab, compartment.hasScoop = outlineEdges(
+            rectangles[index], cavityCells[findCavity(index)]
+        )
+
+
+def mergeCells(
+    regions: list[list], depths: dict[any, float] = None
+) -> list[BinBodyCompartmentDefinition]:
+    """Builds compartments for a regions[y][x] grid, None cells stay solid.
+
+    Cells of the same region form one cavity. Compartments of regions missing
+    from depths use the default compartment depth.
+    """
+    depths = depths or {}
+    compartments = []
+    for region, cells in regionCells(regions).items():
+        for rectangle in sorted(
+            coverRegion(cells), key=lambda item: (item[1], item[0])
+        ):
+            hasTab, hasScoop = outlineEdges(rectangle, cells)
+            compartment = BinBodyCompartmentDefinition(
+                *rectangle, hasTab=hasTab, hasScoop=hasScoop
+            )
+            if region in depths:
+                compartment.depth = depths[region]
+            compartments.append(compartment)
+    return compartments
@@ -35,3 +35,25 @@ def excludeEdges(
 ):
     toExcludeIds = [edge.tempId for edge in toExclude]
     return [edge for edge in edges if not edge.tempId in toExcludeIds]
+
+
+def isConvexCornerEdge(
+    edge: adsk.fusion.BRepEdge,
+    rectangles: list[tuple[float, float, float, float]],
+):
+    """Checks a vertical edge is an outer corner of the union of rectangles.
+
+    Rectangles are (x, y, width, length). Only one of the four quadrants next to
+    a convex corner is inside the union, three next to a concave one.
+    """
+    point = edge.boundingBox.minPoint
+    offset = const.DEFAULT_FILTER_TOLERANCE * 10
+    insideQuadrants = [
+        any(
+            x < point.x + offsetX < x + width and y < point.y + offsetY < y + length
+            for x, y, width, length in rectangles
+        )
+        for offsetX in (-offset, offset)
+        for offsetY in (-offset, offset)
+    ]
+    return insideQuadrants.count(True) == 1
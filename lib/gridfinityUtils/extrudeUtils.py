@@ -1,9 +1,11 @@
 import adsk.core, adsk.fusion, traceback
 import os
 
-from . import sketchUtils
+from ...lib import stageTimer
+from . import sketchUtils, commonUtils
 
 
+@stageTimer.timed
 def simpleDistanceExtrude(
     profile: adsk.core.Base,
     operation: adsk.fusion.FeatureOperations,
@@ -28,6 +30,7 @@ def simpleDistanceExtrude(
     return extrudeFeature
 
 
+@stageTimer.timed
 def createBox(
     width: float,
     length: float,
@@ -55,6 +58,7 @@ def createBox(
     return extrude
 
 
+@stageTimer.timed
 def createBoxAtPoint(
     width: float,
     length: float,
@@ -91,3 +95,49 @@ def createBoxAtPoint(
     )
     extrude.name = f"{name} extrude" if name else "Simple box at point extrude"
     return extrude
+
+
+@stageTimer.timed
+def createBoxesAtHeight(
+    rectangles: list[tuple[float, float, float, float]],
+    height: float,
+    z: float,
+    targetComponent: adsk.fusion.Component,
+    name: str = "",
+):
+    """Extrudes (x, y, width, length) rectangles from one sketch with one feature.
+
+    Rectangles which touch or overlap end up in the same body.
+    """
+    features: adsk.fusion.Features = targetComponent.features
+    extrudeFeatures: adsk.fusion.ExtrudeFeatures = features.extrudeFeatures
+    boxesPlaneInput: adsk.fusion.ConstructionPlaneInput = (
+        targetComponent.constructionPlanes.createInput()
+    )
+    boxesPlaneInput.setByOffset(
+        targetComponent.xYConstructionPlane,
+        adsk.core.ValueInput.createByReal(z),
+    )
+    boxesConstructionPlane = targetComponent.constructionPlanes.add(boxesPlaneInput)
+    boxesConstructionPlane.name = (
+        f"{name} plane" if name else "Boxes construction plane"
+    )
+    sketches: adsk.fusion.Sketches = targetComponent.sketches
+    recSketch: adsk.fusion.Sketch = sketches.add(boxesConstructionPlane)
+    recSketch.name = f"{name} sketch" if name else "Boxes sketch"
+    for x, y, width, length in rectangles:
+        sketchUtils.createRectangle(
+            width,
+            length,
+            recSketch.modelToSketchSpace(adsk.core.Point3D.create(x, y, z)),
+            recSketch,
+        )
+
+    # extrude
+    extrude = extrudeFeatures.addSimple(
+        commonUtils.objectCollectionFromList(recSketch.profiles),
+        adsk.core.ValueInput.createByReal(height),
+        adsk.fusion.FeatureOperations.NewBodyFeatureOperation,
+    )
+    extrude.name = f"{name} extrude" if name else "Boxes extrude"
+    return extrude
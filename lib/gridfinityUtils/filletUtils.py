@@ -2,9 +2,11 @@ import adsk.core, adsk.fusion, traceback
 import os
 import math
 
+from ...lib import stageTimer
 from . import edgeUtils, faceUtils, commonUtils, const
 
 
+@stageTimer.timed
 def createFillet(
     edges: list[adsk.fusion.BRepEdge],
     radius: float,
@@ -23,6 +25,7 @@ def createFillet(
     return filletFeatures.add(filletInput)
 
 
+@stageTimer.timed
 def filletEdgesByLength(
     faces: adsk.fusion.BRepFaces,
     radius: float,
@@ -42,6 +45,7 @@ def filletEdgesByLength(
     return filletFeatures.add(bottomFilletInput)
 
 
+@stageTimer.timed
 def chamferEdgesByLength(
     faces: adsk.fusion.BRepFaces,
     distance: float,
@@ -59,6 +63,7 @@ def chamferEdgesByLength(
     )
 
 
+@stageTimer.timed
 def createChamfer(
     edges: adsk.core.ObjectCollection,
     distance: float,
@@ -71,3 +76,61 @@ def createChamfer(
         edges, adsk.core.ValueInput.createByReal(distance), True
     )
     return chamferFeatures.add(chamferInput)
+
+
+class DeferredFillets:
+    """Collects constant radius fillets to create them as one fillet feature.
+
+    Edges are grouped into one edge set per radius and tangent chain option.
+    Edges of different bodies can be collected as long as none of the bodies
+    is changed by another feature before create is called.
+    """
+
+    def __init__(self):
+        self.edgeSets: dict[tuple[float, bool], list[adsk.fusion.BRepEdge]] = {}
+
+    def add(
+        self,
+        edges: list[adsk.fusion.BRepEdge],
+        radius: float,
+        isTangentChain: bool,
+    ):
+        key = (round(radius, 6), isTangentChain)
+        self.edgeSets.setdefault(key, []).extend(edges)
+
+    def addEdgesByLength(
+        self,
+        faces: adsk.fusion.BRepFaces,
+        radius: float,
+        filterEdgeLength: float,
+    ):
+        self.add(
+            list(
+                edgeUtils.selectEdgesByLength(
+                    faces, filterEdgeLength, const.DEFAULT_FILTER_TOLERANCE
+                )
+            ),
+            radius,
+            True,
+        )
+
+    @stageTimer.timed
+    def create(self, targetComponent: adsk.fusion.Component):
+        edgeSets = [(key, edges) for key, edges in self.edgeSets.items() if edges]
+        self.edgeSets = {}
+        if not edgeSets:
+            return None
+        filletFeatures: adsk.fusion.FilletFeatures = (
+            targetComponent.features.filletFeatures
+        )
+        filletInput = filletFeatures.createInput()
+        filletInput.isRollingBallCorner = True
+        for (radius, isTangentChain), edges in edgeSets:
+            filletInput.edgeSetInputs.addConstantRadiusEdgeSet(
+                commonUtils.objectCollectionFromList(edges),
+                adsk.core.ValueInput.createByReal(radius),
+                isTangentChain,
+            )
+        filletFeature = filletFeatures.add(filletInput)
+        filletFeature.name = "Consolidated fillets"
+        return filletFeature
@@ -0,0 +1,96 @@
+import adsk.core, adsk.fusion, traceback
+import dataclasses
+import hashlib
+import json
+
+# Frozen mirrors of the generator input classes. Specs only hold plain python
+# values, points are (x, y, z) tuples, so they are cheap to copy with
+# dataclasses.replace, can be compared and hashed and work as generation cache
+# keys. Generators still take the input classes, toInput() converts a spec to
+# its input class with adsk types right before generating.
+
+# floats closer than that are considered equal, well below modeling tolerance
+CANONICAL_FLOAT_DIGITS = 5
+
+
+def canonicalValue(value: any):
+    if value is None or isinstance(value, (bool, str)):
+        return value
+    if isinstance(value, (int, float)):
+        rounded = round(float(value), CANONICAL_FLOAT_DIGITS)
+        # avoid -0.0 and 0.0 producing different keys
+        return rounded if rounded != 0 else 0.0
+    if isinstance(value, (list, tuple)):
+        return [canonicalValue(item) for item in value]
+    if isinstance(value, dict):
+        return {str(key): canonicalValue(value[key]) for key in sorted(value)}
+    if isinstance(value, GeneratorSpec):
+        return value.canonicalFields()
+    raise TypeError(f"Value of type {type(value).__name__} has no canonical form")
+
+
+def pointTuple(point: adsk.core.Point3D) -> tuple[float, float, float]:
+    return (point.x, point.y, point.z)
+
+
+def point3D(values: tuple[float, float, float]) -> adsk.core.Point3D:
+    return adsk.core.Point3D.create(*values)
+
+
+def convertedField(default, toSpec, toInput):
+    """Field converted with toSpec(value) and toInput(value) when it isn't None."""
+    return dataclasses.field(
+        default=default, metadata={"toSpec": toSpec, "toInput": toInput}
+    )
+
+
+def pointField(default: tuple[float, float, float] = None):
+    return convertedField(default, pointTuple, point3D)
+
+
+@dataclasses.dataclass(frozen=True, slots=True, eq=False)
+class GeneratorSpec:
+    """Base of input specs, subclasses set inputType to the mirrored input class."""
+
+    @classmethod
+    def fromInput(cls, input):
+        values = {}
+        for field in dataclasses.fields(cls):
+            # inputs leave some values unset until the command fills them in
+            value = getattr(input, field.name, field.default)
+            if value is not None and "toSpec" in field.metadata:
+                value = field.metadata["toSpec"](value)
+            values[field.name] = value
+        return cls(**values)
+
+    def toInput(self):
+        input = self.inputType()
+        for field in dataclasses.fields(self):
+            value = getattr(self, field.name)
+            if value is None:
+                continue
+            if "toInput" in field.metadata:
+                value = field.metadata["toInput"](value)
+            setattr(input, field.name, value)
+        return input
+
+    def canonicalFields(self) -> dict:
+        fields = {"type": type(self).__name__}
+        for field in dataclasses.fields(self):
+            fields[field.name] = canonicalValue(getattr(self, field.name))
+        return fields
+
+    def canonicalHash(self) -> str:
+        """Hash stable between sessions, floats are rounded to CANONICAL_FLOAT_DIGITS."""
+        payload = json.dumps(
+            self.canonicalFields(), sort_keys=True, separators=(",", ":")
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.canonicalFields() == other.canonicalFields()
+
+    def __hash__(self):
+        return hash(self.canonicalHash())
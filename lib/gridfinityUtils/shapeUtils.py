@@ -1,7 +1,7 @@
 import adsk.core, adsk.fusion, traceback
 import os
 
-from . import extrudeUtils, sketchUtils
+from . import commonUtils, const, extrudeUtils, sketchUtils
 
 app = adsk.core.Application.get()
 ui = app.userInterface
@@ -28,9 +28,11 @@ def simpleCylinder(
         baseConstructionPlane
     )
     cylinderBaseSketch.name = "Simple cylinder sketch"
-    dimensions: adsk.fusion.SketchDimensions = cylinderBaseSketch.sketchDimensions
-    constraints: adsk.fusion.GeometricConstraints = (
-        cylinderBaseSketch.geometricConstraints
+    dimensions: adsk.fusion.SketchDimensions = sketchUtils.sketchDimensions(
+        cylinderBaseSketch
+    )
+    constraints: adsk.fusion.GeometricConstraints = sketchUtils.geometricConstraints(
+        cylinderBaseSketch
     )
     centerOnSketch = cylinderBaseSketch.modelToSketchSpace(centerBottom)
     centerOnSketch.z = 0
@@ -80,6 +82,95 @@ def simpleCylinder(
     return cylinderExtrude.bodies.item(0)
 
 
+def coaxialCylinders(
+    plane: adsk.core.Base,
+    centerBottom: adsk.core.Point3D,
+    cylinders: list[tuple[float, float, float]],
+    targetComponent: adsk.fusion.Component,
+    name: str = "",
+) -> list[adsk.fusion.BRepBody]:
+    """Creates cylinders sharing one axis from one sketch of concentric circles.
+
+    Cylinders are (radius, startOffset, height) tuples, offset and height are
+    measured along the plane normal. Each cylinder is one extrude of the sketch
+    profiles inside its circle, bodies are returned in the order of cylinders.
+    """
+    sketch: adsk.fusion.Sketch = targetComponent.sketches.add(plane)
+    sketch.name = f"{name} sketch" if name else "Coaxial cylinders sketch"
+    sketchUtils.convertToConstruction(sketch.sketchCurves)
+    dimensions: adsk.fusion.SketchDimensions = sketchUtils.sketchDimensions(sketch)
+    constraints: adsk.fusion.GeometricConstraints = sketchUtils.geometricConstraints(
+        sketch
+    )
+    centerOnSketch = sketch.modelToSketchSpace(centerBottom)
+    centerOnSketch.z = 0
+
+    circles: list[adsk.fusion.SketchCircle] = []
+    for radius in sorted(set(radius for radius, _, _ in cylinders)):
+        circle = sketch.sketchCurves.sketchCircles.addByCenterRadius(
+            centerOnSketch, radius
+        )
+        dimensions.addDiameterDimension(
+            circle,
+            adsk.core.Point3D.create(
+                centerOnSketch.x + radius, centerOnSketch.y + radius, 0
+            ),
+            True,
+        )
+        if circles:
+            constraints.addConcentric(circles[0], circle)
+        circles.append(circle)
+    if centerOnSketch.isEqualTo(sketch.originPoint.geometry):
+        constraints.addCoincident(sketch.originPoint, circles[0].centerSketchPoint)
+    else:
+        dimensions.addDistanceDimension(
+            sketch.originPoint,
+            circles[0].centerSketchPoint,
+            adsk.fusion.DimensionOrientations.HorizontalDimensionOrientation,
+            adsk.core.Point3D.create(centerOnSketch.x, 0, 0),
+            True,
+        )
+        dimensions.addDistanceDimension(
+            sketch.originPoint,
+            circles[0].centerSketchPoint,
+            adsk.fusion.DimensionOrientations.VerticalDimensionOrientation,
+            adsk.core.Point3D.create(0, centerOnSketch.y, 0),
+            True,
+        )
+
+    extrudeFeatures: adsk.fusion.ExtrudeFeatures = (
+        targetComponent.features.extrudeFeatures
+    )
+    profiles = list(sketch.profiles)
+    bodies: list[adsk.fusion.BRepBody] = []
+    for radius, startOffset, height in cylinders:
+        # the disc and the rings up to the cylinder circle
+        cylinderProfiles = [
+            profile
+            for profile in profiles
+            if profile.boundingBox.maxPoint.x - profile.boundingBox.minPoint.x
+            <= radius * 2 + const.DEFAULT_FILTER_TOLERANCE
+        ]
+        extrudeInput = extrudeFeatures.createInput(
+            commonUtils.objectCollectionFromList(cylinderProfiles),
+            adsk.fusion.FeatureOperations.NewBodyFeatureOperation,
+        )
+        if startOffset != 0:
+            extrudeInput.startExtent = adsk.fusion.OffsetStartDefinition.create(
+                adsk.core.ValueInput.createByReal(startOffset)
+            )
+        extrudeInput.setOneSideExtent(
+            adsk.fusion.DistanceExtentDefinition.create(
+                adsk.core.ValueInput.createByReal(height)
+            ),
+            adsk.fusion.ExtentDirections.PositiveExtentDirection,
+        )
+        extrude = extrudeFeatures.add(extrudeInput)
+        extrude.name = f"{name} extrude" if name else "Coaxial cylinder extrude"
+        bodies.append(extrude.bodies.item(0))
+    return bodies
+
+
 def simpleBox(
     plane: adsk.core.Base,
     planeOffset: float,
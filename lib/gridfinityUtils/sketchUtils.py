@@ -3,6 +3,28 @@ import adsk.core, adsk.fusion, traceback
 import os
 
 from . import const
+from ... import config
+
+
+class SkippedSketchCalls:
+    """Stands in for sketch constraints and dimensions, every add call does nothing."""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+def geometricConstraints(
+    sketch: adsk.fusion.Sketch,
+) -> adsk.fusion.GeometricConstraints:
+    if config.SKETCH_CONSTRAINTS_ENABLED:
+        return sketch.geometricConstraints
+    return SkippedSketchCalls()
+
+
+def sketchDimensions(sketch: adsk.fusion.Sketch) -> adsk.fusion.SketchDimensions:
+    if config.SKETCH_CONSTRAINTS_ENABLED:
+        return sketch.sketchDimensions
+    return SkippedSketchCalls()
 
 
 def isVertical(line: adsk.fusion.SketchLine):
@@ -27,8 +49,8 @@ def createRectangle(
     startPoint: adsk.core.Point3D,
     sketch: adsk.fusion.Sketch,
 ):
-    constraints: adsk.fusion.GeometricConstraints = sketch.geometricConstraints
-    dimensions: adsk.fusion.SketchDimensions = sketch.sketchDimensions
+    constraints: adsk.fusion.GeometricConstraints = geometricConstraints(sketch)
+    dimensions: adsk.fusion.SketchDimensions = sketchDimensions(sketch)
     lines: adsk.fusion.SketchLines = sketch.sketchCurves.sketchLines
     rectangleLines = lines.addTwoPointRectangle(
         startPoint,
@@ -91,6 +113,8 @@ def createOffsetProfileSketch(
 ):
     sketches: adsk.fusion.Sketches = targetComponent.sketches
     sketch: adsk.fusion.Sketch = sketches.add(planarEntity)
+    # the offset constraint creates the curves, it isn't skipped with the
+    # other constraints
     constraints: adsk.fusion.GeometricConstraints = sketch.geometricConstraints
     curvesList: list[adsk.fusion.SketchCurve] = []
     for curve in sketch.sketchCurves:
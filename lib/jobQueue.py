@@ -0,0 +1,177 @@
+import adsk.core, adsk.fusion, traceback
+import collections
+import time
+
+from . import fusion360utils as futil
+from . import stageTimer
+from .. import config
+
+app = adsk.core.Application.get()
+ui = app.userInterface
+
+# Runs batch generation, like several copies of a bin, one step at a time.
+# Every step is dispatched from a custom event, Fusion handles pending UI
+# events and repaints between steps instead of being blocked by the whole
+# batch. Progress is shown in the status bar progress bar, a cancelled job
+# stops at the next step boundary.
+
+JOB_STATUS_PENDING = "pending"
+JOB_STATUS_RUNNING = "running"
+JOB_STATUS_DONE = "done"
+JOB_STATUS_CANCELLED = "cancelled"
+JOB_STATUS_FAILED = "failed"
+# finished jobs kept with their timings
+JOB_HISTORY_SIZE = 50
+
+
+class Job:
+    def __init__(self, name: str, steps: list[tuple[str, any]]):
+        self.name = name
+        self.steps = steps
+        self.status = JOB_STATUS_PENDING
+        self.isCancelled = False
+        self.stepSeconds: list[tuple[str, float]] = []
+        self.seconds = 0.0
+
+    @property
+    def completedSteps(self):
+        return len(self.stepSeconds)
+
+    def timingsReport(self) -> stageTimer.Stage:
+        root = stageTimer.Stage(f"{self.name} job")
+        root.calls = 1
+        root.seconds = self.seconds
+        for label, seconds in self.stepSeconds:
+            stage = root.child(label)
+            stage.calls += 1
+            stage.seconds += seconds
+        return root
+
+
+class JobQueue:
+    def __init__(self, name: str):
+        self.name = name
+        self.eventId = f"{config.COMPANY_NAME}_{config.ADDIN_NAME}_{name}_jobs"
+        self.pendingJobs: collections.deque[Job] = collections.deque()
+        self.currentJob: Job = None
+        self.history: collections.deque[Job] = collections.deque(
+            maxlen=JOB_HISTORY_SIZE
+        )
+        self._isStepQueued = False
+        self._isStarted = False
+        self._handlers = []
+
+    @property
+    def isBusy(self):
+        return self.currentJob is not None or len(self.pendingJobs) > 0
+
+    def start(self):
+        if self._isStarted:
+            return
+        customEvent = app.registerCustomEvent(self.eventId)
+        futil.add_handler(
+            customEvent,
+            self._onStepEvent,
+            name=f"{self.name} job step",
+            local_handlers=self._handlers,
+        )
+        self._isStarted = True
+
+    def stop(self):
+        if not self._isStarted:
+            return
+        self.cancel()
+        app.unregisterCustomEvent(self.eventId)
+        self._handlers = []
+        self._isStarted = False
+        self._isStepQueued = False
+
+    def submit(self, name: str, steps: list[tuple[str, any]]) -> Job:
+        """Queues a job of (label, function) steps, each step runs from its own event."""
+        self.start()
+        job = Job(name, steps)
+        self.pendingJobs.append(job)
+        self._queueStep()
+        return job
+
+    def cancel(self):
+        """Cancels the running job at the next step boundary and drops pending jobs."""
+        if self.currentJob is not None:
+            self.currentJob.isCancelled = True
+        while self.pendingJobs:
+            job = self.pendingJobs.popleft()
+            job.isCancelled = True
+            self._finish(job, JOB_STATUS_CANCELLED)
+
+    def _queueStep(self):
+        if self._isStepQueued or not self.isBusy:
+            return
+        self._isStepQueued = True
+        app.fireCustomEvent(self.eventId)
+
+    def _onStepEvent(self, args: adsk.core.CustomEventArgs):
+        self._isStepQueued = False
+        if self.currentJob is None:
+            if not self.pendingJobs:
+                return
+            self.currentJob = self.pendingJobs.popleft()
+            self.currentJob.status = JOB_STATUS_RUNNING
+            ui.progressBar.show(
+                f"{self.currentJob.name}, %v of %m", 0, len(self.currentJob.steps)
+            )
+        job = self.currentJob
+
+        if job.isCancelled:
+            self._finish(job, JOB_STATUS_CANCELLED)
+        else:
+            label, step = job.steps[job.completedSteps]
+            startTime = time.perf_counter()
+            try:
+                step()
+            except:
+                futil.handle_error(f"{job.name}, {label}")
+                self._finish(job, JOB_STATUS_FAILED)
+            else:
+                seconds = time.perf_counter() - startTime
+                job.stepSeconds.append((label, seconds))
+                job.seconds += seconds
+                ui.progressBar.progressValue = job.completedSteps
+                if job.completedSteps == len(job.steps):
+                    self._finish(job, JOB_STATUS_DONE)
+        self._queueStep()
+
+    def _finish(self, job: Job, status: str):
+        job.status = status
+        self.history.append(job)
+        if job is self.currentJob:
+            self.currentJob = None
+            ui.progressBar.hide()
+        futil.log(
+            f"{job.name} job {status}, {job.completedSteps} of {len(job.steps)} steps in {job.seconds * 1000:.1f} ms, "
+            + ", ".join(
+                f"{label} {seconds * 1000:.1f} ms" for label, seconds in job.stepSeconds
+            )
+        )
+        if status != JOB_STATUS_DONE:
+            ui.statusMessage = f"{job.name} {status} after {job.completedSteps} of {len(job.steps)} steps"
+        if config.PROFILING_ENABLED and job.stepSeconds:
+            stageTimer.writeReport(
+                job.timingsReport(), config.PROFILING_REPORT_FOLDER_PATH
+            )
+
+
+_jobQueue: JobQueue = None
+
+
+def getJobQueue():
+    global _jobQueue
+    if _jobQueue is None:
+        _jobQueue = JobQueue("generation")
+    return _jobQueue
+
+
+def stopJobQueue():
+    global _jobQueue
+    if _jobQueue is not None:
+        _jobQueue.stop()
+        _jobQueue = None
@@ -0,0 +1,184 @@
+import adsk.core, adsk.fusion, traceback
+import functools
+import json
+import os
+import time
+
+from . import fusion360utils as futil
+from .. import config
+
+REPORT_FILE_EXTENSION = ".json"
+
+
+class Stage:
+    def __init__(self, name: str, parent: "Stage" = None):
+        self.name = name
+        self.parent = parent
+        self.children: dict[str, Stage] = {}
+        self.calls = 0
+        self.seconds = 0.0
+
+    def child(self, name: str):
+        # repeated calls of the same stage are aggregated under one node
+        stage = self.children.get(name)
+        if stage is None:
+            stage = Stage(name, self)
+            self.children[name] = stage
+        return stage
+
+    @property
+    def ownSeconds(self):
+        return self.seconds - sum(child.seconds for child in self.children.values())
+
+    def toDict(self):
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "seconds": self.seconds,
+            "ownSeconds": self.ownSeconds,
+            "children": [child.toDict() for child in self.children.values()],
+        }
+
+
+# stage new timed calls are attributed to, None when there is no active session
+_currentStage: Stage = None
+# perf_counter time timed calls may not start after, None when there is no budget
+_deadline: float = None
+
+
+class BudgetExceeded(Exception):
+    pass
+
+
+class StageContext:
+    def __init__(self, name: str):
+        self.name = name
+        self.stage: Stage = None
+
+    def __enter__(self):
+        global _currentStage
+        if _currentStage is None:
+            return self
+        self.stage = _currentStage.child(self.name)
+        self.stage.calls += 1
+        _currentStage = self.stage
+        self.startTime = time.perf_counter()
+        return self
+
+    def __exit__(self, excType, excValue, excTraceback):
+        global _currentStage
+        if self.stage is None:
+            return False
+        self.stage.seconds += time.perf_counter() - self.startTime
+        _currentStage = self.stage.parent
+        return False
+
+
+def stage(name: str):
+    return StageContext(name)
+
+
+def timed(function):
+    name = "{}.{}".format(function.__module__.rsplit(".", 1)[-1], function.__name__)
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if _deadline is not None and time.perf_counter() > _deadline:
+            raise BudgetExceeded(f"time budget exceeded before {name}")
+        if _currentStage is None:
+            return function(*args, **kwargs)
+        with StageContext(name):
+            return function(*args, **kwargs)
+
+    return wrapper
+
+
+def formatReport(root: Stage):
+    lines = [f"Generation timings: {root.name}, total {root.seconds * 1000:.1f} ms"]
+
+    def addLines(stage: Stage, depth: int):
+        for child in sorted(
+            stage.children.values(), key=lambda item: item.seconds, reverse=True
+        ):
+            share = child.seconds / root.seconds if root.seconds > 0 else 0
+            lines.append(
+                "{:<60} {:>5} x {:>10.1f} ms {:>6.1%}".format(
+                    "  " * depth + child.name, child.calls, child.seconds * 1000, share
+                )
+            )
+            addLines(child, depth + 1)
+
+    addLines(root, 1)
+    return "\n".join(lines)
+
+
+def writeReport(root: Stage, folderPath: str):
+    try:
+        if not os.path.exists(folderPath):
+            os.makedirs(folderPath)
+        fileName = "{}_{}{}".format(
+            time.strftime("%Y%m%d-%H%M%S"),
+            "".join(char if char.isalnum() else "_" for char in root.name),
+            REPORT_FILE_EXTENSION,
+        )
+        with open(os.path.join(folderPath, fileName), "w") as reportFile:
+            json.dump(root.toDict(), reportFile, indent=True)
+        return True
+    except Exception as err:
+        futil.log(f"Couldn't write timings report, {err}")
+        return False
+
+
+class SessionContext:
+    def __init__(self, name: str):
+        self.name = name
+        self.root: Stage = None
+
+    def __enter__(self):
+        global _currentStage
+        # nested sessions are recorded as stages of the outer one
+        if not config.PROFILING_ENABLED or _currentStage is not None:
+            return self
+        self.root = Stage(self.name)
+        self.root.calls = 1
+        _currentStage = self.root
+        self.startTime = time.perf_counter()
+        return self
+
+    def __exit__(self, excType, excValue, excTraceback):
+        global _currentStage
+        if self.root is None:
+            return False
+        self.root.seconds = time.perf_counter() - self.startTime
+        _currentStage = None
+        futil.log(formatReport(self.root), force_console=True)
+        writeReport(self.root, config.PROFILING_REPORT_FOLDER_PATH)
+        return False
+
+
+def session(name: str):
+    return SessionContext(name)
+
+
+class BudgetContext:
+    def __init__(self, seconds: float):
+        self.seconds = seconds
+        self.previousDeadline: float = None
+
+    def __enter__(self):
+        global _deadline
+        self.previousDeadline = _deadline
+        if self.seconds > 0:
+            deadline = time.perf_counter() + self.seconds
+            _deadline = deadline if _deadline is None else min(_deadline, deadline)
+        return self
+
+    def __exit__(self, excType, excValue, excTraceback):
+        global _deadline
+        _deadline = self.previousDeadline
+        return False
+
+
+def budget(seconds: float):
+    """Timed calls started after `seconds` raise BudgetExceeded, 0 disables the budget."""
+    return BudgetContext(seconds)
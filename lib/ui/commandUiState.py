@@ -20,6 +20,10 @@ class CommandUiState:
     def __init__(self, commandName):
         self.inputState: dict[str, SingleInputState] = {}
         self.commandInputs: dict[str, adsk.core.CommandInput] = {}
+        # last value written to or read from each command input
+        self.writtenValues: dict[str, any] = {}
+        # ids of entries which may differ from their command input
+        self.dirtyInputs: set[str] = set()
         self.commandName = commandName
 
     def removeValue(self, inputId: str):
@@ -27,27 +31,48 @@ class CommandUiState:
             del self.inputState[inputId]
         if inputId in self.commandInputs:
             del self.commandInputs[inputId]
+        self.writtenValues.pop(inputId, None)
+        self.dirtyInputs.discard(inputId)
 
-    def initValue(self, inputId: str, inputValue: any, inputType: str):
+    def setValue(self, inputId: str, inputValue: any, inputType: str):
         self.inputState[inputId] = SingleInputState(inputId, inputValue, inputType)
+        if (
+            inputId not in self.writtenValues
+            or self.writtenValues[inputId] != inputValue
+        ):
+            self.dirtyInputs.add(inputId)
+
+    def initValue(self, inputId: str, inputValue: any, inputType: str):
+        self.setValue(inputId, inputValue, inputType)
 
     def updateValue(self, inputId: str, inputValue: any):
         if inputId in self.inputState:
-            self.inputState[inputId].value = inputValue
-        if inputId in self.commandInputs:
-            self.updateInputFromState(self.commandInputs[inputId])
+            self.setValue(inputId, inputValue, self.inputState[inputId].type)
+        if inputId in self.commandInputs and inputId in self.dirtyInputs:
+            self.writeInput(self.commandInputs[inputId])
 
     def initValues(self, inputValues: dict[str, any]):
         for v in inputValues.values():
-            self.inputState[v["id"]] = SingleInputState(v["id"], v["value"], v["type"])
+            self.setValue(v["id"], v["value"], v["type"])
 
     def registerCommandInput(self, input: adsk.core.CommandInput):
-        futil.log(f"{self.commandName} Registering command input {input.id}")
+        futil.log_debug("%s Registering command input %s", self.commandName, input.id)
         self.commandInputs[input.id] = input
+        # a new input may show anything, write the state on the next refresh
+        self.writtenValues.pop(input.id, None)
+        self.dirtyInputs.add(input.id)
 
     def onInputUpdate(self, input: adsk.core.CommandInput):
         inputId = input.id
         self.commandInputs[inputId] = input
+        self.readInput(input)
+        if inputId in self.inputState:
+            # the input already shows the value it was read from
+            self.writtenValues[inputId] = self.inputState[inputId].value
+            self.dirtyInputs.discard(inputId)
+
+    def readInput(self, input: adsk.core.CommandInput):
+        inputId = input.id
         if isinstance(input, adsk.core.IntegerSpinnerCommandInput):
             self.inputState[inputId] = SingleInputState(
                 inputId, input.value, input.objectType
@@ -87,23 +112,39 @@ class CommandUiState:
             )
 
     def forceUIRefresh(self):
-        futil.log(f"{self.commandName} Forcing UI input state refresh")
-        for input in self.inputState.values():
-            if input.id in self.commandInputs:
-                commandInput = self.commandInputs[input.id]
-                futil.log(f"{self.commandName} Input {input.id}, {commandInput}")
+        futil.log_debug(
+            "%s Refreshing %s changed UI inputs",
+            self.commandName,
+            len(self.dirtyInputs),
+        )
+        for inputId in list(self.dirtyInputs):
+            if inputId not in self.inputState:
+                # tables, buttons and labels have no state to write
+                self.dirtyInputs.discard(inputId)
+            elif inputId in self.commandInputs:
+                commandInput = self.commandInputs[inputId]
+                futil.log_debug(
+                    "%s Input %s, %s", self.commandName, inputId, commandInput
+                )
                 try:
-                    self.updateInputFromState(commandInput)
+                    self.writeInput(commandInput)
                 except Exception as err:
                     futil.log(
-                        f"{self.commandName} Skipping {input.id} due to error: {err}"
+                        f"{self.commandName} Skipping {inputId} due to error: {err}"
                     )
-
             else:
-                futil.log(
-                    f"{self.commandName} Skipping {input.id} as it wasn't registered"
+                futil.log_debug(
+                    "%s Skipping %s as it wasn't registered", self.commandName, inputId
                 )
 
+    def writeInput(self, input: adsk.core.CommandInput):
+        inputId = input.id
+        value = self.getState(inputId)
+        if inputId not in self.writtenValues or self.writtenValues[inputId] != value:
+            self.updateInputFromState(input)
+            self.writtenValues[inputId] = value
+        self.dirtyInputs.discard(inputId)
+
     def updateInputFromState(self, input: adsk.core.CommandInput):
         inputId = input.id
         value = self.getState(inputId)
@@ -0,0 +1,237 @@
+import math
+import operator
+from dataclasses import dataclass
+from typing import Callable, Iterable
+
+# Pure python, doesn't use the Fusion API so rule sets can be checked outside
+# of Fusion. Rules read fields of a frozen input state snapshot, see
+# commandCreateBaseplate/inputState.py and commandCreateBin/inputState.py.
+
+
+@dataclass(frozen=True)
+class ValidationRule:
+    field: str
+    # returns error messages for the snapshot, empty when the field is valid
+    evaluate: Callable[[any], Iterable[str]]
+    # rule is skipped when the condition returns False
+    condition: Callable[[any], bool] = None
+    # name of the field in messages shown to the user, the dialog input label
+    label: str = None
+
+
+class ValidationResult:
+    def __init__(self, errors: dict[str, list[str]], labels: dict[str, str] = None):
+        self.errors = errors
+        self.labels = labels or {}
+
+    @property
+    def isValid(self) -> bool:
+        return not self.errors
+
+    def fieldErrors(self, field: str) -> list[str]:
+        return self.errors.get(field, [])
+
+    def messages(self) -> list[str]:
+        return [
+            f"{self.labels.get(field, field)} {message}"
+            for field, messages in self.errors.items()
+            for message in messages
+        ]
+
+
+class RuleSet:
+    def __init__(self, rules: list[ValidationRule]):
+        self.rules = list(rules)
+        # rules sharing a condition are grouped so each condition is evaluated
+        # once per validation
+        groups: dict[int, tuple[Callable, list[ValidationRule]]] = {}
+        for rule in self.rules:
+            key = id(rule.condition)
+            if key not in groups:
+                groups[key] = (rule.condition, [])
+            groups[key][1].append(rule)
+        self.groups = list(groups.values())
+
+    def validate(self, state) -> ValidationResult:
+        errors: dict[str, list[str]] = {}
+        labels: dict[str, str] = {}
+        for condition, rules in self.groups:
+            if condition is not None and not condition(state):
+                continue
+            for rule in rules:
+                messages = rule.evaluate(state)
+                if messages:
+                    errors.setdefault(rule.field, []).extend(messages)
+                    if rule.label is not None:
+                        labels[rule.field] = rule.label
+        return ValidationResult(errors, labels)
+
+
+def formatDegrees(radians: float) -> str:
+    """Formats an angle stored in radians the way the dialog shows it."""
+    return f"{round(math.degrees(radians), 6):g}°"
+
+
+def formatMillimeters(centimeters: float) -> str:
+    """Formats a length stored in cm the way the dialog shows it."""
+    return f"{round(centimeters * 10, 6):g} mm"
+
+
+def compareRule(
+    field: str,
+    compare: Callable[[any, any], bool],
+    limit: any,
+    message: str,
+    when: Callable[[any], bool] = None,
+    label: str = None,
+):
+    getValue = operator.attrgetter(field)
+
+    def evaluate(state):
+        return () if compare(getValue(state), limit) else (message,)
+
+    return ValidationRule(field, evaluate, when, label)
+
+
+# label is the dialog input label used in messages instead of the field name,
+# formatValue turns limits into the text of the message, for values the dialog
+# shows in other units than they are stored in
+
+
+def greaterThan(
+    field: str,
+    limit: float,
+    when: Callable[[any], bool] = None,
+    formatValue: Callable[[float], str] = str,
+    label: str = None,
+):
+    return compareRule(
+        field,
+        operator.gt,
+        limit,
+        f"must be greater than {formatValue(limit)}",
+        when,
+        label,
+    )
+
+
+def atLeast(
+    field: str,
+    limit: float,
+    when: Callable[[any], bool] = None,
+    formatValue: Callable[[float], str] = str,
+    label: str = None,
+):
+    return compareRule(
+        field,
+        operator.ge,
+        limit,
+        f"must be at least {formatValue(limit)}",
+        when,
+        label,
+    )
+
+
+def atMost(
+    field: str,
+    limit: float,
+    when: Callable[[any], bool] = None,
+    formatValue: Callable[[float], str] = str,
+    label: str = None,
+):
+    return compareRule(
+        field,
+        operator.le,
+        limit,
+        f"must be at most {formatValue(limit)}",
+        when,
+        label,
+    )
+
+
+def inRange(
+    field: str,
+    minimum: float,
+    maximum: float,
+    when: Callable[[any], bool] = None,
+    formatValue: Callable[[float], str] = str,
+    label: str = None,
+):
+    getValue = operator.attrgetter(field)
+    message = f"must be between {formatValue(minimum)} and {formatValue(maximum)}"
+
+    def evaluate(state):
+        return () if minimum <= getValue(state) <= maximum else (message,)
+
+    return ValidationRule(field, evaluate, when, label)
+
+
+def compareFields(
+    field: str,
+    compare: Callable[[any, any], bool],
+    otherField: str,
+    message: str,
+    when: Callable[[any], bool] = None,
+    label: str = None,
+):
+    getValue = operator.attrgetter(field)
+    getOtherValue = operator.attrgetter(otherField)
+
+    def evaluate(state):
+        return () if compare(getValue(state), getOtherValue(state)) else (message,)
+
+    return ValidationRule(field, evaluate, when, label)
+
+
+def lessThanField(
+    field: str,
+    otherField: str,
+    when: Callable[[any], bool] = None,
+    label: str = None,
+    otherLabel: str = None,
+):
+    return compareFields(
+        field,
+        operator.lt,
+        otherField,
+        f"must be less than {otherLabel or otherField}",
+        when,
+        label,
+    )
+
+
+def greaterThanField(
+    field: str,
+    otherField: str,
+    when: Callable[[any], bool] = None,
+    label: str = None,
+    otherLabel: str = None,
+):
+    return compareFields(
+        field,
+        operator.gt,
+        otherField,
+        f"must be greater than {otherLabel or otherField}",
+        when,
+        label,
+    )
+
+
+def eachItem(
+    field: str,
+    check: Callable[[any, any], bool],
+    message: str,
+    when: Callable[[any], bool] = None,
+    label: str = None,
+):
+    """Checks every item of a sequence field, message is formatted with the item index."""
+    getItems = operator.attrgetter(field)
+
+    def evaluate(state):
+        return [
+            message.format(index)
+            for index, item in enumerate(getItems(state), 1)
+            if not check(item, state)
+        ]
+
+    return ValidationRule(field, evaluate, when, label)
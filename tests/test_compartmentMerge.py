@@ -0,0 +1,109 @@
+"""Checks tabs and scoops of text layout regions covered by several rectangles."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"
+    ),
+)
+
+import benchmarkUtils
+
+benchmarkUtils.loadAddin()
+
+compartmentLayout = benchmarkUtils.importAddinModule(
+    "lib.gridfinityUtils.compartmentLayout"
+)
+compartmentMerge = benchmarkUtils.importAddinModule(
+    "lib.gridfinityUtils.compartmentMerge"
+)
+binBodyGeneratorInput = benchmarkUtils.importAddinModule(
+    "lib.gridfinityUtils.binBodyGeneratorInput"
+)
+
+
+def rectangle(compartment):
+    return (
+        compartment.positionX,
+        compartment.positionY,
+        compartment.width,
+        compartment.length,
+    )
+
+
+def edgeFlags(compartments):
+    return {
+        rectangle(compartment): (compartment.hasTab, compartment.hasScoop)
+        for compartment in compartments
+    }
+
+
+@pytest.mark.parametrize(
+    "layout, expected",
+    [
+        # the first text row is the back of the bin
+        ("A.\nAA", {(0, 0, 2, 1): (False, True), (0, 0, 1, 2): (True, True)}),
+        ("AA\nA.", {(0, 1, 2, 1): (True, True), (0, 0, 1, 2): (True, True)}),
+        (".A\nAA\n.A", {(0, 1, 2, 1): (False, True), (1, 0, 1, 3): (True, True)}),
+        ("AB\nCC", {(0, 1, 1, 1): (True, True), (1, 1, 1, 1): (True, True)}),
+    ],
+)
+def test_mergeCellsOutlineEdges(layout, expected):
+    compartments = compartmentLayout.parseLayout(layout).compartments
+    flags = edgeFlags(compartments)
+    for item, itemFlags in expected.items():
+        assert flags[item] == itemFlags
+
+
+def test_regionGetsTabOnBackOutline():
+    # L shaped pocket, the wide rectangle's back edge is half inside the pocket
+    compartments = compartmentLayout.parseLayout("A.\nAA").compartments
+    tabbed = [rectangle(item) for item in compartments if item.hasTab]
+    assert tabbed == [(0, 0, 1, 2)]
+    assert all(item.hasScoop for item in compartments)
+
+
+def test_markOutlineEdgesOfOverlappingCompartments():
+    Definition = binBodyGeneratorInput.BinBodyCompartmentDefinition
+    compartments = [
+        Definition(0, 0, 2, 2),
+        # front edge is all inside the pocket
+        Definition(0, 1, 1, 2),
+        # touches the pocket without overlapping, keeps its own tab and scoop
+        Definition(1, 2, 1, 1),
+    ]
+    compartmentMerge.markOutlineEdges(compartments)
+    assert edgeFlags(compartments) == {
+        (0, 0, 2, 2): (False, True),
+        (0, 1, 1, 2): (True, False),
+        (1, 2, 1, 1): (True, True),
+    }
+
+
+def test_lShapedLayoutBinHasOneTab(monkeypatch):
+    binBodyGenerator = benchmarkUtils.importAddinModule(
+        "lib.gridfinityUtils.binBodyGenerator"
+    )
+    layout = compartmentLayout.parseLayout("A.\nAA")
+    tabRanges = []
+    createRowTab = binBodyGenerator.createGridfinityBinBodyRowTab
+
+    def recordRowTab(tabInputs, compartmentRanges, targetComponent):
+        tabRanges.extend(compartmentRanges)
+        return createRowTab(tabInputs, compartmentRanges, targetComponent)
+
+    monkeypatch.setattr(binBodyGenerator, "createGridfinityBinBodyRowTab", recordRowTab)
+    baseInput, bodyInput = benchmarkUtils.binInputs(
+        compartmentsByX=layout.gridWidth,
+        compartmentsByY=layout.gridLength,
+        compartments=layout.compartments,
+        hasScoop=True,
+        hasTab=True,
+    )
+    benchmarkUtils.generateBin(baseInput, bodyInput)
+    assert len(tabRanges) == 1
@@ -0,0 +1,126 @@
+"""Checks consolidated fillets round the same edges as fillets made one by one.
+
+Edges are compared by position, each fillet made one by one is applied before
+the next one picks its edges. Tangent chains are followed the way they run on
+the filleted body: along bottom edges through already filleted vertical
+corners, stopping at edges filleted before.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"
+    ),
+)
+
+import benchmarkUtils
+
+benchmarkUtils.loadAddin()
+import adsk.core, adsk.fusion
+
+binBodyCutoutGenerator = benchmarkUtils.importAddinModule(
+    "lib.gridfinityUtils.binBodyCutoutGenerator"
+)
+binBodyCutoutGeneratorInput = benchmarkUtils.importAddinModule(
+    "lib.gridfinityUtils.binBodyCutoutGeneratorInput"
+)
+filletUtils = benchmarkUtils.importAddinModule("lib.gridfinityUtils.filletUtils")
+
+
+def edgeKey(edge):
+    box = edge.boundingBox
+    return (
+        tuple(round(value, 6) for value in box.minPoint.asArray()),
+        tuple(round(value, 6) for value in box.maxPoint.asArray()),
+    )
+
+
+def isVertical(key):
+    (x1, y1, z1), (x2, y2, z2) = key
+    return x1 == x2 and y1 == y2 and z1 != z2
+
+
+def chainedBottomEdges(key, bottomKeys, filletedKeys):
+    """Bottom edges reached from key through filleted vertical corners."""
+    verticalCorners = {
+        start[:2] for start, end in filletedKeys if isVertical((start, end))
+    }
+    chain = {key}
+    pending = [key]
+    while pending:
+        start, end = pending.pop()
+        corners = {start[:2], end[:2]} & verticalCorners
+        for other in bottomKeys - chain - filletedKeys:
+            if {other[0][:2], other[1][:2]} & corners:
+                chain.add(other)
+                pending.append(other)
+    return chain
+
+
+def filletedEdges(features, bottomKeys):
+    """Edge keys with their radius, features in the order they were created."""
+    filleted: dict = {}
+    for edgeSets in features:
+        added = {}
+        for edges, radius, isTangentChain in edgeSets:
+            for edge in edges:
+                key = edgeKey(edge)
+                keys = {key}
+                if isTangentChain and key in bottomKeys:
+                    keys = chainedBottomEdges(key, bottomKeys, set(filleted))
+                for chained in keys:
+                    added[chained] = round(radius, 6)
+        filleted.update(added)
+    return filleted
+
+
+def generateCutout(hasScoop, hasBottomFillet, consolidated, monkeypatch):
+    features = []
+    add = adsk.fusion.FilletFeatures.add
+
+    def recordingAdd(self, input):
+        features.append(
+            [
+                (list(edges), radius.realValue, isTangentChain)
+                for edges, radius, isTangentChain in input.edgeSetInputs._edgeSets
+            ]
+        )
+        return add(self, input)
+
+    monkeypatch.setattr(adsk.fusion.FilletFeatures, "add", recordingAdd)
+    component = benchmarkUtils.newComponent("Fillet check")
+    input = binBodyCutoutGeneratorInput.BinBodyCutoutGeneratorInput()
+    input.origin = adsk.core.Point3D.create(0.25, 0.25, 4)
+    input.width = 3.5
+    input.length = 3.5
+    input.height = 3
+    input.hasScoop = hasScoop
+    input.filletRadius = 0.3
+    input.hasBottomFillet = hasBottomFillet
+    deferredFillets = filletUtils.DeferredFillets() if consolidated else None
+    body = binBodyCutoutGenerator.createGridfinityBinBodyCutout(
+        input, component, deferredFillets
+    )
+    if deferredFillets is not None:
+        deferredFillets.create(component)
+    bottomZ = body.boundingBox.minPoint.z
+    bottomKeys = {
+        edgeKey(edge)
+        for face in body.faces
+        for edge in face.edges
+        if round(edge.boundingBox.maxPoint.z, 6) == round(bottomZ, 6)
+    }
+    return filletedEdges(features, bottomKeys)
+
+
+@pytest.mark.parametrize("hasScoop", [False, True])
+@pytest.mark.parametrize("hasBottomFillet", [False, True])
+def test_consolidatedCutoutFilletsMatch(hasScoop, hasBottomFillet, monkeypatch):
+    separate = generateCutout(hasScoop, hasBottomFillet, False, monkeypatch)
+    consolidated = generateCutout(hasScoop, hasBottomFillet, True, monkeypatch)
+    assert consolidated == separate
@@ -0,0 +1,104 @@
+"""Runs the generators against the adsk stand-in of the benchmarks.
+
+Usage: python -m pytest tests
+
+Generated counts are checked against benchmarks/featureBudgets.json, the same
+budgets benchmarks/featureBudget.py checks for the whole configuration matrix.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"
+    ),
+)
+
+import benchmarkUtils
+import featureBudget
+
+BIN_CONFIGS = {
+    "bin 1x1": dict(binWidth=1, binLength=1),
+    "bin 4x3": dict(binWidth=4, binLength=3),
+    "bin 2x2 c2x2 hollow hasLip+hasScoop+hasTab+hasMagnetCutouts+hasScrewHoles": dict(
+        compartmentsByX=2,
+        compartmentsByY=2,
+        hasScoop=True,
+        hasTab=True,
+        hasMagnetCutouts=True,
+        hasScrewHoles=True,
+    ),
+    "bin 2x2 c2x2 shelled plain": dict(
+        binType="shelled", compartmentsByX=2, compartmentsByY=2, hasLip=False
+    ),
+    "bin 8x8 c4x4 compartments lip": dict(
+        binWidth=8,
+        binLength=8,
+        compartmentsByX=4,
+        compartmentsByY=4,
+        hasCompartmentsLip=True,
+    ),
+}
+BASEPLATE_CONFIGS = {
+    "baseplate 1x1 light plain": dict(
+        plateWidth=1, plateLength=1, hasSkeletonizedBottom=False
+    ),
+    "baseplate 3x3 skeletonized magnets+screws": dict(
+        plateWidth=3, plateLength=3, hasMagnetCutouts=True, hasScrewHoles=True
+    ),
+    "baseplate 4x4 skeletonized connection holes+padding": dict(
+        plateWidth=4, plateLength=4, hasConnectionHoles=True, hasPadding=True
+    ),
+}
+
+
+@pytest.fixture(scope="module")
+def budgets():
+    return featureBudget.readBudgets()
+
+
+def assertWithinBudget(name, result, budgets):
+    assert name in budgets, f"{name} has no budget"
+    for metric in featureBudget.BUDGET_METRICS:
+        assert metric in budgets[name], f"{name} has no {metric} budget"
+        assert result[metric] <= budgets[name][metric], metric
+
+
+@pytest.mark.parametrize("name", BIN_CONFIGS)
+def test_createGridfinityBinBody(name, budgets):
+    baseInput, bodyInput = benchmarkUtils.binInputs(**BIN_CONFIGS[name])
+    component = None
+
+    def generate():
+        nonlocal component
+        component = benchmarkUtils.generateBin(baseInput, bodyInput)
+
+    result = benchmarkUtils.measure(generate)
+    assert result["features"] > 0
+    assert component.bRepBodies.count == 1
+    assertWithinBudget(name, result, budgets)
+
+
+@pytest.mark.parametrize("name", BASEPLATE_CONFIGS)
+def test_createGridfinityBaseplate(name, budgets):
+    plateInput = benchmarkUtils.baseplateInput(**BASEPLATE_CONFIGS[name])
+    component = None
+
+    def generate():
+        nonlocal component
+        component = benchmarkUtils.generateBaseplate(plateInput)
+
+    result = benchmarkUtils.measure(generate)
+    assert result["features"] > 0
+    assert component.bRepBodies.count >= 1
+    assertWithinBudget(name, result, budgets)
+
+
+def test_featureBudgets(budgets):
+    overBudget, _, missing = featureBudget.compare(featureBudget.measureAll(), budgets)
+    assert overBudget == []
+    assert missing == []
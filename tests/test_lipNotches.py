@@ -0,0 +1,55 @@
+"""Checks lip notch patterns cover the bin perimeter cells."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"
+    ),
+)
+
+import benchmarkUtils
+
+benchmarkUtils.loadAddin()
+
+binBodyLipNotchGenerator = benchmarkUtils.importAddinModule(
+    "lib.gridfinityUtils.binBodyLipNotchGenerator"
+)
+
+
+def patternedCells(cellsX, cellsY):
+    # the seed cutout is in the first corner
+    cells = [(0, 0)]
+    patterns = binBodyLipNotchGenerator.perimeterPatterns(cellsX, cellsY)
+    for (quantityX, stepX), (quantityY, stepY) in patterns:
+        cells += [
+            (x * stepX, y * stepY)
+            for x in range(quantityX)
+            for y in range(quantityY)
+            if (x, y) != (0, 0)
+        ]
+    return cells
+
+
+@pytest.mark.parametrize(
+    "cellsX, cellsY",
+    [(1, 1), (2, 2), (3, 3), (5, 4), (1, 2), (1, 5), (2, 1), (5, 1), (2, 5)],
+)
+def test_perimeterPatterns(cellsX, cellsY):
+    perimeter = {
+        (x, y)
+        for x in range(cellsX)
+        for y in range(cellsY)
+        if x in (0, cellsX - 1) or y in (0, cellsY - 1)
+    }
+    cells = patternedCells(cellsX, cellsY)
+    assert set(cells) == perimeter
+    # the cell at the end of the front row is covered by both patterns
+    assert len(cells) <= len(perimeter) + 1
+    patterns = binBodyLipNotchGenerator.perimeterPatterns(cellsX, cellsY)
+    for (quantityX, stepX), (quantityY, stepY) in patterns:
+        assert stepX > 0 and stepY > 0
@@ -0,0 +1,53 @@
+"""Checks how coaxial cylinder sketches are tied to the sketch origin."""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0,
+    os.path.join(
+        os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "benchmarks"
+    ),
+)
+
+import benchmarkUtils
+
+benchmarkUtils.loadAddin()
+import adsk.core, adsk.fusion
+
+config = benchmarkUtils.importAddinModule("config")
+shapeUtils = benchmarkUtils.importAddinModule("lib.gridfinityUtils.shapeUtils")
+
+
+@pytest.mark.parametrize(
+    "center, distanceDimensions, coincidentConstraints",
+    [((0, 0, 0), 0, 1), ((1, 2, 0), 2, 0)],
+)
+def test_coaxialCylindersOriginConstraint(
+    center, distanceDimensions, coincidentConstraints, monkeypatch
+):
+    monkeypatch.setattr(config, "SKETCH_CONSTRAINTS_ENABLED", True)
+    calls = []
+    for owner, name in [
+        (adsk.fusion.SketchDimensions, "addDistanceDimension"),
+        (adsk.fusion.GeometricConstraints, "addCoincident"),
+    ]:
+
+        def record(self, *args, name=name, method=getattr(owner, name), **kwargs):
+            calls.append(name)
+            return method(self, *args, **kwargs)
+
+        monkeypatch.setattr(owner, name, record)
+
+    component = benchmarkUtils.newComponent("Coaxial cylinders")
+    bodies = shapeUtils.coaxialCylinders(
+        component.xYConstructionPlane,
+        adsk.core.Point3D.create(*center),
+        [(0.3, 0, 0.2), (0.15, 0, 0.5)],
+        component,
+    )
+    assert len(bodies) == 2
+    assert calls.count("addDistanceDimension") == distanceDimensions
+    assert calls.count("addCoincident") == coincidentConstraints